@@ -0,0 +1,81 @@
+import asyncio
+from typing import List
+from uuid import uuid4
+
+import pendulum
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from syntask.server.database.dependencies import provide_database_interface
+from syntask.server.events.schemas.events import ReceivedEvent
+from syntask.server.events.storage.database import write_events
+from syntask.server.utilities.database import get_dialect
+from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
+    SYNTASK_API_SERVICES_EVENT_PERSISTER_COPY_ENABLED,
+    temporary_settings,
+)
+
+NUM_EVENTS = 2_000
+
+
+def make_events(n: int) -> List[ReceivedEvent]:
+    return [
+        ReceivedEvent(
+            occurred=pendulum.now("UTC"),
+            event="syntask.benchmark.event",
+            resource={"syntask.resource.id": f"syntask.benchmark.{i}"},
+            related=[
+                {
+                    "syntask.resource.id": "syntask.benchmark.related",
+                    "syntask.resource.role": "benchmark",
+                },
+                {
+                    "syntask.resource.id": f"syntask.benchmark.related.{i}",
+                    "syntask.resource.role": "benchmark",
+                },
+            ],
+            payload={"index": i, "data": "x" * 100},
+            id=uuid4(),
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [20, 500])
+@pytest.mark.parametrize("copy", [False, True], ids=["insert", "copy"])
+def bench_write_events(benchmark: BenchmarkFixture, copy: bool, batch_size: int):
+    """
+    Writes events in batches the way the event persister does, reporting the
+    throughput in `extra_info["events_per_second"]`.
+    """
+    dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
+    if copy and dialect.name != "postgresql":
+        pytest.skip("COPY is only used with PostgreSQL")
+
+    db = provide_database_interface()
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(db.create_db())
+
+    async def write(events: List[ReceivedEvent]):
+        for start in range(0, len(events), batch_size):
+            async with db.session_context() as session:
+                await write_events(session, events[start : start + batch_size])
+                await session.commit()
+
+    def setup():
+        return (make_events(NUM_EVENTS),), {}
+
+    try:
+        with temporary_settings(
+            {SYNTASK_API_SERVICES_EVENT_PERSISTER_COPY_ENABLED: copy}
+        ):
+            benchmark.pedantic(
+                lambda events: loop.run_until_complete(write(events)),
+                setup=setup,
+                rounds=3,
+            )
+    finally:
+        loop.close()
+
+    benchmark.extra_info["events_per_second"] = NUM_EVENTS / benchmark.stats["mean"]
@@ -0,0 +1,82 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import List
+from uuid import uuid4
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from syntask.logging.handlers import APILogHandler, APILogWorker
+
+NUM_LOGS = 10_000
+
+
+class CountingLogWorker(APILogWorker):
+    """An `APILogWorker` that counts logs instead of sending them to the API"""
+
+    handled = 0
+
+    async def _handle_batch(self, items: List[dict]):
+        CountingLogWorker.handled += len(items)
+
+    @asynccontextmanager
+    async def _lifespan(self):
+        yield
+
+
+def make_records(n: int) -> List[logging.LogRecord]:
+    flow_run_id = uuid4()
+    records = []
+    for i in range(n):
+        record = logging.LogRecord(
+            name="syntask.benchmark",
+            level=logging.INFO,
+            pathname=__file__,
+            lineno=0,
+            msg="Benchmark log line %s with some typical content",
+            args=(i,),
+            exc_info=None,
+        )
+        record.flow_run_id = flow_run_id
+        records.append(record)
+    return records
+
+
+def bench_api_log_handler_prepare(benchmark: BenchmarkFixture):
+    """
+    Prepares logs for the API the way `APILogHandler.emit` does, including sizing
+    them, reporting the throughput in `extra_info["logs_per_second"]`.
+    """
+    handler = APILogHandler()
+
+    def prepare(records: List[logging.LogRecord]):
+        for record in records:
+            handler.prepare(record)
+
+    benchmark.pedantic(prepare, setup=lambda: ((make_records(NUM_LOGS),), {}), rounds=3)
+    benchmark.extra_info["logs_per_second"] = NUM_LOGS / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("num_logs", [1_000, NUM_LOGS])
+def bench_api_log_worker_throughput(benchmark: BenchmarkFixture, num_logs: int):
+    """
+    Sends prepared logs through the `APILogWorker` queue without sending them to the
+    API, reporting the throughput in `extra_info["logs_per_second"]`.
+    """
+    handler = APILogHandler()
+    logs = [handler.prepare(record) for record in make_records(num_logs)]
+
+    def send_and_drain(logs: List[dict]):
+        worker = CountingLogWorker.instance()
+        for log in logs:
+            worker.send(log)
+        worker.drain()
+
+    def setup():
+        CountingLogWorker.handled = 0
+        return ([dict(log) for log in logs],), {}
+
+    benchmark.pedantic(send_and_drain, setup=setup, rounds=3)
+
+    assert CountingLogWorker.handled == num_logs
+    benchmark.extra_info["logs_per_second"] = num_logs / benchmark.stats["mean"]
@@ -0,0 +1,93 @@
+import asyncio
+import datetime
+from typing import List
+
+import pytest
+import sqlalchemy as sa
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from syntask.server import models, schemas
+from syntask.server.database.dependencies import provide_database_interface
+from syntask.server.services.scheduler import Scheduler
+from syntask.settings import (
+    SYNTASK_API_SERVICES_SCHEDULER_COORDINATION_ENABLED,
+    SYNTASK_API_SERVICES_SCHEDULER_SHARDS,
+    temporary_settings,
+)
+
+NUM_DEPLOYMENTS = 500
+
+
+@pytest.mark.parametrize("replicas", [1, 2, 4])
+def bench_scheduler_replicas(benchmark: BenchmarkFixture, replicas: int):
+    """
+    Schedules runs for a set of deployments with scheduler coordination enabled,
+    running one loop of each replica concurrently.  The time reported is the time it
+    takes for all replicas to finish, and the throughput is reported in
+    `extra_info["deployments_per_second"]`.
+    """
+    db = provide_database_interface()
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(db.create_db())
+
+    async def create_deployments():
+        async with db.session_context(begin_transaction=True) as session:
+            flow = await models.flows.create_flow(
+                session=session, flow=schemas.core.Flow(name="bench-scheduler")
+            )
+            for i in range(NUM_DEPLOYMENTS):
+                await models.deployments.create_deployment(
+                    session=session,
+                    deployment=schemas.core.Deployment(
+                        name=f"bench-scheduler-{i}",
+                        flow_id=flow.id,
+                        schedules=[
+                            schemas.core.DeploymentSchedule(
+                                schedule=schemas.schedules.IntervalSchedule(
+                                    interval=datetime.timedelta(hours=1)
+                                ),
+                                active=True,
+                            )
+                        ],
+                    ),
+                )
+
+    async def clear_runs(schedulers: List[Scheduler]):
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(sa.delete(db.FlowRun))
+
+        # every replica takes its lease before any of them schedules
+        for scheduler in schedulers:
+            await scheduler._claim_shard_ranges()
+
+    async def schedule(schedulers: List[Scheduler]):
+        await asyncio.gather(*[scheduler.run_once() for scheduler in schedulers])
+
+    with temporary_settings(
+        {
+            SYNTASK_API_SERVICES_SCHEDULER_COORDINATION_ENABLED: True,
+            SYNTASK_API_SERVICES_SCHEDULER_SHARDS: 16,
+        }
+    ):
+        schedulers = [Scheduler() for _ in range(replicas)]
+
+        def setup():
+            loop.run_until_complete(clear_runs(schedulers))
+            return (schedulers,), {}
+
+        try:
+            loop.run_until_complete(create_deployments())
+            benchmark.pedantic(
+                lambda schedulers: loop.run_until_complete(schedule(schedulers)),
+                setup=setup,
+                rounds=3,
+            )
+        finally:
+            for scheduler in schedulers:
+                loop.run_until_complete(scheduler._on_stop())
+            loop.close()
+
+    benchmark.extra_info["replicas"] = replicas
+    benchmark.extra_info["deployments_per_second"] = (
+        NUM_DEPLOYMENTS / benchmark.stats["mean"]
+    )
@@ -0,0 +1,58 @@
+import asyncio
+import datetime
+
+import pendulum
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from syntask.server.schemas.schedules import (
+    CronSchedule,
+    IntervalSchedule,
+    RRuleSchedule,
+)
+
+NUM_DATES = 100
+
+START = pendulum.datetime(2024, 3, 1, tz="America/New_York")
+
+SCHEDULES = {
+    "interval-hourly": IntervalSchedule(
+        interval=datetime.timedelta(hours=1), timezone="America/New_York"
+    ),
+    "interval-daily": IntervalSchedule(
+        interval=datetime.timedelta(days=1), timezone="America/New_York"
+    ),
+    "cron-hourly": CronSchedule(cron="0 * * * *", timezone="America/New_York"),
+    "cron-weekdays": CronSchedule(cron="30 9 * * 1-5", timezone="America/New_York"),
+    "rrule-daily": RRuleSchedule(rrule="FREQ=DAILY", timezone="America/New_York"),
+}
+
+
+@pytest.mark.parametrize("schedule", SCHEDULES.keys())
+def bench_get_dates(benchmark: BenchmarkFixture, schedule: str):
+    """
+    Generates dates one at a time with `get_dates`, reporting the throughput in
+    `extra_info["dates_per_second"]`.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(
+            lambda: loop.run_until_complete(
+                SCHEDULES[schedule].get_dates(n=NUM_DATES, start=START)
+            )
+        )
+    finally:
+        loop.close()
+
+    benchmark.extra_info["dates_per_second"] = NUM_DATES / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("schedule", SCHEDULES.keys())
+def bench_get_dates_batch(benchmark: BenchmarkFixture, schedule: str):
+    """
+    Generates the same dates as `bench_get_dates` with `get_dates_batch`, reporting
+    the throughput in `extra_info["dates_per_second"]`.
+    """
+    benchmark(SCHEDULES[schedule].get_dates_batch, n=NUM_DATES, start=START)
+
+    benchmark.extra_info["dates_per_second"] = NUM_DATES / benchmark.stats["mean"]
@@ -0,0 +1,46 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from syntask import flow, task
+from syntask.task_runners import ProcessPoolTaskRunner, ThreadPoolTaskRunner
+
+np = pytest.importorskip("numpy")
+
+NUM_TASKS = 8
+
+
+@task
+def cpu_bound_task(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+@task
+def array_task(array) -> float:
+    return float((array * array).sum())
+
+
+@pytest.mark.parametrize(
+    "task_runner_cls", [ThreadPoolTaskRunner, ProcessPoolTaskRunner]
+)
+def bench_cpu_bound_tasks(benchmark: BenchmarkFixture, task_runner_cls):
+    @flow(task_runner=task_runner_cls(max_workers=4))
+    def benchmark_flow():
+        cpu_bound_task.map([2_000_000] * NUM_TASKS).result()
+
+    benchmark(benchmark_flow)
+
+
+@pytest.mark.parametrize(
+    "task_runner_cls", [ThreadPoolTaskRunner, ProcessPoolTaskRunner]
+)
+def bench_large_array_arguments(benchmark: BenchmarkFixture, task_runner_cls):
+    arrays = [np.random.rand(1_000_000) for _ in range(NUM_TASKS)]
+
+    @flow(task_runner=task_runner_cls(max_workers=4))
+    def benchmark_flow():
+        array_task.map(arrays).result()
+
+    benchmark(benchmark_flow)
@@ -149,9 +149,7 @@ class QueueService(abc.ABC, Generic[T]):
         log_interval = 4  # log every 4 seconds
 
         while True:
-            item: T = await self._queue_get_thread.submit(
-                create_call(self._queue.get)
-            ).aresult()
+            item: T = await self._get_item()
 
             if self._stopped:
                 current_time = asyncio.get_event_loop().time()
@@ -182,6 +180,23 @@ class QueueService(abc.ABC, Generic[T]):
             finally:
                 self._queue.task_done()
 
+    async def _get_item(self, timeout: Optional[float] = None) -> Optional[T]:
+        """
+        Get the next item from the queue.
+
+        Items that are already available are taken directly; the helper thread is
+        only used to wait for the queue when it is empty, so a backlog of items is
+        drained without a thread handoff per item.
+
+        Raises `queue.Empty` if no item arrives within the timeout.
+        """
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return await self._queue_get_thread.submit(
+                create_call(self._queue.get, timeout=timeout)
+            ).aresult()
+
     @abc.abstractmethod
     async def _handle(self, item: T):
         """
@@ -298,7 +313,8 @@ class BatchedQueueService(QueueService[T]):
     A queue service that handles a batch of items instead of a single item at a time.
 
     Items will be processed when the batch reaches the configured `_max_batch_size`
-    or after an interval of `_min_interval` seconds (if set).
+    or after an interval of `_min_interval` seconds (if set). Items that are already
+    queued are added to the batch as soon as the service wakes up.
     """
 
     _max_batch_size: int
@@ -311,27 +327,30 @@ class BatchedQueueService(QueueService[T]):
             batch = []
             batch_size = 0
 
+            # Checking the log level is not free, so only check it once per batch
+            log_items = logger.isEnabledFor(logging.DEBUG)
+
             # Pull items from the queue until we reach the batch size
             deadline = get_deadline(self._min_interval)
             while batch_size < self._max_batch_size:
                 try:
-                    item = await self._queue_get_thread.submit(
-                        create_call(self._queue.get, timeout=get_timeout(deadline))
-                    ).aresult()
+                    item = await self._get_item(timeout=get_timeout(deadline))
 
                     if item is None:
                         done = True
+                        self._queue.task_done()
                         break
 
                     batch.append(item)
                     batch_size += self._get_size(item)
-                    logger.debug(
-                        "Service %r added item %r to batch (size %s/%s)",
-                        self,
-                        item,
-                        batch_size,
-                        self._max_batch_size,
-                    )
+                    if log_items:
+                        logger.debug(
+                            "Service %r added item %r to batch (size %s/%s)",
+                            self,
+                            item,
+                            batch_size,
+                            self._max_batch_size,
+                        )
                 except queue.Empty:
                     # Process the batch after `min_interval` even if it is smaller than
                     # the batch size
@@ -355,6 +374,9 @@ class BatchedQueueService(QueueService[T]):
                     batch_size,
                     exc_info=log_traceback,
                 )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
 
     @abc.abstractmethod
     async def _handle_batch(self, items: List[T]):
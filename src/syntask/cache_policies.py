@@ -6,8 +6,13 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional,
 
 from typing_extensions import Self
 
-from syntask.context import TaskRunContext
-from syntask.utilities.hashing import hash_objects
+from syntask.context import FlowRunContext, TaskRunContext
+from syntask.utilities.hashing import (
+    get_hash_algorithm,
+    hash_objects,
+    json_hash,
+    stream_hash,
+)
 
 if TYPE_CHECKING:
     from syntask.filesystems import WritableFileSystem
@@ -271,9 +276,20 @@ class RunId(CachePolicy):
 class Inputs(CachePolicy):
     """
     Policy that computes a cache key based on a hash of the runtime inputs provided to the task..
+
+    Inputs that cannot be serialized to JSON are streamed into the hash piece by
+    piece; see `syntask.utilities.hashing.stream_hash`. Within a flow run, the
+    digests of read-only buffers are memoized by object identity until the
+    buffers are garbage collected.
+
+    Attributes:
+        exclude: names of inputs to leave out of the cache key
+        hash_algorithm: the hash algorithm to use; one of `md5`, `sha256`,
+            `blake2b` or `xxhash`
     """
 
     exclude: List[str] = field(default_factory=list)
+    hash_algorithm: str = "md5"
 
     def compute_key(
         self,
@@ -293,12 +309,22 @@ class Inputs(CachePolicy):
             if key not in exclude:
                 hashed_inputs[key] = val
 
-        return hash_objects(hashed_inputs)
+        hash_algo = get_hash_algorithm(self.hash_algorithm)
+        flow_run_context = FlowRunContext.get()
+        memo = flow_run_context.input_hashes if flow_run_context else None
+
+        # hashed in the same shape as `hash_objects(hashed_inputs)`
+        objects = ((hashed_inputs,), {})
+        return json_hash(objects, hash_algo=hash_algo) or stream_hash(
+            objects, hash_algo=hash_algo, memo=memo
+        )
 
     def __sub__(self, other: str) -> "CachePolicy":
         if not isinstance(other, str):
             raise TypeError("Can only subtract strings from key policies.")
-        return Inputs(exclude=self.exclude + [other])
+        return Inputs(
+            exclude=self.exclude + [other], hash_algorithm=self.hash_algorithm
+        )
 
 
 INPUTS = Inputs()
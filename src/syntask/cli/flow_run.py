@@ -2,11 +2,13 @@
 Command line interface for working with flow runs
 """
 
+import asyncio
 import logging
 import os
 from typing import List, Optional
 from uuid import UUID
 
+import anyio
 import httpx
 import pendulum
 import typer
@@ -20,7 +22,7 @@ from syntask.cli._utilities import exit_with_error, exit_with_success
 from syntask.cli.root import app, is_interactive
 from syntask.client.orchestration import get_client
 from syntask.client.schemas.filters import FlowFilter, FlowRunFilter, LogFilter
-from syntask.client.schemas.objects import StateType
+from syntask.client.schemas.objects import Log, StateType
 from syntask.client.schemas.responses import SetStateStatus
 from syntask.client.schemas.sorting import FlowRunSort, LogSort
 from syntask.exceptions import ObjectNotFound
@@ -33,6 +35,8 @@ app.add_typer(flow_run_app, aliases=["flow-runs"])
 
 LOGS_DEFAULT_PAGE_SIZE = 200
 LOGS_WITH_LIMIT_FLAG_DEFAULT_NUM_LOGS = 20
+LOGS_FOLLOW_POLL_INTERVAL = 1.0
+LOGS_FOLLOW_GRACE_PERIOD = 5.0
 
 logger = get_logger(__name__)
 
@@ -253,6 +257,12 @@ async def logs(
             " all logs."
         ),
     ),
+    follow: bool = typer.Option(
+        False,
+        "--follow",
+        "-f",
+        help="Keep showing new logs until the flow run finishes.",
+    ),
 ):
     """
     View logs for a flow run.
@@ -272,11 +282,17 @@ async def logs(
         else None
     )
 
+    if follow and (reverse or (user_specified_num_logs and not tail)):
+        exit_with_error(
+            "The `follow` option can only be combined with the `tail` option."
+        )
+
     # if using tail update offset according to LOGS_DEFAULT_PAGE_SIZE
     if tail:
         offset = max(0, user_specified_num_logs - LOGS_DEFAULT_PAGE_SIZE)
 
     log_filter = LogFilter(flow_run_id={"any_": [id]})
+    last_log: Optional[Log] = None
 
     async with get_client() as client:
         # Get the flow run
@@ -285,6 +301,27 @@ async def logs(
         except ObjectNotFound:
             exit_with_error(f"Flow run {str(id)!r} not found!")
 
+        def print_log(log: Log):
+            nonlocal last_log
+            last_log = log
+
+            # Print following the flow run format (declared in logging.yml)
+            timestamp = f"{log.timestamp:%Y-%m-%d %H:%M:%S.%f}"[:-3]
+            log_level = f"{logging.getLevelName(log.level):7s}"
+            flow_run_info = f"Flow run {flow_run.name!r} - {escape(log.message)}"
+
+            log_message = f"{timestamp} | {log_level} | {flow_run_info}"
+            app.console.print(
+                log_message,
+                soft_wrap=True,
+            )
+
+        # All logs are streamed in a single request instead of a page at a time
+        if user_specified_num_logs is None and not reverse:
+            async for log in client.stream_logs(log_filter=log_filter):
+                print_log(log)
+            more_logs = False
+
         while more_logs:
             num_logs_to_return_from_page = (
                 LOGS_DEFAULT_PAGE_SIZE
@@ -305,16 +342,7 @@ async def logs(
             )
 
             for log in reversed(page_logs) if tail and not reverse else page_logs:
-                # Print following the flow run format (declared in logging.yml)
-                timestamp = f"{log.timestamp:%Y-%m-%d %H:%M:%S.%f}"[:-3]
-                log_level = f"{logging.getLevelName(log.level):7s}"
-                flow_run_info = f"Flow run {flow_run.name!r} - {escape(log.message)}"
-
-                log_message = f"{timestamp} | {log_level} | {flow_run_info}"
-                app.console.print(
-                    log_message,
-                    soft_wrap=True,
-                )
+                print_log(log)
 
             # Update the number of logs retrieved
             num_logs_returned += num_logs_to_return_from_page
@@ -337,6 +365,31 @@ async def logs(
                     # No more logs to show, exit
                     more_logs = False
 
+        if not follow:
+            return
+
+        async def follow_logs():
+            async for log in client.stream_logs(
+                log_filter=log_filter,
+                after=last_log,
+                follow=True,
+                poll_interval=LOGS_FOLLOW_POLL_INTERVAL,
+            ):
+                print_log(log)
+
+        # Stream the logs written since the last one shown until the flow run has
+        # finished.  Logs are sent to the API in batches, so the last logs of a flow
+        # run may arrive shortly after it has finished.
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(follow_logs)
+
+            while flow_run.state is None or not flow_run.state.is_final():
+                await asyncio.sleep(LOGS_FOLLOW_POLL_INTERVAL)
+                flow_run = await client.read_flow_run(id)
+
+            await asyncio.sleep(LOGS_FOLLOW_GRACE_PERIOD)
+            tg.cancel_scope.cancel()
+
 
 @flow_run_app.command()
 async def execute(
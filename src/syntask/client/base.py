@@ -1,7 +1,9 @@
+import asyncio
 import copy
 import sys
 import threading
 import time
+import urllib.request
 import uuid
 from collections import defaultdict
 from contextlib import asynccontextmanager
@@ -30,6 +32,7 @@ from typing_extensions import Self
 
 import syntask
 from syntask.client import constants
+from syntask.client.cache import RESPONSE_CACHE
 from syntask.client.schemas.objects import CsrfToken
 from syntask.exceptions import SyntaskHTTPStatusError
 from syntask.logging import get_logger
@@ -52,6 +55,20 @@ APP_LIFESPANS_REF_COUNTS: Dict[Tuple[int, int], int] = {}
 # identity.
 APP_LIFESPANS_LOCKS: Dict[int, anyio.Lock] = defaultdict(anyio.Lock)
 
+# Connection pools shared by clients when SYNTASK_CLIENT_SHARED_CONNECTION_POOL_ENABLED
+# is set, keyed by the API origin and the pool settings. Async pools are kept per event
+# loop, keyed by the loop's id, since their connections cannot be used from another
+# loop; the pools of closed loops are dropped whenever an async pool is looked up.
+# Sync pools are threadsafe and shared across threads. Metrics are keyed by the API
+# origin.
+SHARED_ASYNC_TRANSPORTS: Dict[
+    int,
+    Tuple[asyncio.AbstractEventLoop, "Dict[Tuple[Any, ...], SharedAsyncHTTPTransport]"],
+] = {}
+SHARED_TRANSPORTS: "Dict[Tuple[Any, ...], SharedHTTPTransport]" = {}
+CONNECTION_POOL_METRICS: "Dict[str, ConnectionPoolMetrics]" = {}
+SHARED_TRANSPORTS_LOCK = threading.Lock()
+
 
 logger = get_logger("client")
 
@@ -153,6 +170,239 @@ async def app_lifespan_context(app: ASGIApp) -> AsyncGenerator[None, None]:
                     await context.__aexit__(*exc_info)
 
 
+class ConnectionPoolMetrics:
+    """
+    Counters for the requests sent through the shared connection pools for one API
+    origin, used to tell how often requests reuse a connection and how long they wait
+    to get one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests: int = 0
+        self.new_connections: int = 0
+        self.connection_wait_seconds: float = 0.0
+
+    def record(self, new_connection: bool, wait_seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.new_connections += int(new_connection)
+            self.connection_wait_seconds += wait_seconds
+
+    @property
+    def reuse_ratio(self) -> float:
+        """The fraction of requests that were sent on an existing connection."""
+        if not self.requests:
+            return 0.0
+        return 1 - self.new_connections / self.requests
+
+    @property
+    def mean_connection_wait_seconds(self) -> float:
+        """The average time a request waited to be sent on a connection."""
+        if not self.requests:
+            return 0.0
+        return self.connection_wait_seconds / self.requests
+
+
+class _ConnectionTrace:
+    """
+    Follows the httpcore trace events of a single request to find out whether it
+    opened a new connection and how long it took before its headers could be sent.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.new_connection = False
+        self.wait_seconds: Optional[float] = None
+
+    def observe(self, event_name: str) -> None:
+        if event_name.startswith("connection.connect_"):
+            self.new_connection = True
+        elif (
+            event_name.endswith(".send_request_headers.started")
+            and self.wait_seconds is None
+        ):
+            self.wait_seconds = time.monotonic() - self.started
+
+
+class SharedAsyncHTTPTransport(httpx.AsyncBaseTransport):
+    """
+    An async transport that sends requests through a connection pool shared by every
+    client of the same API origin on the same event loop.
+
+    Closing this transport does not close the pool, since other clients may still be
+    using its connections; the pool is dropped once its event loop has been closed.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncHTTPTransport, metrics: ConnectionPoolMetrics
+    ) -> None:
+        self._transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: Request) -> Response:
+        trace = _ConnectionTrace()
+        downstream = request.extensions.get("trace")
+
+        async def on_trace(event_name: str, info: Dict[str, Any]) -> None:
+            trace.observe(event_name)
+            if downstream:
+                await downstream(event_name, info)
+
+        # replace rather than update the extensions, since a retried request is sent
+        # again with the same extensions
+        request.extensions = {**request.extensions, "trace": on_trace}
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            if trace.wait_seconds is not None:
+                self.metrics.record(trace.new_connection, trace.wait_seconds)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class SharedHTTPTransport(httpx.BaseTransport):
+    """
+    A transport that sends requests through a connection pool shared by every sync
+    client of the same API origin, across threads.
+
+    Closing this transport does not close the pool, since other clients may still be
+    using its connections.
+    """
+
+    def __init__(
+        self, transport: httpx.HTTPTransport, metrics: ConnectionPoolMetrics
+    ) -> None:
+        self._transport = transport
+        self.metrics = metrics
+
+    def handle_request(self, request: Request) -> Response:
+        trace = _ConnectionTrace()
+        downstream = request.extensions.get("trace")
+
+        def on_trace(event_name: str, info: Dict[str, Any]) -> None:
+            trace.observe(event_name)
+            if downstream:
+                downstream(event_name, info)
+
+        # replace rather than update the extensions, since a retried request is sent
+        # again with the same extensions
+        request.extensions = {**request.extensions, "trace": on_trace}
+        try:
+            return self._transport.handle_request(request)
+        finally:
+            if trace.wait_seconds is not None:
+                self.metrics.record(trace.new_connection, trace.wait_seconds)
+
+    def close(self) -> None:
+        pass
+
+
+def _connection_pool_key(
+    api: str, verify: Any, http2: bool, limits: httpx.Limits
+) -> Tuple[Any, ...]:
+    return (
+        str(httpx.URL(api).copy_with(path="/", query=None, fragment=None)),
+        verify if isinstance(verify, (bool, str)) else id(verify),
+        http2,
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+    )
+
+
+def get_connection_pool_metrics(api: str) -> ConnectionPoolMetrics:
+    """
+    Returns the metrics of the shared connection pools for the origin of the given
+    API URL, which are collected when `SYNTASK_CLIENT_SHARED_CONNECTION_POOL_ENABLED`
+    is set.
+    """
+    origin = str(httpx.URL(api).copy_with(path="/", query=None, fragment=None))
+    with SHARED_TRANSPORTS_LOCK:
+        return CONNECTION_POOL_METRICS.setdefault(origin, ConnectionPoolMetrics())
+
+
+def can_share_transport(api: str, httpx_settings: Dict[str, Any]) -> bool:
+    """
+    Returns whether a client of the given API with the given httpx settings can use
+    the shared transports.
+
+    Those connect directly to the API, so they can't be used by clients that bring
+    their own transport, connect through a proxy, or present a client certificate.
+    Providing a transport also keeps httpx from reading proxies from the
+    environment, so a client that would use one doesn't share either.
+    """
+    if any(
+        httpx_settings.get(setting)
+        for setting in ("transport", "mounts", "proxy", "proxies", "cert")
+    ):
+        return False
+
+    if httpx_settings.get("trust_env", True):
+        environment_proxies = urllib.request.getproxies()
+        if httpx.URL(api).scheme in environment_proxies or (
+            "all" in environment_proxies
+        ):
+            return False
+
+    return True
+
+
+def get_shared_async_transport(
+    api: str, verify: Any, http2: bool, limits: httpx.Limits
+) -> Optional[SharedAsyncHTTPTransport]:
+    """
+    Returns the async transport shared by clients of the given API on the running
+    event loop, creating it if needed. Returns `None` if no event loop is running,
+    since connections cannot be shared without knowing which loop will use them.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    key = _connection_pool_key(api, verify, http2, limits)
+    with SHARED_TRANSPORTS_LOCK:
+        # The connections of a closed loop can never be used again
+        for loop_id, (pool_loop, _) in list(SHARED_ASYNC_TRANSPORTS.items()):
+            if pool_loop.is_closed():
+                del SHARED_ASYNC_TRANSPORTS[loop_id]
+
+        _, transports = SHARED_ASYNC_TRANSPORTS.setdefault(id(loop), (loop, {}))
+        if key not in transports:
+            transports[key] = SharedAsyncHTTPTransport(
+                httpx.AsyncHTTPTransport(
+                    verify=verify, http2=http2, limits=limits, retries=3
+                ),
+                metrics=CONNECTION_POOL_METRICS.setdefault(
+                    key[0], ConnectionPoolMetrics()
+                ),
+            )
+        return transports[key]
+
+
+def get_shared_transport(
+    api: str, verify: Any, http2: bool, limits: httpx.Limits
+) -> SharedHTTPTransport:
+    """
+    Returns the sync transport shared by clients of the given API in this process,
+    creating it if needed.
+    """
+    key = _connection_pool_key(api, verify, http2, limits)
+    with SHARED_TRANSPORTS_LOCK:
+        if key not in SHARED_TRANSPORTS:
+            SHARED_TRANSPORTS[key] = SharedHTTPTransport(
+                httpx.HTTPTransport(
+                    verify=verify, http2=http2, limits=limits, retries=3
+                ),
+                metrics=CONNECTION_POOL_METRICS.setdefault(
+                    key[0], ConnectionPoolMetrics()
+                ),
+            )
+        return SHARED_TRANSPORTS[key]
+
+
 class SyntaskResponse(httpx.Response):
     """
     A Syntask wrapper for the `httpx.Response` class.
@@ -183,6 +433,10 @@ class SyntaskResponse(httpx.Response):
         """
         new_response = copy.copy(response)
         new_response.__class__ = cls
+        # Copying a response drops its stream, so streamed content that has not been
+        # read yet would be lost
+        new_response.stream = response.stream
+        new_response.is_closed = response.is_closed
         return new_response
 
 
@@ -353,6 +607,9 @@ class SyntaskHttpxAsyncClient(httpx.AsyncClient):
             ),
         )
 
+        # Drop cached reads of anything this request may have changed
+        RESPONSE_CACHE.invalidate_for_request(request.method, str(request.url))
+
         # Convert to a Syntask response to add nicer errors messages
         response = SyntaskResponse.from_httpx_response(response)
 
@@ -567,6 +824,9 @@ class SyntaskHttpxSyncClient(httpx.Client):
             ),
         )
 
+        # Drop cached reads of anything this request may have changed
+        RESPONSE_CACHE.invalidate_for_request(request.method, str(request.url))
+
         # Convert to a Syntask response to add nicer errors messages
         response = SyntaskResponse.from_httpx_response(response)
 
@@ -0,0 +1,115 @@
+"""
+A process-wide cache of the API responses for objects that clients read repeatedly,
+such as flows, deployments and work pools.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from syntask.settings import SYNTASK_CLIENT_CACHE_MAX_SIZE
+
+# The final path segments of POST endpoints that read objects rather than change
+# them, or that only change objects that are not cached
+READ_ONLY_POST_ACTIONS = {
+    "filter",
+    "count",
+    "paginate",
+    "history",
+    "get_runs",
+    "get_scheduled_flow_runs",
+    "claim_scheduled_flow_runs",
+}
+
+
+class CachedResponse:
+    """
+    The JSON body of a cached response, with the ETag the API sent for it.
+    """
+
+    def __init__(self, data: Any, etag: Optional[str]) -> None:
+        self.data = data
+        self.etag = etag
+        self.fetched_at = time.monotonic()
+
+    @property
+    def age(self) -> float:
+        """The number of seconds since the response was fetched or revalidated."""
+        return time.monotonic() - self.fetched_at
+
+
+class ResponseCache:
+    """
+    A threadsafe LRU cache of the JSON bodies of API responses, keyed by URL and by
+    the credentials they were read with, so that clients with different credentials
+    never see each other's responses.
+
+    Clients serve a cached body without a request until it is older than
+    `SYNTASK_CLIENT_CACHE_TTL`, then revalidate it with the API using its ETag, so an
+    object that has not changed is not sent again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], CachedResponse]" = (
+            OrderedDict()
+        )
+
+    def get(
+        self, url: str, credentials: Optional[str] = None
+    ) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get((url, credentials))
+            if entry is not None:
+                self._entries.move_to_end((url, credentials))
+            return entry
+
+    def set(
+        self,
+        url: str,
+        data: Any,
+        etag: Optional[str],
+        credentials: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._entries[(url, credentials)] = CachedResponse(data, etag)
+            self._entries.move_to_end((url, credentials))
+            while len(self._entries) > SYNTASK_CLIENT_CACHE_MAX_SIZE.value():
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Removes the responses for the given URL and for the URLs above and below it,
+        so that a change to `/deployments/<id>/schedules` also drops the cached
+        `/deployments/<id>`. Removes every response if no URL is given.
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                return
+
+            for key in list(self._entries):
+                cached_url = key[0]
+                if cached_url.startswith(url) or url.startswith(
+                    cached_url.split("?", 1)[0]
+                ):
+                    del self._entries[key]
+
+    def invalidate_for_request(self, method: str, url: str) -> None:
+        """
+        Removes the responses that a request with the given method and URL may have
+        changed, for every set of credentials.
+
+        A POST to a collection, e.g. `/deployments/`, creates or updates an object in
+        it, so every cached response in the collection is removed.
+        """
+        if method in ("PUT", "PATCH", "DELETE"):
+            self.invalidate(url)
+        elif method == "POST":
+            action = url.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+            if action not in READ_ONLY_POST_ACTIONS:
+                self.invalidate(url)
+
+
+RESPONSE_CACHE = ResponseCache()
@@ -1,10 +1,12 @@
 import asyncio
 import datetime
+import hashlib
 import warnings
 from contextlib import AsyncExitStack
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Dict,
     Iterable,
     List,
@@ -130,7 +132,12 @@ from syntask.settings import (
     SYNTASK_API_SSL_CERT_FILE,
     SYNTASK_API_TLS_INSECURE_SKIP_VERIFY,
     SYNTASK_API_URL,
+    SYNTASK_CLIENT_CACHE_TTL,
     SYNTASK_CLIENT_CSRF_SUPPORT_ENABLED,
+    SYNTASK_CLIENT_KEEPALIVE_EXPIRY,
+    SYNTASK_CLIENT_MAX_CONNECTIONS,
+    SYNTASK_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+    SYNTASK_CLIENT_SHARED_CONNECTION_POOL_ENABLED,
     SYNTASK_CLOUD_API_URL,
     SYNTASK_SERVER_ALLOW_EPHEMERAL_MODE,
     SYNTASK_UNIT_TEST_MODE,
@@ -146,7 +153,11 @@ from syntask.client.base import (
     SyntaskHttpxAsyncClient,
     SyntaskHttpxSyncClient,
     app_lifespan_context,
+    can_share_transport,
+    get_shared_async_transport,
+    get_shared_transport,
 )
+from syntask.client.cache import RESPONSE_CACHE
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -321,11 +332,13 @@ class SyntaskClient:
                 httpx.Limits(
                     # We see instability when allowing the client to open many connections at once.
                     # Limiting concurrency results in more stable performance.
-                    max_connections=16,
-                    max_keepalive_connections=8,
+                    max_connections=SYNTASK_CLIENT_MAX_CONNECTIONS.value(),
+                    max_keepalive_connections=(
+                        SYNTASK_CLIENT_MAX_KEEPALIVE_CONNECTIONS.value()
+                    ),
                     # The Syntask Cloud LB will keep connections alive for 30s.
-                    # Only allow the client to keep connections alive for 25s.
-                    keepalive_expiry=25,
+                    # By default, only allow the client to keep them alive for 25s.
+                    keepalive_expiry=SYNTASK_CLIENT_KEEPALIVE_EXPIRY.value(),
                 ),
             )
 
@@ -336,6 +349,21 @@ class SyntaskClient:
             # client will use a standard HTTP/1.1 connection instead.
             httpx_settings.setdefault("http2", SYNTASK_API_ENABLE_HTTP2.value())
 
+            # Share connections with the other clients of this API; the shared
+            # transport already retries connecting 3 times, so it is not altered below
+            if (
+                SYNTASK_CLIENT_SHARED_CONNECTION_POOL_ENABLED.value()
+                and can_share_transport(api, httpx_settings)
+            ):
+                transport = get_shared_async_transport(
+                    api,
+                    verify=httpx_settings["verify"],
+                    http2=httpx_settings["http2"],
+                    limits=httpx_settings["limits"],
+                )
+                if transport:
+                    httpx_settings["transport"] = transport
+
             if server_type:
                 self.server_type = server_type
             else:
@@ -426,6 +454,67 @@ class SyntaskClient:
         """
         return self._client.base_url
 
+    def invalidate_cache(self, path: Optional[str] = None) -> None:
+        """
+        Removes the responses read with `use_cache=True` for the given API path, and
+        for the paths above and below it, from the client cache. If no path is given,
+        removes every cached response for this API.
+
+        Responses are invalidated automatically when this process changes an object
+        through the API; changes made elsewhere are seen once the cached response is
+        older than `SYNTASK_CLIENT_CACHE_TTL`.
+        """
+        if path is None:
+            RESPONSE_CACHE.invalidate(str(self._client.base_url))
+        else:
+            RESPONSE_CACHE.invalidate(str(self._client.build_request("GET", path).url))
+
+    async def _get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+    ) -> Any:
+        """
+        Sends a GET request to the given API path and returns the JSON response body.
+
+        If `use_cache` is set, the body is read through the client cache: a cached
+        body is returned without a request until it is older than
+        `SYNTASK_CLIENT_CACHE_TTL`, and is then revalidated with its ETag.
+        """
+        if not use_cache:
+            response = await self._client.get(path, params=params)
+            return response.json()
+
+        url = str(self._client.build_request("GET", path, params=params).url)
+        credentials = self._cache_credentials()
+        cached = RESPONSE_CACHE.get(url, credentials)
+        if cached and cached.age < SYNTASK_CLIENT_CACHE_TTL.value():
+            return cached.data
+
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+        try:
+            response = await self._client.get(path, params=params, headers=headers)
+        except httpx.HTTPStatusError as e:
+            if cached and e.response.status_code == status.HTTP_304_NOT_MODIFIED:
+                RESPONSE_CACHE.set(url, cached.data, cached.etag, credentials)
+                return cached.data
+            raise
+
+        data = response.json()
+        RESPONSE_CACHE.set(url, data, response.headers.get("ETag"), credentials)
+        return data
+
+    def _cache_credentials(self) -> Optional[str]:
+        """
+        Returns a digest of the credentials this client sends, which the client
+        cache uses to keep the responses read with different credentials apart.
+        """
+        authorization = self._client.headers.get("Authorization")
+        if authorization is None:
+            return None
+        return hashlib.sha256(authorization.encode()).hexdigest()
+
     # API methods ----------------------------------------------------------------------
 
     async def api_healthcheck(self) -> Optional[Exception]:
@@ -487,18 +576,20 @@ class SyntaskClient:
         # Return the id of the created flow
         return UUID(flow_id)
 
-    async def read_flow(self, flow_id: UUID) -> Flow:
+    async def read_flow(self, flow_id: UUID, use_cache: bool = False) -> Flow:
         """
         Query the Syntask API for a flow by id.
 
         Args:
             flow_id: the flow ID of interest
+            use_cache: whether to read the flow through the client cache
 
         Returns:
             a [Flow model][syntask.client.schemas.objects.Flow] representation of the flow
         """
-        response = await self._client.get(f"/flows/{flow_id}")
-        return Flow.model_validate(response.json())
+        return Flow.model_validate(
+            await self._get_json(f"/flows/{flow_id}", use_cache=use_cache)
+        )
 
     async def read_flows(
         self,
@@ -1491,6 +1582,7 @@ class SyntaskClient:
         self,
         block_document_id: UUID,
         include_secrets: bool = True,
+        use_cache: bool = False,
     ):
         """
         Read the block document with the specified ID.
@@ -1503,6 +1595,7 @@ class SyntaskClient:
                 by Pydantic, but users can additionally choose not to receive
                 their values from the API. Note that any business logic on the
                 Block may not work if this is `False`.
+            use_cache: whether to read the block document through the client cache
 
         Raises:
             httpx.RequestError: if the block document was not found for any reason
@@ -1514,16 +1607,17 @@ class SyntaskClient:
             block_document_id is not None
         ), "Unexpected ID on block document. Was it persisted?"
         try:
-            response = await self._client.get(
+            data = await self._get_json(
                 f"/block_documents/{block_document_id}",
                 params=dict(include_secrets=include_secrets),
+                use_cache=use_cache,
             )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == status.HTTP_404_NOT_FOUND:
                 raise syntask.exceptions.ObjectNotFound(http_exc=e) from e
             else:
                 raise
-        return BlockDocument.model_validate(response.json())
+        return BlockDocument.model_validate(data)
 
     async def read_block_document_by_name(
         self,
@@ -1765,12 +1859,14 @@ class SyntaskClient:
     async def read_deployment(
         self,
         deployment_id: UUID,
+        use_cache: bool = False,
     ) -> DeploymentResponse:
         """
         Query the Syntask API for a deployment by id.
 
         Args:
             deployment_id: the deployment ID of interest
+            use_cache: whether to read the deployment through the client cache
 
         Returns:
             a [Deployment model][syntask.client.schemas.objects.Deployment] representation of the deployment
@@ -1782,13 +1878,15 @@ class SyntaskClient:
                 raise ValueError(f"Invalid deployment ID: {deployment_id}")
 
         try:
-            response = await self._client.get(f"/deployments/{deployment_id}")
+            data = await self._get_json(
+                f"/deployments/{deployment_id}", use_cache=use_cache
+            )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == status.HTTP_404_NOT_FOUND:
                 raise syntask.exceptions.ObjectNotFound(http_exc=e) from e
             else:
                 raise
-        return DeploymentResponse.model_validate(response.json())
+        return DeploymentResponse.model_validate(data)
 
     async def read_deployment_by_name(
         self,
@@ -2390,6 +2488,44 @@ class SyntaskClient:
         )
         return OrchestrationResult.model_validate(response.json())
 
+    async def set_task_run_states(
+        self,
+        task_run_states: Iterable[Tuple[UUID, syntask.states.State]],
+        force: bool = False,
+    ) -> List[OrchestrationResult]:
+        """
+        Set the states of many task runs with a single request.
+
+        All transitions are orchestrated by the Syntask API in one transaction.
+
+        Args:
+            task_run_states: pairs of task run ids and the states to set
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Syntask API to accept the states
+
+        Returns:
+            a list of OrchestrationResult model representations of state orchestration
+                output, in the same order as the given states
+        """
+        payload = []
+        for task_run_id, state in task_run_states:
+            state_create = state.to_state_create()
+            state_create.state_details.task_run_id = task_run_id
+            payload.append(
+                dict(
+                    task_run_id=str(task_run_id),
+                    state=state_create.model_dump(mode="json"),
+                )
+            )
+
+        response = await self._client.post(
+            "/task_runs/set_states",
+            json=dict(task_run_states=payload, force=force),
+        )
+        return pydantic.TypeAdapter(List[OrchestrationResult]).validate_python(
+            response.json()
+        )
+
     async def read_task_run_states(
         self, task_run_id: UUID
     ) -> List[syntask.states.State]:
@@ -2587,6 +2723,90 @@ class SyntaskClient:
         response = await self._client.post("/logs/filter", json=body)
         return pydantic.TypeAdapter(List[Log]).validate_python(response.json())
 
+    async def stream_logs(
+        self,
+        log_filter: Optional[LogFilter] = None,
+        after: Optional[Log] = None,
+        follow: bool = False,
+        poll_interval: float = 1.0,
+        lookback: datetime.timedelta = datetime.timedelta(seconds=10),
+    ) -> AsyncGenerator[Log, None]:
+        """
+        Stream flow and task run logs in order of their timestamp.
+
+        Logs are streamed from the API in a single response, so all matching logs
+        can be read without paging through them.
+
+        Args:
+            log_filter: only stream logs that match these filters
+            after: the log to start after; if not provided, logs are streamed from
+                the first one
+            follow: if `True`, keep polling for new logs every `poll_interval`
+                seconds once all existing logs have been streamed
+            poll_interval: the number of seconds between polls when following
+            lookback: when following, each poll re-reads the logs with a timestamp
+                up to this long before that of the newest log streamed, so that logs
+                which reach the API after newer ones are still streamed.  Logs
+                arriving later than this are not included.
+
+        Yields:
+            Each matching log.  When following, logs that arrive late may be yielded
+            after logs with a newer timestamp.
+        """
+        cursor = (after.timestamp, after.id) if after else None
+        newest: Optional[datetime.datetime] = after.timestamp if after else None
+        # The IDs and timestamps of the logs streamed within the lookback window, in
+        # the order they were streamed, so that they are not yielded again when the
+        # window is re-read
+        seen: Dict[UUID, datetime.datetime] = {}
+
+        while True:
+            body = {
+                "logs": log_filter.model_dump(mode="json") if log_filter else None,
+                "after_timestamp": cursor[0].isoformat() if cursor else None,
+                "after_id": str(cursor[1]) if cursor else None,
+            }
+            async with self._client.stream(
+                "POST", "/logs/stream", json=body
+            ) as response:
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+
+                    log = Log.model_validate_json(line)
+                    if log.id in seen:
+                        continue
+                    if newest is None or log.timestamp > newest:
+                        newest = log.timestamp
+                    if follow:
+                        seen[log.id] = log.timestamp
+                        # Forget logs as they leave the window, so that catching up
+                        # on a long history only remembers the logs of the window
+                        while seen:
+                            log_id, timestamp = next(iter(seen.items()))
+                            if timestamp >= newest - lookback:
+                                break
+                            del seen[log_id]
+                    yield log
+
+            if not follow:
+                return
+
+            if newest is not None:
+                # Re-read from the start of the lookback window, but never from
+                # before the log the caller asked to start after
+                window = (newest - lookback, UUID(int=0))
+                cursor = max(cursor, window) if cursor else window
+                # Logs that arrived late may sit behind newer ones, so the whole
+                # window is checked once per poll
+                seen = {
+                    log_id: timestamp
+                    for log_id, timestamp in seen.items()
+                    if timestamp >= window[0]
+                }
+
+            await asyncio.sleep(poll_interval)
+
     async def send_worker_heartbeat(
         self,
         work_pool_name: str,
@@ -2640,20 +2860,25 @@ class SyntaskClient:
 
         return pydantic.TypeAdapter(List[Worker]).validate_python(response.json())
 
-    async def read_work_pool(self, work_pool_name: str) -> WorkPool:
+    async def read_work_pool(
+        self, work_pool_name: str, use_cache: bool = False
+    ) -> WorkPool:
         """
         Reads information for a given work pool
 
         Args:
             work_pool_name: The name of the work pool to for which to get
                 information.
+            use_cache: whether to read the work pool through the client cache
 
         Returns:
             Information about the requested work pool.
         """
         try:
-            response = await self._client.get(f"/work_pools/{work_pool_name}")
-            return WorkPool.model_validate(response.json())
+            data = await self._get_json(
+                f"/work_pools/{work_pool_name}", use_cache=use_cache
+            )
+            return WorkPool.model_validate(data)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == status.HTTP_404_NOT_FOUND:
                 raise syntask.exceptions.ObjectNotFound(http_exc=e) from e
@@ -2839,11 +3064,27 @@ class SyntaskClient:
             response.json()
         )
 
+    def _long_poll_timeout(self, wait_seconds: Optional[float]) -> httpx.Timeout:
+        """
+        Returns the timeout for a request that the server may hold for up to
+        `wait_seconds`, which allows the usual time for a response on top of the wait.
+        """
+        timeout = self._client.timeout
+        if not wait_seconds or timeout.read is None:
+            return timeout
+        return httpx.Timeout(
+            connect=timeout.connect,
+            read=timeout.read + wait_seconds,
+            write=timeout.write,
+            pool=timeout.pool,
+        )
+
     async def get_scheduled_flow_runs_for_work_pool(
         self,
         work_pool_name: str,
         work_queue_names: Optional[List[str]] = None,
         scheduled_before: Optional[datetime.datetime] = None,
+        wait_seconds: Optional[float] = None,
     ) -> List[WorkerFlowRunResponse]:
         """
         Retrieves scheduled flow runs for the provided set of work pool queues.
@@ -2855,6 +3096,9 @@ class SyntaskClient:
                 to get scheduled flow runs.
             scheduled_before: Datetime used to filter returned flow runs. Flow runs
                 scheduled for after the given datetime string will not be returned.
+            wait_seconds: If given, the server holds the request for up to this many
+                seconds until there are flow runs due, instead of returning an
+                empty list.
 
         Returns:
             A list of worker flow run responses containing information about the
@@ -2865,10 +3109,94 @@ class SyntaskClient:
             body["work_queue_names"] = list(work_queue_names)
         if scheduled_before:
             body["scheduled_before"] = str(scheduled_before)
+        if wait_seconds:
+            body["wait_seconds"] = wait_seconds
 
         response = await self._client.post(
             f"/work_pools/{work_pool_name}/get_scheduled_flow_runs",
             json=body,
+            timeout=self._long_poll_timeout(wait_seconds),
+        )
+        return pydantic.TypeAdapter(List[WorkerFlowRunResponse]).validate_python(
+            response.json()
+        )
+
+    async def claim_scheduled_flow_runs_for_deployments(
+        self,
+        deployment_ids: List[UUID],
+        scheduled_before: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[FlowRunResponse]:
+        """
+        Claims scheduled flow runs for the provided deployments, moving them into a
+        PENDING state so that no other runner will be given them.
+
+        Args:
+            deployment_ids: The IDs of the deployments to claim flow runs for.
+            scheduled_before: Datetime used to filter claimed flow runs. Flow runs
+                scheduled for after the given datetime will not be claimed.
+            limit: The maximum number of flow runs to claim.
+
+        Returns:
+            The flow runs that were claimed, which are in a PENDING state.
+        """
+        body: Dict[str, Any] = dict(deployment_ids=[str(id) for id in deployment_ids])
+        if scheduled_before:
+            body["scheduled_before"] = str(scheduled_before)
+        if limit:
+            body["limit"] = limit
+
+        response = await self._client.post(
+            "/deployments/claim_scheduled_flow_runs",
+            json=body,
+        )
+
+        return pydantic.TypeAdapter(List[FlowRunResponse]).validate_python(
+            response.json()
+        )
+
+    async def claim_scheduled_flow_runs_for_work_pool(
+        self,
+        work_pool_name: str,
+        work_queue_names: Optional[List[str]] = None,
+        scheduled_before: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        wait_seconds: Optional[float] = None,
+    ) -> List[WorkerFlowRunResponse]:
+        """
+        Claims scheduled flow runs for the provided set of work pool queues, moving
+        them into a PENDING state so that no other worker will be given them.
+
+        Args:
+            work_pool_name: The name of the work pool that the work pool
+                queues are associated with.
+            work_queue_names: The names of the work pool queues from which
+                to claim scheduled flow runs.
+            scheduled_before: Datetime used to filter claimed flow runs. Flow runs
+                scheduled for after the given datetime will not be claimed.
+            limit: The maximum number of flow runs to claim.
+            wait_seconds: If given, the server holds the request for up to this many
+                seconds until there are flow runs due, instead of returning an
+                empty list.
+
+        Returns:
+            A list of worker flow run responses for the claimed flow runs, which are
+            in a PENDING state.
+        """
+        body: Dict[str, Any] = {}
+        if work_queue_names is not None:
+            body["work_queue_names"] = list(work_queue_names)
+        if scheduled_before:
+            body["scheduled_before"] = str(scheduled_before)
+        if limit:
+            body["limit"] = limit
+        if wait_seconds:
+            body["wait_seconds"] = wait_seconds
+
+        response = await self._client.post(
+            f"/work_pools/{work_pool_name}/claim_scheduled_flow_runs",
+            json=body,
+            timeout=self._long_poll_timeout(wait_seconds),
         )
         return pydantic.TypeAdapter(List[WorkerFlowRunResponse]).validate_python(
             response.json()
@@ -3039,11 +3367,17 @@ class SyntaskClient:
             json=variable.model_dump(mode="json", exclude_unset=True),
         )
 
-    async def read_variable_by_name(self, name: str) -> Optional[Variable]:
-        """Reads a variable by name. Returns None if no variable is found."""
+    async def read_variable_by_name(
+        self, name: str, use_cache: bool = False
+    ) -> Optional[Variable]:
+        """
+        Reads a variable by name. Returns None if no variable is found.
+
+        If `use_cache` is set, the variable is read through the client cache.
+        """
         try:
-            response = await self._client.get(f"/variables/name/{name}")
-            return Variable(**response.json())
+            data = await self._get_json(f"/variables/name/{name}", use_cache=use_cache)
+            return Variable(**data)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == status.HTTP_404_NOT_FOUND:
                 return None
@@ -3546,11 +3880,13 @@ class SyncSyntaskClient:
                 httpx.Limits(
                     # We see instability when allowing the client to open many connections at once.
                     # Limiting concurrency results in more stable performance.
-                    max_connections=16,
-                    max_keepalive_connections=8,
+                    max_connections=SYNTASK_CLIENT_MAX_CONNECTIONS.value(),
+                    max_keepalive_connections=(
+                        SYNTASK_CLIENT_MAX_KEEPALIVE_CONNECTIONS.value()
+                    ),
                     # The Syntask Cloud LB will keep connections alive for 30s.
-                    # Only allow the client to keep connections alive for 25s.
-                    keepalive_expiry=25,
+                    # By default, only allow the client to keep them alive for 25s.
+                    keepalive_expiry=SYNTASK_CLIENT_KEEPALIVE_EXPIRY.value(),
                 ),
             )
 
@@ -3561,6 +3897,21 @@ class SyncSyntaskClient:
             # client will use a standard HTTP/1.1 connection instead.
             httpx_settings.setdefault("http2", SYNTASK_API_ENABLE_HTTP2.value())
 
+            # Share connections with the other clients of this API; the shared
+            # transport already retries connecting 3 times, so it is not altered below
+            if (
+                SYNTASK_CLIENT_SHARED_CONNECTION_POOL_ENABLED.value()
+                and can_share_transport(api, httpx_settings)
+            ):
+                transport = get_shared_transport(
+                    api,
+                    verify=httpx_settings["verify"],
+                    http2=httpx_settings["http2"],
+                    limits=httpx_settings["limits"],
+                )
+                if transport:
+                    httpx_settings["transport"] = transport
+
             if server_type:
                 self.server_type = server_type
             else:
@@ -4167,6 +4518,44 @@ class SyncSyntaskClient:
         )
         return OrchestrationResult.model_validate(response.json())
 
+    def set_task_run_states(
+        self,
+        task_run_states: Iterable[Tuple[UUID, syntask.states.State]],
+        force: bool = False,
+    ) -> List[OrchestrationResult]:
+        """
+        Set the states of many task runs with a single request.
+
+        All transitions are orchestrated by the Syntask API in one transaction.
+
+        Args:
+            task_run_states: pairs of task run ids and the states to set
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Syntask API to accept the states
+
+        Returns:
+            a list of OrchestrationResult model representations of state orchestration
+                output, in the same order as the given states
+        """
+        payload = []
+        for task_run_id, state in task_run_states:
+            state_create = state.to_state_create()
+            state_create.state_details.task_run_id = task_run_id
+            payload.append(
+                dict(
+                    task_run_id=str(task_run_id),
+                    state=state_create.model_dump(mode="json"),
+                )
+            )
+
+        response = self._client.post(
+            "/task_runs/set_states",
+            json=dict(task_run_states=payload, force=force),
+        )
+        return pydantic.TypeAdapter(List[OrchestrationResult]).validate_python(
+            response.json()
+        )
+
     def read_task_run_states(self, task_run_id: UUID) -> List[syntask.states.State]:
         """
         Query for the states of a task run
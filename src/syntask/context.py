@@ -20,6 +20,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -329,6 +330,7 @@ class EngineContext(RunContext):
         task_run_states: A list of states for task runs created within this flow run
         task_run_results: A mapping of result ids to task run states for this flow run
         flow_run_states: A list of states for flow runs created within this flow run
+        input_hashes: A memo of input digests used by the `Inputs` cache policy
     """
 
     flow: Optional["Flow"] = None
@@ -355,6 +357,9 @@ class EngineContext(RunContext):
     # Holds the ID of the object returned by the task run and task run state
     task_run_results: Mapping[int, State] = Field(default_factory=dict)
 
+    # Memoized digests of read-only task inputs, keyed by object ID and hash algorithm
+    input_hashes: Dict[Tuple[int, str], str] = Field(default_factory=dict)
+
     # Events worker to emit events
     events: Optional[EventsWorker] = None
 
@@ -1,5 +1,6 @@
 import abc
 import asyncio
+import zlib
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -11,6 +12,7 @@ from typing import (
     Optional,
     Tuple,
     Type,
+    Union,
     cast,
 )
 from uuid import UUID
@@ -35,6 +37,7 @@ from syntask.settings import (
     SYNTASK_API_URL,
     SYNTASK_CLOUD_API_URL,
     SYNTASK_DEBUG_MODE,
+    SYNTASK_EVENTS_CLIENT_BATCH_MAX_BYTES,
     SYNTASK_SERVER_ALLOW_EPHEMERAL_MODE,
 )
 
@@ -80,6 +83,27 @@ def events_out_socket_from_api_url(url: str):
     return http_to_ws(url) + "/events/out"
 
 
+def encode_events_batch(
+    events: List[Event], compress: bool = False
+) -> Union[str, bytes]:
+    """
+    Encode a batch of events as a single message for the events websocket: a JSON
+    array of the events, compressed with zlib into a binary message if requested.
+    """
+    return _encode_serialized_batch(
+        [event.model_dump_json() for event in events], compress=compress
+    )
+
+
+def _encode_serialized_batch(
+    serialized_events: List[str], compress: bool = False
+) -> Union[str, bytes]:
+    message = "[" + ",".join(serialized_events) + "]"
+    if compress:
+        return zlib.compress(message.encode())
+    return message
+
+
 def get_events_client(
     reconnection_attempts: int = 10,
     checkpoint_every: int = 700,
@@ -161,10 +185,27 @@ class EventsClient(abc.ABC):
         finally:
             EVENTS_EMITTED.labels(self.client_name).inc()
 
+    async def emit_batch(self, events: List[Event]) -> None:
+        """Emit a batch of events"""
+        if not hasattr(self, "_in_context"):
+            raise TypeError(
+                "Events may only be emitted while this client is being used as a "
+                "context manager"
+            )
+
+        try:
+            return await self._emit_batch(events)
+        finally:
+            EVENTS_EMITTED.labels(self.client_name).inc(len(events))
+
     @abc.abstractmethod
     async def _emit(self, event: Event) -> None:  # pragma: no cover
         ...
 
+    async def _emit_batch(self, events: List[Event]) -> None:
+        for event in events:
+            await self._emit(event)
+
     async def __aenter__(self) -> Self:
         self._in_context = True
         return self
@@ -249,6 +290,8 @@ class SyntaskEventsClient(EventsClient):
         api_url: Optional[str] = None,
         reconnection_attempts: int = 10,
         checkpoint_every: int = 700,
+        compress_batches: bool = False,
+        max_batch_bytes: Optional[int] = None,
     ):
         """
         Args:
@@ -257,6 +300,11 @@ class SyntaskEventsClient(EventsClient):
                 the client should attempt to reconnect
             checkpoint_every: How often the client should sync with the server to
                 confirm receipt of all previously sent events
+            compress_batches: Whether batches of events should be sent as
+                zlib-compressed binary messages rather than text messages
+            max_batch_bytes: The maximum size of the events sent in one message,
+                before compression; larger batches are split across messages.
+                Defaults to `SYNTASK_EVENTS_CLIENT_BATCH_MAX_BYTES`.
         """
         api_url = api_url or SYNTASK_API_URL.value()
         if not api_url:
@@ -270,6 +318,10 @@ class SyntaskEventsClient(EventsClient):
         self._reconnection_attempts = reconnection_attempts
         self._unconfirmed_events = []
         self._checkpoint_every = checkpoint_every
+        self._compress_batches = compress_batches
+        self._max_batch_bytes = (
+            max_batch_bytes or SYNTASK_EVENTS_CLIENT_BATCH_MAX_BYTES.value()
+        )
 
     async def __aenter__(self) -> Self:
         # Don't handle any errors in the initial connection, because these are most
@@ -321,10 +373,10 @@ class SyntaskEventsClient(EventsClient):
         for event in events_to_resend:
             await self.emit(event)
 
-    async def _checkpoint(self, event: Event) -> None:
+    async def _checkpoint(self, events: List[Event]) -> None:
         assert self._websocket
 
-        self._unconfirmed_events.append(event)
+        self._unconfirmed_events.extend(events)
 
         unconfirmed_count = len(self._unconfirmed_events)
         if unconfirmed_count < self._checkpoint_every:
@@ -341,6 +393,38 @@ class SyntaskEventsClient(EventsClient):
         EVENT_WEBSOCKET_CHECKPOINTS.labels(self.client_name).inc()
 
     async def _emit(self, event: Event) -> None:
+        await self._send(event.model_dump_json(), [event])
+
+    async def _emit_batch(self, events: List[Event]) -> None:
+        # Split the batch so that no message is larger than the server will accept.
+        # An event larger than the limit on its own is sent in a message by itself.
+        chunk: List[Event] = []
+        serialized_chunk: List[str] = []
+        chunk_size = 2  # the enclosing brackets of the JSON array
+
+        for event in events:
+            serialized = event.model_dump_json()
+            size = len(serialized.encode()) + 1  # and its separating comma
+            if chunk and chunk_size + size > self._max_batch_bytes:
+                await self._send_batch(serialized_chunk, chunk)
+                chunk, serialized_chunk, chunk_size = [], [], 2
+
+            chunk.append(event)
+            serialized_chunk.append(serialized)
+            chunk_size += size
+
+        if chunk:
+            await self._send_batch(serialized_chunk, chunk)
+
+    async def _send_batch(
+        self, serialized_events: List[str], events: List[Event]
+    ) -> None:
+        message = _encode_serialized_batch(
+            serialized_events, compress=self._compress_batches
+        )
+        await self._send(message, events)
+
+    async def _send(self, message: Union[str, bytes], events: List[Event]) -> None:
         for i in range(self._reconnection_attempts + 1):
             try:
                 # If we're here and the websocket is None, then we've had a failure in a
@@ -353,8 +437,8 @@ class SyntaskEventsClient(EventsClient):
                     await self._reconnect()
                     assert self._websocket
 
-                await self._websocket.send(event.model_dump_json())
-                await self._checkpoint(event)
+                await self._websocket.send(message)
+                await self._checkpoint(events)
 
                 return
             except ConnectionClosed:
@@ -404,6 +488,10 @@ class AssertingPassthroughEventsClient(SyntaskEventsClient):
         # record the event for inspection
         self.events.append(event)
 
+    async def _emit_batch(self, events: List[Event]) -> None:
+        await super()._emit_batch(events)
+        self.events.extend(events)
+
     async def __aenter__(self) -> Self:
         await super().__aenter__()
         self.events = []
@@ -419,6 +507,8 @@ class SyntaskCloudEventsClient(SyntaskEventsClient):
         api_key: Optional[str] = None,
         reconnection_attempts: int = 10,
         checkpoint_every: int = 700,
+        compress_batches: bool = False,
+        max_batch_bytes: Optional[int] = None,
     ):
         """
         Args:
@@ -428,12 +518,19 @@ class SyntaskCloudEventsClient(SyntaskEventsClient):
                 the client should attempt to reconnect
             checkpoint_every: How often the client should sync with the server to
                 confirm receipt of all previously sent events
+            compress_batches: Whether batches of events should be sent as
+                zlib-compressed binary messages rather than text messages
+            max_batch_bytes: The maximum size of the events sent in one message,
+                before compression; larger batches are split across messages.
+                Defaults to `SYNTASK_EVENTS_CLIENT_BATCH_MAX_BYTES`.
         """
         api_url, api_key = _get_api_url_and_key(api_url, api_key)
         super().__init__(
             api_url=api_url,
             reconnection_attempts=reconnection_attempts,
             checkpoint_every=checkpoint_every,
+            compress_batches=compress_batches,
+            max_batch_bytes=max_batch_bytes,
         )
         self._connect = connect(
             self._events_socket_url,
@@ -1,15 +1,19 @@
 from contextlib import asynccontextmanager
 from contextvars import Context, copy_context
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from typing_extensions import Self
 
-from syntask._internal.concurrency.services import QueueService
+from syntask._internal.concurrency.services import BatchedQueueService
 from syntask.settings import (
     SYNTASK_API_KEY,
     SYNTASK_API_URL,
     SYNTASK_CLOUD_API_URL,
+    SYNTASK_EVENTS_CLIENT_BATCH_COMPRESSION_ENABLED,
+    SYNTASK_EVENTS_CLIENT_BATCH_INTERVAL,
+    SYNTASK_EVENTS_CLIENT_BATCH_SIZE,
+    SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED,
 )
 from syntask.utilities.context import temporary_context
 
@@ -50,7 +54,16 @@ def should_emit_events_to_ephemeral_server() -> bool:
     return SYNTASK_API_KEY.value() is None
 
 
-class EventsWorker(QueueService[Event]):
+class EventsWorker(BatchedQueueService[Event]):
+    """
+    Emits events in the background.
+
+    Events are emitted one at a time unless `SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED`
+    is set, in which case up to `SYNTASK_EVENTS_CLIENT_BATCH_SIZE` events, or as many
+    as arrive within `SYNTASK_EVENTS_CLIENT_BATCH_INTERVAL` seconds, are emitted
+    together, split across messages of at most `SYNTASK_EVENTS_CLIENT_BATCH_MAX_BYTES`.
+    """
+
     def __init__(
         self, client_type: Type[EventsClient], client_options: Tuple[Tuple[str, Any]]
     ):
@@ -61,6 +74,13 @@ class EventsWorker(QueueService[Event]):
         self._orchestration_client: "SyntaskClient"
         self._context_cache: Dict[UUID, Context] = {}
 
+        self._batching = SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED.value()
+        if self._batching:
+            self._max_batch_size = SYNTASK_EVENTS_CLIENT_BATCH_SIZE.value()
+            self._min_interval = SYNTASK_EVENTS_CLIENT_BATCH_INTERVAL.value()
+        else:
+            self._max_batch_size = 1
+
     @asynccontextmanager
     async def _lifespan(self):
         self._client = self.client_type(**{k: v for k, v in self.client_options})
@@ -75,12 +95,20 @@ class EventsWorker(QueueService[Event]):
         self._context_cache[event.id] = copy_context()
         return event
 
-    async def _handle(self, event: Event):
-        context = self._context_cache.pop(event.id)
-        with temporary_context(context=context):
-            await self.attach_related_resources_from_context(event)
-
-        await self._client.emit(event)
+    async def _handle_batch(self, events: List[Event]):
+        try:
+            for event in events:
+                with temporary_context(context=self._context_cache[event.id]):
+                    await self.attach_related_resources_from_context(event)
+        finally:
+            for event in events:
+                self._context_cache.pop(event.id, None)
+
+        if self._batching:
+            await self._client.emit_batch(events)
+        else:
+            for event in events:
+                await self._client.emit(event)
 
     async def attach_related_resources_from_context(self, event: Event):
         exclude = {resource.id for resource in event.involved_resources}
@@ -117,6 +145,13 @@ class EventsWorker(QueueService[Event]):
             else:
                 client_type = NullEventsClient
 
+        if (
+            issubclass(client_type, SyntaskEventsClient)
+            and SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED.value()
+            and SYNTASK_EVENTS_CLIENT_BATCH_COMPRESSION_ENABLED.value()
+        ):
+            client_kwargs["compress_batches"] = True
+
         # The base class will take care of returning an existing worker with these
         # options if available
         return super().instance(client_type, tuple(client_kwargs.items()))
@@ -41,6 +41,7 @@ from syntask.exceptions import (
 )
 from syntask.flows import Flow, load_flow_from_entrypoint, load_flow_from_flow_run
 from syntask.futures import SyntaskFuture, resolve_futures_to_states
+from syntask.logging.handlers import APILogHandler
 from syntask.logging.loggers import (
     flow_run_logger,
     get_logger,
@@ -606,6 +607,7 @@ class FlowRunEngine(Generic[P, R]):
                     level=logging.INFO if self.state.is_completed() else logging.ERROR,
                     msg=f"Finished in state {display_state}",
                 )
+                APILogHandler.report_limited_logs(self.flow_run.id)
 
                 self._is_started = False
                 self._client = None
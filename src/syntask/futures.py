@@ -1,12 +1,24 @@
 import abc
+import asyncio
 import collections
 import concurrent.futures
 import inspect
 import threading
 import uuid
-from collections.abc import Generator, Iterator
+from collections.abc import AsyncGenerator, AsyncIterable, Generator, Iterator
 from functools import partial
-from typing import Any, Callable, Generic, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
 from typing_extensions import TypeVar
 
@@ -331,43 +343,261 @@ class SyntaskFutureList(list, Iterator, Generic[F]):
 
 
 def as_completed(
-    futures: List[SyntaskFuture[R]], timeout: Optional[float] = None
+    futures: Iterable[SyntaskFuture[R]],
+    timeout: Optional[float] = None,
+    max_in_flight: Optional[int] = None,
 ) -> Generator[SyntaskFuture[R], None]:
-    unique_futures: Set[SyntaskFuture[R]] = set(futures)
-    total_futures = len(unique_futures)
+    """
+    Yield futures as they complete.
+
+    Args:
+        futures: The futures to wait on. May be a lazy iterator, e.g. a generator
+            that submits a task each time it is advanced.
+        timeout: The maximum number of seconds to wait for all futures to complete.
+        max_in_flight: The maximum number of futures to take from `futures` that
+            have not completed yet. Another future is taken each time one completes.
+            By default, all futures are taken up front and duplicates are ignored.
+
+    Yields:
+        Each future, once it has completed.
+
+    Raises:
+        TimeoutError: If the timeout is reached before all futures complete.
+    """
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError("`max_in_flight` must be at least 1.")
+
+    if max_in_flight is None:
+        futures = set(futures)
+    futures_iterator = iter(futures)
+    exhausted = False
+    total_futures = 0
+    pending: Set[SyntaskFuture[R]] = set()
+
+    finished_event = threading.Event()
+    finished_lock = threading.Lock()
+    finished_futures = []
+
+    def add_to_done(future):
+        with finished_lock:
+            finished_futures.append(future)
+            finished_event.set()
+
+    def take_futures() -> List[SyntaskFuture[R]]:
+        """
+        Take futures until `max_in_flight` are pending, returning any that have
+        already completed.
+        """
+        nonlocal exhausted, total_futures
+        done = []
+        while not exhausted and (max_in_flight is None or len(pending) < max_in_flight):
+            try:
+                future = next(futures_iterator)
+            except StopIteration:
+                exhausted = True
+                break
+            if future in pending:
+                continue
+            total_futures += 1
+            if future._final_state:
+                done.append(future)
+            else:
+                pending.add(future)
+                future.add_done_callback(add_to_done)
+        return done
+
     try:
         with timeout_context(timeout):
-            done = {f for f in unique_futures if f._final_state}
-            pending = unique_futures - done
-            yield from done
+            done = take_futures()
+            while done or pending:
+                yield from done
+
+                if pending:
+                    finished_event.wait()
+                    with finished_lock:
+                        newly_done = finished_futures
+                        finished_futures = []
+                        finished_event.clear()
+                    for future in newly_done:
+                        pending.remove(future)
+                else:
+                    newly_done = []
+
+                # Top up the in-flight futures before handing back completed ones
+                done = take_futures() + newly_done
+
+    except TimeoutError:
+        raise TimeoutError(
+            "%d (of %d) futures unfinished" % (len(pending), total_futures)
+        )
+
+
+def iter_in_order(
+    futures: Iterable[SyntaskFuture[R]], max_in_flight: int
+) -> Generator[SyntaskFuture[R], None]:
+    """
+    Yield futures in the order they are taken from `futures`, once each has
+    completed.
+
+    Args:
+        futures: The futures to wait on. May be a lazy iterator, e.g. a generator
+            that submits a task each time it is advanced.
+        max_in_flight: The maximum number of futures to take from `futures` ahead of
+            the next future to yield.
+
+    Yields:
+        Each future, once it has completed.
+    """
+    if max_in_flight < 1:
+        raise ValueError("`max_in_flight` must be at least 1.")
+
+    in_flight: Deque[SyntaskFuture[R]] = collections.deque()
+    for future in futures:
+        in_flight.append(future)
+        if len(in_flight) >= max_in_flight:
+            next_future = in_flight.popleft()
+            next_future.wait()
+            yield next_future
+
+    while in_flight:
+        next_future = in_flight.popleft()
+        next_future.wait()
+        yield next_future
+
+
+async def as_completed_async(
+    futures: AsyncIterable[SyntaskFuture[R]], max_in_flight: int
+) -> AsyncGenerator[SyntaskFuture[R], None]:
+    """
+    Yield futures as they complete without blocking the event loop.
+
+    This is the asynchronous counterpart of `as_completed` with `max_in_flight`.
 
-            finished_event = threading.Event()
-            finished_lock = threading.Lock()
-            finished_futures = []
+    Args:
+        futures: The futures to wait on. May be a lazy async iterator, e.g. an async
+            generator that submits a task each time it is advanced.
+        max_in_flight: The maximum number of futures to take from `futures` that
+            have not completed yet. Another future is taken each time one completes.
+
+    Yields:
+        Each future, once it has completed.
+    """
+    if max_in_flight < 1:
+        raise ValueError("`max_in_flight` must be at least 1.")
 
-            def add_to_done(future):
-                with finished_lock:
-                    finished_futures.append(future)
-                    finished_event.set()
+    futures_iterator = futures.__aiter__()
+    exhausted = False
+    pending: Set[SyntaskFuture[R]] = set()
+    finished: asyncio.Queue[SyntaskFuture[R]] = asyncio.Queue()
+    add_to_done = _loop_callback(finished.put_nowait)
 
-            for future in pending:
+    async def take_futures() -> List[SyntaskFuture[R]]:
+        """
+        Take futures until `max_in_flight` are pending, returning any that have
+        already completed.
+        """
+        nonlocal exhausted
+        done = []
+        while not exhausted and len(pending) < max_in_flight:
+            try:
+                future = await futures_iterator.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                break
+            if future in pending:
+                continue
+            if future._final_state:
+                done.append(future)
+            else:
+                pending.add(future)
                 future.add_done_callback(add_to_done)
+        return done
 
-            while pending:
-                finished_event.wait()
-                with finished_lock:
-                    done = finished_futures
-                    finished_futures = []
-                    finished_event.clear()
+    done = await take_futures()
+    while done or pending:
+        for future in done:
+            yield future
 
-                for future in done:
-                    pending.remove(future)
-                    yield future
+        newly_done = []
+        if pending:
+            newly_done.append(await finished.get())
+            while not finished.empty():
+                newly_done.append(finished.get_nowait())
+            for future in newly_done:
+                pending.remove(future)
 
-    except TimeoutError:
-        raise TimeoutError(
-            "%d (of %d) futures unfinished" % (len(pending), total_futures)
-        )
+        # Top up the in-flight futures before handing back completed ones
+        done = await take_futures() + newly_done
+
+
+async def iter_in_order_async(
+    futures: AsyncIterable[SyntaskFuture[R]], max_in_flight: int
+) -> AsyncGenerator[SyntaskFuture[R], None]:
+    """
+    Yield futures in the order they are taken from `futures`, once each has
+    completed, without blocking the event loop.
+
+    This is the asynchronous counterpart of `iter_in_order`.
+
+    Args:
+        futures: The futures to wait on. May be a lazy async iterator, e.g. an async
+            generator that submits a task each time it is advanced.
+        max_in_flight: The maximum number of futures to take from `futures` ahead of
+            the next future to yield.
+
+    Yields:
+        Each future, once it has completed.
+    """
+    if max_in_flight < 1:
+        raise ValueError("`max_in_flight` must be at least 1.")
+
+    in_flight: Deque[SyntaskFuture[R]] = collections.deque()
+    async for future in futures:
+        in_flight.append(future)
+        if len(in_flight) >= max_in_flight:
+            next_future = in_flight.popleft()
+            await _wait_for_future(next_future)
+            yield next_future
+
+    while in_flight:
+        next_future = in_flight.popleft()
+        await _wait_for_future(next_future)
+        yield next_future
+
+
+def _loop_callback(
+    fn: Callable[[SyntaskFuture[R]], None],
+) -> Callable[[SyntaskFuture[R]], None]:
+    """
+    Wrap a done callback so that it runs on the current event loop, whichever
+    thread the future completes in.
+    """
+    loop = asyncio.get_running_loop()
+
+    def callback(future: SyntaskFuture[R]) -> None:
+        try:
+            loop.call_soon_threadsafe(fn, future)
+        except RuntimeError:
+            # the loop was closed after its consumer stopped waiting
+            pass
+
+    return callback
+
+
+async def _wait_for_future(future: SyntaskFuture[R]) -> None:
+    """
+    Wait for a future to complete without blocking the event loop.
+    """
+    if future._final_state:
+        return
+    done: asyncio.Future[SyntaskFuture[R]] = asyncio.get_running_loop().create_future()
+
+    def set_done(future: SyntaskFuture[R]) -> None:
+        if not done.done():
+            done.set_result(future)
+
+    future.add_done_callback(_loop_callback(set_done))
+    await done
 
 
 DoneAndNotDoneFutures = collections.namedtuple("DoneAndNotDoneFutures", "done not_done")
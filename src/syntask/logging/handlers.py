@@ -1,12 +1,15 @@
 import json
 import logging
+import random
 import sys
+import threading
 import time
 import traceback
 import uuid
 import warnings
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 import pendulum
 from rich.console import Console
@@ -34,6 +37,9 @@ from syntask.settings import (
     SYNTASK_LOGGING_TO_API_WHEN_MISSING_FLOW,
 )
 
+if TYPE_CHECKING:
+    from syntask.settings import Settings
+
 
 class APILogWorker(BatchedQueueService[Dict[str, Any]]):
     @property
@@ -81,14 +87,257 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
         return item.pop("__payload_size__", None) or len(json.dumps(item).encode())
 
 
+class TokenBucket:
+    """
+    A token bucket that holds up to `capacity` tokens and is refilled at `rate` tokens
+    per second.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        """Takes a token from the bucket. Returns `False` if the bucket is empty."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class _RunLogs:
+    """The state kept by an `APILogLimiter` for the logs of a single run"""
+
+    def __init__(self, flow_run_id: Optional[str], task_run_id: Optional[str]) -> None:
+        self.flow_run_id = flow_run_id
+        # Only set for task runs outside of a flow run, whose logs are limited alone
+        self.task_run_id = task_run_id
+        self.bucket: Optional[TokenBucket] = None
+        self.logger_buckets: Dict[str, TokenBucket] = {}
+        self.dropped = 0
+        self.last_log: Optional[Dict[str, Any]] = None
+        self.repeats: Optional[Tuple[int, str]] = None
+        self.touched = time.monotonic()
+
+    def pop_repeats(self) -> List[Dict[str, Any]]:
+        if self.repeats is None:
+            return []
+
+        assert self.last_log is not None
+        count, timestamp = self.repeats
+        self.repeats = None
+        self.last_log.pop("__payload_size__", None)
+        return [
+            {
+                **self.last_log,
+                "timestamp": timestamp,
+                "message": f"Last message repeated {count} time(s)",
+            }
+        ]
+
+    def report(self) -> List[Dict[str, Any]]:
+        logs = self.pop_repeats()
+        if self.dropped:
+            if self.task_run_id is None:
+                run_type, logger_name = "flow run", "syntask.flow_runs"
+            else:
+                run_type, logger_name = "task run", "syntask.task_runs"
+            logs.append(
+                LogCreate(
+                    flow_run_id=self.flow_run_id,
+                    task_run_id=self.task_run_id,
+                    name=logger_name,
+                    level=logging.WARNING,
+                    timestamp=pendulum.now("UTC"),
+                    message=(
+                        f"{self.dropped} log(s) of this {run_type} were not sent to "
+                        "the API because of the log sampling or rate limit settings."
+                    ),
+                ).model_dump(mode="json")
+            )
+            self.dropped = 0
+        return logs
+
+
+class APILogLimiter:
+    """
+    Limits the logs that each flow run sends to the API.
+
+    Logs below the `WARNING` level are sampled and then limited by a token bucket per
+    flow run and per logger of each flow run.  A log below the `WARNING` level that
+    repeats the previous log of its flow run is not sent; instead, the number of
+    repeats is sent before the next log of the flow run.  Logs at the `WARNING` level
+    and above are always sent.
+
+    The logs of a task run outside of a flow run are limited in the same way on their
+    own.  Logs without a flow or task run are only sampled.
+
+    The number of logs dropped for a flow run, and any repeats not yet sent, are
+    reported once the flow run has finished.  So that long-lived processes do not
+    keep state forever for runs that are never reported, the state of the least
+    recently used runs is reported and forgotten once more than `max_runs` runs are
+    tracked, or once a run has not logged for `idle_timeout` seconds.
+    """
+
+    def __init__(self, max_runs: int = 1000, idle_timeout: float = 600) -> None:
+        self.max_runs = max_runs
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._runs: "OrderedDict[str, _RunLogs]" = OrderedDict()
+
+    @staticmethod
+    def is_enabled(settings: "Settings") -> bool:
+        return (
+            settings.logging_to_api_collapse_repeated
+            or settings.logging_to_api_sample_rate < 1
+            or settings.logging_to_api_flow_run_rate_limit is not None
+            or settings.logging_to_api_logger_rate_limit is not None
+        )
+
+    def limit(self, log: Dict[str, Any], settings: "Settings") -> List[Dict[str, Any]]:
+        """
+        Returns the logs to send to the API in place of the given log: none if it was
+        dropped or repeats the previous log, and the number of repeats of the
+        previous log before it if there were any.  Reports for runs that are no
+        longer tracked may also be included.
+        """
+        flow_run_id, task_run_id = log["flow_run_id"], log["task_run_id"]
+        if flow_run_id is None and task_run_id is None:
+            # There is no run to keep the state of the limits for or report to
+            if log["level"] < logging.WARNING and not _sample(settings):
+                return []
+            return [log]
+
+        run_key = flow_run_id or task_run_id
+        with self._lock:
+            run = self._runs.get(run_key)
+            if run is None:
+                run = self._runs[run_key] = _RunLogs(
+                    flow_run_id, task_run_id if flow_run_id is None else None
+                )
+            else:
+                self._runs.move_to_end(run_key)
+                run.touched = time.monotonic()
+
+            logs = self._evict()
+
+            collapse = (
+                settings.logging_to_api_collapse_repeated
+                and log["level"] < logging.WARNING
+            )
+            if collapse and run.last_log is not None and _is_repeat(run.last_log, log):
+                count = run.repeats[0] if run.repeats else 0
+                run.repeats = (count + 1, log["timestamp"])
+                return logs
+
+            logs.extend(run.pop_repeats())
+            run.last_log = None
+
+            if log["level"] < logging.WARNING and not self._allow(run, log, settings):
+                run.dropped += 1
+                return logs
+
+            if collapse:
+                # The log is copied since the worker removes its payload size
+                run.last_log = dict(log)
+
+        logs.append(log)
+        return logs
+
+    def report(
+        self, flow_run_id: Optional[str], task_run_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the logs reporting the repeats and dropped logs of a finished run that
+        have not been sent yet, and forgets the run.
+
+        The limits of a task run within a flow run apply to the whole flow run, so
+        only the repeats of the task run's last log are reported for it.
+        """
+        with self._lock:
+            if flow_run_id is not None and task_run_id is not None:
+                run = self._runs.get(flow_run_id)
+                if (
+                    run is None
+                    or run.last_log is None
+                    or run.last_log["task_run_id"] != task_run_id
+                ):
+                    return []
+                return run.pop_repeats()
+
+            run = self._runs.pop(flow_run_id or task_run_id, None)
+            return run.report() if run else []
+
+    def _evict(self) -> List[Dict[str, Any]]:
+        logs = []
+        now = time.monotonic()
+        while self._runs:
+            run_key, run = next(iter(self._runs.items()))
+            if (
+                len(self._runs) <= self.max_runs
+                and now - run.touched < self.idle_timeout
+            ):
+                break
+
+            del self._runs[run_key]
+            logs.extend(run.report())
+        return logs
+
+    def _allow(self, run: _RunLogs, log: Dict[str, Any], settings: "Settings") -> bool:
+        if not _sample(settings):
+            return False
+
+        burst = settings.logging_to_api_rate_limit_burst
+        flow_run_rate = settings.logging_to_api_flow_run_rate_limit
+        if flow_run_rate is not None:
+            if run.bucket is None:
+                run.bucket = TokenBucket(flow_run_rate, burst)
+            if not run.bucket.take():
+                return False
+
+        logger_rate = settings.logging_to_api_logger_rate_limit
+        if logger_rate is not None:
+            bucket = run.logger_buckets.get(log["name"])
+            if bucket is None:
+                bucket = run.logger_buckets[log["name"]] = TokenBucket(
+                    logger_rate, burst
+                )
+            if not bucket.take():
+                return False
+
+        return True
+
+
+def _sample(settings: "Settings") -> bool:
+    sample_rate = settings.logging_to_api_sample_rate
+    return sample_rate >= 1 or random.random() < sample_rate
+
+
+def _is_repeat(last_log: Dict[str, Any], log: Dict[str, Any]) -> bool:
+    return all(
+        last_log[key] == log[key] for key in ("name", "level", "task_run_id", "message")
+    )
+
+
 class APILogHandler(logging.Handler):
     """
     A logging handler that sends logs to the Syntask API.
 
     Sends log records to the `APILogWorker` which manages sending batches of logs in
-    the background.
+    the background.  The logs of runaway flow runs can be limited with the
+    `SYNTASK_LOGGING_TO_API_*_RATE_LIMIT`, `SYNTASK_LOGGING_TO_API_SAMPLE_RATE` and
+    `SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED` settings.
     """
 
+    _limiter = APILogLimiter()
+
     @classmethod
     def flush(cls):
         """
@@ -126,6 +375,26 @@ class APILogHandler(logging.Handler):
 
         return await APILogWorker.drain_all()
 
+    @classmethod
+    def report_limited_logs(
+        cls,
+        flow_run_id: Optional[Union[str, uuid.UUID]],
+        task_run_id: Optional[Union[str, uuid.UUID]] = None,
+    ) -> None:
+        """
+        Send the number of logs of a finished flow or task run that were repeated or
+        dropped by the log limits, if any were.
+        """
+        settings = syntask.context.get_settings_context().settings
+        if not settings.logging_to_api_enabled:
+            return
+
+        for log in cls._limiter.report(
+            str(flow_run_id) if flow_run_id else None,
+            str(task_run_id) if task_run_id else None,
+        ):
+            APILogWorker.instance().send(log)
+
     def emit(self, record: logging.LogRecord):
         """
         Send a log to the `APILogWorker`
@@ -139,7 +408,11 @@ class APILogHandler(logging.Handler):
                 return  # Do not send records that have opted out
 
             log = self.prepare(record)
-            APILogWorker.instance().send(log)
+            if APILogLimiter.is_enabled(profile.settings):
+                for limited_log in self._limiter.limit(log, profile.settings):
+                    APILogWorker.instance().send(limited_log)
+            else:
+                APILogWorker.instance().send(log)
 
         except Exception:
             self.handleError(record)
@@ -0,0 +1,158 @@
+import datetime
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pendulum
+
+from syntask.logging.loggers import get_logger
+
+from .protocol import ResultCache, ResultCacheEntry, ResultCacheStats
+
+logger = get_logger(__name__)
+
+# Each cache file starts with a header holding the expiration timestamp of the
+# entry; a negative timestamp marks content that never expires.
+_HEADER = struct.Struct("!d")
+
+
+class FileSystemResultCache(ResultCache):
+    """
+    A result cache that keeps content in files on the local filesystem.
+
+    Files are named after a hash of their storage key, so the cache directory can be
+    shared by processes on the same machine. When the directory grows beyond
+    `max_bytes`, the least recently used files are deleted.
+
+    Attributes:
+        cache_directory: the directory where cached content is stored
+        max_bytes: the maximum total size of the cache directory
+    """
+
+    def __init__(self, cache_directory: Path, max_bytes: int):
+        self.cache_directory = cache_directory.expanduser().resolve()
+        self.max_bytes = max_bytes
+        self.stats = ResultCacheStats()
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _path_for_key(self, key: str) -> Path:
+        return self.cache_directory / hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[ResultCacheEntry]:
+        path = self._path_for_key(key)
+        try:
+            with open(path, "rb") as cache_file:
+                (timestamp,) = _HEADER.unpack(cache_file.read(_HEADER.size))
+                content = cache_file.read()
+        except (FileNotFoundError, struct.error):
+            self.stats.misses += 1
+            return None
+
+        entry = ResultCacheEntry(
+            content=content,
+            expiration=pendulum.from_timestamp(timestamp) if timestamp >= 0 else None,
+        )
+        if entry.is_expired():
+            with self._lock:
+                self._unlink(path)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        # record the access time used for least recently used eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.stats.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        content: bytes,
+        expiration: Optional[datetime.datetime] = None,
+    ) -> None:
+        size = _HEADER.size + len(content)
+        if size > self.max_bytes:
+            return
+
+        path = self._path_for_key(key)
+        timestamp = expiration.timestamp() if expiration is not None else -1.0
+
+        with self._lock:
+            self.cache_directory.mkdir(parents=True, exist_ok=True)
+            self._unlink(path)
+            # measured before the new file is written, so that a first scan of the
+            # directory doesn't count it twice
+            current_size = self._current_size()
+
+            # write to a temporary file first so readers never see partial content
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(_HEADER.pack(timestamp))
+                    tmp_file.write(content)
+                os.replace(tmp_path, path)
+            except OSError:
+                logger.debug(
+                    "Failed to write result cache file %s", path, exc_info=True
+                )
+                self._unlink(Path(tmp_path))
+                return
+
+            self._size = current_size + size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._unlink(self._path_for_key(key))
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._scan())
+        return self._size
+
+    def _scan(self):
+        """
+        Yield the path, last access time, and size of each cached file.
+        """
+        try:
+            entries = list(os.scandir(self.cache_directory))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if entry.name.endswith(".tmp"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            yield Path(entry.path), stat.st_mtime, stat.st_size
+
+    def _evict(self) -> None:
+        # other processes may share the directory, so rescan before deleting files
+        files = sorted(self._scan(), key=lambda file: file[1])
+        self._size = sum(size for _, _, size in files)
+        for path, _, size in files:
+            if self._size <= self.max_bytes:
+                break
+            if self._unlink(path, track_size=False):
+                self._size -= size
+                self.stats.evictions += 1
+
+    def _unlink(self, path: Path, track_size: bool = True) -> bool:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        if track_size and self._size is not None:
+            self._size -= size
+        return True
@@ -0,0 +1,77 @@
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .protocol import ResultCache, ResultCacheEntry, ResultCacheStats
+
+
+class MemoryResultCache(ResultCache):
+    """
+    A least recently used result cache that keeps content in memory.
+
+    Entries are evicted once the total size of cached content exceeds `max_bytes`.
+    Content larger than the budget is never cached.
+
+    Attributes:
+        max_bytes: the maximum total size of cached content
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.stats = ResultCacheStats()
+        self._entries: OrderedDict[str, ResultCacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The total size of cached content in bytes."""
+        return self._size
+
+    def get(self, key: str) -> Optional[ResultCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            if entry.is_expired():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: str,
+        content: bytes,
+        expiration: Optional[datetime.datetime] = None,
+    ) -> None:
+        with self._lock:
+            self._remove(key)
+            if len(content) > self.max_bytes:
+                return
+
+            self._entries[key] = ResultCacheEntry(
+                content=content, expiration=expiration
+            )
+            self._size += len(content)
+
+            while self._size > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.stats.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
@@ -0,0 +1,89 @@
+import datetime
+from dataclasses import dataclass
+from typing import Optional, Protocol, runtime_checkable
+
+import pendulum
+
+
+@dataclass
+class ResultCacheEntry:
+    """
+    The content of a cached storage read.
+
+    Attributes:
+        content: The bytes that were read from result storage.
+        expiration: Datetime when the cached result record expires, if ever.
+    """
+
+    content: bytes
+    expiration: Optional[datetime.datetime] = None
+
+    def is_expired(self) -> bool:
+        return self.expiration is not None and self.expiration <= pendulum.now("utc")
+
+
+@dataclass
+class ResultCacheStats:
+    """
+    Counters describing the effectiveness of a result cache.
+
+    Attributes:
+        hits: The number of reads served from the cache.
+        misses: The number of reads that were not found in the cache or had expired.
+        evictions: The number of entries removed to stay within the size budget.
+        expirations: The number of entries removed because their result expired.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@runtime_checkable
+class ResultCache(Protocol):
+    stats: ResultCacheStats
+
+    def get(self, key: str) -> Optional[ResultCacheEntry]:
+        """
+        Read the cached content for a storage key.
+
+        Expired entries are removed and treated as missing.
+
+        Args:
+            key: Unique identifier for the storage location of the content.
+
+        Returns:
+            The cache entry if present and not expired; None otherwise.
+        """
+        ...
+
+    def put(
+        self,
+        key: str,
+        content: bytes,
+        expiration: Optional[datetime.datetime] = None,
+    ) -> None:
+        """
+        Store content read from or written to a storage key.
+
+        Args:
+            key: Unique identifier for the storage location of the content.
+            content: The bytes stored at the storage location.
+            expiration: Datetime after which the content must no longer be served.
+        """
+        ...
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove any cached content for a storage key.
+
+        Args:
+            key: Unique identifier for the storage location of the content.
+        """
+        ...
@@ -0,0 +1,47 @@
+import datetime
+from typing import Optional, Sequence
+
+from .protocol import ResultCache, ResultCacheEntry, ResultCacheStats
+
+
+class TieredResultCache(ResultCache):
+    """
+    A result cache that combines several caches, from fastest to slowest.
+
+    Reads check each tier in order and copy content found in a slower tier into the
+    faster tiers. Writes and invalidations are applied to every tier. The `stats`
+    of this cache count lookups across all tiers; the stats of each tier are
+    available on the tiers themselves.
+
+    Attributes:
+        tiers: the caches to use, from fastest to slowest
+    """
+
+    def __init__(self, tiers: Sequence[ResultCache]):
+        self.tiers = list(tiers)
+        self.stats = ResultCacheStats()
+
+    def get(self, key: str) -> Optional[ResultCacheEntry]:
+        for index, tier in enumerate(self.tiers):
+            entry = tier.get(key)
+            if entry is not None:
+                for faster_tier in self.tiers[:index]:
+                    faster_tier.put(key, entry.content, entry.expiration)
+                self.stats.hits += 1
+                return entry
+
+        self.stats.misses += 1
+        return None
+
+    def put(
+        self,
+        key: str,
+        content: bytes,
+        expiration: Optional[datetime.datetime] = None,
+    ) -> None:
+        for tier in self.tiers:
+            tier.put(key, content, expiration)
+
+    def invalidate(self, key: str) -> None:
+        for tier in self.tiers:
+            tier.invalidate(key)
@@ -1,4 +1,5 @@
 import abc
+import hashlib
 import inspect
 import os
 import socket
@@ -7,6 +8,7 @@ import uuid
 from functools import partial
 from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
     Annotated,
     Any,
@@ -55,16 +57,23 @@ from syntask.filesystems import (
 )
 from syntask.locking.protocol import LockManager
 from syntask.logging import get_logger
-from syntask.serializers import PickleSerializer, Serializer
+from syntask.result_cache.filesystem import FileSystemResultCache
+from syntask.result_cache.memory import MemoryResultCache
+from syntask.result_cache.protocol import ResultCache
+from syntask.result_cache.tiered import TieredResultCache
+from syntask.serializers import ColumnarSerializer, PickleSerializer, Serializer
 from syntask.settings import (
     SYNTASK_DEFAULT_RESULT_STORAGE_BLOCK,
     SYNTASK_LOCAL_STORAGE_PATH,
     SYNTASK_RESULTS_DEFAULT_SERIALIZER,
+    SYNTASK_RESULTS_LOCAL_CACHE_DISK_MAX_BYTES,
+    SYNTASK_RESULTS_LOCAL_CACHE_MEMORY_MAX_BYTES,
+    SYNTASK_RESULTS_LOCAL_CACHE_PATH,
     SYNTASK_RESULTS_PERSIST_BY_DEFAULT,
     SYNTASK_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK,
 )
 from syntask.utilities.annotations import NotSet
-from syntask.utilities.asyncutils import sync_compatible
+from syntask.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from syntask.utilities.pydantic import get_dispatch_key, lookup_type, register_base_type
 
 if TYPE_CHECKING:
@@ -87,6 +96,7 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 _default_storages: Dict[Tuple[str, str], WritableFileSystem] = {}
+_default_result_caches: Dict[Tuple[int, str, int], Optional[ResultCache]] = {}
 
 
 @sync_compatible
@@ -112,6 +122,42 @@ async def get_default_result_storage() -> WritableFileSystem:
     return storage
 
 
+def get_default_result_cache() -> Optional[ResultCache]:
+    """
+    Get the local cache for content read from result storage, as configured by the
+    `SYNTASK_RESULTS_LOCAL_CACHE_*` settings.
+
+    The same cache is returned for the same settings so that all result stores in a
+    process share it. Returns `None` if no cache tier is enabled.
+    """
+    memory_max_bytes = SYNTASK_RESULTS_LOCAL_CACHE_MEMORY_MAX_BYTES.value()
+    disk_path = SYNTASK_RESULTS_LOCAL_CACHE_PATH.value()
+    disk_max_bytes = SYNTASK_RESULTS_LOCAL_CACHE_DISK_MAX_BYTES.value()
+
+    cache_key = (memory_max_bytes, str(disk_path), disk_max_bytes)
+
+    if cache_key not in _default_result_caches:
+        tiers = []
+        if memory_max_bytes > 0:
+            tiers.append(MemoryResultCache(max_bytes=memory_max_bytes))
+        if disk_path is not None and disk_max_bytes > 0:
+            tiers.append(
+                FileSystemResultCache(
+                    cache_directory=disk_path, max_bytes=disk_max_bytes
+                )
+            )
+
+        if not tiers:
+            cache = None
+        elif len(tiers) == 1:
+            cache = tiers[0]
+        else:
+            cache = TieredResultCache(tiers)
+        _default_result_caches[cache_key] = cache
+
+    return _default_result_caches[cache_key]
+
+
 @sync_compatible
 async def resolve_result_storage(
     result_storage: Union[ResultStorage, UUID, Path],
@@ -257,6 +303,9 @@ class ResultStore(BaseModel):
         cache_result_in_memory: Whether to cache results in memory.
         serializer: The serializer to use for results.
         storage_key_fn: The function to generate storage keys.
+        result_cache: A local cache for content read from remote result and metadata
+            storage. If not provided, the cache configured by the
+            `SYNTASK_RESULTS_LOCAL_CACHE_*` settings will be used.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -275,6 +324,9 @@ class ResultStore(BaseModel):
     serializer: Serializer = Field(default_factory=get_default_result_serializer)
     storage_key_fn: Callable[[], str] = Field(default=DEFAULT_STORAGE_KEY_FN)
     cache: LRUCache = Field(default_factory=lambda: LRUCache(maxsize=1000))
+    result_cache: Optional[ResultCache] = Field(
+        default_factory=get_default_result_cache
+    )
 
     # Deprecated fields
     persist_result: Optional[bool] = Field(default=None)
@@ -372,6 +424,110 @@ class ResultStore(BaseModel):
         thread_id = threading.get_ident()
         return f"{hostname}:{pid}:{thread_id}:{thread_name}"
 
+    def _result_cache_key(
+        self, storage: Union[WritableFileSystem, NullFileSystem, None], path: str
+    ) -> Optional[str]:
+        """
+        Get the key for content at a path of a storage block in the result cache.
+
+        Returns `None` if the content should not be cached, e.g. because it is
+        already stored on the local filesystem.
+        """
+        if self.result_cache is None or not isinstance(storage, WritableFileSystem):
+            return None
+        if isinstance(storage, LocalFileSystem):
+            return None
+
+        # the same content may be referenced by relative and resolved paths
+        if hasattr(storage, "_resolve_path"):
+            try:
+                path = str(storage._resolve_path(path))
+            except ValueError:
+                return None
+
+        if storage._block_document_id is not None:
+            storage_id = str(storage._block_document_id)
+        else:
+            storage_id = hashlib.sha256(
+                f"{type(storage).__name__}:{storage.model_dump_json()}".encode()
+            ).hexdigest()
+        return f"{storage_id}:{path}"
+
+    async def _read_path(
+        self, storage: Union[WritableFileSystem, NullFileSystem], path: str
+    ) -> Tuple[Optional[bytes], bool]:
+        """
+        Read content from storage, using the result cache if possible.
+
+        Returns:
+            A tuple of the content and whether it was served from the cache.
+        """
+        cache_key = self._result_cache_key(storage, path)
+        if cache_key is not None:
+            entry = self.result_cache.get(cache_key)
+            if entry is not None:
+                return entry.content, True
+        return await storage.read_path(path), False
+
+    def _cache_content(
+        self,
+        storage: Union[WritableFileSystem, NullFileSystem, None],
+        path: str,
+        content: Optional[bytes],
+        expiration: Optional[DateTime],
+    ):
+        """
+        Store content read from or written to storage in the result cache.
+        """
+        cache_key = self._result_cache_key(storage, path)
+        if cache_key is not None and content is not None:
+            self.result_cache.put(cache_key, content, expiration)
+
+    def _streams_result(self, serializer: Serializer) -> bool:
+        """
+        Whether results are streamed between the serializer and a local file instead
+        of being passed to and from storage as bytes.
+
+        This is only possible when results are stored separately from their metadata.
+        """
+        return (
+            self.metadata_storage is not None
+            and isinstance(serializer, ColumnarSerializer)
+            and isinstance(self.result_storage, LocalFileSystem)
+        )
+
+    async def _write_result_file(self, result_record: "ResultRecord"):
+        """
+        Stream a result to its file in local result storage.
+        """
+        path = self.result_storage._resolve_path(result_record.metadata.storage_key)
+
+        def write():
+            path.parent.mkdir(exist_ok=True, parents=True)
+            if path.exists() and not path.is_file():
+                raise ValueError(f"Path {path} already exists and is not a file.")
+
+            # Write to a new file and move it into place, so that results loaded from
+            # the previous file keep their memory map
+            tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                with open(tmp_path, "wb") as file:
+                    result_record.write_result(file)
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+        await run_sync_in_worker_thread(write)
+
+    async def _load_result_file(self, metadata: "ResultRecordMetadata") -> Any:
+        """
+        Load a result from its file in local result storage, memory-mapping its data.
+        """
+        path = self.result_storage._resolve_path(metadata.storage_key)
+        if not path.is_file():
+            raise ValueError(f"Path {path} does not exist.")
+        return await run_sync_in_worker_thread(metadata.serializer.load, path)
+
     @sync_compatible
     async def _exists(self, key: str) -> bool:
         """
@@ -387,20 +543,33 @@ class ResultStore(BaseModel):
             # TODO: Add an `exists` method to commonly used storage blocks
             # so the entire payload doesn't need to be read
             try:
-                metadata_content = await self.metadata_storage.read_path(key)
+                metadata_content, cached = await self._read_path(
+                    self.metadata_storage, key
+                )
                 if metadata_content is None:
                     return False
                 metadata = ResultRecordMetadata.load_bytes(metadata_content)
+                if not cached:
+                    self._cache_content(
+                        self.metadata_storage,
+                        key,
+                        metadata_content,
+                        metadata.expiration,
+                    )
 
             except Exception:
                 return False
         else:
             try:
-                content = await self.result_storage.read_path(key)
+                content, cached = await self._read_path(self.result_storage, key)
                 if content is None:
                     return False
                 record = ResultRecord.deserialize(content)
                 metadata = record.metadata
+                if not cached:
+                    self._cache_content(
+                        self.result_storage, key, content, metadata.expiration
+                    )
             except Exception:
                 return False
 
@@ -462,20 +631,45 @@ class ResultStore(BaseModel):
             self.result_storage = await get_default_result_storage()
 
         if self.metadata_storage is not None:
-            metadata_content = await self.metadata_storage.read_path(key)
+            metadata_content, metadata_cached = await self._read_path(
+                self.metadata_storage, key
+            )
             metadata = ResultRecordMetadata.load_bytes(metadata_content)
             assert (
                 metadata.storage_key is not None
             ), "Did not find storage key in metadata"
-            result_content = await self.result_storage.read_path(metadata.storage_key)
-            result_record = ResultRecord.deserialize_from_result_and_metadata(
-                result=result_content, metadata=metadata_content
-            )
+            if self._streams_result(metadata.serializer):
+                result_record = ResultRecord(
+                    metadata=metadata, result=await self._load_result_file(metadata)
+                )
+                result_content, result_cached = None, True
+            else:
+                result_content, result_cached = await self._read_path(
+                    self.result_storage, metadata.storage_key
+                )
+                result_record = ResultRecord.deserialize_from_result_and_metadata(
+                    result=result_content, metadata=metadata_content
+                )
+            if not metadata_cached:
+                self._cache_content(
+                    self.metadata_storage, key, metadata_content, metadata.expiration
+                )
+            if not result_cached:
+                self._cache_content(
+                    self.result_storage,
+                    metadata.storage_key,
+                    result_content,
+                    metadata.expiration,
+                )
         else:
-            content = await self.result_storage.read_path(key)
+            content, cached = await self._read_path(self.result_storage, key)
             result_record = ResultRecord.deserialize(
                 content, backup_serializer=self.serializer
             )
+            if not cached:
+                self._cache_content(
+                    self.result_storage, key, content, result_record.expiration
+                )
 
         if self.cache_result_in_memory:
             if self.result_storage_block_id is None and hasattr(
@@ -643,20 +837,43 @@ class ResultStore(BaseModel):
         if self.result_storage is None:
             self.result_storage = await get_default_result_storage()
 
+        expiration = result_record.metadata.expiration
+
         # If metadata storage is configured, write result and metadata separately
         if self.metadata_storage is not None:
-            await self.result_storage.write_path(
-                result_record.metadata.storage_key,
-                content=result_record.serialize_result(),
-            )
+            if self._streams_result(result_record.serializer):
+                await self._write_result_file(result_record)
+            else:
+                result_content = result_record.serialize_result()
+                await self.result_storage.write_path(
+                    result_record.metadata.storage_key,
+                    content=result_content,
+                )
+                self._cache_content(
+                    self.result_storage,
+                    result_record.metadata.storage_key,
+                    result_content,
+                    expiration,
+                )
+            metadata_content = result_record.serialize_metadata()
             await self.metadata_storage.write_path(
                 base_key,
-                content=result_record.serialize_metadata(),
+                content=metadata_content,
+            )
+            self._cache_content(
+                self.metadata_storage, base_key, metadata_content, expiration
             )
         # Otherwise, write the result metadata and result together
         else:
+            content = result_record.serialize()
             await self.result_storage.write_path(
-                result_record.metadata.storage_key, content=result_record.serialize()
+                result_record.metadata.storage_key, content=content
+            )
+            self._cache_content(
+                self.result_storage,
+                result_record.metadata.storage_key,
+                content,
+                expiration,
             )
 
         if self.cache_result_in_memory:
@@ -977,46 +1194,59 @@ class ResultRecord(BaseModel, Generic[R]):
         try:
             data = self.serializer.dumps(self.result)
         except Exception as exc:
-            extra_info = (
-                'You can try a different serializer (e.g. result_serializer="json") '
-                "or disabling persistence (persist_result=False) for this flow or task."
-            )
-            # check if this is a known issue with cloudpickle and pydantic
-            # and add extra information to help the user recover
-
-            if (
-                isinstance(exc, TypeError)
-                and isinstance(self.result, BaseModel)
-                and str(exc).startswith("cannot pickle")
-            ):
-                try:
-                    from IPython import get_ipython
-
-                    if get_ipython() is not None:
-                        extra_info = inspect.cleandoc(
-                            """
-                            This is a known issue in Pydantic that prevents
-                            locally-defined (non-imported) models from being
-                            serialized by cloudpickle in IPython/Jupyter
-                            environments. Please see
-                            https://github.com/pydantic/pydantic/issues/8232 for
-                            more information. To fix the issue, either: (1) move
-                            your Pydantic class definition to an importable
-                            location, (2) use the JSON serializer for your flow
-                            or task (`result_serializer="json"`), or (3)
-                            disable result persistence for your flow or task
-                            (`persist_result=False`).
-                            """
-                        ).replace("\n", " ")
-                except ImportError:
-                    pass
-            raise SerializationError(
-                f"Failed to serialize object of type {type(self.result).__name__!r} with "
-                f"serializer {self.serializer.type!r}. {extra_info}"
-            ) from exc
+            raise self._serialization_error(exc) from exc
 
         return data
 
+    def write_result(self, file: IO[bytes]) -> None:
+        """
+        Stream the serialized result to a binary file. Only supported by serializers
+        with a `dump` method, such as the `ColumnarSerializer`.
+        """
+        try:
+            self.serializer.dump(self.result, file)
+        except Exception as exc:
+            raise self._serialization_error(exc) from exc
+
+    def _serialization_error(self, exc: Exception) -> SerializationError:
+        extra_info = (
+            'You can try a different serializer (e.g. result_serializer="json") '
+            "or disabling persistence (persist_result=False) for this flow or task."
+        )
+        # check if this is a known issue with cloudpickle and pydantic
+        # and add extra information to help the user recover
+
+        if (
+            isinstance(exc, TypeError)
+            and isinstance(self.result, BaseModel)
+            and str(exc).startswith("cannot pickle")
+        ):
+            try:
+                from IPython import get_ipython
+
+                if get_ipython() is not None:
+                    extra_info = inspect.cleandoc(
+                        """
+                        This is a known issue in Pydantic that prevents
+                        locally-defined (non-imported) models from being
+                        serialized by cloudpickle in IPython/Jupyter
+                        environments. Please see
+                        https://github.com/pydantic/pydantic/issues/8232 for
+                        more information. To fix the issue, either: (1) move
+                        your Pydantic class definition to an importable
+                        location, (2) use the JSON serializer for your flow
+                        or task (`result_serializer="json"`), or (3)
+                        disable result persistence for your flow or task
+                        (`persist_result=False`).
+                        """
+                    ).replace("\n", " ")
+            except ImportError:
+                pass
+        return SerializationError(
+            f"Failed to serialize object of type {type(self.result).__name__!r} with "
+            f"serializer {self.serializer.type!r}. {extra_info}"
+        )
+
     @model_validator(mode="before")
     @classmethod
     def coerce_old_format(cls, value: Any):
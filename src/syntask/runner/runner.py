@@ -50,6 +50,7 @@ from uuid import UUID, uuid4
 import anyio
 import anyio.abc
 import pendulum
+from starlette import status
 
 from syntask._internal.concurrency.api import (
     create_call,
@@ -79,7 +80,7 @@ from syntask.events import DeploymentTriggerTypes, TriggerTypes
 from syntask.events.related import tags_as_related_resources
 from syntask.events.schemas.events import RelatedResource
 from syntask.events.utilities import emit_event
-from syntask.exceptions import Abort, ObjectNotFound
+from syntask.exceptions import Abort, ObjectNotFound, SyntaskHTTPStatusError
 from syntask.flows import Flow, load_flow_from_flow_run
 from syntask.logging.loggers import SyntaskLogAdapter, flow_run_logger, get_logger
 from syntask.runner.storage import RunnerStorage
@@ -93,6 +94,7 @@ from syntask.settings import (
 from syntask.states import (
     Crashed,
     Pending,
+    Scheduled,
     exception_to_failed_state,
 )
 from syntask.types.entrypoint import EntrypointType
@@ -184,6 +186,7 @@ class Runner:
 
         self.query_seconds = query_seconds or SYNTASK_RUNNER_POLL_FREQUENCY.value()
         self._prefetch_seconds = prefetch_seconds
+        self._claim_scheduled_flow_runs = True
 
         self._limiter: Optional[anyio.CapacityLimiter] = None
         self._client = get_client()
@@ -838,7 +841,7 @@ class Runner:
             except ObjectNotFound:
                 deployment = None
             try:
-                flow = await self._client.read_flow(flow_run.flow_id)
+                flow = await self._client.read_flow(flow_run.flow_id, use_cache=True)
             except ObjectNotFound:
                 flow = None
             self._emit_flow_run_cancelled_event(
@@ -902,19 +905,50 @@ class Runner:
         self,
     ) -> List["FlowRun"]:
         """
-        Retrieve scheduled flow runs for this runner.
+        Claim scheduled flow runs for this runner, taking no more runs than it has
+        slots available for.
         """
+        if not self.has_slots_available():
+            self._logger.debug(
+                "Flow run limit reached; not querying for scheduled flow runs"
+            )
+            return []
+
         scheduled_before = pendulum.now("utc").add(seconds=int(self._prefetch_seconds))
         self._logger.debug(
             f"Querying for flow runs scheduled before {scheduled_before}"
         )
 
-        scheduled_flow_runs = (
-            await self._client.get_scheduled_flow_runs_for_deployments(
-                deployment_ids=list(self._deployment_ids),
-                scheduled_before=scheduled_before,
+        limit = int(self._limiter.available_tokens)
+        if self._claim_scheduled_flow_runs:
+            try:
+                scheduled_flow_runs = (
+                    await self._client.claim_scheduled_flow_runs_for_deployments(
+                        deployment_ids=list(self._deployment_ids),
+                        scheduled_before=scheduled_before,
+                        limit=limit,
+                    )
+                )
+            except SyntaskHTTPStatusError as exc:
+                if exc.response.status_code not in (
+                    status.HTTP_404_NOT_FOUND,
+                    status.HTTP_405_METHOD_NOT_ALLOWED,
+                ):
+                    raise
+                self._logger.debug(
+                    "Server does not support claiming flow runs; proposing PENDING "
+                    "for each flow run instead"
+                )
+                self._claim_scheduled_flow_runs = False
+
+        if not self._claim_scheduled_flow_runs:
+            scheduled_flow_runs = (
+                await self._client.get_scheduled_flow_runs_for_deployments(
+                    deployment_ids=list(self._deployment_ids),
+                    scheduled_before=scheduled_before,
+                    limit=limit,
+                )
             )
-        )
         self._logger.debug(f"Discovered {len(scheduled_flow_runs)} scheduled_flow_runs")
         return scheduled_flow_runs
 
@@ -977,10 +1011,16 @@ class Runner:
         for execution by the runner.
         """
         submittable_flow_runs = flow_run_response
-        submittable_flow_runs.sort(key=lambda run: run.next_scheduled_start_time)
+        # claimed runs are already pending, so their next scheduled start time has
+        # been cleared
+        submittable_flow_runs.sort(
+            key=lambda run: run.next_scheduled_start_time or run.expected_start_time
+        )
+        skipped_flow_runs: List["FlowRun"] = []
 
         for i, flow_run in enumerate(submittable_flow_runs):
             if flow_run.id in self._submitting_flow_run_ids:
+                skipped_flow_runs.append(flow_run)
                 continue
 
             if self._acquire_limit_slot(flow_run.id):
@@ -999,8 +1039,15 @@ class Runner:
                     )
                 )
             else:
+                skipped_flow_runs.extend(submittable_flow_runs[i:])
                 break
 
+        # runs claimed for this runner that it won't submit must be released for
+        # another runner to claim
+        for flow_run in skipped_flow_runs:
+            if flow_run.state and flow_run.state.is_pending():
+                await self._propose_scheduled_state(flow_run)
+
         return list(
             filter(
                 lambda run: run.id in self._submitting_flow_run_ids,
@@ -1105,6 +1152,11 @@ class Runner:
     async def _propose_pending_state(self, flow_run: "FlowRun") -> bool:
         run_logger = self._get_flow_run_logger(flow_run)
         state = flow_run.state
+        if state and state.is_pending():
+            # the run was claimed for this runner, which already placed it in a
+            # PENDING state
+            return True
+
         try:
             state = await propose_state(
                 self._client, Pending(), flow_run_id=flow_run.id
@@ -1134,6 +1186,26 @@ class Runner:
 
         return True
 
+    async def _propose_scheduled_state(self, flow_run: "FlowRun") -> None:
+        """
+        Returns a flow run that this runner will not run to its scheduled state, so
+        that it can be picked up again.
+        """
+        run_logger = self._get_flow_run_logger(flow_run)
+        try:
+            await propose_state(
+                self._client,
+                Scheduled(scheduled_time=flow_run.expected_start_time),
+                flow_run_id=flow_run.id,
+            )
+        except Abort:
+            pass
+        except Exception:
+            run_logger.error(
+                f"Failed to update state of flow run '{flow_run.id}'",
+                exc_info=True,
+            )
+
     async def _propose_failed_state(self, flow_run: "FlowRun", exc: Exception) -> None:
         run_logger = self._get_flow_run_logger(flow_run)
         try:
@@ -118,7 +118,7 @@ async def _get_task_run(task_run_id):
 async def _get_flow_from_run(flow_run_id):
     async with get_client() as client:
         flow_run = await client.read_flow_run(flow_run_id)
-        return await client.read_flow(flow_run.flow_id)
+        return await client.read_flow(flow_run.flow_id, use_cache=True)
 
 
 def get_id() -> Optional[str]:
@@ -13,7 +13,11 @@ bytes to an object respectively.
 
 import abc
 import base64
-from typing import Any, Dict, Generic, Optional, Type
+import binascii
+import io
+import sys
+from pathlib import Path
+from typing import IO, Any, Dict, Generic, Optional, Type, Union
 
 from pydantic import (
     BaseModel,
@@ -255,3 +259,148 @@ class CompressedJSONSerializer(CompressedSerializer):
     type: Literal["compressed/json"] = "compressed/json"
 
     serializer: Serializer = Field(default_factory=JSONSerializer)
+
+
+NPY_MAGIC = b"\x93NUMPY"
+ARROW_IPC_MAGIC = b"\xff\xff\xff\xff"
+
+
+class ColumnarSerializer(Serializer):
+    """
+    Serializes arrays and tables in columnar formats that can be loaded without
+    copying.
+
+    - NumPy arrays are written in the `.npy` format, unless they hold Python objects
+        or are a subclass of `numpy.ndarray`, such as a masked array.
+    - PyArrow tables and record batches, and pandas data frames, are written in the
+        Arrow IPC stream format, unless a data frame cannot be converted to Arrow.
+    - Any other object is written with the `fallback_serializer`.
+
+    `dump` streams the object to a file, so persisting a large result does not need a
+    second copy of it in memory. `load` memory-maps the file, so the loaded arrays are
+    backed by the file rather than by a copy of its contents. `dumps` wraps arrays and
+    tables in base64 so they can be embedded in a result record, and returns the
+    output of the `fallback_serializer` as is, the same as `dump` writes it.
+    """
+
+    type: Literal["columnar"] = "columnar"
+
+    fallback_serializer: Serializer = Field(default_factory=PickleSerializer)
+    record_batch_size: int = Field(
+        default=64_000,
+        description="The number of rows per record batch when writing Arrow tables.",
+    )
+
+    @field_validator("fallback_serializer", mode="before")
+    def validate_fallback_serializer(cls, value):
+        return cast_type_names_to_serializers(value)
+
+    def dump(self, obj: Any, file: IO[bytes]) -> None:
+        """Write the object to a binary file."""
+        numpy = _import_if_loaded("numpy")
+        # Subclasses such as masked arrays carry more than the raw data that `.npy`
+        # holds, so they are written with the fallback serializer
+        if numpy is not None and type(obj) is numpy.ndarray and not obj.dtype.hasobject:
+            numpy.lib.format.write_array(file, obj, allow_pickle=False)
+            return
+
+        table = self._to_arrow_table(obj)
+        if table is None:
+            file.write(self.fallback_serializer.dumps(obj))
+            return
+
+        import pyarrow
+
+        with pyarrow.ipc.new_stream(file, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=self.record_batch_size):
+                writer.write_batch(batch)
+
+    def load(self, path: Union[str, Path]) -> Any:
+        """Read an object from a file, memory-mapping arrays and tables."""
+        with open(path, "rb") as file:
+            magic = file.read(len(NPY_MAGIC))
+
+        if magic.startswith(NPY_MAGIC):
+            import numpy
+
+            return numpy.load(path, mmap_mode="r", allow_pickle=False)
+        elif magic.startswith(ARROW_IPC_MAGIC):
+            import pyarrow
+
+            with pyarrow.memory_map(str(path), "r") as source:
+                reader = pyarrow.ipc.open_stream(source)
+                return self._from_arrow_table(reader.read_all())
+        else:
+            return self.fallback_serializer.loads(Path(path).read_bytes())
+
+    def dumps(self, obj: Any) -> bytes:
+        buffer = io.BytesIO()
+        self.dump(obj, buffer)
+        if not _is_columnar(buffer.getbuffer()[: len(NPY_MAGIC)].tobytes()):
+            return buffer.getvalue()
+        return base64.encodebytes(buffer.getbuffer())
+
+    def loads(self, blob: bytes) -> Any:
+        if not _is_columnar(blob):
+            # Either `dumps` output or the raw content of a file written by `dump`, and
+            # only arrays and tables are wrapped in base64 by `dumps`
+            try:
+                decoded = base64.decodebytes(blob)
+            except binascii.Error:
+                decoded = b""
+            if not _is_columnar(decoded):
+                return self.fallback_serializer.loads(blob)
+            blob = decoded
+
+        if blob.startswith(NPY_MAGIC):
+            import numpy
+
+            return numpy.load(io.BytesIO(blob), allow_pickle=False)
+
+        import pyarrow
+
+        reader = pyarrow.ipc.open_stream(pyarrow.py_buffer(blob))
+        return self._from_arrow_table(reader.read_all())
+
+    @staticmethod
+    def _to_arrow_table(obj: Any) -> Any:
+        pandas = _import_if_loaded("pandas")
+        pyarrow = _import_if_loaded("pyarrow")
+        if pandas is not None and isinstance(obj, pandas.DataFrame):
+            try:
+                import pyarrow
+            except ImportError:
+                return None
+
+            try:
+                return pyarrow.Table.from_pandas(obj)
+            except pyarrow.ArrowException:
+                # Not every data frame has an Arrow schema, such as one with a column
+                # of mixed Python types
+                return None
+        elif pyarrow is not None and isinstance(obj, pyarrow.RecordBatch):
+            return pyarrow.Table.from_batches([obj])
+        elif pyarrow is not None and isinstance(obj, pyarrow.Table):
+            return obj
+        return None
+
+    @staticmethod
+    def _from_arrow_table(table: Any) -> Any:
+        if table.schema.pandas_metadata is not None:
+            return table.to_pandas()
+        return table
+
+
+def _is_columnar(blob: bytes) -> bool:
+    """Whether the data was written in the `.npy` or Arrow IPC stream format."""
+    return blob.startswith((NPY_MAGIC, ARROW_IPC_MAGIC))
+
+
+def _import_if_loaded(name: str) -> Any:
+    """
+    Return a module if it has already been imported.
+
+    An object can only be an instance of a library's types if the library has been
+    imported, so this avoids importing optional libraries that are not in use.
+    """
+    return sys.modules.get(name)
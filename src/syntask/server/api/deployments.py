@@ -3,7 +3,7 @@ Routes for interacting with Deployment objects.
 """
 
 import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Type
 from uuid import UUID
 
 import jsonschema.exceptions
@@ -25,7 +25,10 @@ from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.exceptions import MissingVariableError, ObjectNotFoundError
 from syntask.server.models.deployments import mark_deployments_ready
 from syntask.server.models.workers import DEFAULT_AGENT_WORK_POOL_NAME
+from syntask.server.orchestration import dependencies as orchestration_dependencies
+from syntask.server.orchestration.policies import BaseOrchestrationPolicy
 from syntask.server.schemas.responses import DeploymentPaginationResponse
+from syntask.server.services.foreman import get_poll_aggregator
 from syntask.server.utilities.server import SyntaskRouter
 from syntask.utilities.schema_tools.hydration import (
     HydrationContext,
@@ -449,13 +452,75 @@ async def get_scheduled_flow_runs_for_deployments(
             for orm_flow_run in orm_flow_runs
         ]
 
+    _mark_polled_deployments_ready(background_tasks, deployment_ids)
+
+    return flow_run_responses
+
+
+@router.post("/claim_scheduled_flow_runs")
+async def claim_scheduled_flow_runs_for_deployments(
+    background_tasks: BackgroundTasks,
+    deployment_ids: List[UUID] = Body(
+        default=..., description="The deployment IDs to claim scheduled runs for"
+    ),
+    scheduled_before: DateTime = Body(
+        None, description="The maximum time to look for scheduled flow runs"
+    ),
+    limit: int = dependencies.LimitBody(),
+    db: SyntaskDBInterface = Depends(provide_database_interface),
+    flow_policy: Type[BaseOrchestrationPolicy] = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
+    api_version=Depends(dependencies.provide_request_api_version),
+) -> List[schemas.responses.FlowRunResponse]:
+    """
+    Claim scheduled runs for a set of deployments, moving them into a PENDING state
+    so that they are not given to any other runner. Used by a runner to poll for
+    work.
+    """
+    # pass the request version to the orchestration engine to support compatibility code
+    orchestration_parameters.update({"api-version": api_version})
+
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        orm_flow_runs = await models.deployments.claim_scheduled_flow_runs(
+            session=session,
+            deployment_ids=deployment_ids,
+            scheduled_before=scheduled_before,
+            limit=limit,
+            flow_policy=flow_policy,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+        flow_run_responses = [
+            schemas.responses.FlowRunResponse.model_validate(
+                orm_flow_run, from_attributes=True
+            )
+            for orm_flow_run in orm_flow_runs
+        ]
+
+    _mark_polled_deployments_ready(background_tasks, deployment_ids)
+
+    return flow_run_responses
+
+
+def _mark_polled_deployments_ready(
+    background_tasks: BackgroundTasks, deployment_ids: List[UUID]
+) -> None:
+    poll_aggregator = get_poll_aggregator()
+    if poll_aggregator:
+        poll_aggregator.record_deployment_polls(deployment_ids=deployment_ids)
+        return
+
     background_tasks.add_task(
         mark_deployments_ready,
         deployment_ids=deployment_ids,
     )
 
-    return flow_run_responses
-
 
 @router.post("/count")
 async def count_deployments(
@@ -1,13 +1,15 @@
 import base64
-from typing import List, Optional
+import zlib
+from typing import Any, List, Mapping, Optional
 
 from fastapi import Response, WebSocket, status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends, Path
 from fastapi.params import Body, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
-from starlette.status import WS_1002_PROTOCOL_ERROR
+from starlette.status import WS_1002_PROTOCOL_ERROR, WS_1009_MESSAGE_TOO_BIG
 
 from syntask.logging import get_logger
 from syntask.server.api.dependencies import is_ephemeral_request
@@ -31,6 +33,7 @@ from syntask.server.events.storage import (
 from syntask.server.utilities import subscriptions
 from syntask.server.utilities.server import SyntaskRouter
 from syntask.settings import (
+    SYNTASK_EVENTS_MAXIMUM_BATCH_SIZE_BYTES,
     SYNTASK_EVENTS_MAXIMUM_WEBSOCKET_BACKFILL,
     SYNTASK_EVENTS_WEBSOCKET_BACKFILL_PAGE_SIZE,
 )
@@ -54,6 +57,46 @@ async def create_events(
         await messaging.publish(received_events)
 
 
+EVENTS_BATCH = TypeAdapter(List[Event])
+
+
+class MessageTooLarge(ValueError):
+    """Raised when a message on the incoming events WebSocket exceeds
+    `SYNTASK_EVENTS_MAXIMUM_BATCH_SIZE_BYTES`"""
+
+
+def events_from_message(message: Mapping[str, Any]) -> List[Event]:
+    """
+    Parse the events in a message received on the incoming events WebSocket, which is
+    either a single event as a JSON object, or a batch of events as a JSON array.
+    Batches may be sent as zlib-compressed binary messages.
+
+    Raises:
+        MessageTooLarge: if the message, once decompressed, is larger than
+            `SYNTASK_EVENTS_MAXIMUM_BATCH_SIZE_BYTES`
+    """
+    limit = SYNTASK_EVENTS_MAXIMUM_BATCH_SIZE_BYTES.value()
+
+    if message.get("text") is not None:
+        data = message["text"].encode()
+    else:
+        # Never inflate more than one byte past the limit, so that a small compressed
+        # message can't expand into an unbounded amount of memory
+        decompressor = zlib.decompressobj()
+        data = decompressor.decompress(message["bytes"], limit + 1)
+        if len(data) <= limit and not decompressor.eof:
+            raise zlib.error("Incomplete or truncated compressed message")
+
+    if len(data) > limit:
+        raise MessageTooLarge(
+            f"Message exceeds the maximum batch size of {limit} bytes"
+        )
+
+    if data.lstrip().startswith(b"["):
+        return EVENTS_BATCH.validate_json(data)
+    return [Event.model_validate_json(data)]
+
+
 @router.websocket("/in")
 async def stream_events_in(websocket: WebSocket) -> None:
     """Open a WebSocket to stream incoming Events"""
@@ -62,9 +105,22 @@ async def stream_events_in(websocket: WebSocket) -> None:
 
     try:
         async with messaging.create_event_publisher() as publisher:
-            async for event_json in websocket.iter_text():
-                event = Event.model_validate_json(event_json)
-                await publisher.publish_event(event.receive())
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+
+                try:
+                    events = events_from_message(message)
+                except MessageTooLarge as exc:
+                    return await websocket.close(
+                        WS_1009_MESSAGE_TOO_BIG, reason=str(exc)
+                    )
+
+                # The messaging layer's publishers have no batch API, so the events
+                # of a batch are published individually over the same publisher
+                for event in events:
+                    await publisher.publish_event(event.receive())
     except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:  # pragma: no cover
         pass  # it's fine if a client disconnects either normally or abnormally
 
@@ -2,9 +2,12 @@
 Routes for interacting with log objects.
 """
 
-from typing import List
+from typing import AsyncGenerator, List, Optional
+from uuid import UUID
 
-from fastapi import Body, Depends, status
+from fastapi import Body, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic_extra_types.pendulum_dt import DateTime
 
 import syntask.server.api.dependencies as dependencies
 import syntask.server.models as models
@@ -22,7 +25,12 @@ async def create_logs(
     db: SyntaskDBInterface = Depends(provide_database_interface),
 ):
     """Create new logs from the provided schema."""
-    for batch in models.logs.split_logs_into_batches(logs):
+    if models.logs.copies_logs(db):
+        batches = [logs]
+    else:
+        batches = models.logs.split_logs_into_batches(logs)
+
+    for batch in batches:
         async with db.session_context(begin_transaction=True) as session:
             await models.logs.create_logs(session=session, logs=batch)
 
@@ -42,3 +50,63 @@ async def read_logs(
         return await models.logs.read_logs(
             session=session, log_filter=logs, offset=offset, limit=limit, sort=sort
         )
+
+
+# The number of logs read from the database at a time while streaming
+LOGS_STREAM_PAGE_SIZE = 1000
+
+
+@router.post("/stream")
+async def stream_logs(
+    logs: schemas.filters.LogFilter = None,
+    after_timestamp: Optional[DateTime] = Body(
+        None, description="The timestamp of the log to start after."
+    ),
+    after_id: Optional[UUID] = Body(
+        None, description="The ID of the log to start after."
+    ),
+    db: SyntaskDBInterface = Depends(provide_database_interface),
+) -> StreamingResponse:
+    """
+    Stream all logs matching a filter as newline-delimited JSON, in order of their
+    timestamp and ID.
+
+    To continue a stream, pass the timestamp and ID of the last log received.  The
+    response is compressed if the client accepts gzip encoding.
+    """
+    if (after_timestamp is None) != (after_id is None):
+        raise HTTPException(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="`after_timestamp` and `after_id` must be provided together.",
+        )
+
+    after = (after_timestamp, after_id) if after_timestamp and after_id else None
+
+    async def generate() -> AsyncGenerator[str, None]:
+        cursor = after
+        while True:
+            # Each page is read in its own session so that a slow reader does not
+            # hold a database connection for the length of the stream
+            async with db.session_context() as session:
+                page = await models.logs.read_logs_after(
+                    session=session,
+                    log_filter=logs,
+                    after=cursor,
+                    limit=LOGS_STREAM_PAGE_SIZE,
+                )
+
+            if page:
+                yield "".join(
+                    schemas.core.Log.model_validate(
+                        log, from_attributes=True
+                    ).model_dump_json()
+                    + "\n"
+                    for log in page
+                )
+
+            if len(page) < LOGS_STREAM_PAGE_SIZE:
+                break
+
+            cursor = (page[-1].timestamp, page[-1].id)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
@@ -567,6 +567,12 @@ def create_app(
         if syntask.settings.SYNTASK_API_SERVICES_EVENT_PERSISTER_ENABLED:
             service_instances.append(EventPersister())
 
+        if syntask.settings.SYNTASK_API_SERVICES_EVENT_RETENTION_ENABLED.value():
+            service_instances.append(services.event_retention.EventRetention())
+
+        if syntask.settings.SYNTASK_API_SERVICES_LOG_RETENTION_ENABLED.value():
+            service_instances.append(services.log_retention.LogRetention())
+
         if syntask.settings.SYNTASK_API_EVENTS_STREAM_OUT_ENABLED:
             service_instances.append(stream.Distributor())
 
@@ -275,6 +275,46 @@ async def set_task_run_state(
     return orchestration_result
 
 
+@router.post("/set_states")
+async def set_task_run_states(
+    task_run_states: List[schemas.actions.TaskRunStateCreate] = Body(
+        ..., description="The intended states, paired with their task run ids."
+    ),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transitions. If True, orchestration rules are not applied."
+        ),
+    ),
+    db: SyntaskDBInterface = Depends(provide_database_interface),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[OrchestrationResult]:
+    """
+    Set the states of many task runs in a single transaction, invoking any
+    orchestration rules. Results are returned in the order the states were given.
+    """
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        return await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_states=[
+                (
+                    task_run_state.task_run_id,
+                    # convert to a full State object
+                    schemas.states.State.model_validate(task_run_state.state),
+                )
+                for task_run_state in task_run_states
+            ],
+            force=force,
+            task_policy=CoreTaskPolicy,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+
 @router.websocket("/subscriptions/scheduled")
 async def scheduled_task_subscription(websocket: WebSocket):
     websocket = await subscriptions.accept_syntask_socket(websocket)
@@ -1,5 +1,5 @@
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, cast
 
 import pendulum
@@ -15,6 +15,7 @@ from syntask.server import models
 from syntask.server.database.dependencies import provide_database_interface
 from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.utilities.server import SyntaskRouter
+from syntask.settings import SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED
 
 logger = get_logger("orion.api.ui.task_runs")
 
@@ -38,31 +39,37 @@ class TaskRunCount(SyntaskBaseModel):
 
 
 def _postgres_bucket_expression(
-    db: SyntaskDBInterface, delta: pendulum.Duration, start_datetime: datetime
+    db: SyntaskDBInterface,
+    delta: pendulum.Duration,
+    start_datetime: datetime,
+    column=None,
 ):
     # asyncpg under Python 3.7 doesn't support timezone-aware datetimes for the EXTRACT
     # function, so we will send it as a naive datetime in UTC
     if sys.version_info < (3, 8):
         start_datetime = start_datetime.astimezone(timezone.utc).replace(tzinfo=None)
 
+    if column is None:
+        column = db.TaskRun.start_time
+
     return sa.func.floor(
-        (
-            sa.func.extract("epoch", db.TaskRun.start_time)
-            - sa.func.extract("epoch", start_datetime)
-        )
+        (sa.func.extract("epoch", column) - sa.func.extract("epoch", start_datetime))
         / delta.total_seconds()
     ).label("bucket")
 
 
 def _sqlite_bucket_expression(
-    db: SyntaskDBInterface, delta: pendulum.Duration, start_datetime: datetime
+    db: SyntaskDBInterface,
+    delta: pendulum.Duration,
+    start_datetime: datetime,
+    column=None,
 ):
+    if column is None:
+        column = db.TaskRun.start_time
+
     return sa.func.floor(
         (
-            (
-                sa.func.strftime("%s", db.TaskRun.start_time)
-                - sa.func.strftime("%s", start_datetime)
-            )
+            (sa.func.strftime("%s", column) - sa.func.strftime("%s", start_datetime))
             / delta.total_seconds()
         )
     ).label("bucket")
@@ -84,6 +91,12 @@ async def read_dashboard_task_run_counts(
             detail="task_runs.start_time.after_ is required",
         )
 
+    use_rollups = SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED.value() and (
+        _only_filters_start_time(
+            task_runs, flows, flow_runs, deployments, work_pools, work_queues
+        )
+    )
+
     # We only care about task runs that are in a terminal state, all others
     # should be ignored.
     task_runs.state = schemas.filters.TaskRunFilterState(
@@ -121,11 +134,20 @@ async def read_dashboard_task_run_counts(
             start_time.microsecond,
             start_time.timezone,
         )
-        bucket_expression = (
-            _sqlite_bucket_expression(db, delta, start_datetime)
+        bucket_expression_for = (
+            _sqlite_bucket_expression
             if db.dialect.name == "sqlite"
-            else _postgres_bucket_expression(db, delta, start_datetime)
+            else _postgres_bucket_expression
         )
+        bucket_expression = bucket_expression_for(db, delta, start_datetime)
+
+        # With rollups, only the task runs that started in the minutes split
+        # between two buckets, or cut short by the filter, are counted one by one
+        partial_minutes: List[DateTime] = []
+        if use_rollups:
+            partial_minutes = _partial_minutes(
+                task_runs.start_time, start_time, end_time, delta, bucket_count
+            )
 
         raw_counts = (
             (
@@ -160,6 +182,20 @@ async def read_dashboard_task_run_counts(
                     work_queue_filter=work_queues,
                 )
             )
+            .where(
+                sa.or_(
+                    sa.false(),
+                    *[
+                        sa.and_(
+                            db.TaskRun.start_time >= minute,
+                            db.TaskRun.start_time < minute.add(minutes=1),
+                        )
+                        for minute in partial_minutes
+                    ],
+                )
+                if use_rollups
+                else sa.true()
+            )
             .group_by("bucket", db.TaskRun.start_time)
             .subquery()
         )
@@ -177,20 +213,89 @@ async def read_dashboard_task_run_counts(
             .order_by(sa.asc("oldest"))
         )
 
-        result = await session.execute(query)
+        rows = list(await session.execute(query))
+
+        if use_rollups:
+            rollup = db.TaskRunStateRollup
+            rollup_query = (
+                sa.select(
+                    bucket_expression_for(
+                        db, delta, start_datetime, column=rollup.bucket
+                    ),
+                    sa.func.sum(
+                        sa.case(
+                            (rollup.state_type.in_(FAILED_STATES), rollup.count),
+                            else_=0,
+                        )
+                    ).label("failed_count"),
+                    sa.func.sum(
+                        sa.case(
+                            (rollup.state_type.notin_(FAILED_STATES), rollup.count),
+                            else_=0,
+                        )
+                    ).label("successful_count"),
+                )
+                .where(
+                    rollup.bucket >= start_time,
+                    rollup.bucket <= end_time,
+                    rollup.bucket.notin_(partial_minutes),
+                )
+                .group_by("bucket")
+            )
+            rows.extend(await session.execute(rollup_query))
 
     # Ensure that all buckets of time are present in the result even if no
     # matching task runs occurred during the given time period.
     buckets = [TaskRunCount(completed=0, failed=0) for _ in range(bucket_count)]
 
-    for row in result:
+    for row in rows:
         index = int(row.bucket)
-        buckets[index].completed = row.successful_count
-        buckets[index].failed = row.failed_count
+        buckets[index].completed += row.successful_count
+        buckets[index].failed += row.failed_count
 
     return buckets
 
 
+def _only_filters_start_time(
+    task_runs: schemas.filters.TaskRunFilter, *other_filters
+) -> bool:
+    """Whether the dashboard filters can be answered from the task run rollups"""
+
+    def criteria(filter) -> set:
+        if filter is None:
+            return set()
+        return set(filter.model_dump(exclude={"operator"}, exclude_none=True))
+
+    if any(criteria(filter) for filter in other_filters):
+        return False
+    if criteria(task_runs) - {"start_time"}:
+        return False
+    return not (task_runs.start_time and task_runs.start_time.is_null_)
+
+
+def _partial_minutes(
+    start_time_filter: schemas.filters.TaskRunFilterStartTime,
+    start_time: DateTime,
+    end_time: DateTime,
+    delta: timedelta,
+    bucket_count: int,
+) -> List[DateTime]:
+    """
+    Returns the minutes whose task runs can't all be counted in the same bucket from
+    the rollups, because they span two buckets or are only partly within the filter
+    """
+    minutes = {
+        (start_time + delta * i).start_of("minute") for i in range(1, bucket_count)
+    }
+
+    if start_time_filter.after_ != start_time:
+        minutes.add(start_time)
+    if start_time_filter.before_ and start_time_filter.before_ != end_time:
+        minutes.add(start_time_filter.before_.start_of("minute"))
+
+    return sorted(minutes)
+
+
 @router.post("/count")
 async def read_task_run_counts_by_state(
     flows: Optional[schemas.filters.FlowFilter] = None,
@@ -28,6 +28,7 @@ from syntask.server.models.work_queues import (
     mark_work_queues_ready,
 )
 from syntask.server.schemas.statuses import WorkQueueStatus
+from syntask.server.services.foreman import get_poll_aggregator
 from syntask.server.utilities.server import SyntaskRouter
 
 router = SyntaskRouter(prefix="/work_queues", tags=["Work Queues"])
@@ -166,12 +167,8 @@ async def read_work_queue_runs(
     if x_syntask_ui:
         return flow_runs
 
-    background_tasks.add_task(
-        mark_work_queues_ready,
-        polled_work_queue_ids=[work_queue_id],
-        ready_work_queue_ids=(
-            [work_queue_id] if work_queue.status == WorkQueueStatus.NOT_READY else []
-        ),
+    ready_work_queue_ids = (
+        [work_queue_id] if work_queue.status == WorkQueueStatus.NOT_READY else []
     )
 
     if agent_id:
@@ -181,6 +178,21 @@ async def read_work_queue_runs(
             agent_id=agent_id,
         )
 
+    poll_aggregator = get_poll_aggregator()
+    if poll_aggregator:
+        poll_aggregator.record_work_queue_polls(
+            polled_work_queue_ids=[work_queue_id],
+            ready_work_queue_ids=ready_work_queue_ids,
+        )
+        poll_aggregator.record_deployment_polls(work_queue_ids=[work_queue_id])
+        return flow_runs
+
+    background_tasks.add_task(
+        mark_work_queues_ready,
+        polled_work_queue_ids=[work_queue_id],
+        ready_work_queue_ids=ready_work_queue_ids,
+    )
+
     background_tasks.add_task(
         mark_deployments_ready,
         work_queue_ids=[work_queue_id],
@@ -2,7 +2,20 @@
 Routes for interacting with work queue objects.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+import asyncio
+import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 from uuid import UUID, uuid4
 
 import pendulum
@@ -24,14 +37,30 @@ import syntask.server.schemas as schemas
 from syntask.server.api.validation import validate_job_variable_defaults_for_work_pool
 from syntask.server.database.dependencies import provide_database_interface
 from syntask.server.database.interface import SyntaskDBInterface
+from syntask.server.events import stream
+from syntask.server.events.filters import (
+    EventAnyResourceFilter,
+    EventFilter,
+    EventNameFilter,
+    EventOccurredFilter,
+)
+from syntask.server.events.schemas.events import ReceivedEvent
 from syntask.server.models.deployments import mark_deployments_ready
 from syntask.server.models.work_queues import (
     emit_work_queue_status_event,
     mark_work_queues_ready,
 )
 from syntask.server.models.workers import emit_work_pool_status_event
+from syntask.server.orchestration import dependencies as orchestration_dependencies
+from syntask.server.orchestration.policies import BaseOrchestrationPolicy
+from syntask.server.schemas.states import StateType
 from syntask.server.schemas.statuses import WorkQueueStatus
+from syntask.server.services.foreman import get_poll_aggregator
 from syntask.server.utilities.server import SyntaskRouter
+from syntask.settings import (
+    SYNTASK_API_WORK_POOLS_MAX_WAIT_SECONDS,
+    SYNTASK_API_WORK_POOLS_WAIT_RECHECK_SECONDS,
+)
 
 if TYPE_CHECKING:
     from syntask.server.database.orm_models import ORMWorkQueue
@@ -331,11 +360,150 @@ async def get_scheduled_flow_runs(
         None, description="The minimum time to look for scheduled flow runs"
     ),
     limit: int = dependencies.LimitBody(),
+    wait_seconds: Optional[float] = Body(
+        None,
+        ge=0,
+        description=(
+            "If given, how long to wait for runs to become due when there are none,"
+            " up to the server's maximum"
+        ),
+    ),
+    worker_lookups: WorkerLookups = Depends(WorkerLookups),
+    db: SyntaskDBInterface = Depends(provide_database_interface),
+) -> List[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Load scheduled runs for a worker. If `wait_seconds` is given, the request is held
+    until runs are due in the work pool, rather than returning an empty list.
+    """
+    work_pool_id, work_queues, work_queue_ids = await _read_polled_work_queues(
+        db=db,
+        worker_lookups=worker_lookups,
+        work_pool_name=work_pool_name,
+        work_queue_names=work_queue_names,
+    )
+
+    async def get_runs(
+        scheduled_before: Optional[datetime.datetime],
+    ) -> Sequence[schemas.responses.WorkerFlowRunResponse]:
+        async with db.session_context(begin_transaction=True) as session:
+            return await models.workers.get_scheduled_flow_runs(
+                session=session,
+                work_pool_ids=[work_pool_id],
+                work_queue_ids=work_queue_ids,
+                scheduled_before=scheduled_before,
+                scheduled_after=scheduled_after,
+                limit=limit,
+            )
+
+    if wait_seconds:
+        queue_response = await _wait_for_scheduled_flow_runs(
+            work_pool_id=work_pool_id,
+            work_queue_ids=work_queue_ids,
+            scheduled_before=scheduled_before,
+            scheduled_after=scheduled_after,
+            wait_seconds=wait_seconds,
+            get_runs=get_runs,
+            db=db,
+        )
+    else:
+        queue_response = await get_runs(scheduled_before)
+
+    _mark_polled_work_queues_ready(background_tasks, work_queues)
+
+    return queue_response
+
+
+@router.post("/{name}/claim_scheduled_flow_runs")
+async def claim_scheduled_flow_runs(
+    background_tasks: BackgroundTasks,
+    work_pool_name: str = Path(..., description="The work pool name", alias="name"),
+    work_queue_names: List[str] = Body(
+        None, description="The names of work pool queues"
+    ),
+    scheduled_before: DateTime = Body(
+        None, description="The maximum time to look for scheduled flow runs"
+    ),
+    scheduled_after: DateTime = Body(
+        None, description="The minimum time to look for scheduled flow runs"
+    ),
+    limit: int = dependencies.LimitBody(),
+    wait_seconds: Optional[float] = Body(
+        None,
+        ge=0,
+        description=(
+            "If given, how long to wait for runs to become due when there are none,"
+            " up to the server's maximum"
+        ),
+    ),
     worker_lookups: WorkerLookups = Depends(WorkerLookups),
     db: SyntaskDBInterface = Depends(provide_database_interface),
+    flow_policy: Type[BaseOrchestrationPolicy] = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
+    api_version=Depends(dependencies.provide_request_api_version),
 ) -> List[schemas.responses.WorkerFlowRunResponse]:
     """
-    Load scheduled runs for a worker
+    Claim scheduled runs for a worker, moving them into a PENDING state so that they
+    are not given to any other worker.  Accepts the same parameters as
+    `get_scheduled_flow_runs`, and returns only the runs that were moved to PENDING.
+    """
+    work_pool_id, work_queues, work_queue_ids = await _read_polled_work_queues(
+        db=db,
+        worker_lookups=worker_lookups,
+        work_pool_name=work_pool_name,
+        work_queue_names=work_queue_names,
+    )
+
+    # pass the request version to the orchestration engine to support compatibility code
+    orchestration_parameters.update({"api-version": api_version})
+
+    async def claim_runs(
+        scheduled_before: Optional[datetime.datetime],
+    ) -> Sequence[schemas.responses.WorkerFlowRunResponse]:
+        async with db.session_context(
+            begin_transaction=True, with_for_update=True
+        ) as session:
+            return await models.workers.claim_scheduled_flow_runs(
+                session=session,
+                work_pool_ids=[work_pool_id],
+                work_queue_ids=work_queue_ids,
+                scheduled_before=scheduled_before,
+                scheduled_after=scheduled_after,
+                limit=limit,
+                flow_policy=flow_policy,
+                orchestration_parameters=orchestration_parameters,
+            )
+
+    if wait_seconds:
+        queue_response = await _wait_for_scheduled_flow_runs(
+            work_pool_id=work_pool_id,
+            work_queue_ids=work_queue_ids,
+            scheduled_before=scheduled_before,
+            scheduled_after=scheduled_after,
+            wait_seconds=wait_seconds,
+            get_runs=claim_runs,
+            db=db,
+        )
+    else:
+        queue_response = await claim_runs(scheduled_before)
+
+    _mark_polled_work_queues_ready(background_tasks, work_queues)
+
+    return queue_response
+
+
+async def _read_polled_work_queues(
+    db: SyntaskDBInterface,
+    worker_lookups: WorkerLookups,
+    work_pool_name: str,
+    work_queue_names: Optional[List[str]],
+) -> Tuple[UUID, List["ORMWorkQueue"], Optional[List[UUID]]]:
+    """
+    Reads the ID of the work pool a worker is polling and the work queues it is
+    polling, along with the IDs of those queues if they were named explicitly.
     """
     async with db.session_context() as session:
         work_pool_id = await worker_lookups._get_work_pool_id_from_name(
@@ -362,24 +530,34 @@ async def get_scheduled_flow_runs(
             ]
             work_queue_ids = [wq.id for wq in work_queues]
 
-    async with db.session_context(begin_transaction=True) as session:
-        queue_response = await models.workers.get_scheduled_flow_runs(
-            session=session,
-            work_pool_ids=[work_pool_id],
-            work_queue_ids=work_queue_ids,
-            scheduled_before=scheduled_before,
-            scheduled_after=scheduled_after,
-            limit=limit,
+    return work_pool_id, work_queues, work_queue_ids
+
+
+def _mark_polled_work_queues_ready(
+    background_tasks: BackgroundTasks, work_queues: List["ORMWorkQueue"]
+) -> None:
+    polled_work_queue_ids = [
+        wq.id for wq in work_queues if wq.status != WorkQueueStatus.NOT_READY
+    ]
+    ready_work_queue_ids = [
+        wq.id for wq in work_queues if wq.status == WorkQueueStatus.NOT_READY
+    ]
+
+    poll_aggregator = get_poll_aggregator()
+    if poll_aggregator:
+        poll_aggregator.record_work_queue_polls(
+            polled_work_queue_ids=polled_work_queue_ids,
+            ready_work_queue_ids=ready_work_queue_ids,
         )
+        poll_aggregator.record_deployment_polls(
+            work_queue_ids=[wq.id for wq in work_queues]
+        )
+        return
 
     background_tasks.add_task(
         mark_work_queues_ready,
-        polled_work_queue_ids=[
-            wq.id for wq in work_queues if wq.status != WorkQueueStatus.NOT_READY
-        ],
-        ready_work_queue_ids=[
-            wq.id for wq in work_queues if wq.status == WorkQueueStatus.NOT_READY
-        ],
+        polled_work_queue_ids=polled_work_queue_ids,
+        ready_work_queue_ids=ready_work_queue_ids,
     )
 
     background_tasks.add_task(
@@ -387,7 +565,92 @@ async def get_scheduled_flow_runs(
         work_queue_ids=[wq.id for wq in work_queues],
     )
 
-    return queue_response
+
+async def _wait_for_scheduled_flow_runs(
+    db: SyntaskDBInterface,
+    work_pool_id: UUID,
+    work_queue_ids: Optional[List[UUID]],
+    scheduled_before: Optional[datetime.datetime],
+    scheduled_after: Optional[datetime.datetime],
+    wait_seconds: float,
+    get_runs: Callable[
+        [Optional[datetime.datetime]],
+        Awaitable[Sequence[schemas.responses.WorkerFlowRunResponse]],
+    ],
+) -> Sequence[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Waits up to `wait_seconds` for scheduled runs in the work pool to be due, then
+    gets them with `get_runs`.  Until the next scheduled start time says there are
+    runs due, only that inexpensive query is made, and the waiting is cut short when
+    a run is scheduled in the pool.
+    """
+    now = pendulum.now("UTC")
+    deadline = now.add(
+        seconds=min(wait_seconds, SYNTASK_API_WORK_POOLS_MAX_WAIT_SECONDS.value())
+    )
+    recheck = datetime.timedelta(
+        seconds=SYNTASK_API_WORK_POOLS_WAIT_RECHECK_SECONDS.value()
+    )
+
+    # workers look for runs up to a little while ahead, so that window moves forward
+    # along with the time spent waiting
+    lookahead = scheduled_before - now if scheduled_before else None
+
+    newly_scheduled = EventFilter(
+        occurred=EventOccurredFilter(
+            since=now.subtract(minutes=1), until=deadline.add(minutes=1)
+        ),
+        event=EventNameFilter(prefix=["syntask.flow-run."]),
+        any_resource=EventAnyResourceFilter(id=[f"syntask.work-pool.{work_pool_id}"]),
+    )
+
+    async with stream.subscribed(newly_scheduled) as events:
+        while True:
+            now = pendulum.now("UTC")
+            window_end = now + lookahead if lookahead is not None else None
+
+            async with db.session_context() as session:
+                next_start = await models.workers.read_next_scheduled_start_time(
+                    session=session,
+                    work_pool_ids=[work_pool_id],
+                    work_queue_ids=work_queue_ids,
+                    scheduled_after=scheduled_after,
+                )
+
+            is_due = next_start is not None and (
+                window_end is None or next_start <= window_end
+            )
+            if is_due:
+                runs = await get_runs(window_end)
+                if runs:
+                    return runs
+
+                # the runs that are due are being held back by paused queues or
+                # concurrency limits, so only look again after a while
+                wake_at = now + recheck
+            elif next_start is not None:
+                wake_at = min(next_start - lookahead, now + recheck)
+            else:
+                wake_at = now + recheck
+
+            if now >= deadline:
+                return []
+
+            try:
+                await asyncio.wait_for(
+                    _next_scheduled_event(events),
+                    timeout=(min(wake_at, deadline) - now).total_seconds(),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+async def _next_scheduled_event(events: "asyncio.Queue[ReceivedEvent]") -> None:
+    """Waits for an event of a flow run moving into a scheduled state"""
+    while True:
+        event = await events.get()
+        if event.resource.get("syntask.state-type") == StateType.SCHEDULED.value:
+            return
 
 
 # -----------------------------------------------------
@@ -586,6 +849,20 @@ async def worker_heartbeat(
                 detail=f'Work pool "{work_pool_name}" not found.',
             )
 
+        poll_aggregator = get_poll_aggregator()
+        if (
+            poll_aggregator
+            and work_pool.status == schemas.statuses.WorkPoolStatus.READY
+        ):
+            # the work pool doesn't need to change status, so the heartbeat can be
+            # written with the next batch
+            poll_aggregator.record_worker_heartbeat(
+                work_pool_id=work_pool.id,
+                worker_name=name,
+                heartbeat_interval_seconds=heartbeat_interval_seconds,
+            )
+            return
+
         await models.workers.worker_heartbeat(
             session=session,
             work_pool_id=work_pool.id,
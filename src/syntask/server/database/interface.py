@@ -305,6 +305,21 @@ class SyntaskDBInterface(metaclass=DBSingleton):
         """An event resource model"""
         return orm_models.EventResource
 
+    @property
+    def EventRollup(self):
+        """An event rollup model"""
+        return orm_models.EventRollup
+
+    @property
+    def TaskRunStateRollup(self):
+        """A task run state rollup model"""
+        return orm_models.TaskRunStateRollup
+
+    @property
+    def ServiceLease(self):
+        """A service lease model"""
+        return orm_models.ServiceLease
+
     @property
     def deployment_unique_upsert_columns(self):
         """Unique columns for upserting a Deployment"""
@@ -0,0 +1,122 @@
+"""Partition events and event_resources by occurred
+
+Revision ID: 76f91010863c
+Revises: eaec5004771f
+Create Date: 2024-10-16 10:15:12.384911
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "76f91010863c"
+down_revision = "eaec5004771f"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = {
+    "events": [
+        ("ix_events__event__id", "event, id"),
+        ("ix_events__event_occurred_id", "event, occurred, id"),
+        ("ix_events__event_related_occurred", "event, related, occurred"),
+        ("ix_events__event_resource_id_occurred", "event, resource_id, occurred"),
+        ("ix_events__occurred", "occurred"),
+        ("ix_events__occurred_id", "occurred, id"),
+        ("ix_events__related_resource_ids", "related_resource_ids"),
+        ("ix_events__updated", "updated"),
+    ],
+    "event_resources": [
+        ("ix_event_resources__resource_id__occurred", "resource_id, occurred"),
+        ("ix_event_resources__updated", "updated"),
+    ],
+}
+
+
+def upgrade():
+    # The existing rows become the first partition of each table, which ends at the
+    # start of the day after the latest of them.  Later partitions are created by the
+    # event retention service.
+    cutoff = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT (
+                    date_trunc(
+                        'day',
+                        GREATEST(
+                            now(),
+                            (SELECT max(occurred) FROM events),
+                            (SELECT max(occurred) FROM event_resources)
+                        ) AT TIME ZONE 'UTC'
+                    ) + interval '1 day'
+                ) AT TIME ZONE 'UTC'
+                """
+            )
+        )
+        .scalar()
+    )
+
+    for table, indexes in INDEXES.items():
+        legacy = f"{table}_legacy"
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT pk_{table} TO pk_{legacy}")
+        for name, _ in indexes:
+            op.execute(
+                f"ALTER INDEX {name} RENAME TO "
+                f"{name.replace(f'ix_{table}__', f'ix_{legacy}__', 1)}"
+            )
+
+        # The partition key must be part of the primary key of a partitioned table
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (occurred)"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT pk_{table} PRIMARY KEY (id, occurred)"
+        )
+        for name, columns in indexes:
+            op.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+
+        # Prove the bounds and build the (id, occurred) primary key on the legacy table
+        # ahead of attaching it, which only spares the attach its own scan of the
+        # table.  The migration runs in one transaction, so the rename above holds
+        # ACCESS EXCLUSIVE on the table through all of these steps until it commits.
+        op.execute(
+            f"ALTER TABLE {legacy} ADD CONSTRAINT ck_{legacy}__partition_bound "
+            f"CHECK (occurred < '{cutoff.isoformat()}') NOT VALID"
+        )
+        op.execute(
+            f"ALTER TABLE {legacy} VALIDATE CONSTRAINT ck_{legacy}__partition_bound"
+        )
+        op.execute(
+            f"CREATE UNIQUE INDEX ix_{legacy}__id_occurred ON {legacy} (id, occurred)"
+        )
+        op.execute(f"ALTER TABLE {legacy} DROP CONSTRAINT pk_{legacy}")
+        op.execute(
+            f"ALTER TABLE {legacy} ADD CONSTRAINT pk_{legacy} "
+            f"PRIMARY KEY USING INDEX ix_{legacy}__id_occurred"
+        )
+
+        op.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{cutoff.isoformat()}')"
+        )
+        op.execute(f"ALTER TABLE {legacy} DROP CONSTRAINT ck_{legacy}__partition_bound")
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def downgrade():
+    for table, indexes in INDEXES.items():
+        unpartitioned = f"{table}_unpartitioned"
+        op.execute(f"CREATE TABLE {unpartitioned} (LIKE {table} INCLUDING DEFAULTS)")
+        op.execute(
+            f"INSERT INTO {unpartitioned} SELECT DISTINCT ON (id) * FROM {table}"
+        )
+        op.execute(f"DROP TABLE {table}")
+        op.execute(f"ALTER TABLE {unpartitioned} RENAME TO {table}")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT pk_{table} PRIMARY KEY (id)")
+        for name, columns in indexes:
+            op.execute(f"CREATE INDEX {name} ON {table} ({columns})")
@@ -0,0 +1,170 @@
+"""Add event and task run state rollups
+
+Revision ID: 02483e6d77d4
+Revises: 76f91010863c
+Create Date: 2024-10-16 14:30:15.204871
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+import syntask
+
+# revision identifiers, used by Alembic.
+revision = "02483e6d77d4"
+down_revision = "76f91010863c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "event_rollups",
+        sa.Column("unit", sa.String(), nullable=False),
+        sa.Column(
+            "bucket",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("event", sa.Text(), nullable=False),
+        sa.Column("resource_id", sa.Text(), nullable=False),
+        sa.Column("resource_label", sa.Text(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "oldest",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "latest",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            syntask.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_event_rollups")),
+    )
+    op.create_index(
+        "uq_event_rollups__unit_bucket_event_resource_id",
+        "event_rollups",
+        ["unit", "bucket", "event", "resource_id"],
+        unique=True,
+    )
+
+    op.create_table(
+        "task_run_state_rollup",
+        sa.Column(
+            "bucket",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            postgresql.ENUM(name="state_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("shard", sa.SmallInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "id",
+            syntask.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_task_run_state_rollup")),
+    )
+    op.create_index(
+        "uq_task_run_state_rollup__bucket_state_type_shard",
+        "task_run_state_rollup",
+        ["bucket", "state_type", "shard"],
+        unique=True,
+    )
+
+    # backfill the rollups of the existing events and task runs
+    for unit in ("minute", "hour"):
+        op.execute(
+            sa.text(
+                f"""
+                INSERT INTO event_rollups
+                    (unit, bucket, event, resource_id, resource_label, count, oldest, latest)
+                SELECT
+                    '{unit}',
+                    date_trunc('{unit}', occurred AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+                        AS bucket,
+                    event,
+                    resource_id,
+                    max(
+                        coalesce(
+                            resource->>'syntask.resource.name',
+                            resource->>'syntask.name',
+                            resource_id
+                        )
+                    ),
+                    count(*),
+                    min(occurred),
+                    max(occurred)
+                FROM events
+                GROUP BY bucket, event, resource_id
+                """
+            )
+        )
+
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO task_run_state_rollup (bucket, state_type, count)
+            SELECT
+                date_trunc('minute', start_time AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+                    AS bucket,
+                state_type,
+                count(*)
+            FROM task_run
+            WHERE start_time IS NOT NULL
+            AND state_type IN ('COMPLETED', 'FAILED', 'CANCELLED', 'CRASHED')
+            GROUP BY bucket, state_type
+            """
+        )
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "uq_task_run_state_rollup__bucket_state_type_shard",
+        table_name="task_run_state_rollup",
+    )
+    op.drop_table("task_run_state_rollup")
+
+    op.drop_index(
+        "uq_event_rollups__unit_bucket_event_resource_id", table_name="event_rollups"
+    )
+    op.drop_table("event_rollups")
@@ -0,0 +1,61 @@
+"""Add service_lease
+
+Revision ID: 9c4e2a81d6f0
+Revises: 02483e6d77d4
+Create Date: 2024-10-16 22:15:02.640117
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import syntask
+
+# revision identifiers, used by Alembic.
+revision = "9c4e2a81d6f0"
+down_revision = "02483e6d77d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "service_lease",
+        sa.Column("service", sa.String(), nullable=False),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column(
+            "expires",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            syntask.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_service_lease")),
+    )
+    op.create_index(
+        "uq_service_lease__service_holder",
+        "service_lease",
+        ["service", "holder"],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index("uq_service_lease__service_holder", table_name="service_lease")
+    op.drop_table("service_lease")
@@ -0,0 +1,51 @@
+"""Add scheduled_through and next_due to DeploymentSchedule
+
+Revision ID: c7d2f4a90b16
+Revises: 9c4e2a81d6f0
+Create Date: 2024-10-16 23:12:38.271940
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import syntask
+
+# revision identifiers, used by Alembic.
+revision = "c7d2f4a90b16"
+down_revision = "9c4e2a81d6f0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "deployment_schedule",
+        sa.Column(
+            "scheduled_through",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "deployment_schedule",
+        sa.Column(
+            "next_due",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        op.f("ix_deployment_schedule__next_due"),
+        "deployment_schedule",
+        ["next_due"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_deployment_schedule__next_due"), table_name="deployment_schedule"
+    )
+    op.drop_column("deployment_schedule", "next_due")
+    op.drop_column("deployment_schedule", "scheduled_through")
@@ -0,0 +1,103 @@
+"""Partition log by timestamp
+
+Revision ID: e4a1b7c93d25
+Revises: c7d2f4a90b16
+Create Date: 2024-10-16 23:50:19.518203
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4a1b7c93d25"
+down_revision = "c7d2f4a90b16"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_log__flow_run_id", "flow_run_id"),
+    ("ix_log__flow_run_id_timestamp", 'flow_run_id, "timestamp"'),
+    ("ix_log__level", "level"),
+    ("ix_log__task_run_id", "task_run_id"),
+    ("ix_log__timestamp", '"timestamp"'),
+    ("ix_log__updated", "updated"),
+]
+
+
+def upgrade():
+    # The existing rows become the first partition, which ends at the start of the
+    # day after the latest of them.  Later partitions are created by the log
+    # retention service.
+    cutoff = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT (
+                    date_trunc(
+                        'day',
+                        GREATEST(now(), (SELECT max("timestamp") FROM log))
+                        AT TIME ZONE 'UTC'
+                    ) + interval '1 day'
+                ) AT TIME ZONE 'UTC'
+                """
+            )
+        )
+        .scalar()
+    )
+
+    op.execute("ALTER TABLE log RENAME TO log_legacy")
+    op.execute("ALTER TABLE log_legacy RENAME CONSTRAINT pk_log TO pk_log_legacy")
+    for name, _ in INDEXES:
+        op.execute(
+            f"ALTER INDEX {name} RENAME TO "
+            f"{name.replace('ix_log__', 'ix_log_legacy__', 1)}"
+        )
+
+    # The partition key must be part of the primary key of a partitioned table
+    op.execute(
+        "CREATE TABLE log (LIKE log_legacy INCLUDING DEFAULTS) "
+        'PARTITION BY RANGE ("timestamp")'
+    )
+    op.execute('ALTER TABLE log ADD CONSTRAINT pk_log PRIMARY KEY (id, "timestamp")')
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON log ({columns})")
+
+    # Prove the bounds and build the (id, timestamp) primary key on the legacy table
+    # ahead of attaching it, which only spares the attach its own scan of the table.
+    # The migration runs in one transaction, so the rename above holds ACCESS
+    # EXCLUSIVE on the table through all of these steps until it commits.
+    op.execute(
+        "ALTER TABLE log_legacy ADD CONSTRAINT ck_log_legacy__partition_bound "
+        f"CHECK (\"timestamp\" < '{cutoff.isoformat()}') NOT VALID"
+    )
+    op.execute(
+        "ALTER TABLE log_legacy VALIDATE CONSTRAINT ck_log_legacy__partition_bound"
+    )
+    op.execute(
+        'CREATE UNIQUE INDEX ix_log_legacy__id_timestamp ON log_legacy (id, "timestamp")'
+    )
+    op.execute("ALTER TABLE log_legacy DROP CONSTRAINT pk_log_legacy")
+    op.execute(
+        "ALTER TABLE log_legacy ADD CONSTRAINT pk_log_legacy "
+        "PRIMARY KEY USING INDEX ix_log_legacy__id_timestamp"
+    )
+
+    op.execute(
+        "ALTER TABLE log ATTACH PARTITION log_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{cutoff.isoformat()}')"
+    )
+    op.execute("ALTER TABLE log_legacy DROP CONSTRAINT ck_log_legacy__partition_bound")
+    op.execute("CREATE TABLE log_default PARTITION OF log DEFAULT")
+
+
+def downgrade():
+    op.execute("CREATE TABLE log_unpartitioned (LIKE log INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO log_unpartitioned SELECT DISTINCT ON (id) * FROM log")
+    op.execute("DROP TABLE log")
+    op.execute("ALTER TABLE log_unpartitioned RENAME TO log")
+    op.execute("ALTER TABLE log ADD CONSTRAINT pk_log PRIMARY KEY (id)")
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON log ({columns})")
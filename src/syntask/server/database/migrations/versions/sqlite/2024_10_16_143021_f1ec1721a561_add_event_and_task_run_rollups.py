@@ -0,0 +1,182 @@
+"""Add event and task run state rollups
+
+Revision ID: f1ec1721a561
+Revises: 4ad4658cbefe
+Create Date: 2024-10-16 14:30:21.518302
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import syntask
+
+# revision identifiers, used by Alembic.
+revision = "f1ec1721a561"
+down_revision = "4ad4658cbefe"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "event_rollups",
+        sa.Column("unit", sa.String(), nullable=False),
+        sa.Column(
+            "bucket",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("event", sa.Text(), nullable=False),
+        sa.Column("resource_id", sa.Text(), nullable=False),
+        sa.Column("resource_label", sa.Text(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "oldest",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "latest",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            syntask.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n        || lower(hex(randomblob(2)))\n        || '-4'\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || substr('89ab',abs(random()) % 4 + 1, 1)\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_event_rollups")),
+    )
+    with op.batch_alter_table("event_rollups", schema=None) as batch_op:
+        batch_op.create_index(
+            "uq_event_rollups__unit_bucket_event_resource_id",
+            ["unit", "bucket", "event", "resource_id"],
+            unique=True,
+        )
+
+    op.create_table(
+        "task_run_state_rollup",
+        sa.Column(
+            "bucket",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            sa.Enum(
+                "SCHEDULED",
+                "PENDING",
+                "RUNNING",
+                "COMPLETED",
+                "FAILED",
+                "CANCELLED",
+                "CRASHED",
+                "PAUSED",
+                "CANCELLING",
+                name="state_type",
+            ),
+            nullable=False,
+        ),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("shard", sa.SmallInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "id",
+            syntask.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n        || lower(hex(randomblob(2)))\n        || '-4'\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || substr('89ab',abs(random()) % 4 + 1, 1)\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_task_run_state_rollup")),
+    )
+    with op.batch_alter_table("task_run_state_rollup", schema=None) as batch_op:
+        batch_op.create_index(
+            "uq_task_run_state_rollup__bucket_state_type_shard",
+            ["bucket", "state_type", "shard"],
+            unique=True,
+        )
+
+    # backfill the rollups of the existing events and task runs
+    for unit, bucket_format in (
+        ("minute", "%Y-%m-%d %H:%M:00.000000"),
+        ("hour", "%Y-%m-%d %H:00:00.000000"),
+    ):
+        op.execute(
+            sa.text(
+                f"""
+                INSERT INTO event_rollups
+                    (unit, bucket, event, resource_id, resource_label, count, oldest, latest)
+                SELECT
+                    '{unit}',
+                    strftime('{bucket_format}', occurred) AS bucket,
+                    event,
+                    resource_id,
+                    max(
+                        coalesce(
+                            json_extract(resource, '$."syntask.resource.name"'),
+                            json_extract(resource, '$."syntask.name"'),
+                            resource_id
+                        )
+                    ),
+                    count(*),
+                    min(occurred),
+                    max(occurred)
+                FROM events
+                GROUP BY bucket, event, resource_id
+                """
+            )
+        )
+
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO task_run_state_rollup (bucket, state_type, count)
+            SELECT
+                strftime('%Y-%m-%d %H:%M:00.000000', start_time) AS bucket,
+                state_type,
+                count(*)
+            FROM task_run
+            WHERE start_time IS NOT NULL
+            AND state_type IN ('COMPLETED', 'FAILED', 'CANCELLED', 'CRASHED')
+            GROUP BY bucket, state_type
+            """
+        )
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("task_run_state_rollup", schema=None) as batch_op:
+        batch_op.drop_index("uq_task_run_state_rollup__bucket_state_type_shard")
+    op.drop_table("task_run_state_rollup")
+
+    with op.batch_alter_table("event_rollups", schema=None) as batch_op:
+        batch_op.drop_index("uq_event_rollups__unit_bucket_event_resource_id")
+    op.drop_table("event_rollups")
@@ -0,0 +1,64 @@
+"""Add service_lease
+
+Revision ID: 3b9f1c7e5a2d
+Revises: f1ec1721a561
+Create Date: 2024-10-16 22:15:08.118204
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import syntask
+
+# revision identifiers, used by Alembic.
+revision = "3b9f1c7e5a2d"
+down_revision = "f1ec1721a561"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "service_lease",
+        sa.Column("service", sa.String(), nullable=False),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column(
+            "expires",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            syntask.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n        || lower(hex(randomblob(2)))\n        || '-4'\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || substr('89ab',abs(random()) % 4 + 1, 1)\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            syntask.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_service_lease")),
+    )
+    with op.batch_alter_table("service_lease", schema=None) as batch_op:
+        batch_op.create_index(
+            "uq_service_lease__service_holder",
+            ["service", "holder"],
+            unique=True,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("service_lease", schema=None) as batch_op:
+        batch_op.drop_index("uq_service_lease__service_holder")
+    op.drop_table("service_lease")
@@ -0,0 +1,48 @@
+"""Add scheduled_through and next_due to DeploymentSchedule
+
+Revision ID: 5e81b0d3f7a9
+Revises: 3b9f1c7e5a2d
+Create Date: 2024-10-16 23:12:44.905713
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import syntask
+
+# revision identifiers, used by Alembic.
+revision = "5e81b0d3f7a9"
+down_revision = "3b9f1c7e5a2d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("deployment_schedule", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "scheduled_through",
+                syntask.server.utilities.database.Timestamp(timezone=True),
+                nullable=True,
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "next_due",
+                syntask.server.utilities.database.Timestamp(timezone=True),
+                nullable=True,
+            )
+        )
+        batch_op.create_index(
+            batch_op.f("ix_deployment_schedule__next_due"),
+            ["next_due"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("deployment_schedule", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_deployment_schedule__next_due"))
+        batch_op.drop_column("next_due")
+        batch_op.drop_column("scheduled_through")
@@ -0,0 +1,29 @@
+"""Add occurred to the primary keys of events and event_resources
+
+Revision ID: a3d8e61f2c47
+Revises: 5e81b0d3f7a9
+Create Date: 2024-10-17 09:30:12.418365
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3d8e61f2c47"
+down_revision = "5e81b0d3f7a9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ("events", "event_resources"):
+        with op.batch_alter_table(table, schema=None, recreate="always") as batch_op:
+            batch_op.drop_constraint(f"pk_{table}", type_="primary")
+            batch_op.create_primary_key(f"pk_{table}", ["id", "occurred"])
+
+
+def downgrade():
+    for table in ("events", "event_resources"):
+        with op.batch_alter_table(table, schema=None, recreate="always") as batch_op:
+            batch_op.drop_constraint(f"pk_{table}", type_="primary")
+            batch_op.create_primary_key(f"pk_{table}", ["id"])
@@ -0,0 +1,27 @@
+"""Add timestamp to the primary key of log
+
+Revision ID: b7e04c2d9f18
+Revises: a3d8e61f2c47
+Create Date: 2024-10-17 09:45:18.207541
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e04c2d9f18"
+down_revision = "a3d8e61f2c47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("log", schema=None, recreate="always") as batch_op:
+        batch_op.drop_constraint("pk_log", type_="primary")
+        batch_op.create_primary_key("pk_log", ["id", "timestamp"])
+
+
+def downgrade():
+    with op.batch_alter_table("log", schema=None, recreate="always") as batch_op:
+        batch_op.drop_constraint("pk_log", type_="primary")
+        batch_op.create_primary_key("pk_log", ["id"])
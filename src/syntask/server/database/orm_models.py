@@ -830,6 +830,12 @@ class DeploymentSchedule(Base):
     max_scheduled_runs = sa.Column(sa.Integer, nullable=True)
     catchup = sa.Column(sa.Boolean, nullable=False, default=False)
 
+    # the latest run the scheduler has generated for this schedule, and the time by
+    # which it will need to generate more; both are cleared when the schedule or its
+    # deployment changes so that the scheduler picks the schedule up again
+    scheduled_through = sa.Column(Timestamp(), nullable=True)
+    next_due = sa.Column(Timestamp(), nullable=True, index=True)
+
 
 class Deployment(Base):
     """SQLAlchemy model of a deployment."""
@@ -967,8 +973,16 @@ class Log(Base):
     task_run_id = sa.Column(UUID(), nullable=True, index=True)
     message = sa.Column(sa.Text, nullable=False)
 
+    # partitioned tables on PostgreSQL need the partition key in their primary key;
+    # `id` is redeclared here so that it comes first in that key
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        server_default=GenerateUUID(),
+        default=uuid.uuid4,
+    )
+
     # The client-side timestamp of this logged statement.
-    timestamp = sa.Column(Timestamp(), nullable=False, index=True)
+    timestamp = sa.Column(Timestamp(), nullable=False, index=True, primary_key=True)
 
     __table_args__ = (
         sa.Index(
@@ -1496,7 +1510,14 @@ class Event(Base):
         sa.Index("ix_events__event_related_occurred", "event", "related", "occurred"),
     )
 
-    occurred = sa.Column(Timestamp(), nullable=False)
+    # partitioned tables on PostgreSQL need the partition key in their primary key;
+    # `id` is redeclared here so that it comes first in that key
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        server_default=GenerateUUID(),
+        default=uuid.uuid4,
+    )
+    occurred = sa.Column(Timestamp(), nullable=False, primary_key=True)
     event = sa.Column(sa.Text(), nullable=False)
     resource_id = sa.Column(sa.Text(), nullable=False)
     resource = sa.Column(JSON(), nullable=False)
@@ -1523,13 +1544,94 @@ class EventResource(Base):
         ),
     )
 
-    occurred = sa.Column("occurred", Timestamp(), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        server_default=GenerateUUID(),
+        default=uuid.uuid4,
+    )
+    occurred = sa.Column("occurred", Timestamp(), nullable=False, primary_key=True)
     resource_id = sa.Column("resource_id", sa.Text(), nullable=False)
     resource_role = sa.Column("resource_role", sa.Text(), nullable=False)
     resource = sa.Column("resource", sa.JSON(), nullable=False)
     event_id = sa.Column("event_id", UUID(), nullable=False)
 
 
+class EventRollup(Base):
+    """
+    Per-minute and per-hour counts of events by event name and resource, maintained
+    as events are written.
+    """
+
+    @declared_attr
+    def __tablename__(cls):
+        return "event_rollups"
+
+    __table_args__ = (
+        sa.Index(
+            "uq_event_rollups__unit_bucket_event_resource_id",
+            "unit",
+            "bucket",
+            "event",
+            "resource_id",
+            unique=True,
+        ),
+    )
+
+    unit = sa.Column(sa.String(), nullable=False)
+    bucket = sa.Column(Timestamp(), nullable=False)
+    event = sa.Column(sa.Text(), nullable=False)
+    resource_id = sa.Column(sa.Text(), nullable=False)
+    resource_label = sa.Column(sa.Text(), nullable=False)
+    count = sa.Column(sa.BigInteger(), nullable=False)
+    oldest = sa.Column(Timestamp(), nullable=False)
+    latest = sa.Column(Timestamp(), nullable=False)
+
+
+class TaskRunStateRollup(Base):
+    """
+    Per-minute counts of task runs in a terminal state by the minute they started,
+    maintained as task run states are set.  Each count is split across several
+    shards, so that task runs finishing at once don't all update the same row.
+    """
+
+    __table_args__ = (
+        sa.Index(
+            "uq_task_run_state_rollup__bucket_state_type_shard",
+            "bucket",
+            "state_type",
+            "shard",
+            unique=True,
+        ),
+    )
+
+    bucket = sa.Column(Timestamp(), nullable=False)
+    state_type = sa.Column(
+        sa.Enum(schemas.states.StateType, name="state_type"), nullable=False
+    )
+    count = sa.Column(sa.BigInteger(), nullable=False)
+    shard = sa.Column(sa.SmallInteger, server_default="0", default=0, nullable=False)
+
+
+class ServiceLease(Base):
+    """
+    A lease held by one replica of a service, renewed while the replica is running,
+    used by replicas to find the other live replicas of the same service.
+    """
+
+    __table_args__ = (
+        sa.Index(
+            "uq_service_lease__service_holder",
+            "service",
+            "holder",
+            unique=True,
+        ),
+    )
+
+    service = sa.Column(sa.String(), nullable=False)
+    holder = sa.Column(sa.String(), nullable=False)
+    expires = sa.Column(Timestamp(), nullable=False)
+
+
 # These are temporary until we've migrated all the references to the new,
 # non-ORM names
 
@@ -1570,6 +1672,9 @@ ORMCompositeTriggerChildFiring = CompositeTriggerChildFiring
 ORMAutomationEventFollower = AutomationEventFollower
 ORMEvent = Event
 ORMEventResource = EventResource
+ORMEventRollup = EventRollup
+ORMTaskRunStateRollup = TaskRunStateRollup
+ORMServiceLease = ServiceLease
 
 
 class BaseORMConfiguration(ABC):
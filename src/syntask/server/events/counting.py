@@ -1,15 +1,21 @@
 import math
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 import pendulum
 import sqlalchemy as sa
 from pendulum.datetime import DateTime
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CompoundSelect, Select
 
 from syntask.server.database.dependencies import provide_database_interface
 from syntask.server.database.interface import SyntaskDBInterface
+from syntask.server.events.storage.rollups import (
+    ROLLUP_UNITS,
+    rollup_where_clauses,
+    split_span,
+)
 from syntask.server.utilities.database import json_extract
+from syntask.settings import SYNTASK_EVENTS_RETENTION_PERIOD
 from syntask.utilities.collections import AutoEnum
 
 if TYPE_CHECKING:
@@ -102,11 +108,16 @@ class TimeUnit(AutoEnum):
             yield (span_start, next_span_start - timedelta(microseconds=1))
             span_start = next_span_start
 
-    def database_value_expression(self, time_interval: float):
-        """Returns the SQL expression to place an event in a time bucket"""
+    def database_value_expression(self, time_interval: float, column=None):
+        """
+        Returns the SQL expression to place an event in a time bucket, by the given
+        timestamp column or by when the event occurred
+        """
         # The date_bin function can do the bucketing for us:
         # https://www.postgresql.org/docs/14/functions-datetime.html#FUNCTIONS-DATETIME-BIN
         db = provide_database_interface()
+        if column is None:
+            column = db.Event.occurred
         delta = self.as_timedelta(time_interval)
         if db.dialect.name == "postgresql":
             return sa.cast(
@@ -114,7 +125,7 @@ class TimeUnit(AutoEnum):
                     sa.extract(
                         "epoch",
                         (
-                            sa.func.date_bin(delta, db.Event.occurred, PIVOT_DATETIME)
+                            sa.func.date_bin(delta, column, PIVOT_DATETIME)
                             - PIVOT_DATETIME
                         ),
                     )
@@ -127,7 +138,7 @@ class TimeUnit(AutoEnum):
             pivot_timestamp = sa.func.strftime(
                 "%s", PIVOT_DATETIME.strftime("%Y-%m-%d %H:%M:%S")
             )
-            event_timestamp = sa.func.strftime("%s", db.Event.occurred)
+            event_timestamp = sa.func.strftime("%s", column)
             seconds_since_pivot = event_timestamp - pivot_timestamp
             # Calculate the bucket index by dividing by the interval in seconds and flooring the result
             bucket_index = sa.func.floor(
@@ -137,19 +148,26 @@ class TimeUnit(AutoEnum):
         else:
             raise NotImplementedError(f"Dialect {db.dialect.name} is not supported.")
 
-    def database_label_expression(self, db: SyntaskDBInterface, time_interval: float):
-        """Returns the SQL expression to label a time bucket"""
+    def database_label_expression(
+        self, db: SyntaskDBInterface, time_interval: float, column=None
+    ):
+        """
+        Returns the SQL expression to label a time bucket, by the given timestamp
+        column or by when the event occurred
+        """
+        if column is None:
+            column = db.Event.occurred
         time_delta = self.as_timedelta(time_interval)
         if db.dialect.name == "postgresql":
             # The date_bin function can do the bucketing for us:
             # https://www.postgresql.org/docs/14/functions-datetime.html#FUNCTIONS-DATETIME-BIN
             return sa.func.to_char(
-                sa.func.date_bin(time_delta, db.Event.occurred, PIVOT_DATETIME),
+                sa.func.date_bin(time_delta, column, PIVOT_DATETIME),
                 'YYYY-MM-DD"T"HH24:MI:SSTZH:TZM',
             )
         elif db.dialect.name == "sqlite":
             # We can't use date_bin in SQLite, so we have to do the bucketing manually
-            seconds_since_epoch = sa.func.strftime("%s", db.Event.occurred)
+            seconds_since_epoch = sa.func.strftime("%s", column)
             # Convert the total seconds of the timedelta to a constant in SQL
             bucket_size = time_delta.total_seconds()
             # Perform integer division and multiplication to find the bucket start epoch using SQL functions
@@ -183,32 +201,10 @@ class Countable(AutoEnum):
         # The innermost SELECT pulls the matching events and groups them up by their
         # buckets.  At this point, there may be duplicate buckets for each value, since
         # the label of the thing referred to might have changed
-        fundamental_counts = (
-            sa.select(
-                (
-                    self._database_value_expression(
-                        db,
-                        time_unit=time_unit,
-                        time_interval=time_interval,
-                    ).label("value")
-                ),
-                (
-                    self._database_label_expression(
-                        db,
-                        time_unit=time_unit,
-                        time_interval=time_interval,
-                    ).label("label")
-                ),
-                sa.func.max(db.Event.occurred).label("latest"),
-                sa.func.min(db.Event.occurred).label("oldest"),
-                sa.func.count().label("count"),
-            )
-            .where(sa.and_(*filter.build_where_clauses()))
-            .group_by("value", "label")
+        fundamental_counts = self._fundamental_counts(
+            db, filter, time_unit=time_unit, time_interval=time_interval
         )
 
-        fundamental_counts = fundamental_counts.select_from(db.Event)
-
         # An intermediate SELECT takes the fundamental counts and reprojects it with the
         # most recent value for the labels of that bucket.
         fundamental = fundamental_counts.subquery("fundamental_counts")
@@ -257,21 +253,153 @@ class Countable(AutoEnum):
 
         return reaggregated
 
+    def _fundamental_counts(
+        self,
+        db: SyntaskDBInterface,
+        filter: "EventFilter",
+        time_unit: TimeUnit,
+        time_interval: float,
+    ) -> Union[Select, CompoundSelect]:
+        event_counts = (
+            sa.select(
+                (
+                    self._database_value_expression(
+                        db,
+                        time_unit=time_unit,
+                        time_interval=time_interval,
+                    ).label("value")
+                ),
+                (
+                    self._database_label_expression(
+                        db,
+                        time_unit=time_unit,
+                        time_interval=time_interval,
+                    ).label("label")
+                ),
+                sa.func.max(db.Event.occurred).label("latest"),
+                sa.func.min(db.Event.occurred).label("oldest"),
+                sa.func.count().label("count"),
+            )
+            .select_from(db.Event)
+            .where(sa.and_(*filter.build_where_clauses()))
+            .group_by("value", "label")
+        )
+
+        rollup_clauses = rollup_where_clauses(filter)
+        if rollup_clauses is None:
+            return event_counts
+
+        spans = self._rollup_spans(filter, time_unit, time_interval)
+        units = {unit for unit, _, _ in spans if unit}
+        if not units:
+            return event_counts
+
+        def within(column, unit: Optional[str]):
+            return sa.or_(
+                *[
+                    sa.and_(column >= start, column < end)
+                    for span_unit, start, end in spans
+                    if span_unit == unit
+                ]
+            )
+
+        # The whole minutes and hours of the range are counted from the rollups, and
+        # only the remainder from the events themselves
+        counts = []
+        if any(unit is None for unit, _, _ in spans):
+            counts.append(event_counts.where(within(db.Event.occurred, None)))
+
+        rollup = db.EventRollup
+        for unit in sorted(units):
+            counts.append(
+                sa.select(
+                    (
+                        self._database_value_expression(
+                            db,
+                            time_unit=time_unit,
+                            time_interval=time_interval,
+                            rollup=True,
+                        ).label("value")
+                    ),
+                    (
+                        self._database_label_expression(
+                            db,
+                            time_unit=time_unit,
+                            time_interval=time_interval,
+                            rollup=True,
+                        ).label("label")
+                    ),
+                    sa.func.max(rollup.latest).label("latest"),
+                    sa.func.min(rollup.oldest).label("oldest"),
+                    sa.cast(sa.func.sum(rollup.count), sa.BigInteger).label("count"),
+                )
+                .select_from(rollup)
+                .where(
+                    rollup.unit == unit, within(rollup.bucket, unit), *rollup_clauses
+                )
+                .group_by("value", "label")
+            )
+
+        return sa.union_all(*counts)
+
+    def _rollup_spans(
+        self,
+        filter: "EventFilter",
+        time_unit: TimeUnit,
+        time_interval: float,
+    ) -> List[Tuple[Optional[str], DateTime, DateTime]]:
+        """
+        Splits the filtered time range into spans counted from the rollups of each
+        unit and spans counted from the events (with a unit of `None`)
+        """
+        units = list(ROLLUP_UNITS)
+        if self in (self.day, self.time):
+            # Each rollup must fall into exactly one time bucket
+            if self == self.day:
+                time_unit, time_interval = TimeUnit.day, 1
+            bucket_seconds = time_unit.as_timedelta(time_interval).total_seconds()
+            units = [
+                unit
+                for unit in units
+                if bucket_seconds % ROLLUP_UNITS[unit].total_seconds() == 0
+            ]
+
+        since = filter.occurred.since
+        end = filter.occurred.until + timedelta(microseconds=1)
+
+        # The rollups of the oldest hour may already include events that were trimmed
+        earliest = (
+            pendulum.now("UTC")
+            - SYNTASK_EVENTS_RETENTION_PERIOD.value()
+            + max(ROLLUP_UNITS.values())
+        )
+        if since >= earliest:
+            return split_span(since, end, units)
+        if end <= earliest:
+            return [(None, since, end)]
+        return [(None, since, earliest), *split_span(earliest, end, units)]
+
     def _database_value_expression(
         self,
         db: SyntaskDBInterface,
         time_unit: TimeUnit,
         time_interval: float,
+        rollup: bool = False,
     ):
+        table = db.EventRollup if rollup else db.Event
         if self == self.day:
             # The legacy `day` Countable is just a special case of the `time` one
-            return TimeUnit.day.database_value_expression(1)
+            return TimeUnit.day.database_value_expression(
+                1, column=db.EventRollup.bucket if rollup else None
+            )
         elif self == self.time:
-            return time_unit.database_value_expression(time_interval)
+            return time_unit.database_value_expression(
+                time_interval, column=db.EventRollup.bucket if rollup else None
+            )
         elif self == self.event:
-            return db.Event.event
+            return table.event
         elif self == self.resource:
-            return db.Event.resource_id
+            return table.resource_id
         else:
             raise NotImplementedError()
 
@@ -280,14 +408,21 @@ class Countable(AutoEnum):
         db: SyntaskDBInterface,
         time_unit: TimeUnit,
         time_interval: float,
+        rollup: bool = False,
     ):
         if self == self.day:
             # The legacy `day` Countable is just a special case of the `time` one
-            return TimeUnit.day.database_label_expression(db, 1)
+            return TimeUnit.day.database_label_expression(
+                db, 1, column=db.EventRollup.bucket if rollup else None
+            )
         elif self == self.time:
-            return time_unit.database_label_expression(db, time_interval)
+            return time_unit.database_label_expression(
+                db, time_interval, column=db.EventRollup.bucket if rollup else None
+            )
         elif self == self.event:
-            return db.Event.event
+            return db.EventRollup.event if rollup else db.Event.event
+        elif rollup and self == self.resource:
+            return db.EventRollup.resource_label
         elif self == self.resource:
             return sa.func.coalesce(
                 json_extract(
@@ -75,6 +75,11 @@ class CausalOrdering:
     async def record_event_as_seen(self, event: ReceivedEvent) -> None:
         self._seen_events[self.scope][event.id] = True
 
+    async def forget_event_as_seen(self, event: ReceivedEvent) -> None:
+        """Forget that this event was processed, so that it will be processed again
+        if it is redelivered"""
+        self._seen_events[self.scope].pop(event.id, None)
+
     @db_injector
     async def record_follower(db: SyntaskDBInterface, self: Self, event: ReceivedEvent):
         """Remember that this event is waiting on another event to arrive"""
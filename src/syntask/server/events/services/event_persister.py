@@ -15,10 +15,15 @@ from syntask.logging import get_logger
 from syntask.server.database.dependencies import provide_database_interface
 from syntask.server.events.schemas.events import ReceivedEvent
 from syntask.server.events.storage.database import write_events
+from syntask.server.events.storage.rollups import trim_event_rollups
+from syntask.server.utilities.database import get_dialect
 from syntask.server.utilities.messaging import Message, MessageHandler, create_consumer
+from syntask.server.utilities.partitions import is_partitioned
 from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
     SYNTASK_API_SERVICES_EVENT_PERSISTER_BATCH_SIZE,
     SYNTASK_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL,
+    SYNTASK_API_SERVICES_EVENT_RETENTION_ENABLED,
     SYNTASK_EVENTS_RETENTION_PERIOD,
 )
 
@@ -116,9 +121,20 @@ async def create_handler(
 
         try:
             async with db.session_context() as session:
+                # Partitioned events are trimmed by the event retention service, which
+                # drops whole partitions instead
+                dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
+                if (
+                    dialect.name == "postgresql"
+                    and SYNTASK_API_SERVICES_EVENT_RETENTION_ENABLED.value()
+                    and await is_partitioned(session, "events")
+                ):
+                    return
+
                 result = await session.execute(
                     sa.delete(db.Event).where(db.Event.occurred < older_than)
                 )
+                await trim_event_rollups(session, older_than)
                 await session.commit()
                 if result.rowcount:
                     logger.debug(
@@ -1,11 +1,16 @@
 import asyncio
+from datetime import timedelta
 from typing import Optional
 
 from syntask.logging import get_logger
 from syntask.server.events import triggers
 from syntask.server.services.loop_service import LoopService
-from syntask.server.utilities.messaging import create_consumer
-from syntask.settings import SYNTASK_EVENTS_PROACTIVE_GRANULARITY
+from syntask.server.utilities.messaging import MessageHandler, create_consumer
+from syntask.settings import (
+    SYNTASK_API_SERVICES_TRIGGERS_BATCH_SIZE,
+    SYNTASK_API_SERVICES_TRIGGERS_FLUSH_INTERVAL,
+    SYNTASK_EVENTS_PROACTIVE_GRANULARITY,
+)
 
 logger = get_logger(__name__)
 
@@ -21,8 +26,18 @@ class ReactiveTriggers:
         assert self.consumer_task is None, "Reactive triggers already started"
         self.consumer = create_consumer("events")
 
-        async with triggers.consumer() as handler:
-            self.consumer_task = asyncio.create_task(self.consumer.run(handler))
+        batch_size = SYNTASK_API_SERVICES_TRIGGERS_BATCH_SIZE.value()
+        async with triggers.consumer(
+            batch_size=batch_size,
+            flush_every=timedelta(
+                seconds=SYNTASK_API_SERVICES_TRIGGERS_FLUSH_INTERVAL.value()
+            ),
+        ) as handler:
+            # A batched handler waits for its batch to be evaluated before its message
+            # is acknowledged, so a batch can only fill with that many messages in flight
+            self.consumer_task = asyncio.create_task(
+                self._run_consumers(handler, concurrency=batch_size)
+            )
             logger.debug("Reactive triggers started")
 
             try:
@@ -30,6 +45,11 @@ class ReactiveTriggers:
             except asyncio.CancelledError:
                 pass
 
+    async def _run_consumers(self, handler: MessageHandler, concurrency: int):
+        await asyncio.gather(
+            *(self.consumer.run(handler) for _ in range(max(concurrency, 1)))
+        )
+
     async def stop(self):
         assert self.consumer_task is not None, "Reactive triggers not started"
         self.consumer_task.cancel()
@@ -1,3 +1,4 @@
+import json
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple
 
 import pydantic
@@ -17,8 +18,12 @@ from syntask.server.events.storage import (
     process_time_based_counts,
     to_page_token,
 )
-from syntask.server.utilities.database import get_dialect
-from syntask.settings import SYNTASK_API_DATABASE_CONNECTION_URL
+from syntask.server.events.storage.rollups import write_event_rollups
+from syntask.server.utilities.database import JSON, get_dialect
+from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
+    SYNTASK_API_SERVICES_EVENT_PERSISTER_COPY_ENABLED,
+)
 
 if TYPE_CHECKING:
     from syntask.server.database.orm_models import ORMEvent
@@ -203,15 +208,20 @@ async def write_events(session: AsyncSession, events: List[ReceivedEvent]) -> No
     if events:
         dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
         if dialect.name == "postgresql":
-            await _write_postgres_events(session, events)
+            if SYNTASK_API_SERVICES_EVENT_PERSISTER_COPY_ENABLED.value():
+                inserted = await _copy_postgres_events(session, events)
+            else:
+                inserted = await _write_postgres_events(session, events)
         else:
-            await _write_sqlite_events(session, events)
+            inserted = await _write_sqlite_events(session, events)
+
+        await write_event_rollups(session, inserted)
 
 
 @db_injector
 async def _write_sqlite_events(
     db: SyntaskDBInterface, session: AsyncSession, events: List[ReceivedEvent]
-) -> None:
+) -> List[ReceivedEvent]:
     """
     Write events to the SQLite database.
 
@@ -221,7 +231,11 @@ async def _write_sqlite_events(
     Args:
         session: a SQLite events session
         events: the events to insert
+
+    Returns:
+        The events that were inserted
     """
+    inserted: List[ReceivedEvent] = []
     for batch in _in_safe_batches(events):
         event_ids = {event.id for event in batch}
         result = await session.scalars(
@@ -231,8 +245,12 @@ async def _write_sqlite_events(
         events_to_insert = [
             event for event in batch if event.id not in existing_event_ids
         ]
+        if not events_to_insert:
+            continue
+
         event_rows = [event.as_database_row() for event in events_to_insert]
         await session.execute(db.insert(db.Event).values(event_rows))
+        inserted.extend(events_to_insert)
 
         resource_rows: List[Dict[str, Any]] = []
         for event in events_to_insert:
@@ -243,18 +261,24 @@ async def _write_sqlite_events(
 
         await session.execute(db.insert(db.EventResource).values(resource_rows))
 
+    return inserted
+
 
 @db_injector
 async def _write_postgres_events(
     db: SyntaskDBInterface, session: AsyncSession, events: List[ReceivedEvent]
-) -> None:
+) -> List[ReceivedEvent]:
     """
     Write events to the Postgres database.
 
     Args:
         session: a Postgres events session
         events: the events to insert
+
+    Returns:
+        The events that were inserted
     """
+    inserted: List[ReceivedEvent] = []
     for batch in _in_safe_batches(events):
         event_rows = [event.as_database_row() for event in batch]
         result = await session.scalars(
@@ -272,6 +296,9 @@ async def _write_postgres_events(
                 # we will skip adding its related resources, as they would have been
                 # inserted already
                 continue
+            # an event that appears twice in a batch was only inserted once
+            inserted_event_ids.discard(event.id)
+            inserted.append(event)
             resource_rows.extend(event.as_database_resource_rows())
 
         if not resource_rows:
@@ -279,6 +306,153 @@ async def _write_postgres_events(
 
         await session.execute(db.insert(db.EventResource).values(resource_rows))
 
+    return inserted
+
+
+EVENTS_STAGING_TABLE = "syntask_events_staging"
+EVENT_RESOURCES_STAGING_TABLE = "syntask_event_resources_staging"
+
+# The columns copied into the staging tables; the remaining columns of `events` and
+# `event_resources` are filled in by their server defaults
+EVENT_COPY_COLUMNS = (
+    "id",
+    "occurred",
+    "event",
+    "resource_id",
+    "resource",
+    "related_resource_ids",
+    "related",
+    "payload",
+    "received",
+    "recorded",
+    "follows",
+)
+EVENT_RESOURCE_COPY_COLUMNS = (
+    "occurred",
+    "resource_id",
+    "resource_role",
+    "resource",
+    "event_id",
+)
+
+
+@db_injector
+async def _copy_postgres_events(
+    db: SyntaskDBInterface, session: AsyncSession, events: List[ReceivedEvent]
+) -> List[ReceivedEvent]:
+    """
+    Write events to the Postgres database with a binary `COPY`.
+
+    The events and their resources are copied into temporary staging tables and then
+    merged into `events` and `event_resources` with a single statement.  Unlike
+    `_write_postgres_events`, the number of events written at once is not limited by
+    the number of parameters a query may have.
+
+    Args:
+        session: a Postgres events session
+        events: the events to insert
+
+    Returns:
+        The events that were inserted
+    """
+    event_table = db.Event.__table__
+    resource_table = db.EventResource.__table__
+
+    # The staging tables live for as long as the connection and are emptied on
+    # commit.  Executing these statements through the session also begins its
+    # transaction, which the `COPY`s below take part in.
+    for table, staging_table, columns in (
+        (event_table, EVENTS_STAGING_TABLE, EVENT_COPY_COLUMNS),
+        (resource_table, EVENT_RESOURCES_STAGING_TABLE, EVENT_RESOURCE_COPY_COLUMNS),
+    ):
+        await session.execute(
+            sa.text(
+                f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging_table} "
+                "ON COMMIT DELETE ROWS "
+                f"AS SELECT {', '.join(columns)} FROM {table.name} WITH NO DATA"
+            )
+        )
+    await session.execute(
+        sa.text(f"TRUNCATE {EVENTS_STAGING_TABLE}, {EVENT_RESOURCES_STAGING_TABLE}")
+    )
+
+    # duplicates within the batch would be inserted into `event_resources` twice,
+    # so only the first of them is copied
+    unique_events = list({event.id: event for event in reversed(events)}.values())
+    unique_events.reverse()
+
+    event_records = []
+    resource_records = []
+    for event in unique_events:
+        row = event.as_database_row()
+        event_records.append(
+            tuple(
+                _json_copy_value(row[column])
+                if isinstance(event_table.c[column].type, JSON)
+                else row[column]
+                for column in EVENT_COPY_COLUMNS
+            )
+        )
+        for resource_row in event.as_database_resource_rows():
+            resource_row["resource"] = _json_copy_value(resource_row["resource"])
+            resource_records.append(
+                tuple(resource_row[column] for column in EVENT_RESOURCE_COPY_COLUMNS)
+            )
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    await driver_connection.copy_records_to_table(
+        EVENTS_STAGING_TABLE, records=event_records, columns=EVENT_COPY_COLUMNS
+    )
+    await driver_connection.copy_records_to_table(
+        EVENT_RESOURCES_STAGING_TABLE,
+        records=resource_records,
+        columns=EVENT_RESOURCE_COPY_COLUMNS,
+    )
+
+    staged_events = sa.table(
+        EVENTS_STAGING_TABLE, *(sa.column(c) for c in EVENT_COPY_COLUMNS)
+    )
+    staged_resources = sa.table(
+        EVENT_RESOURCES_STAGING_TABLE,
+        *(sa.column(c) for c in EVENT_RESOURCE_COPY_COLUMNS),
+    )
+
+    # Only the resources of events that were actually inserted are written, as the
+    # resources of duplicate events would have been inserted already
+    inserted_events = (
+        db.insert(db.Event)
+        .from_select(
+            EVENT_COPY_COLUMNS, sa.select(staged_events), include_defaults=False
+        )
+        .on_conflict_do_nothing()
+        .returning(db.Event.id)
+        .cte("inserted_events")
+    )
+    result = await session.scalars(
+        db.insert(db.EventResource)
+        .from_select(
+            EVENT_RESOURCE_COPY_COLUMNS,
+            sa.select(staged_resources).join(
+                inserted_events,
+                inserted_events.c.id == staged_resources.c.event_id,
+            ),
+            include_defaults=False,
+        )
+        .returning(db.EventResource.event_id)
+    )
+
+    # every event has at least its own resource, so this covers all inserted events
+    inserted_event_ids = set(result.all())
+    return [event for event in unique_events if event.id in inserted_event_ids]
+
+
+def _json_copy_value(value: Any) -> Optional[str]:
+    """Encodes a value for a JSON column the same way a parameter binding would"""
+    value = JSON().process_bind_param(value, dialect=None)
+    return None if value is None else json.dumps(value)
+
 
 def get_max_query_parameters() -> int:
     dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
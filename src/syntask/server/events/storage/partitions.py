@@ -0,0 +1,10 @@
+"""
+The time-based partitions of the events tables.
+
+On PostgreSQL, both tables are partitioned by range on their `occurred` column and
+maintained with the helpers in `syntask.server.utilities.partitions`.
+"""
+
+PARTITIONED_TABLES = ("events", "event_resources")
+
+PARTITION_COLUMN = "occurred"
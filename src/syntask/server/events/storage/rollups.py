@@ -0,0 +1,215 @@
+"""
+Pre-aggregated counts of events, maintained as events are written.
+
+For each minute and each hour, the `event_rollups` table holds the number of events
+with a given event name and resource, along with the label of the resource and the
+oldest and latest times those events occurred.  Event counts over long time ranges
+can be answered from the rollups for the whole minutes and hours of the range, and
+from the `events` table only for its ragged edges.
+"""
+
+import math
+from datetime import timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+import pendulum
+import sqlalchemy as sa
+from pendulum.datetime import DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from syntask.server.database.dependencies import db_injector
+from syntask.server.database.interface import SyntaskDBInterface
+from syntask.server.events.schemas.events import ReceivedEvent
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql.expression import ColumnElement
+
+    from syntask.server.events.filters import EventFilter
+
+# The rollup units, from the coarsest to the finest
+ROLLUP_UNITS: Dict[str, timedelta] = {
+    "hour": timedelta(hours=1),
+    "minute": timedelta(minutes=1),
+}
+
+# The number of rollups written with a single statement
+ROLLUP_BATCH_SIZE = 100
+
+RollupKey = Tuple[str, DateTime, str, str]
+
+
+def bucket_start(moment: DateTime, unit: str) -> DateTime:
+    """Returns the start of the rollup bucket of the given unit containing a moment"""
+    seconds = int(ROLLUP_UNITS[unit].total_seconds())
+    return pendulum.from_timestamp(
+        math.floor(moment.timestamp()) // seconds * seconds, tz="UTC"
+    )
+
+
+def _bucket_ceiling(moment: DateTime, unit: str) -> DateTime:
+    start = bucket_start(moment, unit)
+    return start if start == moment else start + ROLLUP_UNITS[unit]
+
+
+def resource_label(event: ReceivedEvent) -> str:
+    """The label counts of an event's resource are reported with"""
+    for label in ("syntask.resource.name", "syntask.name"):
+        value = event.resource.get(label)
+        if value is not None:
+            return value
+    return event.resource.id
+
+
+@db_injector
+async def write_event_rollups(
+    db: SyntaskDBInterface, session: AsyncSession, events: Sequence[ReceivedEvent]
+) -> None:
+    """
+    Adds newly written events to the rollups of each unit.
+
+    Callers must only pass events that were actually inserted, and each of them once,
+    so that duplicate events are not counted twice.
+
+    Args:
+        session: a database session
+        events: the events that were inserted
+    """
+    rollups: Dict[RollupKey, Dict] = {}
+    for event in events:
+        occurred = pendulum.instance(event.occurred).in_timezone("UTC")
+        for unit in ROLLUP_UNITS:
+            key = (unit, bucket_start(occurred, unit), event.event, event.resource.id)
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollups[key] = {
+                    "unit": key[0],
+                    "bucket": key[1],
+                    "event": key[2],
+                    "resource_id": key[3],
+                    "resource_label": resource_label(event),
+                    "count": 1,
+                    "oldest": occurred,
+                    "latest": occurred,
+                }
+                continue
+
+            rollup["count"] += 1
+            rollup["oldest"] = min(rollup["oldest"], occurred)
+            if occurred >= rollup["latest"]:
+                rollup["latest"] = occurred
+                rollup["resource_label"] = resource_label(event)
+
+    # Upserting the rollups in a consistent order keeps concurrent writers from
+    # deadlocking on each other's rows
+    rows = [rollups[key] for key in sorted(rollups)]
+
+    rollup = db.EventRollup
+    for i in range(0, len(rows), ROLLUP_BATCH_SIZE):
+        insert = db.insert(rollup).values(rows[i : i + ROLLUP_BATCH_SIZE])
+        await session.execute(
+            insert.on_conflict_do_update(
+                index_elements=[
+                    rollup.unit,
+                    rollup.bucket,
+                    rollup.event,
+                    rollup.resource_id,
+                ],
+                set_=dict(
+                    count=rollup.count + insert.excluded.count,
+                    oldest=db.queries.least(rollup.oldest, insert.excluded.oldest),
+                    latest=db.queries.greatest(rollup.latest, insert.excluded.latest),
+                    resource_label=sa.case(
+                        (
+                            insert.excluded.latest >= rollup.latest,
+                            insert.excluded.resource_label,
+                        ),
+                        else_=rollup.resource_label,
+                    ),
+                    updated=pendulum.now("UTC"),
+                ),
+            )
+        )
+
+
+@db_injector
+async def trim_event_rollups(
+    db: SyntaskDBInterface, session: AsyncSession, older_than: DateTime
+) -> int:
+    """
+    Deletes the rollups of events that all occurred before the given moment.
+
+    Returns:
+        The number of rollups deleted
+    """
+    deleted = 0
+    for unit, delta in ROLLUP_UNITS.items():
+        result = await session.execute(
+            sa.delete(db.EventRollup).where(
+                db.EventRollup.unit == unit,
+                db.EventRollup.bucket <= older_than - delta,
+            )
+        )
+        deleted += result.rowcount
+    return deleted
+
+
+def split_span(
+    start: DateTime, end: DateTime, units: Sequence[str]
+) -> List[Tuple[Optional[str], DateTime, DateTime]]:
+    """
+    Splits the time from `start` (inclusive) to `end` (exclusive) into the spans that
+    can be counted from the rollups of each unit, preferring the coarsest units.
+
+    Returns:
+        `(unit, start, end)` for each span, where the unit is `None` for the spans
+        that must be counted from the events themselves
+    """
+    if start >= end:
+        return []
+    if not units:
+        return [(None, start, end)]
+
+    unit, finer = units[0], units[1:]
+    first, last = _bucket_ceiling(start, unit), bucket_start(end, unit)
+    if first >= last:
+        return split_span(start, end, finer)
+
+    return [
+        *split_span(start, first, finer),
+        (unit, first, last),
+        *split_span(last, end, finer),
+    ]
+
+
+@db_injector
+def rollup_where_clauses(
+    db: SyntaskDBInterface, filter: "EventFilter"
+) -> Optional[List["ColumnElement[bool]"]]:
+    """
+    Translates the criteria of an event filter, other than when the events occurred,
+    onto the `event_rollups` table.
+
+    Returns:
+        The clauses, or `None` if the filter has criteria the rollups can't answer
+    """
+    if filter.any_resource or filter.related or filter.id.id:
+        return None
+    if filter.resource and (filter.resource.labels or filter.resource.distinct):
+        return None
+
+    clauses: List["ColumnElement[bool]"] = []
+    if filter.event:
+        clauses.extend(filter.event.build_where_clauses())
+    if filter.resource:
+        clauses.extend(filter.resource.build_where_clauses())
+
+    events = db.Event.__table__
+    rollups = db.EventRollup.__table__
+
+    def to_rollup_column(element):
+        if isinstance(element, sa.Column) and element.table is events:
+            return rollups.c[element.key]
+        return None
+
+    return [replacement_traverse(clause, {}, to_rollup_column) for clause in clauses]
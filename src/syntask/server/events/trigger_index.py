@@ -0,0 +1,266 @@
+"""
+An inverted index over the loaded event triggers, used to find the triggers that may be
+interested in an event without checking every trigger against it.
+
+Each trigger is indexed once, by the most selective of its criteria:
+
+1. the exact values of one of the labels of the resources it `match`es,
+2. the literal prefixes of the events it `expect`s (and comes `after`),
+3. the wildcard prefixes of one of the labels of the resources it `match`es,
+4. the exact values, then the wildcard prefixes, of one of the labels of the related
+   resources it matches with `match_related`,
+
+and otherwise it is considered a candidate for every event.  Looking up an event
+returns a superset of the interested triggers, so each candidate must still be checked
+with `EventTrigger.covers`.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from typing_extensions import TypeAlias
+
+from syntask.server.events.schemas.automations import EventTrigger
+from syntask.server.events.schemas.events import ReceivedEvent, ResourceSpecification
+
+TriggerID: TypeAlias = UUID
+
+# The resource labels to prefer when indexing a trigger, from the most selective
+PREFERRED_LABELS = ("syntask.resource.id", "syntask.resource.name")
+
+
+class PrefixIndex:
+    """Maps string prefixes to the triggers interested in values starting with them"""
+
+    def __init__(self) -> None:
+        self._by_prefix: Dict[str, Set[TriggerID]] = defaultdict(set)
+        self._lengths: Dict[int, int] = defaultdict(int)
+
+    def add(self, prefix: str, trigger_id: TriggerID) -> None:
+        ids = self._by_prefix[prefix]
+        if trigger_id not in ids:
+            ids.add(trigger_id)
+            self._lengths[len(prefix)] += 1
+
+    def discard(self, prefix: str, trigger_id: TriggerID) -> None:
+        ids = self._by_prefix.get(prefix)
+        if not ids or trigger_id not in ids:
+            return
+        ids.discard(trigger_id)
+        if not ids:
+            del self._by_prefix[prefix]
+        self._lengths[len(prefix)] -= 1
+        if not self._lengths[len(prefix)]:
+            del self._lengths[len(prefix)]
+
+    def lookup(self, value: str) -> Iterable[TriggerID]:
+        for length in self._lengths:
+            if length <= len(value):
+                yield from self._by_prefix.get(value[:length], ())
+
+    def __bool__(self) -> bool:
+        return bool(self._by_prefix)
+
+
+class LabelIndex:
+    """Indexes triggers by the exact values and the wildcard prefixes they expect for
+    the labels of a resource"""
+
+    def __init__(self) -> None:
+        self._exact: Dict[Tuple[str, str], Set[TriggerID]] = defaultdict(set)
+        self._exact_labels: Dict[str, int] = defaultdict(int)
+        self._prefixes: Dict[str, PrefixIndex] = defaultdict(PrefixIndex)
+
+    def add_exact(self, label: str, value: str, trigger_id: TriggerID) -> None:
+        ids = self._exact[(label, value)]
+        if trigger_id not in ids:
+            ids.add(trigger_id)
+            self._exact_labels[label] += 1
+
+    def discard_exact(self, label: str, value: str, trigger_id: TriggerID) -> None:
+        ids = self._exact.get((label, value))
+        if not ids or trigger_id not in ids:
+            return
+        ids.discard(trigger_id)
+        if not ids:
+            del self._exact[(label, value)]
+        self._exact_labels[label] -= 1
+        if not self._exact_labels[label]:
+            del self._exact_labels[label]
+
+    def add_prefix(self, label: str, prefix: str, trigger_id: TriggerID) -> None:
+        self._prefixes[label].add(prefix, trigger_id)
+
+    def discard_prefix(self, label: str, prefix: str, trigger_id: TriggerID) -> None:
+        index = self._prefixes.get(label)
+        if index is None:
+            return
+        index.discard(prefix, trigger_id)
+        if not index:
+            del self._prefixes[label]
+
+    def lookup(self, resource: Dict[str, str]) -> Iterable[TriggerID]:
+        for label in self._exact_labels:
+            value = resource.get(label)
+            if value is not None:
+                yield from self._exact.get((label, value), ())
+
+        for label, index in self._prefixes.items():
+            value = resource.get(label)
+            if value is not None:
+                yield from index.lookup(value)
+
+
+# How a trigger was indexed: the kind of entry, the label (if any), and the keys
+IndexEntry: TypeAlias = Tuple[str, Optional[str], Tuple[str, ...]]
+
+
+def _label_values(
+    specification: ResourceSpecification, wildcards: bool
+) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """Chooses a label of the specification that can be indexed, returning the label
+    and its exact values (or its wildcard prefixes, if `wildcards` is set)"""
+    labels = sorted(
+        specification.root,
+        key=lambda label: (
+            PREFERRED_LABELS.index(label)
+            if label in PREFERRED_LABELS
+            else len(PREFERRED_LABELS),
+            label,
+        ),
+    )
+    for label in labels:
+        values = specification.get(label) or []
+        if not values or any(value.startswith("!") for value in values):
+            continue
+
+        has_wildcards = any(value.endswith("*") for value in values)
+        if not wildcards:
+            if has_wildcards:
+                continue
+            return label, tuple(values)
+
+        prefixes = tuple(
+            value[:-1] if value.endswith("*") else value for value in values
+        )
+        if all(prefixes):
+            return label, prefixes
+
+    return None
+
+
+def _event_prefixes(trigger: EventTrigger) -> Optional[Tuple[str, ...]]:
+    """The literal prefixes of the events a trigger is interested in, matching the
+    semantics of `EventTrigger.event_pattern`"""
+    if not trigger.expect:
+        return None
+    prefixes = tuple(e.split("*", 1)[0] for e in trigger.expect | trigger.after)
+    if not all(prefixes):
+        return None
+    return prefixes
+
+
+def _choose_entry(trigger: EventTrigger) -> IndexEntry:
+    if chosen := _label_values(trigger.match, wildcards=False):
+        return ("resource", chosen[0], chosen[1])
+
+    if prefixes := _event_prefixes(trigger):
+        return ("event", None, prefixes)
+
+    if chosen := _label_values(trigger.match, wildcards=True):
+        return ("resource-prefix", chosen[0], chosen[1])
+
+    if chosen := _label_values(trigger.match_related, wildcards=False):
+        return ("related", chosen[0], chosen[1])
+
+    if chosen := _label_values(trigger.match_related, wildcards=True):
+        return ("related-prefix", chosen[0], chosen[1])
+
+    return ("any", None, ())
+
+
+class TriggerIndex:
+    """An inverted index of event triggers by the events and resources they match"""
+
+    def __init__(self) -> None:
+        self._entries: Dict[TriggerID, IndexEntry] = {}
+        # Remembers the order triggers were added so that lookups return candidates
+        # in a stable order
+        self._order: Dict[TriggerID, int] = {}
+        self._next_order = 0
+
+        self._events = PrefixIndex()
+        self._resources = LabelIndex()
+        self._related = LabelIndex()
+        self._any: Set[TriggerID] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, trigger_id: TriggerID) -> bool:
+        return trigger_id in self._entries
+
+    def add(self, trigger: EventTrigger) -> None:
+        """Indexes the given trigger, replacing any previous version of it"""
+        self.discard(trigger.id, keep_order=True)
+
+        entry = _choose_entry(trigger)
+        self._entries[trigger.id] = entry
+        if trigger.id not in self._order:
+            self._order[trigger.id] = self._next_order
+            self._next_order += 1
+
+        self._apply(trigger.id, entry, add=True)
+
+    def discard(self, trigger_id: TriggerID, keep_order: bool = False) -> None:
+        """Removes the given trigger from the index, if it was indexed"""
+        entry = self._entries.pop(trigger_id, None)
+        if not keep_order:
+            self._order.pop(trigger_id, None)
+        if entry:
+            self._apply(trigger_id, entry, add=False)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def _apply(self, trigger_id: TriggerID, entry: IndexEntry, add: bool) -> None:
+        kind, label, keys = entry
+
+        if kind == "any":
+            if add:
+                self._any.add(trigger_id)
+            else:
+                self._any.discard(trigger_id)
+            return
+
+        for key in keys:
+            if kind == "event":
+                if add:
+                    self._events.add(key, trigger_id)
+                else:
+                    self._events.discard(key, trigger_id)
+                continue
+
+            assert label is not None
+            index = self._resources if kind.startswith("resource") else self._related
+            if kind.endswith("-prefix"):
+                if add:
+                    index.add_prefix(label, key, trigger_id)
+                else:
+                    index.discard_prefix(label, key, trigger_id)
+            else:
+                if add:
+                    index.add_exact(label, key, trigger_id)
+                else:
+                    index.discard_exact(label, key, trigger_id)
+
+    def candidates(self, event: ReceivedEvent) -> List[TriggerID]:
+        """Returns the IDs of the triggers that may be interested in the event, in
+        the order they were added"""
+        found: Set[TriggerID] = set(self._any)
+        found.update(self._events.lookup(event.event))
+        found.update(self._resources.lookup(event.resource.root))
+        for related in event.related:
+            found.update(self._related.lookup(related.root))
+        return sorted(found, key=self._order.__getitem__)
@@ -5,7 +5,9 @@ to act on them based on the automations that users have set up.
 
 import asyncio
 from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
@@ -13,6 +15,8 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
 )
 from uuid import UUID
@@ -55,6 +59,7 @@ from syntask.server.events.schemas.automations import (
     TriggerState,
 )
 from syntask.server.events.schemas.events import ReceivedEvent
+from syntask.server.events.trigger_index import TriggerIndex
 from syntask.server.utilities.messaging import Message, MessageHandler
 from syntask.settings import SYNTASK_EVENTS_EXPIRED_BUCKET_BUFFER
 
@@ -468,7 +473,9 @@ async def reset_events_clock():
         _events_clock_updated = None
 
 
-async def reactive_evaluation(event: ReceivedEvent, depth: int = 0):
+async def reactive_evaluation(
+    event: ReceivedEvent, depth: int = 0, batch: Optional["BucketBatch"] = None
+):
     """
     Evaluate all automations that may apply to this event.
 
@@ -478,14 +485,19 @@ async def reactive_evaluation(event: ReceivedEvent, depth: int = 0):
     depth (int, optional): The current recursion depth. This is used to prevent infinite recursion
         due to cyclic event dependencies. Defaults to 0 and is incremented with
         each recursive call.
+    batch (BucketBatch, optional): When given, bucket increments that can't cause a
+        trigger to fire are collected in the batch instead of being written
+        immediately.  The caller must flush the batch.
 
     """
+    handler = (
+        partial(reactive_evaluation, batch=batch) if batch else reactive_evaluation
+    )
+
     async with AsyncExitStack() as stack:
         await update_events_clock(event)
         await stack.enter_async_context(
-            causal_ordering().preceding_event_confirmed(
-                reactive_evaluation, event, depth
-            )
+            causal_ordering().preceding_event_confirmed(handler, event, depth)
         )
 
         interested_triggers = find_interested_triggers(event)
@@ -505,79 +517,124 @@ async def reactive_evaluation(event: ReceivedEvent, depth: int = 0):
 
             bucketing_key = trigger.bucketing_key(event)
 
-            async with automations_session(begin_transaction=True) as session:
-                try:
-                    bucket: Optional["ORMAutomationBucket"] = None
-
-                    if trigger.after and trigger.starts_after(event.event):
-                        # When an event matches both the after and expect, each event
-                        # can both start a new bucket and increment the bucket that was
-                        # started by the previous event.  Here we offset the bucket to
-                        # start at -1 so that the first event will leave the bucket at 0
-                        # after evaluation.  See the tests:
-                        #
-                        #   test_same_event_in_expect_and_after_never_reacts_immediately
-                        #   test_same_event_in_expect_and_after_reacts_after_threshold_is_met
-                        #   test_same_event_in_expect_and_after_proactively_does_not_fire
-                        #   test_same_event_in_expect_and_after_proactively_fires
-                        #
-                        # in test_triggers_regressions.py for examples of how we expect
-                        # this to behave.
-                        #
-                        # https://github.com/SynoPKG/nebula/issues/4201
-                        initial_count = -1 if trigger.expects(event.event) else 0
-                        bucket = await ensure_bucket(
-                            session,
-                            trigger,
-                            bucketing_key,
-                            start=event.occurred,
-                            end=event.occurred + trigger.within,
-                            last_event=event,
-                            initial_count=initial_count,
-                        )
-
-                    if (
-                        not bucket
-                        and not trigger.after
-                        and trigger.expects(event.event)
-                    ):
-                        # When ensuring a bucket and _creating it for the first time_,
-                        # use an old time so that we can catch any other events flowing
-                        # through the system at the same time even if they are out of
-                        # order.  After the trigger fires and creates its next bucket,
-                        # time will start from that point forward.  We'll use our
-                        # preceding event lookback variable as the horizon that we'll
-                        # accept these older events.
-                        #
-                        # https://github.com/SynoPKG/nebula/issues/7230
-                        start = event.occurred - PRECEDING_EVENT_LOOKBACK
-
-                        bucket = await ensure_bucket(
-                            session,
-                            trigger,
-                            bucketing_key=bucketing_key,
-                            start=start,
-                            end=event.occurred + trigger.within,
-                            last_event=event,
-                        )
-
-                    if not trigger.expects(event.event):
-                        continue
-
-                    if not bucket:
-                        bucket = await read_bucket(session, trigger, bucketing_key)
-                        if not bucket:
-                            continue
+            if batch:
+                if await batch.absorb(trigger, bucketing_key, event):
+                    continue
 
-                    await evaluate(
-                        session,
-                        trigger,
-                        bucket,
-                        event.occurred,
-                        triggering_event=event,
-                    )
-                finally:
-                    await session.commit()
+                # This event needs the full evaluation below, which must see any
+                # increments the batch is still holding for this bucket
+                await batch.flush(trigger.id, bucketing_key)
+
+            await _reactive_evaluation_for_trigger(trigger, bucketing_key, event)
+
+
+async def _reactive_evaluation_for_trigger(
+    trigger: EventTrigger, bucketing_key: Tuple[str, ...], event: ReceivedEvent
+) -> None:
+    """Evaluate a single trigger that is interested in this event"""
+    async with automations_session(begin_transaction=True) as session:
+        try:
+            bucket: Optional["ORMAutomationBucket"] = None
+
+            if trigger.after and trigger.starts_after(event.event):
+                # When an event matches both the after and expect, each event
+                # can both start a new bucket and increment the bucket that was
+                # started by the previous event.  Here we offset the bucket to
+                # start at -1 so that the first event will leave the bucket at 0
+                # after evaluation.  See the tests:
+                #
+                #   test_same_event_in_expect_and_after_never_reacts_immediately
+                #   test_same_event_in_expect_and_after_reacts_after_threshold_is_met
+                #   test_same_event_in_expect_and_after_proactively_does_not_fire
+                #   test_same_event_in_expect_and_after_proactively_fires
+                #
+                # in test_triggers_regressions.py for examples of how we expect
+                # this to behave.
+                #
+                # https://github.com/SynoPKG/nebula/issues/4201
+                initial_count = -1 if trigger.expects(event.event) else 0
+                bucket = await ensure_bucket(
+                    session,
+                    trigger,
+                    bucketing_key,
+                    start=event.occurred,
+                    end=event.occurred + trigger.within,
+                    last_event=event,
+                    initial_count=initial_count,
+                )
+
+            if not bucket and not trigger.after and trigger.expects(event.event):
+                # When ensuring a bucket and _creating it for the first time_,
+                # use an old time so that we can catch any other events flowing
+                # through the system at the same time even if they are out of
+                # order.  After the trigger fires and creates its next bucket,
+                # time will start from that point forward.  We'll use our
+                # preceding event lookback variable as the horizon that we'll
+                # accept these older events.
+                #
+                # https://github.com/SynoPKG/nebula/issues/7230
+                start = event.occurred - PRECEDING_EVENT_LOOKBACK
+
+                bucket = await ensure_bucket(
+                    session,
+                    trigger,
+                    bucketing_key=bucketing_key,
+                    start=start,
+                    end=event.occurred + trigger.within,
+                    last_event=event,
+                )
+
+            if not trigger.expects(event.event):
+                return
+
+            if not bucket:
+                bucket = await read_bucket(session, trigger, bucketing_key)
+                if not bucket:
+                    return
+
+            await evaluate(
+                session,
+                trigger,
+                bucket,
+                event.occurred,
+                triggering_event=event,
+            )
+        finally:
+            await session.commit()
+
+
+async def reactive_evaluation_batch(events: Sequence[ReceivedEvent]):
+    """
+    Evaluate a batch of events in the order they were received, collecting the bucket
+    increments that can't cause a trigger to fire so that they are written together
+    with one statement at the end of the batch.  Events that may fire a trigger, or
+    that start or move a bucket, are evaluated individually as they would be by
+    `reactive_evaluation`, after any increments held for their bucket are written.
+
+    Events are recorded as seen as they are evaluated, before their increments are
+    written.  If the batch fails, the events whose increments weren't written are
+    forgotten again, so that they are evaluated when their messages are redelivered.
+    """
+    batch = BucketBatch()
+    seen: Set[UUID] = set()
+    try:
+        try:
+            for event in events:
+                if event.id in seen:
+                    continue
+                seen.add(event.id)
+
+                try:
+                    await reactive_evaluation(event, batch=batch)
+                except EventArrivedEarly:
+                    pass  # it's fine to ACK this message, since it is safe in the DB
+        finally:
+            await batch.flush()
+    except Exception:
+        ordering = causal_ordering()
+        for event in batch.unwritten_events():
+            await ordering.forget_event_as_seen(event)
+        raise
 
 
 # retry on operational errors to account for db flakiness with sqlite
@@ -627,6 +684,7 @@ async def evaluate_periodically(periodic_granularity: timedelta):
 # account and workspace
 automations_by_id: Dict[UUID, Automation] = {}
 triggers: Dict[TriggerID, EventTrigger] = {}
+trigger_index = TriggerIndex()
 next_proactive_runs: Dict[TriggerID, DateTime] = {}
 
 # This lock governs any changes to the set of loaded automations; any routine that will
@@ -643,7 +701,9 @@ def _automations_lock() -> asyncio.Lock:
 
 
 def find_interested_triggers(event: ReceivedEvent) -> Collection[EventTrigger]:
-    candidates = triggers.values()
+    candidates = (
+        triggers[trigger_id] for trigger_id in trigger_index.candidates(event)
+    )
     return [trigger for trigger in candidates if trigger.covers(event)]
 
 
@@ -662,6 +722,7 @@ def load_automation(automation: Optional[Automation]):
 
     for trigger in event_triggers:
         triggers[trigger.id] = trigger
+        trigger_index.add(trigger)
         next_proactive_runs.pop(trigger.id, None)
 
 
@@ -670,6 +731,7 @@ def forget_automation(automation_id: UUID):
     if automation := automations_by_id.pop(automation_id, None):
         for trigger in automation.triggers():
             triggers.pop(trigger.id, None)
+            trigger_index.discard(trigger.id)
             next_proactive_runs.pop(trigger.id, None)
 
 
@@ -792,6 +854,29 @@ async def read_bucket_by_trigger_id(
     return bucket
 
 
+@db_injector
+async def lock_bucket(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    trigger: Trigger,
+    bucketing_key: Tuple[str, ...],
+) -> Optional["ORMAutomationBucket"]:
+    """Gets the current bucket for the given trigger, locking it for the rest of the
+    transaction"""
+    query = (
+        sa.select(db.AutomationBucket)
+        .where(
+            db.AutomationBucket.automation_id == trigger.automation.id,
+            db.AutomationBucket.trigger_id == trigger.id,
+            db.AutomationBucket.bucketing_key == bucketing_key,
+        )
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    result = await session.execute(query)
+    return result.scalars().first()
+
+
 @db_injector
 async def increment_bucket(
     db: SyntaskDBInterface,
@@ -957,11 +1042,192 @@ async def sweep_closed_buckets(
     )
 
 
+@dataclass
+class PendingIncrement:
+    """The increments held for one bucket, along with the state of the bucket when it
+    was read"""
+
+    trigger: EventTrigger
+    bucketing_key: Tuple[str, ...]
+    start: DateTime
+    end: DateTime
+    count: int
+    added: int = 0
+    last_event: Optional[ReceivedEvent] = None
+    events: List[ReceivedEvent] = field(default_factory=list)
+
+
+BucketID: TypeAlias = Tuple[TriggerID, Tuple[str, ...]]
+
+
+class BucketBatch:
+    """
+    Collects the bucket increments of a batch of events, grouped by trigger and
+    bucketing key, so that they may be written together.
+
+    Only increments that could not change the outcome of `evaluate` are collected:
+    events that fall within the current window of an existing bucket without reaching
+    a reactive trigger's threshold, and events that arrive too late to count.  Any
+    other event must be evaluated individually after calling `flush` for its bucket.
+
+    Those decisions are made against the bucket as it was first read in the batch, so
+    `flush` checks each bucket again before writing to it (see `flush`).
+    """
+
+    def __init__(self) -> None:
+        # The buckets read so far in this batch, or None if there was no bucket
+        self._buckets: Dict[BucketID, Optional[PendingIncrement]] = {}
+        # The increments taken out of the batch by `flush` that haven't been written
+        self._flushing: List[PendingIncrement] = []
+
+    def unwritten_events(self) -> List[ReceivedEvent]:
+        """Returns the events whose increments this batch holds, or failed to write"""
+        held = [pending for pending in self._buckets.values() if pending]
+        unwritten: Dict[UUID, ReceivedEvent] = {}
+        for pending in self._flushing + held:
+            for event in pending.events:
+                unwritten.setdefault(event.id, event)
+        return list(unwritten.values())
+
+    async def absorb(
+        self,
+        trigger: EventTrigger,
+        bucketing_key: Tuple[str, ...],
+        event: ReceivedEvent,
+    ) -> bool:
+        """Collects the effect of the event on the trigger's bucket, if possible.
+        Returns False if the event must be evaluated individually."""
+        if trigger.immediate or not trigger.expects(event.event):
+            return False
+        if trigger.after and trigger.starts_after(event.event):
+            return False
+
+        bucket_id = (trigger.id, bucketing_key)
+        if bucket_id not in self._buckets:
+            async with automations_session() as session:
+                bucket = await read_bucket(session, trigger, bucketing_key)
+                self._buckets[bucket_id] = (
+                    PendingIncrement(
+                        trigger=trigger,
+                        bucketing_key=bucketing_key,
+                        start=pendulum.instance(bucket.start),
+                        end=pendulum.instance(bucket.end),
+                        count=bucket.count,
+                    )
+                    if bucket
+                    else None
+                )
+
+        pending = self._buckets[bucket_id]
+        if not pending:
+            # Triggers with `after` ignore events until a bucket has been started,
+            # but the others start a new bucket with this event
+            return bool(trigger.after)
+
+        if event.occurred < pending.start:
+            # A late event doesn't count towards the bucket, but triggers without
+            # `after` still record it as the bucket's last event
+            if not trigger.after:
+                pending.last_event = event
+                pending.events.append(event)
+            return True
+
+        if not (pending.start <= event.occurred < pending.end):
+            return False
+
+        if trigger.posture == Posture.Reactive and trigger.meets_threshold(
+            pending.count + pending.added + 1
+        ):
+            return False
+
+        pending.added += 1
+        pending.last_event = event
+        pending.events.append(event)
+        return True
+
+    async def flush(
+        self,
+        trigger_id: Optional[TriggerID] = None,
+        bucketing_key: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        """Writes the increments held for one bucket, or for all of them, and forgets
+        those buckets so that they will be read again.
+
+        Each bucket is read again and locked before its increments are added, since
+        another consumer may have changed it after it was read into the batch.  If the
+        bucket has moved to another window, the events held for it are evaluated
+        individually instead.  If other increments have brought a reactive trigger's
+        bucket to its threshold, the trigger is evaluated as of the last event."""
+        if trigger_id is not None:
+            bucket_id = (trigger_id, bucketing_key or ())
+            pending = self._buckets.pop(bucket_id, None)
+            to_write = [pending] if pending else []
+        else:
+            to_write = [pending for pending in self._buckets.values() if pending]
+            self._buckets.clear()
+
+        to_write = [pending for pending in to_write if pending.last_event]
+        if not to_write:
+            return
+
+        self._flushing.extend(to_write)
+        written: List[PendingIncrement] = []
+        moved: List[PendingIncrement] = []
+
+        async with automations_session(begin_transaction=True) as session:
+            # Locking the buckets in a consistent order keeps concurrent writers from
+            # deadlocking on each other's rows
+            for pending in sorted(
+                to_write, key=lambda p: (str(p.trigger.id), p.bucketing_key)
+            ):
+                trigger = pending.trigger
+                assert pending.last_event
+
+                bucket = await lock_bucket(session, trigger, pending.bucketing_key)
+                if (
+                    not bucket
+                    or pendulum.instance(bucket.start) != pending.start
+                    or pendulum.instance(bucket.end) != pending.end
+                ):
+                    moved.append(pending)
+                    continue
+
+                bucket = await increment_bucket(
+                    session, bucket, pending.added, pending.last_event
+                )
+
+                if trigger.posture == Posture.Reactive and trigger.meets_threshold(
+                    bucket.count
+                ):
+                    await evaluate(
+                        session,
+                        trigger,
+                        bucket,
+                        pending.last_event.occurred,
+                        triggering_event=None,
+                    )
+
+                written.append(pending)
+
+        for pending in written:
+            pending.events.clear()
+
+        for pending in moved:
+            while pending.events:
+                await _reactive_evaluation_for_trigger(
+                    pending.trigger, pending.bucketing_key, pending.events[0]
+                )
+                pending.events.pop(0)
+
+        self._flushing = [pending for pending in self._flushing if pending.events]
+
+
 async def reset():
     """Resets the in-memory state of the service"""
     reset_events_clock()
     automations_by_id.clear()
     triggers.clear()
+    trigger_index.clear()
     next_proactive_runs.clear()
 
 
@@ -972,10 +1238,18 @@ def causal_ordering() -> CausalOrdering:
 @asynccontextmanager
 async def consumer(
     periodic_granularity: timedelta = timedelta(seconds=5),
+    batch_size: int = 1,
+    flush_every: timedelta = timedelta(milliseconds=5),
 ) -> AsyncGenerator[MessageHandler, None]:
     """The `triggers.consumer` processes all Events arriving on the event bus to
     determine if they meet the automation criteria, queuing up a corresponding
-    `TriggeredAction` for the `actions` service if the automation criteria is met."""
+    `TriggeredAction` for the `actions` service if the automation criteria is met.
+
+    With a `batch_size` greater than 1, events are gathered and evaluated together
+    every `batch_size` messages, or every `flush_every` interval, so that their bucket
+    increments can be written together (see `reactive_evaluation_batch`).  The handler
+    only returns once the batch holding its message has been evaluated, and raises if
+    that batch failed, so it must be called concurrently for batches to fill."""
     async with automations_session() as session:
         await load_automations(session)
 
@@ -983,6 +1257,49 @@ async def consumer(
 
     ordering = causal_ordering()
 
+    pending_events: List[Tuple[ReceivedEvent, "asyncio.Future[None]"]] = []
+    batch_full = asyncio.Event()
+
+    async def flush() -> None:
+        batch = pending_events[:]
+        pending_events.clear()
+        try:
+            await reactive_evaluation_batch([event for event, _ in batch])
+        except Exception as exc:
+            for _, evaluated in batch:
+                if not evaluated.done():
+                    evaluated.set_exception(exc)
+        except BaseException:
+            for _, evaluated in batch:
+                evaluated.cancel()
+            raise
+        else:
+            for _, evaluated in batch:
+                if not evaluated.done():
+                    evaluated.set_result(None)
+
+    async def flush_periodically():
+        # Batches are only evaluated here, one at a time and in order, which preserves
+        # the causal ordering of their events and keeps an evaluation from being
+        # cancelled along with the handler that filled its batch
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        batch_full.wait(), timeout=flush_every.total_seconds()
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                batch_full.clear()
+                if pending_events:
+                    await flush()
+        except asyncio.CancelledError:
+            return
+
+    periodic_flush = (
+        asyncio.create_task(flush_periodically()) if batch_size > 1 else None
+    )
+
     async def message_handler(message: Message):
         if not message.data:
             logger.warning("Message had no data")
@@ -1011,6 +1328,15 @@ async def consumer(
 
         event = ReceivedEvent.model_validate_json(message.data)
 
+        if batch_size > 1:
+            evaluated: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            pending_events.append((event, evaluated))
+            if len(pending_events) >= batch_size:
+                batch_full.set()
+            # acknowledge the message only once its batch has been evaluated
+            await evaluated
+            return
+
         try:
             await reactive_evaluation(event)
         except EventArrivedEarly:
@@ -1021,6 +1347,13 @@ async def consumer(
         yield message_handler
     finally:
         proactive_task.cancel()
+        if periodic_flush:
+            periodic_flush.cancel()
+            # the handlers of any events still waiting have stopped without
+            # acknowledging their messages, which will be delivered again
+            for _, evaluated in pending_events:
+                evaluated.cancel()
+            pending_events.clear()
 
 
 async def proactive_evaluation(trigger: EventTrigger, as_of: DateTime) -> DateTime:
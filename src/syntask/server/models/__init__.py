@@ -17,6 +17,7 @@ from . import (
     flows,
     logs,
     saved_searches,
+    service_leases,
     task_run_states,
     task_runs,
     task_workers,
@@ -4,7 +4,18 @@ Intended for internal use by the Syntask REST API.
 """
 
 import datetime
-from typing import Dict, Iterable, List, Optional, Sequence, TypeVar
+import math
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID, uuid4
 
 import pendulum
@@ -20,6 +31,7 @@ from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.events.clients import SyntaskServerEventsClient
 from syntask.server.exceptions import ObjectNotFoundError
 from syntask.server.models.events import deployment_status_event
+from syntask.server.orchestration.policies import BaseOrchestrationPolicy
 from syntask.server.schemas.statuses import DeploymentStatus
 from syntask.server.utilities.database import json_contains
 from syntask.settings import (
@@ -31,6 +43,13 @@ from syntask.settings import (
 
 T = TypeVar("T", bound=tuple)
 
+# the latest run generated for a deployment schedule, the time by which the
+# schedule will need more runs, and when the schedule was last updated as of
+# generating them
+ScheduleWatermark = Tuple[
+    Optional[datetime.datetime], datetime.datetime, Optional[datetime.datetime]
+]
+
 
 async def _delete_scheduled_runs(
     session: AsyncSession,
@@ -58,6 +77,12 @@ async def _delete_scheduled_runs(
 
     await session.execute(delete_query)
 
+    # the deleted runs must be generated again, so the deployment's schedules are
+    # due right away
+    await _clear_deployment_schedule_watermarks(
+        session=session, deployment_id=deployment_id
+    )
+
 
 @db_injector
 async def create_deployment(
@@ -618,6 +643,7 @@ async def _generate_scheduled_flow_runs(
     min_runs: int,
     max_runs: int,
     auto_scheduled: bool = True,
+    watermarks: Optional[Dict[UUID, ScheduleWatermark]] = None,
 ) -> List[Dict]:
     """
     Given a `deployment_id` and schedule, generates a list of flow run objects and
@@ -636,6 +662,8 @@ async def _generate_scheduled_flow_runs(
         min_time: runs will be scheduled until at least this far in the future
         min_runs: a minimum amount of runs to schedule
         max_runs: a maximum amount of runs to schedule
+        watermarks: if provided, this is filled in with the `ScheduleWatermark` of
+            each of the deployment's active schedules, keyed by schedule id
 
     This function will generate the minimum number of runs that satisfy the min
     and max times, and the min and max counts. Specifically, the following order
@@ -666,17 +694,23 @@ async def _generate_scheduled_flow_runs(
     )
 
     for deployment_schedule in active_deployment_schedules:
-        dates = []
-
-        # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
-        for dt in deployment_schedule.schedule._get_dates_generator(
-            n=max_runs, start=start_time, end=end_time
-        ):
-            dates.append(dt)
+        dates = _get_schedule_dates(
+            deployment_schedule.schedule,
+            start_time=start_time,
+            end_time=end_time,
+            min_time=min_time,
+            min_runs=min_runs,
+            max_runs=max_runs,
+        )
 
-            # at any point, if we satisfy both of the minimums, we can stop
-            if len(dates) >= min_runs and dt >= (start_time + min_time):
-                break
+        if watermarks is not None:
+            watermarks[deployment_schedule.id] = (
+                dates[-1] if dates else None,
+                _next_due(
+                    dates, start_time=start_time, min_time=min_time, min_runs=min_runs
+                ),
+                deployment_schedule.updated,
+            )
 
         tags = deployment.tags
         if auto_scheduled:
@@ -710,6 +744,128 @@ async def _generate_scheduled_flow_runs(
     return runs
 
 
+def _get_schedule_dates(
+    schedule: schemas.schedules.SCHEDULE_TYPES,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+) -> List[datetime.datetime]:
+    """
+    Generates up to `max_runs` dates of a schedule between `start_time` and
+    `end_time`, stopping at the first date that satisfies both `min_runs` and
+    `min_time`.
+
+    Dates are generated in batches, each sized from the spacing of the dates in the
+    one before it, rather than one at a time.  As every batch starts from
+    `start_time`, each is a prefix of the next and the dates are the same as
+    generating them one by one.
+    """
+    n = min(max(min_runs, 1), max_runs)
+
+    while True:
+        dates = schedule.get_dates_batch(n=n, start=start_time, end=end_time)
+
+        # at any point, if we satisfy both of the minimums, we can stop
+        for i, dt in enumerate(dates):
+            if i + 1 >= min_runs and dt >= (start_time + min_time):
+                return dates[: i + 1]
+
+        # the schedule or the window ran out of dates
+        if len(dates) < n or n >= max_runs:
+            return dates
+
+        estimate = 2 * n
+        if len(dates) > 1:
+            spacing = (dates[-1] - dates[0]).total_seconds() / (len(dates) - 1)
+            remaining = (start_time + min_time - dates[-1]).total_seconds()
+            estimate = max(estimate, n + math.ceil(remaining / spacing))
+        n = min(estimate, max_runs)
+
+
+def _next_due(
+    dates: List[datetime.datetime],
+    start_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+) -> datetime.datetime:
+    """
+    Returns the time by which a schedule with runs at the given `dates`, generated at
+    `start_time`, will have fewer than `min_runs` runs in the future or none beyond
+    `min_time` from then, and so will need more runs.
+    """
+    if not dates:
+        # nothing fell within the scheduling horizon, so check again once the horizon
+        # has moved forward
+        return start_time + min_time
+
+    runs_due = dates[-min_runs] if len(dates) >= min_runs else dates[0]
+    time_due = dates[-1] - min_time
+    return max(start_time, min(runs_due, time_due))
+
+
+async def _set_deployment_schedule_watermarks(
+    session: AsyncSession,
+    watermarks: Dict[UUID, ScheduleWatermark],
+) -> None:
+    """
+    Records the `ScheduleWatermark` of each of the given deployment schedules, as
+    produced by `_generate_scheduled_flow_runs`.
+
+    A schedule that was updated after its runs were generated, e.g. because its
+    deployment's scheduled runs were deleted and its watermark cleared, is left as
+    it is so that it stays due.
+
+    Args:
+        session: a database session
+        watermarks: the watermarks, keyed by deployment schedule id
+    """
+    if not watermarks:
+        return
+
+    table = orm_models.DeploymentSchedule.__table__
+    await session.execute(
+        sa.update(table)
+        .where(
+            table.c.id == sa.bindparam("schedule_id"),
+            table.c.updated == sa.bindparam("read_updated"),
+        )
+        .values(
+            scheduled_through=sa.bindparam("scheduled_through"),
+            next_due=sa.bindparam("next_due"),
+        ),
+        [
+            {
+                "schedule_id": id,
+                "read_updated": updated,
+                "scheduled_through": scheduled_through,
+                "next_due": next_due,
+            }
+            for id, (scheduled_through, next_due, updated) in watermarks.items()
+        ],
+    )
+
+
+async def _clear_deployment_schedule_watermarks(
+    session: AsyncSession,
+    deployment_id: UUID,
+) -> None:
+    """
+    Clears the watermarks of a deployment's schedules, so that the scheduler will
+    generate their runs again on its next loop.
+
+    Args:
+        session: a database session
+        deployment_id: the deployment whose schedules should be cleared
+    """
+    await session.execute(
+        sa.update(orm_models.DeploymentSchedule)
+        .where(orm_models.DeploymentSchedule.deployment_id == deployment_id)
+        .values(scheduled_through=None, next_due=None)
+    )
+
+
 @db_injector
 async def _insert_scheduled_flow_runs(
     db: SyntaskDBInterface, session: AsyncSession, runs: List[Dict]
@@ -781,6 +937,57 @@ async def _insert_scheduled_flow_runs(
     return inserted_flow_run_ids
 
 
+@db_injector
+async def claim_scheduled_flow_runs(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    deployment_ids: List[UUID],
+    scheduled_before: Optional[datetime.datetime] = None,
+    limit: Optional[int] = None,
+    flow_policy: Optional[Type[BaseOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+) -> List[orm_models.FlowRun]:
+    """
+    Claims the earliest scheduled runs of the given deployments by moving them to
+    PENDING.  On PostgreSQL the runs are locked with `FOR UPDATE SKIP LOCKED`, so
+    that concurrent claims each get different runs.  On SQLite, the session should
+    be opened with `with_for_update` so that claims are serialized.
+
+    Args:
+        session: a database session
+        deployment_ids: the deployment ids
+        scheduled_before: only claim runs scheduled before this time
+        limit: the maximum number of runs to claim
+        flow_policy: the orchestration policy to apply when moving runs to PENDING
+        orchestration_parameters: parameters for the orchestration rules
+
+    Returns:
+        List[orm_models.FlowRun]: the flow runs that were claimed
+    """
+    query = (
+        sa.select(db.FlowRun.id)
+        .where(
+            db.FlowRun.deployment_id.in_(deployment_ids),
+            db.FlowRun.state_type == schemas.states.StateType.SCHEDULED,
+        )
+        .order_by(db.FlowRun.next_scheduled_start_time)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    if scheduled_before:
+        query = query.where(db.FlowRun.next_scheduled_start_time <= scheduled_before)
+
+    flow_run_ids = (await session.execute(query)).scalars().all()
+
+    return await models.flow_runs.set_flow_runs_pending(
+        session=session,
+        flow_run_ids=flow_run_ids,
+        flow_policy=flow_policy,
+        orchestration_parameters=orchestration_parameters,
+    )
+
+
 async def check_work_queues_for_deployment(
     session: AsyncSession, deployment_id: UUID
 ) -> Sequence[orm_models.WorkQueue]:
@@ -928,7 +1135,12 @@ async def update_deployment_schedule(
                 orm_models.DeploymentSchedule.deployment_id == deployment_id,
             )
         )
-        .values(**schedule.model_dump(exclude_none=True))
+        .values(
+            **schedule.model_dump(exclude_none=True),
+            # the schedule changed, so any runs generated from it are out of date
+            scheduled_through=None,
+            next_due=None,
+        )
     )
 
     return result.rowcount > 0
@@ -984,6 +1196,7 @@ async def mark_deployments_ready(
     db: SyntaskDBInterface,
     deployment_ids: Optional[Iterable[UUID]] = None,
     work_queue_ids: Optional[Iterable[UUID]] = None,
+    last_polled: Optional[datetime.datetime] = None,
 ) -> None:
     deployment_ids = deployment_ids or []
     work_queue_ids = work_queue_ids or []
@@ -1005,7 +1218,7 @@ async def mark_deployments_ready(
         )
         unready_deployments = list(result.scalars().unique().all())
 
-        last_polled = pendulum.now("UTC")
+        last_polled = last_polled or pendulum.now("UTC")
 
         await session.execute(
             sa.update(orm_models.Deployment)
@@ -21,7 +21,9 @@ import syntask.server.schemas as schemas
 from syntask.server.database import orm_models
 from syntask.server.database.dependencies import db_injector
 from syntask.server.database.interface import SyntaskDBInterface
+from syntask.server.events.clients import SyntaskServerEventsClient
 from syntask.server.exceptions import ObjectNotFoundError
+from syntask.server.models.events import flow_run_state_change_event
 from syntask.server.orchestration.core_policy import MinimalFlowPolicy
 from syntask.server.orchestration.global_policy import GlobalFlowPolicy
 from syntask.server.orchestration.policies import BaseOrchestrationPolicy
@@ -469,6 +471,17 @@ async def delete_flow_run(session: AsyncSession, flow_run_id: UUID) -> bool:
         delete(orm_models.FlowRun).where(orm_models.FlowRun.id == flow_run_id)
     )
 
+    if (
+        deployment_id
+        and flow_run.auto_scheduled
+        and flow_run.state_type == schemas.states.StateType.SCHEDULED
+    ):
+        # the scheduler must replace the deleted run, so the deployment's schedules
+        # are due right away rather than when they next run low on runs
+        await models.deployments._clear_deployment_schedule_watermarks(
+            session=session, deployment_id=deployment_id
+        )
+
     return result.rowcount > 0
 
 
@@ -566,6 +579,154 @@ async def set_flow_run_state(
     return result
 
 
+async def set_flow_runs_pending(
+    session: AsyncSession,
+    flow_run_ids: Sequence[UUID],
+    flow_policy: Optional[Type[BaseOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+) -> List[orm_models.FlowRun]:
+    """
+    Proposes a PENDING state for each of the given flow runs, as a worker does before
+    submitting a run, so that the runs can be claimed in a single transaction.
+
+    Args:
+        session: a database session
+        flow_run_ids: the flow run ids
+        flow_policy: the orchestration policy to apply to each transition
+        orchestration_parameters: parameters for the orchestration rules
+
+    Returns:
+        List[orm_models.FlowRun]: the flow runs that were moved to PENDING
+    """
+    pending = []
+
+    for flow_run_id in flow_run_ids:
+        result = await set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run_id,
+            state=schemas.states.Pending(),
+            flow_policy=flow_policy,
+            orchestration_parameters=orchestration_parameters,
+        )
+        if result.state and result.state.type == schemas.states.StateType.PENDING:
+            pending.append(
+                await read_flow_run(session=session, flow_run_id=flow_run_id)
+            )
+
+    return pending
+
+
+@db_injector
+async def mark_flow_runs_late(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    scheduled_to_start_before: datetime.datetime,
+    limit: int,
+) -> List[UUID]:
+    """
+    Marks flow runs that were scheduled to start before `scheduled_to_start_before`
+    as Late, using a fixed number of statements for the whole batch rather than
+    orchestrating each run.
+
+    This applies the `MarkLateRunsPolicy` to the set of runs at once: only runs in a
+    "Scheduled" state are chosen, each gets a new Late state with its scheduled time,
+    and notifications and a state change event are queued and emitted for each of
+    them as they would be by orchestration.  Subflow runs are left out,
+    because their parent task runs must follow their state, so they should be marked
+    late with `set_flow_run_state`.  On PostgreSQL, runs locked by another
+    transaction are skipped.
+
+    Args:
+        session: a database session
+        scheduled_to_start_before: the time before which runs should have started
+        limit: the maximum number of runs to mark late
+
+    Returns:
+        List[UUID]: the ids of the flow runs that were marked late
+    """
+    query = (
+        sa.select(db.FlowRun)
+        .where(
+            db.FlowRun.next_scheduled_start_time <= scheduled_to_start_before,
+            db.FlowRun.state_type == schemas.states.StateType.SCHEDULED,
+            db.FlowRun.state_name == "Scheduled",
+            db.FlowRun.parent_task_run_id.is_(None),
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    flow_runs = (await session.execute(query)).scalars().unique().all()
+    if not flow_runs:
+        return []
+
+    now = pendulum.now("UTC")
+    transitions = []
+    for flow_run in flow_runs:
+        late_state = schemas.states.Late(
+            scheduled_time=flow_run.next_scheduled_start_time, timestamp=now
+        )
+        late_state.state_details.flow_run_id = flow_run.id
+        initial_state = flow_run.state.as_state() if flow_run.state else None
+        transitions.append((flow_run, initial_state, late_state))
+
+    flow_run_ids = [flow_run.id for flow_run in flow_runs]
+    late_states = [
+        {**late_state.model_dump(), "flow_run_id": flow_run.id}
+        for flow_run, _, late_state in transitions
+    ]
+
+    # this syntax (insert statement, values to insert) is most efficient
+    # because it uses a single bind parameter
+    await session.execute(
+        orm_models.FlowRunState.__table__.insert(),  # type: ignore[attr-defined]
+        late_states,
+    )
+    await session.execute(
+        db.set_state_id_on_inserted_flow_runs_statement(
+            inserted_flow_run_ids=flow_run_ids,
+            insert_flow_run_states=late_states,
+        ).values(state_name="Late", state_timestamp=now)
+    )
+
+    # queue notifications as `set_flow_run_state` would, skipping the per-run
+    # queries entirely when there are no active policies to match against
+    active_policy = await session.execute(
+        sa.select(db.FlowRunNotificationPolicy.id)
+        .where(db.FlowRunNotificationPolicy.is_active.is_(True))
+        .limit(1)
+    )
+    if active_policy.first() is not None:
+        for flow_run, _, late_state in transitions:
+            await models.flow_run_notification_policies.queue_flow_run_notifications(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    id=flow_run.id,
+                    flow_id=flow_run.flow_id,
+                    state_id=late_state.id,
+                    state_name=late_state.name,
+                    tags=flow_run.tags,
+                ),
+            )
+
+    events = [
+        await flow_run_state_change_event(
+            session=session,
+            occurred=now,
+            flow_run=flow_run,
+            initial_state_id=initial_state.id if initial_state else None,
+            initial_state=initial_state,
+            validated_state_id=late_state.id,
+            validated_state=late_state,
+        )
+        for flow_run, initial_state, late_state in transitions
+    ]
+    async with SyntaskServerEventsClient() as events_client:
+        for event in events:
+            await events_client.emit(event)
+
+    return flow_run_ids
+
+
 @db_injector
 async def read_flow_run_graph(
     db: SyntaskDBInterface,
@@ -4,7 +4,10 @@ Intended for internal use by the Syntask REST API.
 """
 
 from typing import Generator, List, Optional, Sequence, Tuple
+from uuid import UUID
 
+import sqlalchemy as sa
+from pendulum.datetime import DateTime
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +17,7 @@ from syntask.server.database import orm_models
 from syntask.server.database.dependencies import db_injector
 from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.schemas.actions import LogCreate
+from syntask.settings import SYNTASK_API_LOGS_COPY_ENABLED
 from syntask.utilities.collections import batched_iterable
 
 # We have a limit of 32,767 parameters at a time for a single query...
@@ -25,6 +29,20 @@ NUMBER_OF_LOG_FIELDS = len(schemas.core.Log.model_fields)
 # ...so we can only INSERT batches of a certain size at a time
 LOG_BATCH_SIZE = MAXIMUM_QUERY_PARAMETERS // NUMBER_OF_LOG_FIELDS
 
+# The columns copied into the log table; the remaining columns are filled in by their
+# server defaults
+LOG_COPY_COLUMNS = (
+    "name",
+    "level",
+    "flow_run_id",
+    "task_run_id",
+    "message",
+    "timestamp",
+)
+
+PARTITIONED_TABLE = "log"
+PARTITION_COLUMN = "timestamp"
+
 logger = get_logger(__name__)
 
 
@@ -35,6 +53,14 @@ def split_logs_into_batches(
         yield batch
 
 
+def copies_logs(db: SyntaskDBInterface) -> bool:
+    """
+    Returns whether logs are written with a `COPY`, which is not limited by the number
+    of parameters a query may have, so logs need not be split into batches.
+    """
+    return db.dialect.name == "postgresql" and SYNTASK_API_LOGS_COPY_ENABLED.value()
+
+
 @db_injector
 async def create_logs(
     db: SyntaskDBInterface, session: AsyncSession, logs: List[schemas.core.Log]
@@ -50,9 +76,12 @@ async def create_logs(
         None
     """
     try:
-        await session.execute(
-            db.insert(orm_models.Log).values([log.model_dump() for log in logs])
-        )
+        if copies_logs(db):
+            await _copy_postgres_logs(session, logs)
+        else:
+            await session.execute(
+                db.insert(orm_models.Log).values([log.model_dump() for log in logs])
+            )
     except RuntimeError as exc:
         if "can't create new thread at interpreter shutdown" in str(exc):
             # Background logs sometimes fail to write when the interpreter is shutting down.
@@ -63,6 +92,30 @@ async def create_logs(
             raise
 
 
+async def _copy_postgres_logs(
+    session: AsyncSession, logs: List[schemas.core.Log]
+) -> None:
+    """
+    Write logs to the Postgres database with a binary `COPY`, which PostgreSQL routes
+    to the partitions of the log table.
+
+    Args:
+        session: a Postgres session
+        logs: a list of log schemas
+    """
+    records = [
+        tuple(getattr(log, column) for column in LOG_COPY_COLUMNS) for log in logs
+    ]
+
+    # Acquiring the session's connection begins its transaction, which the `COPY`
+    # takes part in
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        PARTITIONED_TABLE, records=records, columns=LOG_COPY_COLUMNS
+    )
+
+
 async def read_logs(
     session: AsyncSession,
     log_filter: schemas.filters.LogFilter,
@@ -73,6 +126,12 @@ async def read_logs(
     """
     Read logs.
 
+    On PostgreSQL, the log table is partitioned by `timestamp`, so the timestamp
+    bounds of the filter limit the partitions that are scanned, and the logs of a
+    flow run are found with the index on `(flow_run_id, timestamp)` of each of them.
+    When sorting by timestamp, partitions are read in order and the scan stops once
+    the limit is reached.
+
     Args:
         session: a database session
         db: the database interface
@@ -93,3 +152,44 @@ async def read_logs(
 
     result = await session.execute(query)
     return result.scalars().unique().all()
+
+
+async def read_logs_after(
+    session: AsyncSession,
+    log_filter: Optional[schemas.filters.LogFilter],
+    after: Optional[Tuple[DateTime, UUID]] = None,
+    limit: Optional[int] = None,
+) -> Sequence[orm_models.Log]:
+    """
+    Read logs in order of their timestamp and ID, starting after the given position.
+
+    Unlike paging with an offset, reading the next page with the timestamp and ID of
+    the last log of the previous page does not require skipping over the logs before
+    it, so each page costs the same no matter how far into the logs it is.
+
+    Args:
+        session: a database session
+        log_filter: only select logs that match these filters
+        after: the timestamp and ID of the log to start after; if not provided,
+            logs are read from the first one
+        limit: Query limit
+
+    Returns:
+        List[orm_models.Log]: the matching logs
+    """
+    query = (
+        select(orm_models.Log)
+        .order_by(orm_models.Log.timestamp.asc(), orm_models.Log.id.asc())
+        .limit(limit)
+    )
+
+    if log_filter:
+        query = query.where(log_filter.as_sql_filter())
+
+    if after is not None:
+        query = query.where(
+            sa.tuple_(orm_models.Log.timestamp, orm_models.Log.id) > after
+        )
+
+    result = await session.execute(query)
+    return result.scalars().unique().all()
@@ -0,0 +1,99 @@
+"""
+Functions for interacting with service lease ORM objects.
+Intended for internal use by the Syntask REST API.
+"""
+
+import datetime
+from typing import List
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from syntask.server.database.dependencies import db_injector
+from syntask.server.database.interface import SyntaskDBInterface
+
+
+@db_injector
+async def renew_service_lease(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    service: str,
+    holder: str,
+    duration: datetime.timedelta,
+) -> None:
+    """
+    Takes or extends the lease of the given holder on the given service, so that it
+    will be considered live for `duration` from now.
+
+    Args:
+        session: A database session
+        service: The name of the service
+        holder: An identifier for the replica of the service holding the lease
+        duration: How long the lease should last
+    """
+    now = pendulum.now("UTC")
+    expires = now + duration
+
+    await session.execute(
+        db.insert(db.ServiceLease)
+        .values(service=service, holder=holder, expires=expires)
+        .on_conflict_do_update(
+            index_elements=[db.ServiceLease.service, db.ServiceLease.holder],
+            set_=dict(expires=expires, updated=now),
+        )
+    )
+
+
+@db_injector
+async def read_service_lease_holders(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    service: str,
+) -> List[str]:
+    """
+    Reads the holders of the unexpired leases on the given service.
+
+    Args:
+        session: A database session
+        service: The name of the service
+
+    Returns:
+        List[str]: the holders, in sorted order
+    """
+    result = await session.execute(
+        sa.select(db.ServiceLease.holder)
+        .where(
+            db.ServiceLease.service == service,
+            db.ServiceLease.expires > pendulum.now("UTC"),
+        )
+        .order_by(db.ServiceLease.holder)
+    )
+    return list(result.scalars().all())
+
+
+@db_injector
+async def delete_service_lease(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    service: str,
+    holder: str,
+) -> bool:
+    """
+    Gives up the lease of the given holder on the given service.
+
+    Args:
+        session: A database session
+        service: The name of the service
+        holder: An identifier for the replica of the service holding the lease
+
+    Returns:
+        bool: whether or not the lease was deleted
+    """
+    result = await session.execute(
+        sa.delete(db.ServiceLease).where(
+            db.ServiceLease.service == service,
+            db.ServiceLease.holder == holder,
+        )
+    )
+    return result.rowcount > 0
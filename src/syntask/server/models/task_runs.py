@@ -4,7 +4,18 @@ Intended for internal use by the Syntask REST API.
 """
 
 import contextlib
-from typing import Any, Dict, Optional, Sequence, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
 import pendulum
@@ -27,7 +38,12 @@ from syntask.server.orchestration.core_policy import (
 from syntask.server.orchestration.global_policy import GlobalTaskPolicy
 from syntask.server.orchestration.policies import BaseOrchestrationPolicy
 from syntask.server.orchestration.rules import TaskOrchestrationContext
-from syntask.server.schemas.responses import OrchestrationResult
+from syntask.server.schemas.responses import (
+    OrchestrationResult,
+    SetStateStatus,
+    StateAbortDetails,
+)
+from syntask.settings import SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED
 
 T = TypeVar("T", bound=tuple)
 
@@ -381,6 +397,60 @@ async def count_task_runs_by_state(
     return counts
 
 
+# The number of rows each per-minute count of task runs is split across
+TASK_RUN_STATE_ROLLUP_SHARDS = 16
+
+
+@db_injector
+async def update_task_run_state_rollup(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    task_run_id: UUID,
+    before: Tuple[Optional[schemas.states.StateType], Optional[pendulum.DateTime]],
+    after: Tuple[Optional[schemas.states.StateType], Optional[pendulum.DateTime]],
+) -> None:
+    """
+    Moves a task run between the per-minute counts of task runs in terminal states
+    when its state type or start time changes.
+
+    The task run is always counted in the same shard of each count, chosen by its
+    ID, so that concurrent transactions for different task runs rarely wait on the
+    same row.
+
+    Args:
+        session: a database session
+        task_run_id: the task run id
+        before: the state type and start time of the task run before the change
+        after: the state type and start time of the task run after the change
+    """
+    if before == after:
+        return
+
+    for (state_type, start_time), change in ((before, -1), (after, 1)):
+        if state_type not in schemas.states.TERMINAL_STATES or start_time is None:
+            continue
+
+        insert = db.insert(db.TaskRunStateRollup).values(
+            bucket=pendulum.instance(start_time).in_timezone("UTC").start_of("minute"),
+            state_type=state_type,
+            shard=task_run_id.int % TASK_RUN_STATE_ROLLUP_SHARDS,
+            count=change,
+        )
+        await session.execute(
+            insert.on_conflict_do_update(
+                index_elements=[
+                    db.TaskRunStateRollup.bucket,
+                    db.TaskRunStateRollup.state_type,
+                    db.TaskRunStateRollup.shard,
+                ],
+                set_=dict(
+                    count=db.TaskRunStateRollup.count + insert.excluded.count,
+                    updated=pendulum.now("UTC"),
+                ),
+            )
+        )
+
+
 async def delete_task_run(session: AsyncSession, task_run_id: UUID) -> bool:
     """
     Delete a task run by id.
@@ -392,10 +462,23 @@ async def delete_task_run(session: AsyncSession, task_run_id: UUID) -> bool:
     Returns:
         bool: whether or not the task run was deleted
     """
+    maintain_rollups = SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED.value()
+    deleted = None
+    if maintain_rollups:
+        result = await session.execute(
+            sa.select(
+                orm_models.TaskRun.state_type, orm_models.TaskRun.start_time
+            ).where(orm_models.TaskRun.id == task_run_id)
+        )
+        deleted = result.one_or_none()
 
     result = await session.execute(
         delete(orm_models.TaskRun).where(orm_models.TaskRun.id == task_run_id)
     )
+    if deleted and result.rowcount > 0:
+        await update_task_run_state_rollup(
+            session, task_run_id, before=tuple(deleted), after=(None, None)
+        )
     return result.rowcount > 0
 
 
@@ -481,3 +564,70 @@ async def set_task_run_state(
     )
 
     return result
+
+
+async def set_task_run_states(
+    session: AsyncSession,
+    task_run_states: Iterable[Tuple[UUID, schemas.states.State]],
+    force: bool = False,
+    task_policy: Optional[Type[BaseOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+) -> List[OrchestrationResult]:
+    """
+    Creates new orchestrated states for many task runs at once.
+
+    Each proposed state is governed by the same orchestration rules as
+    `set_task_run_state`, but all transitions share the given session so that
+    they are committed in a single transaction. The task runs are loaded with one
+    query up front instead of one query per transition.
+
+    Transitions are applied in the order given, so multiple states may be proposed
+    for the same task run. A proposal for a task run that does not exist is
+    aborted rather than failing the whole batch.
+
+    Args:
+        session: a database session
+        task_run_states: pairs of task run ids and the states to propose for them
+        force: if False, orchestration rules will be applied that may alter or prevent
+            the state transitions. If True, orchestration rules are not applied.
+
+    Returns:
+        a list of OrchestrationResult objects, one per proposed state
+    """
+    task_run_states = list(task_run_states)
+    task_run_ids = {task_run_id for task_run_id, _ in task_run_states}
+
+    # populate the session's identity map so each transition reads its run from it
+    existing_ids = set()
+    if task_run_ids:
+        result = await session.execute(
+            select(orm_models.TaskRun).where(orm_models.TaskRun.id.in_(task_run_ids))
+        )
+        existing_ids = {run.id for run in result.scalars().unique().all()}
+
+    results = []
+    for task_run_id, state in task_run_states:
+        if task_run_id not in existing_ids:
+            results.append(
+                OrchestrationResult(
+                    state=None,
+                    status=SetStateStatus.ABORT,
+                    details=StateAbortDetails(
+                        reason=f"Task run with id {task_run_id} not found"
+                    ),
+                )
+            )
+            continue
+
+        results.append(
+            await set_task_run_state(
+                session=session,
+                task_run_id=task_run_id,
+                state=state,
+                force=force,
+                task_policy=task_policy,
+                orchestration_parameters=orchestration_parameters,
+            )
+        )
+
+    return results
@@ -500,10 +500,12 @@ async def record_work_queue_polls(
     session: AsyncSession,
     polled_work_queue_ids: Sequence[UUID],
     ready_work_queue_ids: Sequence[UUID],
+    polled: Optional[datetime.datetime] = None,
 ) -> None:
     """Record that the given work queues were polled, and also update the given
-    ready_work_queue_ids to READY."""
-    polled = pendulum.now("UTC")
+    ready_work_queue_ids to READY.  The poll is recorded as of `polled`, or now if
+    it isn't given."""
+    polled = polled or pendulum.now("UTC")
 
     if polled_work_queue_ids:
         await session.execute(
@@ -525,12 +527,14 @@ async def mark_work_queues_ready(
     db: SyntaskDBInterface,
     polled_work_queue_ids: Sequence[UUID],
     ready_work_queue_ids: Sequence[UUID],
+    polled: Optional[datetime.datetime] = None,
 ) -> None:
     async with db.session_context(begin_transaction=True) as session:
         await record_work_queue_polls(
             session=session,
             polled_work_queue_ids=polled_work_queue_ids,
             ready_work_queue_ids=ready_work_queue_ids,
+            polled=polled,
         )
 
     # Emit events for any work queues that have transitioned to ready during this poll
@@ -5,12 +5,15 @@ Intended for internal use by the Syntask REST API.
 
 import datetime
 from typing import (
+    Any,
     Awaitable,
     Callable,
     Dict,
     List,
     Optional,
     Sequence,
+    Tuple,
+    Type,
     Union,
 )
 from uuid import UUID, uuid4
@@ -20,6 +23,7 @@ import sqlalchemy as sa
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import syntask.server.models as models
 import syntask.server.schemas as schemas
 from syntask.server.database import orm_models
 from syntask.server.database.dependencies import db_injector
@@ -27,6 +31,7 @@ from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.events.clients import SyntaskServerEventsClient
 from syntask.server.exceptions import ObjectNotFoundError
 from syntask.server.models.events import work_pool_status_event
+from syntask.server.orchestration.policies import BaseOrchestrationPolicy
 from syntask.server.schemas.statuses import WorkQueueStatus
 from syntask.server.utilities.database import UUID as SyntaskUUID
 
@@ -328,6 +333,112 @@ async def get_scheduled_flow_runs(
     )
 
 
+async def claim_scheduled_flow_runs(
+    session: AsyncSession,
+    work_pool_ids: Optional[List[UUID]] = None,
+    work_queue_ids: Optional[List[UUID]] = None,
+    scheduled_before: Optional[datetime.datetime] = None,
+    scheduled_after: Optional[datetime.datetime] = None,
+    limit: Optional[int] = None,
+    flow_policy: Optional[Type[BaseOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+) -> List[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Claim runs from queues in a specific work pool by moving them to PENDING.
+
+    The runs are chosen like `get_scheduled_flow_runs` chooses them, respecting
+    queue priorities and concurrency limits, and on PostgreSQL the chosen runs are
+    locked with `FOR UPDATE SKIP LOCKED`, so that concurrent claims each get
+    different runs.  On SQLite, the session should be opened with `with_for_update`
+    so that claims are serialized.
+
+    Args:
+        session (AsyncSession): a database session
+        work_pool_ids (List[UUID]): a list of work pool ids
+        work_queue_ids (List[UUID]): a list of work pool queue ids
+        scheduled_before (datetime.datetime): a datetime to filter runs scheduled before
+        scheduled_after (datetime.datetime): a datetime to filter runs scheduled after
+        limit (int): the maximum number of runs to claim
+        flow_policy: the orchestration policy to apply when moving runs to PENDING
+        orchestration_parameters: parameters for the orchestration rules
+
+    Returns:
+        List[WorkerFlowRunResponse]: the runs that were claimed, as well as related
+            work pool details
+    """
+    scheduled = await get_scheduled_flow_runs(
+        session=session,
+        work_pool_ids=work_pool_ids,
+        work_queue_ids=work_queue_ids,
+        scheduled_before=scheduled_before,
+        scheduled_after=scheduled_after,
+        limit=limit,
+    )
+
+    pending = await models.flow_runs.set_flow_runs_pending(
+        session=session,
+        flow_run_ids=[response.flow_run.id for response in scheduled],
+        flow_policy=flow_policy,
+        orchestration_parameters=orchestration_parameters,
+    )
+    pending_by_id = {flow_run.id: flow_run for flow_run in pending}
+
+    return [
+        schemas.responses.WorkerFlowRunResponse(
+            work_pool_id=response.work_pool_id,
+            work_queue_id=response.work_queue_id,
+            flow_run=schemas.core.FlowRun.model_validate(
+                pending_by_id[response.flow_run.id], from_attributes=True
+            ),
+        )
+        for response in scheduled
+        if response.flow_run.id in pending_by_id
+    ]
+
+
+@db_injector
+async def read_next_scheduled_start_time(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    work_pool_ids: Optional[List[UUID]] = None,
+    work_queue_ids: Optional[List[UUID]] = None,
+    scheduled_after: Optional[datetime.datetime] = None,
+) -> Optional[datetime.datetime]:
+    """
+    Read the earliest start time of the scheduled runs in the given work pools and
+    queues.  Unlike `get_scheduled_flow_runs`, this doesn't consider the statuses or
+    concurrency limits of the pools and queues, which makes it an inexpensive way to
+    tell whether there may be runs to get.
+
+    Args:
+        session (AsyncSession): a database session
+        work_pool_ids (List[UUID]): a list of work pool ids
+        work_queue_ids (List[UUID]): a list of work pool queue ids
+        scheduled_after (datetime.datetime): a datetime to filter runs scheduled after
+
+    Returns:
+        Optional[datetime.datetime]: the earliest start time, or None if there are no
+            scheduled runs
+    """
+    query = (
+        sa.select(sa.func.min(db.FlowRun.next_scheduled_start_time))
+        .join(db.WorkQueue, db.FlowRun.work_queue_id == db.WorkQueue.id)
+        .where(db.FlowRun.state_type == schemas.states.StateType.SCHEDULED)
+    )
+
+    if work_pool_ids:
+        query = query.where(db.WorkQueue.work_pool_id.in_(work_pool_ids))
+
+    if work_queue_ids:
+        query = query.where(db.WorkQueue.id.in_(work_queue_ids))
+
+    if scheduled_after:
+        query = query.where(db.FlowRun.next_scheduled_start_time >= scheduled_after)
+
+    result = await session.execute(query)
+    return result.scalar()
+
+
 # -----------------------------------------------------
 # --
 # --
@@ -750,6 +861,57 @@ async def worker_heartbeat(
     return result.rowcount > 0
 
 
+@db_injector
+async def record_worker_heartbeats(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    heartbeats: Dict[Tuple[UUID, str], Tuple[datetime.datetime, Optional[int]]],
+) -> None:
+    """
+    Record heartbeats for many workers at once, as `worker_heartbeat` does for one.
+
+    Args:
+        session (AsyncSession): a database session
+        heartbeats (Dict): the time of each worker's last heartbeat and its heartbeat
+            interval, if it gave one, keyed by its work pool ID and name
+    """
+    if not heartbeats:
+        return
+
+    insert_stmt = db.insert(orm_models.Worker).values(
+        [
+            dict(
+                work_pool_id=work_pool_id,
+                name=worker_name,
+                last_heartbeat_time=last_heartbeat_time,
+                status=schemas.statuses.WorkerStatus.ONLINE,
+                heartbeat_interval_seconds=heartbeat_interval_seconds,
+            )
+            for (work_pool_id, worker_name), (
+                last_heartbeat_time,
+                heartbeat_interval_seconds,
+            ) in heartbeats.items()
+        ]
+    )
+    insert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[
+            orm_models.Worker.work_pool_id,
+            orm_models.Worker.name,
+        ],
+        set_=dict(
+            last_heartbeat_time=insert_stmt.excluded.last_heartbeat_time,
+            status=insert_stmt.excluded.status,
+            # a heartbeat without an interval leaves the worker's interval as it was
+            heartbeat_interval_seconds=sa.func.coalesce(
+                insert_stmt.excluded.heartbeat_interval_seconds,
+                orm_models.Worker.heartbeat_interval_seconds,
+            ),
+        ),
+    )
+
+    await session.execute(insert_stmt)
+
+
 @db_injector
 async def delete_worker(
     db: SyntaskDBInterface,
@@ -20,6 +20,7 @@ from syntask.server.orchestration.rules import (
     TaskOrchestrationContext,
 )
 from syntask.server.schemas.core import FlowRunPolicy
+from syntask.settings import SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED
 
 
 def COMMON_GLOBAL_TRANSFORMS():
@@ -64,9 +65,13 @@ class GlobalTaskPolicy(BaseOrchestrationPolicy):
 
     @staticmethod
     def priority():
-        return COMMON_GLOBAL_TRANSFORMS() + [
-            IncrementTaskRunCount,
-        ]
+        return (
+            [UpdateTaskRunStateRollup]
+            + COMMON_GLOBAL_TRANSFORMS()
+            + [
+                IncrementTaskRunCount,
+            ]
+        )
 
 
 class SetRunStateType(BaseUniversalTransform):
@@ -225,6 +230,30 @@ class IncrementTaskRunCount(BaseUniversalTransform):
             context.run.run_count += 1
 
 
+class UpdateTaskRunStateRollup(BaseUniversalTransform):
+    """
+    Keeps the per-minute counts of task runs in terminal states up to date.
+
+    As the outermost task transform, this sees the run before and after every other
+    transform has updated its state type and start time.  The counts are only kept
+    while `SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED` is set.
+    """
+
+    async def before_transition(self, context: OrchestrationContext) -> None:
+        self._before = (context.run.state_type, context.run.start_time)
+
+    async def after_transition(self, context: OrchestrationContext) -> None:
+        if not SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED.value():
+            return
+
+        await models.task_runs.update_task_run_state_rollup(
+            session=context.session,
+            task_run_id=context.run.id,
+            before=self._before,
+            after=(context.run.state_type, context.run.start_time),
+        )
+
+
 class SetExpectedStartTime(BaseUniversalTransform):
     """
     Estimates the time a state is expected to start running if not set.
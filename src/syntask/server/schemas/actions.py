@@ -395,6 +395,13 @@ class StateCreate(ActionBaseModel):
         return self
 
 
+class TaskRunStateCreate(ActionBaseModel):
+    """Data used by the Syntask REST API to propose a state for one of many task runs."""
+
+    task_run_id: UUID = Field(default=..., description="The task run id")
+    state: StateCreate = Field(default=..., description="The intended state.")
+
+
 class TaskRunCreate(ActionBaseModel):
     """Data used by the Syntask REST API to create a task run"""
 
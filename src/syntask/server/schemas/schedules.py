@@ -3,7 +3,18 @@ Schedule schemas
 """
 
 import datetime
-from typing import Annotated, Any, Generator, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import dateutil
 import dateutil.rrule
@@ -24,6 +35,14 @@ from syntask.types import TimeZone
 
 MAX_ITERATIONS = 1000
 
+# the number of compiled cron and RRule schedules kept between calls to
+# `get_dates_batch`
+COMPILED_SCHEDULE_CACHE_SIZE = 1024
+
+# how many days in a row a compiled cron schedule searches for a match before giving
+# up; rare schedules like "every February 29th that's a Monday" recur every 28 years
+MAX_CRON_SEARCH_DAYS = 366 * 29
+
 
 def _prepare_scheduling_start_and_end(
     start: Any, end: Any, timezone: str
@@ -41,6 +60,50 @@ def _prepare_scheduling_start_and_end(
     return start, end
 
 
+def _unique_dates(
+    candidates: Iterable[pendulum.DateTime],
+    n: int,
+    end: Optional[datetime.datetime],
+) -> Generator[pendulum.DateTime, None, None]:
+    """Yields the candidate dates of a schedule, in order and without duplicates,
+    until `end` is exceeded, `n` dates were yielded, or `MAX_ITERATIONS` candidates
+    were checked."""
+    dates = set()
+    counter = 0
+
+    for next_date in candidates:
+        # if the end date was exceeded, exit
+        if end and next_date > end:
+            break
+
+        # ensure no duplicates; weird things can happen with DST
+        if next_date not in dates:
+            dates.add(next_date)
+            yield next_date
+
+        # if enough dates have been collected or enough attempts were made, exit
+        if len(dates) >= n or counter > MAX_ITERATIONS:
+            break
+
+        counter += 1
+
+
+def _as_utc_datetime(date: pendulum.DateTime) -> datetime.datetime:
+    """Converts a pendulum datetime to a plain UTC datetime, which supports
+    absolute-time arithmetic with `timedelta`s"""
+    date = date.in_tz("UTC")
+    return datetime.datetime(
+        year=date.year,
+        month=date.month,
+        day=date.day,
+        hour=date.hour,
+        minute=date.minute,
+        second=date.second,
+        microsecond=date.microsecond,
+        tzinfo=datetime.timezone.utc,
+    )
+
+
 class IntervalSchedule(SyntaskBaseModel):
     """
     A schedule formed by adding `interval` increments to an `anchor_date`. If no
@@ -107,6 +170,52 @@ class IntervalSchedule(SyntaskBaseModel):
         """
         return sorted(self._get_dates_generator(n=n, start=start, end=end))
 
+    def get_dates_batch(
+        self,
+        n: Optional[int] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> List[pendulum.DateTime]:
+        """Retrieves the same dates as `get_dates`, computing each one directly from
+        the first date after `start` rather than stepping through the intervals one
+        at a time.
+
+        Args:
+            n (int): The number of dates to generate
+            start (datetime.datetime, optional): The first returned date will be on or
+                after this date. Defaults to None.  If a timezone-naive datetime is
+                provided, it is assumed to be in the schedule's timezone.
+            end (datetime.datetime, optional): The maximum scheduled date to return. If
+                a timezone-naive datetime is provided, it is assumed to be in the
+                schedule's timezone.
+
+        Returns:
+            List[pendulum.DateTime]: A list of dates
+        """
+        n, end, first_date = self._prepare_dates_window(n=n, start=start, end=end)
+
+        # `_unique_dates` never checks more candidates than this
+        count = min(max(n, 1), MAX_ITERATIONS + 2)
+
+        first = _as_utc_datetime(first_date)
+        if end is not None:
+            if first_date > end:
+                return []
+            count = min(count, (_as_utc_datetime(end) - first) // self.interval + 1)
+
+        dates = [
+            pendulum.instance(first + i * self.interval).in_tz(self.timezone)
+            for i in range(count)
+        ]
+
+        # intervals of a day or more keep the same local time across DST boundaries,
+        # and `_unique_dates` drops dates that repeat a local time, which only matches
+        # absolute-time arithmetic while the UTC offset holds
+        if any(date.utcoffset() != first_date.utcoffset() for date in dates):
+            return sorted(self._get_dates_generator(n=n, start=start, end=end))
+
+        return dates
+
     def _get_dates_generator(
         self,
         n: Optional[int] = None,
@@ -128,6 +237,36 @@ class IntervalSchedule(SyntaskBaseModel):
         Returns:
             List[pendulum.DateTime]: a list of dates
         """
+        n, end, first_date = self._prepare_dates_window(n=n, start=start, end=end)
+        interval_days, interval_seconds = self._interval_parts()
+
+        def candidates() -> Iterator[pendulum.DateTime]:
+            next_date = first_date
+            while True:
+                yield next_date
+                next_date = next_date.add(days=interval_days, seconds=interval_seconds)
+
+        yield from _unique_dates(candidates(), n=n, end=end)
+
+    def _interval_parts(self) -> Tuple[int, float]:
+        """Breaks the interval into `days` and `seconds` because pendulum will handle
+        DST boundaries properly if days are provided, but not if we add `total
+        seconds`. Therefore, `next_date + self.interval` fails while
+        `next_date.add(days=days, seconds=seconds)` works."""
+        interval_days = self.interval.days
+        interval_seconds = self.interval.total_seconds() - (
+            interval_days * 24 * 60 * 60
+        )
+        return interval_days, interval_seconds
+
+    def _prepare_dates_window(
+        self,
+        n: Optional[int],
+        start: Optional[datetime.datetime],
+        end: Optional[datetime.datetime],
+    ) -> Tuple[int, Optional[pendulum.DateTime], pendulum.DateTime]:
+        """Resolves the number of dates to generate, the end of the window, and the
+        first date of the schedule on or after the start of the window"""
         if n is None:
             # if an end was supplied, we do our best to supply all matching dates (up to
             # MAX_ITERATIONS)
@@ -147,40 +286,114 @@ class IntervalSchedule(SyntaskBaseModel):
         offset = (start - anchor_tz).total_seconds() / self.interval.total_seconds()
         next_date = anchor_tz.add(seconds=self.interval.total_seconds() * int(offset))
 
-        # break the interval into `days` and `seconds` because pendulum
-        # will handle DST boundaries properly if days are provided, but not
-        # if we add `total seconds`. Therefore, `next_date + self.interval`
-        # fails while `next_date.add(days=days, seconds=seconds)` works.
-        interval_days = self.interval.days
-        interval_seconds = self.interval.total_seconds() - (
-            interval_days * 24 * 60 * 60
-        )
+        interval_days, interval_seconds = self._interval_parts()
 
         # daylight saving time boundaries can create a situation where the next date is
         # before the start date, so we advance it if necessary
         while next_date < start:
             next_date = next_date.add(days=interval_days, seconds=interval_seconds)
 
-        counter = 0
-        dates = set()
+        return n, end, next_date
 
-        while True:
-            # if the end date was exceeded, exit
-            if end and next_date > end:
-                break
 
-            # ensure no duplicates; weird things can happen with DST
-            if next_date not in dates:
-                dates.add(next_date)
-                yield next_date
+class _CompiledCron:
+    """A cron expression expanded into bitsets of its matching months, days of the
+    month, and days of the week, and the sorted hours and minutes of each matching
+    day, which can be walked without re-parsing the expression."""
 
-            # if enough dates have been collected or enough attempts were made, exit
-            if len(dates) >= n or counter > MAX_ITERATIONS:
-                break
+    def __init__(
+        self,
+        minutes: List[int],
+        hours: List[int],
+        days: Optional[List[int]],
+        months: Optional[List[int]],
+        weekdays: Optional[List[int]],
+        day_or: bool,
+    ):
+        self.minutes = sorted(set(minutes))
+        self.hours = sorted(set(hours))
+        self.days = _bitset(days if days is not None else range(1, 32))
+        self.months = _bitset(months if months is not None else range(1, 13))
+        self.weekdays = _bitset(
+            [d % 7 for d in weekdays] if weekdays is not None else range(7)
+        )
 
-            counter += 1
+        # like croniter, days of the month and days of the week only combine with OR
+        # when both are restricted
+        self.days_union = day_or and days is not None and weekdays is not None
 
-            next_date = next_date.add(days=interval_days, seconds=interval_seconds)
+    def matches_day(self, date: datetime.date) -> bool:
+        if not (self.months >> date.month) & 1:
+            return False
+
+        day_matches = (self.days >> date.day) & 1
+        # cron counts the days of the week from Sunday, Python from Monday
+        weekday_matches = (self.weekdays >> (date.weekday() + 1) % 7) & 1
+
+        if self.days_union:
+            return bool(day_matches or weekday_matches)
+        return bool(day_matches and weekday_matches)
+
+    def times_after(self, after: datetime.datetime) -> Iterator[datetime.datetime]:
+        """Yields the naive times matching the expression after the minute of
+        `after`, the same times that `croniter.get_next` returns one by one"""
+        threshold = after.replace(second=0, microsecond=0) + datetime.timedelta(
+            minutes=1
+        )
+        day = threshold.date()
+        days_without_match = 0
+
+        while days_without_match < MAX_CRON_SEARCH_DAYS:
+            days_without_match += 1
+            if self.matches_day(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        time = datetime.datetime(
+                            day.year, day.month, day.day, hour, minute
+                        )
+                        if time >= threshold:
+                            days_without_match = 0
+                            yield time
+            day += datetime.timedelta(days=1)
+
+
+def _bitset(values: Iterable[int]) -> int:
+    bits = 0
+    for value in values:
+        bits |= 1 << value
+    return bits
+
+
+@lru_cache(maxsize=COMPILED_SCHEDULE_CACHE_SIZE)
+def _compile_cron(cron: str, day_or: bool) -> Optional[_CompiledCron]:
+    """Compiles a cron expression, or returns None for the expressions that only
+    croniter itself can evaluate (seconds, nth weekdays, last days, and so on)."""
+    try:
+        expanded, nth_weekday_of_month = croniter.expand(cron)
+    except Exception:
+        return None
+
+    if len(expanded) != 5 or nth_weekday_of_month:
+        return None
+
+    fields: List[Optional[List[int]]] = []
+    for values in expanded:
+        if values[0] == "*":
+            fields.append(None)
+        elif all(isinstance(value, int) for value in values):
+            fields.append(list(values))
+        else:
+            return None
+
+    minutes, hours, days, months, weekdays = fields
+    return _CompiledCron(
+        minutes=minutes if minutes is not None else list(range(60)),
+        hours=hours if hours is not None else list(range(24)),
+        days=days,
+        months=months,
+        weekdays=weekdays,
+        day_or=day_or,
+    )
 
 
 class CronSchedule(SyntaskBaseModel):
@@ -252,6 +465,40 @@ class CronSchedule(SyntaskBaseModel):
         """
         return sorted(self._get_dates_generator(n=n, start=start, end=end))
 
+    def get_dates_batch(
+        self,
+        n: Optional[int] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> List[pendulum.DateTime]:
+        """Retrieves the same dates as `get_dates`, matching candidate times against
+        a compiled form of the cron expression that is cached between calls.
+
+        Args:
+            n (int): The number of dates to generate
+            start (datetime.datetime, optional): The first returned date will be on or
+                after this date. Defaults to the current date. If a timezone-naive
+                datetime is provided, it is assumed to be in the schedule's timezone.
+            end (datetime.datetime, optional): No returned date will exceed this date.
+                If a timezone-naive datetime is provided, it is assumed to be in the
+                schedule's timezone.
+
+        Returns:
+            List[pendulum.DateTime]: A list of dates
+        """
+        compiled = _compile_cron(self.cron, self.day_or)
+        if compiled is None:
+            return sorted(self._get_dates_generator(n=n, start=start, end=end))
+
+        n, end, start_localized, start_naive_tz = self._prepare_dates_window(
+            n=n, start=start, end=end
+        )
+        candidates = (
+            pendulum.instance(start_localized + (next_time - start_naive_tz))
+            for next_time in compiled.times_after(start_naive_tz)
+        )
+        return sorted(_unique_dates(candidates, n=n, end=end))
+
     def _get_dates_generator(
         self,
         n: Optional[int] = None,
@@ -273,6 +520,32 @@ class CronSchedule(SyntaskBaseModel):
         Returns:
             List[pendulum.DateTime]: a list of dates
         """
+        n, end, start_localized, start_naive_tz = self._prepare_dates_window(
+            n=n, start=start, end=end
+        )
+        cron = croniter(self.cron, start_naive_tz, day_or=self.day_or)  # type: ignore
+
+        def candidates() -> Iterator[pendulum.DateTime]:
+            while True:
+                # croniter does not handle DST properly when the start time is
+                # in and around when the actual shift occurs. To work around this,
+                # we use the naive start time to get the next cron date delta, then
+                # add that time to the original scheduling anchor.
+                next_time = cron.get_next(datetime.datetime)
+                delta = next_time - start_naive_tz
+                yield pendulum.instance(start_localized + delta)
+
+        yield from _unique_dates(candidates(), n=n, end=end)
+
+    def _prepare_dates_window(
+        self,
+        n: Optional[int],
+        start: Optional[datetime.datetime],
+        end: Optional[datetime.datetime],
+    ) -> Tuple[int, Optional[pendulum.DateTime], datetime.datetime, datetime.datetime]:
+        """Resolves the number of dates to generate and the end of the window, along
+        with the start of the window both localized with pytz and as a naive local
+        time, from which cron times are found"""
         if start is None:
             start = pendulum.now("UTC")
 
@@ -311,32 +584,7 @@ class CronSchedule(SyntaskBaseModel):
         )
         start_naive_tz = start.naive()
 
-        cron = croniter(self.cron, start_naive_tz, day_or=self.day_or)  # type: ignore
-        dates = set()
-        counter = 0
-
-        while True:
-            # croniter does not handle DST properly when the start time is
-            # in and around when the actual shift occurs. To work around this,
-            # we use the naive start time to get the next cron date delta, then
-            # add that time to the original scheduling anchor.
-            next_time = cron.get_next(datetime.datetime)
-            delta = next_time - start_naive_tz
-            next_date = pendulum.instance(start_localized + delta)
-
-            # if the end date was exceeded, exit
-            if end and next_date > end:
-                break
-            # ensure no duplicates; weird things can happen with DST
-            if next_date not in dates:
-                dates.add(next_date)
-                yield next_date
-
-            # if enough dates have been collected or enough attempts were made, exit
-            if len(dates) >= n or counter > MAX_ITERATIONS:
-                break
-
-            counter += 1
+        return n, end, start_localized, start_naive_tz
 
 
 DEFAULT_ANCHOR_DATE = pendulum.date(2020, 1, 1)
@@ -420,7 +668,7 @@ class RRuleSchedule(SyntaskBaseModel):
         else:
             raise ValueError(f"Invalid RRule object: {rrule}")
 
-    def to_rrule(self) -> dateutil.rrule.rrule:
+    def to_rrule(self, cache: bool = True) -> dateutil.rrule.rrule:
         """
         Since rrule doesn't properly serialize/deserialize timezones, we localize dates
         here
@@ -428,7 +676,7 @@ class RRuleSchedule(SyntaskBaseModel):
         rrule = dateutil.rrule.rrulestr(
             self.rrule,
             dtstart=DEFAULT_ANCHOR_DATE,
-            cache=True,
+            cache=cache,
         )
         timezone = dateutil.tz.gettz(self.timezone)
         if isinstance(rrule, dateutil.rrule.rrule):
@@ -498,11 +746,36 @@ class RRuleSchedule(SyntaskBaseModel):
         """
         return sorted(self._get_dates_generator(n=n, start=start, end=end))
 
+    def get_dates_batch(
+        self,
+        n: Optional[int] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> List[pendulum.DateTime]:
+        """Retrieves the same dates as `get_dates`, reusing the parsed and localized
+        rule between calls rather than parsing it each time.
+
+        Args:
+            n (int): The number of dates to generate
+            start (datetime.datetime, optional): The first returned date will be on or
+                after this date. Defaults to the current date. If a timezone-naive
+                datetime is provided, it is assumed to be in the schedule's timezone.
+            end (datetime.datetime, optional): No returned date will exceed this date.
+                If a timezone-naive datetime is provided, it is assumed to be in the
+                schedule's timezone.
+
+        Returns:
+            List[pendulum.DateTime]: A list of dates
+        """
+        rrule = _compile_rrule(self.rrule, self.timezone)
+        return sorted(self._get_dates_generator(n=n, start=start, end=end, rrule=rrule))
+
     def _get_dates_generator(
         self,
         n: Optional[int] = None,
         start: datetime.datetime = None,
         end: datetime.datetime = None,
+        rrule: Optional[dateutil.rrule.rrulebase] = None,
     ) -> Generator[pendulum.DateTime, None, None]:
         """Retrieves dates from the schedule. Up to 1,000 candidate dates are checked
         following the start date.
@@ -515,6 +788,8 @@ class RRuleSchedule(SyntaskBaseModel):
             end (datetime.datetime, optional): No returned date will exceed this date.
                 If a timezone-naive datetime is provided, it is assumed to be in the
                 schedule's timezone.
+            rrule (dateutil.rrule.rrulebase, optional): The localized rule of this
+                schedule, if it has already been parsed
 
         Returns:
             List[pendulum.DateTime]: a list of dates
@@ -532,28 +807,26 @@ class RRuleSchedule(SyntaskBaseModel):
             else:
                 n = 1
 
-        dates = set()
-        counter = 0
+        if rrule is None:
+            rrule = self.to_rrule()
 
         # pass count = None to account for discrepancies with duplicates around DST
         # boundaries
-        for next_date in self.to_rrule().xafter(start, count=None, inc=True):
-            next_date = pendulum.instance(next_date).in_tz(self.timezone)
-
-            # if the end date was exceeded, exit
-            if end and next_date > end:
-                break
-
-            # ensure no duplicates; weird things can happen with DST
-            if next_date not in dates:
-                dates.add(next_date)
-                yield next_date
+        candidates = (
+            pendulum.instance(next_date).in_tz(self.timezone)
+            for next_date in rrule.xafter(start, count=None, inc=True)
+        )
+        yield from _unique_dates(candidates, n=n, end=end)
 
-            # if enough dates have been collected or enough attempts were made, exit
-            if len(dates) >= n or counter > MAX_ITERATIONS:
-                break
 
-            counter += 1
+@lru_cache(maxsize=COMPILED_SCHEDULE_CACHE_SIZE)
+def _compile_rrule(rrule: str, timezone: Optional[str]) -> dateutil.rrule.rrulebase:
+    """Parses and localizes an RRule string once for all of the schedules using it.
+    The rule's own cache of occurrences is disabled, as it would otherwise grow with
+    every date iterated since the rule's start."""
+    return RRuleSchedule.model_construct(rrule=rrule, timezone=timezone).to_rrule(
+        cache=False
+    )
 
 
 SCHEDULE_TYPES = Union[IntervalSchedule, CronSchedule, RRuleSchedule]
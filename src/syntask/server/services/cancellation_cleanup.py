@@ -3,7 +3,8 @@ The CancellationCleanup service. Responsible for cancelling tasks and subflows t
 """
 
 import asyncio
-from typing import Optional
+import time
+from typing import Optional, Sequence
 from uuid import UUID
 
 import pendulum
@@ -14,7 +15,7 @@ import syntask.server.models as models
 from syntask.server.database import orm_models
 from syntask.server.database.dependencies import inject_db
 from syntask.server.database.interface import SyntaskDBInterface
-from syntask.server.schemas import filters, states
+from syntask.server.schemas import states
 from syntask.server.services.loop_service import LoopService
 from syntask.settings import SYNTASK_API_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS
 
@@ -43,15 +44,26 @@ class CancellationCleanup(LoopService):
         - cancels active tasks belonging to recently cancelled flow runs
         - cancels any active subflow that belongs to a cancelled flow
         """
+        start_time = time.monotonic()
+
         # cancels active tasks belonging to recently cancelled flow runs
-        await self.clean_up_cancelled_flow_run_task_runs(db)
+        cancelled_task_runs = await self.clean_up_cancelled_flow_run_task_runs(db)
 
         # cancels any active subflow run that belongs to a cancelled flow run
-        await self.clean_up_cancelled_subflow_runs(db)
-
+        cancelled_subflow_runs = await self.clean_up_cancelled_subflow_runs(db)
+
+        elapsed = time.monotonic() - start_time
+        cancelled = cancelled_task_runs + cancelled_subflow_runs
+        self.logger.info(
+            f"Cancelled {cancelled_task_runs} task runs and {cancelled_subflow_runs} "
+            f"subflow runs in {elapsed:.2f} seconds "
+            f"({cancelled / elapsed if elapsed else 0:.1f} runs/second)."
+        )
         self.logger.info("Finished cleaning up cancelled flow runs.")
 
-    async def clean_up_cancelled_flow_run_task_runs(self, db):
+    async def clean_up_cancelled_flow_run_task_runs(self, db) -> int:
+        cancelled = 0
+        high_water_mark = UUID(int=0)
         while True:
             cancelled_flow_query = (
                 sa.select(orm_models.FlowRun)
@@ -60,7 +72,9 @@ class CancellationCleanup(LoopService):
                     orm_models.FlowRun.end_time.is_not(None),
                     orm_models.FlowRun.end_time
                     >= (pendulum.now("UTC").subtract(days=1)),
+                    orm_models.FlowRun.id > high_water_mark,
                 )
+                .order_by(orm_models.FlowRun.id)
                 .limit(self.batch_size)
             )
 
@@ -68,18 +82,34 @@ class CancellationCleanup(LoopService):
                 flow_run_result = await session.execute(cancelled_flow_query)
             flow_runs = flow_run_result.scalars().all()
 
-            for run in flow_runs:
-                await self._cancel_child_runs(db=db, flow_run=run)
+            if flow_runs:
+                cancelled += await self._cancel_child_runs(db=db, flow_runs=flow_runs)
+                high_water_mark = flow_runs[-1].id
 
             # if no relevant flows were found, exit the loop
             if len(flow_runs) < self.batch_size:
                 break
 
-    async def clean_up_cancelled_subflow_runs(self, db):
+        return cancelled
+
+    async def clean_up_cancelled_subflow_runs(self, db) -> int:
+        cancelled = 0
         high_water_mark = UUID(int=0)
+        parent_task_run = sa.orm.aliased(orm_models.TaskRun)
+        containing_flow_run = sa.orm.aliased(orm_models.FlowRun)
         while True:
+            # active subflow runs whose containing flow run was cancelled; a subflow
+            # without a parent task run is left to the global orchestration policy
             subflow_query = (
                 sa.select(orm_models.FlowRun)
+                .join(
+                    parent_task_run,
+                    orm_models.FlowRun.parent_task_run_id == parent_task_run.id,
+                )
+                .outerjoin(
+                    containing_flow_run,
+                    parent_task_run.flow_run_id == containing_flow_run.id,
+                )
                 .where(
                     or_(
                         orm_models.FlowRun.state_type == states.StateType.PENDING,
@@ -88,8 +118,11 @@ class CancellationCleanup(LoopService):
                         orm_models.FlowRun.state_type == states.StateType.PAUSED,
                         orm_models.FlowRun.state_type == states.StateType.CANCELLING,
                     ),
+                    or_(
+                        containing_flow_run.id.is_(None),
+                        containing_flow_run.state_type == states.StateType.CANCELLED,
+                    ),
                     orm_models.FlowRun.id > high_water_mark,
-                    orm_models.FlowRun.parent_task_run_id.is_not(None),
                 )
                 .order_by(orm_models.FlowRun.id)
                 .limit(self.batch_size)
@@ -99,78 +132,80 @@ class CancellationCleanup(LoopService):
                 subflow_run_result = await session.execute(subflow_query)
             subflow_runs = subflow_run_result.scalars().all()
 
-            for subflow_run in subflow_runs:
-                await self._cancel_subflow(db=db, flow_run=subflow_run)
-                high_water_mark = max(high_water_mark, subflow_run.id)
+            if subflow_runs:
+                await self._cancel_subflows(db=db, flow_runs=subflow_runs)
+                cancelled += len(subflow_runs)
+                high_water_mark = subflow_runs[-1].id
 
             # if no relevant flows were found, exit the loop
             if len(subflow_runs) < self.batch_size:
                 break
 
+        return cancelled
+
     async def _cancel_child_runs(
-        self, db: SyntaskDBInterface, flow_run: orm_models.FlowRun
-    ) -> None:
-        async with db.session_context() as session:
-            child_task_runs = await models.task_runs.read_task_runs(
-                session,
-                flow_run_filter=filters.FlowRunFilter(id={"any_": [flow_run.id]}),
-                task_run_filter=filters.TaskRunFilter(
-                    state={"type": {"any_": NON_TERMINAL_STATES}}
-                ),
-                limit=100,
+        self, db: SyntaskDBInterface, flow_runs: Sequence[orm_models.FlowRun]
+    ) -> int:
+        cancelled = 0
+        high_water_mark = UUID(int=0)
+        while True:
+            child_task_run_query = (
+                sa.select(orm_models.TaskRun)
+                .where(
+                    orm_models.TaskRun.flow_run_id.in_(
+                        [flow_run.id for flow_run in flow_runs]
+                    ),
+                    orm_models.TaskRun.state_type.in_(NON_TERMINAL_STATES),
+                    orm_models.TaskRun.id > high_water_mark,
+                )
+                .order_by(orm_models.TaskRun.id)
+                .limit(self.batch_size)
             )
 
-        for task_run in child_task_runs:
             async with db.session_context(begin_transaction=True) as session:
-                await models.task_runs.set_task_run_state(
+                child_task_run_result = await session.execute(child_task_run_query)
+                child_task_runs = child_task_run_result.scalars().all()
+
+                await models.task_runs.set_task_run_states(
                     session=session,
-                    task_run_id=task_run.id,
-                    state=states.Cancelled(
-                        message="The parent flow run was cancelled."
-                    ),
+                    task_run_states=[
+                        (
+                            task_run.id,
+                            states.Cancelled(
+                                message="The parent flow run was cancelled."
+                            ),
+                        )
+                        for task_run in child_task_runs
+                    ],
                     force=True,
                 )
+            cancelled += len(child_task_runs)
 
-    async def _cancel_subflow(
-        self, db: SyntaskDBInterface, flow_run: orm_models.FlowRun
-    ) -> Optional[bool]:
-        if not flow_run.parent_task_run_id:
-            return False
-
-        if flow_run.state.type in states.TERMINAL_STATES:
-            return False
-
-        async with db.session_context() as session:
-            parent_task_run = await models.task_runs.read_task_run(
-                session, task_run_id=flow_run.parent_task_run_id
-            )
-
-            if not parent_task_run:
-                # Global orchestration policy will prevent further orchestration
-                return False
-
-            containing_flow_run = await models.flow_runs.read_flow_run(
-                session, flow_run_id=parent_task_run.flow_run_id
-            )
-
-            if (
-                containing_flow_run
-                and containing_flow_run.state.type != states.StateType.CANCELLED
-            ):
-                # Nothing to do here; the parent is not cancelled
-                return False
-
-            if flow_run.deployment_id:
-                state = states.Cancelling(message="The parent flow run was cancelled.")
-            else:
-                state = states.Cancelled(message="The parent flow run was cancelled.")
+            # page by ID rather than relying on cancelled task runs dropping out of
+            # the query, so that a task run that stays active cannot be read forever
+            if len(child_task_runs) < self.batch_size:
+                return cancelled
+            high_water_mark = child_task_runs[-1].id
 
+    async def _cancel_subflows(
+        self, db: SyntaskDBInterface, flow_runs: Sequence[orm_models.FlowRun]
+    ) -> None:
         async with db.session_context(begin_transaction=True) as session:
-            await models.flow_runs.set_flow_run_state(
-                session=session,
-                flow_run_id=flow_run.id,
-                state=state,
-            )
+            for flow_run in flow_runs:
+                if flow_run.deployment_id:
+                    state = states.Cancelling(
+                        message="The parent flow run was cancelled."
+                    )
+                else:
+                    state = states.Cancelled(
+                        message="The parent flow run was cancelled."
+                    )
+
+                await models.flow_runs.set_flow_run_state(
+                    session=session,
+                    flow_run_id=flow_run.id,
+                    state=state,
+                )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+"""
+The EventRetention service. Responsible for the partitions of the events tables on
+PostgreSQL: creating them ahead of time and dropping them once they have expired.
+"""
+
+import asyncio
+from typing import Optional
+
+import pendulum
+
+from syntask.server.database.dependencies import inject_db
+from syntask.server.database.interface import SyntaskDBInterface
+from syntask.server.events.storage.partitions import (
+    PARTITION_COLUMN,
+    PARTITIONED_TABLES,
+)
+from syntask.server.events.storage.rollups import trim_event_rollups
+from syntask.server.services.loop_service import LoopService
+from syntask.server.utilities.database import get_dialect
+from syntask.server.utilities.partitions import (
+    PARTITION_INTERVALS,
+    PARTITIONS_AHEAD,
+    create_partitions,
+    drop_partitions,
+    is_partitioned,
+)
+from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
+    SYNTASK_API_SERVICES_EVENT_RETENTION_LOOP_SECONDS,
+    SYNTASK_EVENTS_PARTITION_INTERVAL,
+    SYNTASK_EVENTS_RETENTION_PERIOD,
+)
+
+
+class EventRetention(LoopService):
+    """
+    A loop service that maintains the time-based partitions of the `events` and
+    `event_resources` tables, so that expired events are removed by dropping whole
+    partitions rather than deleting them row by row.
+
+    On databases without partitioned events tables, this service does nothing and the
+    event persister deletes expired events instead.
+    """
+
+    def __init__(self, loop_seconds: Optional[float] = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or SYNTASK_API_SERVICES_EVENT_RETENTION_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+    @inject_db
+    async def run_once(self, db: SyntaskDBInterface):
+        """
+        Maintain the partitions of each events table by:
+
+        - Creating the partitions covering the next few partition intervals
+        - Dropping the partitions older than the retention period
+        - Deleting the event rollups older than the retention period
+        """
+        dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
+        if dialect.name != "postgresql":
+            return
+
+        interval = SYNTASK_EVENTS_PARTITION_INTERVAL.value()
+        now = pendulum.now("UTC")
+        through = now + PARTITION_INTERVALS[interval] * PARTITIONS_AHEAD
+        older_than = now - SYNTASK_EVENTS_RETENTION_PERIOD.value()
+
+        for table in PARTITIONED_TABLES:
+            async with db.session_context(begin_transaction=True) as session:
+                if not await is_partitioned(session, table):
+                    continue
+
+                created = await create_partitions(
+                    session, table, interval, through, column=PARTITION_COLUMN
+                )
+                dropped = await drop_partitions(
+                    session, table, older_than, column=PARTITION_COLUMN
+                )
+
+            if created or dropped:
+                self.logger.info(
+                    "Created %s and dropped %s partitions of %s.",
+                    len(created),
+                    len(dropped),
+                    table,
+                )
+
+        async with db.session_context(begin_transaction=True) as session:
+            await trim_event_rollups(session, older_than)
+
+
+if __name__ == "__main__":
+    asyncio.run(EventRetention(handle_signals=True).start())
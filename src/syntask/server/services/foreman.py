@@ -3,7 +3,8 @@ Foreman is a loop service designed to monitor workers.
 """
 
 from datetime import timedelta
-from typing import Optional
+from typing import Dict, Iterable, Optional, Set, Tuple
+from uuid import UUID
 
 import pendulum
 import sqlalchemy as sa
@@ -12,8 +13,14 @@ from typing_extensions import Self
 from syntask.server import models
 from syntask.server.database.dependencies import db_injector
 from syntask.server.database.interface import SyntaskDBInterface
-from syntask.server.models.deployments import mark_deployments_not_ready
-from syntask.server.models.work_queues import mark_work_queues_not_ready
+from syntask.server.models.deployments import (
+    mark_deployments_not_ready,
+    mark_deployments_ready,
+)
+from syntask.server.models.work_queues import (
+    mark_work_queues_not_ready,
+    mark_work_queues_ready,
+)
 from syntask.server.models.workers import emit_work_pool_status_event
 from syntask.server.schemas.internal import InternalWorkPoolUpdate
 from syntask.server.schemas.statuses import DeploymentStatus, WorkPoolStatus
@@ -23,8 +30,184 @@ from syntask.settings import (
     SYNTASK_API_SERVICES_FOREMAN_FALLBACK_HEARTBEAT_INTERVAL_SECONDS,
     SYNTASK_API_SERVICES_FOREMAN_INACTIVITY_HEARTBEAT_MULTIPLE,
     SYNTASK_API_SERVICES_FOREMAN_LOOP_SECONDS,
+    SYNTASK_API_SERVICES_FOREMAN_POLL_AGGREGATION_ENABLED,
     SYNTASK_API_SERVICES_FOREMAN_WORK_QUEUE_LAST_POLLED_TIMEOUT_SECONDS,
 )
+from syntask.utilities.collections import batched_iterable
+
+HEARTBEAT_INSERT_BATCH_SIZE = 500
+
+
+class PollAggregator:
+    """
+    Holds the work queue polls, deployment polls and worker heartbeats received since
+    the last flush, keeping only the latest of each, so that they can be written in
+    bulk instead of once per request.
+    """
+
+    def __init__(self) -> None:
+        self._work_queue_polls: Dict[UUID, pendulum.DateTime] = {}
+        self._ready_work_queue_ids: Set[UUID] = set()
+        self._deployment_polls: Dict[UUID, pendulum.DateTime] = {}
+        self._deployment_work_queue_polls: Dict[UUID, pendulum.DateTime] = {}
+        self._worker_heartbeats: Dict[
+            Tuple[UUID, str], Tuple[pendulum.DateTime, Optional[int]]
+        ] = {}
+
+    def record_work_queue_polls(
+        self,
+        polled_work_queue_ids: Iterable[UUID],
+        ready_work_queue_ids: Iterable[UUID],
+    ) -> None:
+        """
+        Records that work queues were polled, and that the given NOT_READY work queues
+        should become READY.
+        """
+        now = pendulum.now("UTC")
+        for work_queue_id in polled_work_queue_ids:
+            self._work_queue_polls[work_queue_id] = now
+        for work_queue_id in ready_work_queue_ids:
+            self._work_queue_polls[work_queue_id] = now
+            self._ready_work_queue_ids.add(work_queue_id)
+
+    def record_deployment_polls(
+        self,
+        deployment_ids: Optional[Iterable[UUID]] = None,
+        work_queue_ids: Optional[Iterable[UUID]] = None,
+    ) -> None:
+        """
+        Records that deployments were polled, either directly or through their work
+        queues.
+        """
+        now = pendulum.now("UTC")
+        for deployment_id in deployment_ids or []:
+            self._deployment_polls[deployment_id] = now
+        for work_queue_id in work_queue_ids or []:
+            self._deployment_work_queue_polls[work_queue_id] = now
+
+    def record_worker_heartbeat(
+        self,
+        work_pool_id: UUID,
+        worker_name: str,
+        heartbeat_interval_seconds: Optional[int] = None,
+    ) -> None:
+        """
+        Records a worker's heartbeat, keeping the last heartbeat interval it gave.
+        """
+        key = (work_pool_id, worker_name)
+        if heartbeat_interval_seconds is None and key in self._worker_heartbeats:
+            heartbeat_interval_seconds = self._worker_heartbeats[key][1]
+        self._worker_heartbeats[key] = (
+            pendulum.now("UTC"),
+            heartbeat_interval_seconds,
+        )
+
+    @db_injector
+    async def flush(db: SyntaskDBInterface, self: Self) -> None:
+        """
+        Writes everything recorded since the last flush.  Polls are written as of the
+        latest poll in the batch, and READY transitions emit their events as usual.
+        If a write fails, the records it did not write are kept for the next flush.
+        """
+        # swap in empty records before the first await, so that anything recorded
+        # while writing is kept for the next flush
+        work_queue_polls, self._work_queue_polls = self._work_queue_polls, {}
+        ready_work_queue_ids, self._ready_work_queue_ids = (
+            self._ready_work_queue_ids,
+            set(),
+        )
+        deployment_polls, self._deployment_polls = self._deployment_polls, {}
+        deployment_work_queue_polls, self._deployment_work_queue_polls = (
+            self._deployment_work_queue_polls,
+            {},
+        )
+        worker_heartbeats, self._worker_heartbeats = self._worker_heartbeats, {}
+
+        try:
+            if worker_heartbeats:
+                async with db.session_context(begin_transaction=True) as session:
+                    for batch in batched_iterable(
+                        worker_heartbeats.items(), HEARTBEAT_INSERT_BATCH_SIZE
+                    ):
+                        await models.workers.record_worker_heartbeats(
+                            session=session, heartbeats=dict(batch)
+                        )
+                worker_heartbeats = {}
+
+            if work_queue_polls:
+                await mark_work_queues_ready(
+                    polled_work_queue_ids=[
+                        work_queue_id
+                        for work_queue_id in work_queue_polls
+                        if work_queue_id not in ready_work_queue_ids
+                    ],
+                    ready_work_queue_ids=list(ready_work_queue_ids),
+                    polled=max(work_queue_polls.values()),
+                )
+                work_queue_polls, ready_work_queue_ids = {}, set()
+
+            if deployment_polls or deployment_work_queue_polls:
+                await mark_deployments_ready(
+                    deployment_ids=list(deployment_polls),
+                    work_queue_ids=list(deployment_work_queue_polls),
+                    last_polled=max(
+                        [
+                            *deployment_polls.values(),
+                            *deployment_work_queue_polls.values(),
+                        ]
+                    ),
+                )
+        except BaseException:
+            self._restore(
+                work_queue_polls=work_queue_polls,
+                ready_work_queue_ids=ready_work_queue_ids,
+                deployment_polls=deployment_polls,
+                deployment_work_queue_polls=deployment_work_queue_polls,
+                worker_heartbeats=worker_heartbeats,
+            )
+            raise
+
+    def _restore(
+        self,
+        work_queue_polls: Dict[UUID, pendulum.DateTime],
+        ready_work_queue_ids: Set[UUID],
+        deployment_polls: Dict[UUID, pendulum.DateTime],
+        deployment_work_queue_polls: Dict[UUID, pendulum.DateTime],
+        worker_heartbeats: Dict[
+            Tuple[UUID, str], Tuple[pendulum.DateTime, Optional[int]]
+        ],
+    ) -> None:
+        """
+        Puts back records that a failed flush did not write, without replacing any
+        newer records made while it was writing.
+        """
+        for key, polled in work_queue_polls.items():
+            self._work_queue_polls.setdefault(key, polled)
+        self._ready_work_queue_ids |= ready_work_queue_ids
+        for key, polled in deployment_polls.items():
+            self._deployment_polls.setdefault(key, polled)
+        for key, polled in deployment_work_queue_polls.items():
+            self._deployment_work_queue_polls.setdefault(key, polled)
+        for key, (heartbeat, interval) in worker_heartbeats.items():
+            if key in self._worker_heartbeats:
+                newer_heartbeat, newer_interval = self._worker_heartbeats[key]
+                self._worker_heartbeats[key] = (
+                    newer_heartbeat,
+                    interval if newer_interval is None else newer_interval,
+                )
+            else:
+                self._worker_heartbeats[key] = (heartbeat, interval)
+
+
+_poll_aggregator: Optional[PollAggregator] = None
+
+
+def get_poll_aggregator() -> Optional[PollAggregator]:
+    """
+    Returns the aggregator that polls and heartbeats should be recorded with, if a
+    Foreman with poll aggregation enabled is running in this process.
+    """
+    return _poll_aggregator
 
 
 class Foreman(LoopService):
@@ -68,16 +251,41 @@ class Foreman(LoopService):
             if work_queue_last_polled_timeout_seconds is None
             else work_queue_last_polled_timeout_seconds
         )
+        self._poll_aggregator: Optional[PollAggregator] = None
+
+    async def _on_start(self) -> None:
+        global _poll_aggregator
+
+        await super()._on_start()
+
+        if SYNTASK_API_SERVICES_FOREMAN_POLL_AGGREGATION_ENABLED.value():
+            self._poll_aggregator = _poll_aggregator = PollAggregator()
+
+    async def _on_stop(self) -> None:
+        global _poll_aggregator
+
+        if self._poll_aggregator:
+            # send new polls straight to the database before writing the last batch
+            if _poll_aggregator is self._poll_aggregator:
+                _poll_aggregator = None
+            await self._poll_aggregator.flush()
+            self._poll_aggregator = None
+
+        await super()._on_stop()
 
     @db_injector
     async def run_once(db: SyntaskDBInterface, self: Self) -> None:
         """
-        Iterate over workers current marked as online. Mark workers as offline
+        Write any polls and heartbeats held by the poll aggregator, then iterate over
+        workers current marked as online. Mark workers as offline
         if they have an old last_heartbeat_time. Marks work pools as not ready
         if they do not have any online workers and are currently marked as ready.
         Mark deployments as not ready if they have a last_polled time that is
         older than the configured deployment last polled timeout.
         """
+        if self._poll_aggregator:
+            await self._poll_aggregator.flush()
+
         await self._mark_online_workers_without_a_recent_heartbeat_as_offline()
         await self._mark_work_pools_as_not_ready()
         await self._mark_deployments_as_not_ready()
@@ -5,6 +5,7 @@ The threshold for a late run can be configured by changing `SYNTASK_API_SERVICES
 
 import asyncio
 import datetime
+import time
 from typing import Optional
 
 import pendulum
@@ -55,10 +56,29 @@ class MarkLateRuns(LoopService):
 
         - Querying for flow runs in a scheduled state that are Scheduled to start in the past
         - For any runs past the "late" threshold, setting the flow run state to a new `Late` state
+
+        Top-level runs are marked late a batch at a time with
+        `models.flow_runs.mark_flow_runs_late`; subflow runs are orchestrated one at
+        a time so that their parent task runs follow them.
         """
         scheduled_to_start_before = pendulum.now("UTC").subtract(
             seconds=self.mark_late_after.total_seconds()
         )
+        start_time = time.monotonic()
+        marked_late = 0
+
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                flow_run_ids = await models.flow_runs.mark_flow_runs_late(
+                    session=session,
+                    scheduled_to_start_before=scheduled_to_start_before,
+                    limit=self.batch_size,
+                )
+            marked_late += len(flow_run_ids)
+
+            # if no runs were found, exit the loop
+            if len(flow_run_ids) < self.batch_size:
+                break
 
         while True:
             async with db.session_context(begin_transaction=True) as session:
@@ -72,11 +92,17 @@ class MarkLateRuns(LoopService):
                 # mark each run as late
                 for run in runs:
                     await self._mark_flow_run_as_late(session=session, flow_run=run)
+            marked_late += len(runs)
 
-                # if no runs were found, exit the loop
-                if len(runs) < self.batch_size:
-                    break
+            # if no runs were found, exit the loop
+            if len(runs) < self.batch_size:
+                break
 
+        elapsed = time.monotonic() - start_time
+        self.logger.info(
+            f"Marked {marked_late} flow runs as late in {elapsed:.2f} seconds "
+            f"({marked_late / elapsed if elapsed else 0:.1f} runs/second)."
+        )
         self.logger.info("Finished monitoring for late runs.")
 
     @inject_db
@@ -84,7 +110,7 @@ class MarkLateRuns(LoopService):
         self, scheduled_to_start_before: datetime.datetime, db: SyntaskDBInterface
     ):
         """
-        Returns a sqlalchemy query for late flow runs.
+        Returns a sqlalchemy query for late subflow runs.
 
         Args:
             scheduled_to_start_before: the maximum next scheduled start time of
@@ -101,6 +127,7 @@ class MarkLateRuns(LoopService):
                 (db.FlowRun.next_scheduled_start_time <= scheduled_to_start_before),
                 db.FlowRun.state_type == states.StateType.SCHEDULED,
                 db.FlowRun.state_name == "Scheduled",
+                db.FlowRun.parent_task_run_id.is_not(None),
             )
             .limit(self.batch_size)
         )
@@ -0,0 +1,90 @@
+"""
+The LogRetention service. Responsible for the partitions of the log table on
+PostgreSQL: creating them ahead of time and dropping them once they have expired.
+"""
+
+import asyncio
+from typing import Optional
+
+import pendulum
+
+from syntask.server.database.dependencies import inject_db
+from syntask.server.database.interface import SyntaskDBInterface
+from syntask.server.models.logs import PARTITION_COLUMN, PARTITIONED_TABLE
+from syntask.server.services.loop_service import LoopService
+from syntask.server.utilities.database import get_dialect
+from syntask.server.utilities.partitions import (
+    PARTITION_INTERVALS,
+    PARTITIONS_AHEAD,
+    create_partitions,
+    drop_partitions,
+    is_partitioned,
+)
+from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
+    SYNTASK_API_LOGS_PARTITION_INTERVAL,
+    SYNTASK_API_LOGS_RETENTION_PERIOD,
+    SYNTASK_API_SERVICES_LOG_RETENTION_LOOP_SECONDS,
+)
+
+
+class LogRetention(LoopService):
+    """
+    A loop service that maintains the time-based partitions of the `log` table, so
+    that logs are written to a partition covering their timestamp and expired logs are
+    removed by dropping whole partitions.
+
+    On databases without a partitioned log table, this service does nothing.
+    """
+
+    def __init__(self, loop_seconds: Optional[float] = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or SYNTASK_API_SERVICES_LOG_RETENTION_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+    @inject_db
+    async def run_once(self, db: SyntaskDBInterface):
+        """
+        Maintain the partitions of the log table by:
+
+        - Creating the partitions covering the next few partition intervals
+        - Dropping the partitions older than the retention period, if there is one
+        """
+        dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
+        if dialect.name != "postgresql":
+            return
+
+        interval = SYNTASK_API_LOGS_PARTITION_INTERVAL.value()
+        retention_period = SYNTASK_API_LOGS_RETENTION_PERIOD.value()
+        now = pendulum.now("UTC")
+        through = now + PARTITION_INTERVALS[interval] * PARTITIONS_AHEAD
+
+        async with db.session_context(begin_transaction=True) as session:
+            if not await is_partitioned(session, PARTITIONED_TABLE):
+                return
+
+            created = await create_partitions(
+                session, PARTITIONED_TABLE, interval, through, column=PARTITION_COLUMN
+            )
+            dropped = []
+            if retention_period is not None:
+                dropped = await drop_partitions(
+                    session,
+                    PARTITIONED_TABLE,
+                    now - retention_period,
+                    column=PARTITION_COLUMN,
+                )
+
+        if created or dropped:
+            self.logger.info(
+                "Created %s and dropped %s partitions of %s.",
+                len(created),
+                len(dropped),
+                PARTITIONED_TABLE,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(LogRetention(handle_signals=True).start())
@@ -4,8 +4,9 @@ The Scheduler service.
 
 import asyncio
 import datetime
-from typing import Dict, List, Optional
-from uuid import UUID
+import hashlib
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 import pendulum
 import sqlalchemy as sa
@@ -13,24 +14,60 @@ import sqlalchemy as sa
 import syntask.server.models as models
 from syntask.server.database.dependencies import inject_db
 from syntask.server.database.interface import SyntaskDBInterface
-from syntask.server.schemas.states import StateType
 from syntask.server.services.loop_service import LoopService, run_multiple_services
 from syntask.settings import (
+    SYNTASK_API_SERVICES_SCHEDULER_COORDINATION_ENABLED,
     SYNTASK_API_SERVICES_SCHEDULER_DEPLOYMENT_BATCH_SIZE,
     SYNTASK_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE,
+    SYNTASK_API_SERVICES_SCHEDULER_LEASE_SECONDS,
     SYNTASK_API_SERVICES_SCHEDULER_LOOP_SECONDS,
     SYNTASK_API_SERVICES_SCHEDULER_MAX_RUNS,
     SYNTASK_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME,
     SYNTASK_API_SERVICES_SCHEDULER_MIN_RUNS,
     SYNTASK_API_SERVICES_SCHEDULER_MIN_SCHEDULED_TIME,
+    SYNTASK_API_SERVICES_SCHEDULER_SHARDS,
 )
 from syntask.utilities.collections import batched_iterable
 
+# A range of deployment IDs, where `None` means the range is unbounded on that side
+ShardRange = Tuple[Optional[UUID], Optional[UUID]]
+
 
 class TryAgain(Exception):
     """Internal control-flow exception used to retry the Scheduler's main loop"""
 
 
+def shard_range(shard: int, shards: int) -> ShardRange:
+    """
+    Returns the range of deployment IDs, inclusive of the lower bound and exclusive of
+    the upper bound, that belongs to the given shard.  Deployment IDs are random, so
+    dividing the ID space into equal ranges divides the deployments evenly.
+    """
+    lower = (shard << 128) // shards
+    upper = ((shard + 1) << 128) // shards
+    return (
+        UUID(int=lower) if shard > 0 else None,
+        UUID(int=upper) if shard < shards - 1 else None,
+    )
+
+
+def assign_shards(holder: str, holders: List[str], shards: int) -> List[int]:
+    """
+    Returns the shards assigned to `holder` among the given live `holders`.  Each shard
+    goes to the holder with the highest hash of the pair (rendezvous hashing), so that
+    a holder joining or leaving only moves the shards that it gains or loses.
+    """
+
+    def weight(candidate: str, shard: int) -> bytes:
+        return hashlib.sha256(f"{candidate}:{shard}".encode()).digest()
+
+    return [
+        shard
+        for shard in range(shards)
+        if max(holders, key=lambda candidate: weight(candidate, shard)) == holder
+    ]
+
+
 class Scheduler(LoopService):
     """
     A loop service that schedules flow runs from deployments.
@@ -63,26 +100,100 @@ class Scheduler(LoopService):
         self.insert_batch_size = (
             SYNTASK_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE.value()
         )
+        self.coordination_enabled: bool = (
+            SYNTASK_API_SERVICES_SCHEDULER_COORDINATION_ENABLED.value()
+        )
+        self.shards: int = SYNTASK_API_SERVICES_SCHEDULER_SHARDS.value()
+        self.lease_duration = datetime.timedelta(
+            seconds=SYNTASK_API_SERVICES_SCHEDULER_LEASE_SECONDS.value()
+        )
+        self.lease_holder = str(uuid4())
+
+    @inject_db
+    async def _on_stop(self, db: SyntaskDBInterface) -> None:
+        if self.coordination_enabled:
+            # give up this replica's shards right away rather than waiting for the
+            # lease to expire
+            async with db.session_context(begin_transaction=True) as session:
+                await models.service_leases.delete_service_lease(
+                    session=session, service=self.name, holder=self.lease_holder
+                )
+        await super()._on_stop()
 
     @inject_db
-    async def run_once(self, db: SyntaskDBInterface):
+    async def _claim_shard_ranges(self, db: SyntaskDBInterface) -> List[ShardRange]:
+        """
+        Returns the ranges of deployment IDs this replica should schedule.  With
+        coordination enabled, this renews the replica's lease and returns the ranges of
+        the shards assigned to it among the live replicas.
+        """
+        if not self.coordination_enabled:
+            return [(None, None)]
+
+        async with db.session_context(begin_transaction=True) as session:
+            await models.service_leases.renew_service_lease(
+                session=session,
+                service=self.name,
+                holder=self.lease_holder,
+                duration=self.lease_duration,
+            )
+            holders = await models.service_leases.read_service_lease_holders(
+                session=session, service=self.name
+            )
+
+        shards = assign_shards(self.lease_holder, holders, self.shards)
+        self.logger.debug(
+            f"Scheduling {len(shards)} of {self.shards} shards among"
+            f" {len(holders)} replicas."
+        )
+        return [shard_range(shard, self.shards) for shard in shards]
+
+    async def run_once(self):
         """
         Schedule flow runs by:
 
-        - Querying for deployments with active schedules
+        - Claiming the shards of deployments this replica should schedule, if
+          coordination between replicas is enabled
+        - Querying for deployments with active schedules that are due
         - Generating the next set of flow runs based on each deployments schedule
         - Inserting all scheduled flow runs into the database
+        - Recording when each schedule will next be due
 
         All inserted flow runs are committed to the database at the termination of the
         loop.
         """
         total_inserted_runs = 0
 
+        for lower, upper in await self._claim_shard_ranges():
+            total_inserted_runs += await self._schedule_deployments_in_range(
+                lower, upper
+            )
+
+        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
+
+    @inject_db
+    async def _schedule_deployments_in_range(
+        self,
+        lower: Optional[UUID],
+        upper: Optional[UUID],
+        db: SyntaskDBInterface,
+    ) -> int:
+        """
+        Schedules flow runs for the deployments with IDs from `lower`, inclusive, to
+        `upper`, exclusive, returning the number of runs inserted.
+        """
+        total_inserted_runs = 0
+
         last_id = None
         while True:
             async with db.session_context(begin_transaction=False) as session:
                 query = self._get_select_deployments_to_schedule_query()
 
+                if lower is not None:
+                    query = query.where(db.Deployment.id >= lower)
+                if upper is not None:
+                    query = query.where(db.Deployment.id < upper)
+
                 # use cursor based pagination
                 if last_id:
                     query = query.where(db.Deployment.id > last_id)
@@ -91,9 +202,12 @@ class Scheduler(LoopService):
                 deployment_ids = result.scalars().unique().all()
 
                 # collect runs across all deployments
+                watermarks: Dict[UUID, models.deployments.ScheduleWatermark] = {}
                 try:
                     runs_to_insert = await self._collect_flow_runs(
-                        session=session, deployment_ids=deployment_ids
+                        session=session,
+                        deployment_ids=deployment_ids,
+                        watermarks=watermarks,
                     )
                 except TryAgain:
                     continue
@@ -106,6 +220,13 @@ class Scheduler(LoopService):
                     )
                     total_inserted_runs += len(inserted_runs)
 
+            # only once their runs are in the database, record when each schedule will
+            # next need more runs
+            async with db.session_context(begin_transaction=True) as session:
+                await models.deployments._set_deployment_schedule_watermarks(
+                    session=session, watermarks=watermarks
+                )
+
             # if this is the last page of deployments, exit the loop
             if len(deployment_ids) < self.deployment_batch_size:
                 break
@@ -113,66 +234,45 @@ class Scheduler(LoopService):
                 # record the last deployment ID
                 last_id = deployment_ids[-1]
 
-        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
+        return total_inserted_runs
 
     @inject_db
     def _get_select_deployments_to_schedule_query(self, db: SyntaskDBInterface):
         """
         Returns a sqlalchemy query for selecting deployments to schedule.
 
-        The query gets the IDs of any deployments with:
+        The query gets the IDs of any deployments with an active schedule that is due,
+        meaning that either:
 
-            - an active schedule
-            - EITHER:
-                - fewer than `min_runs` auto-scheduled runs
-                - OR the max scheduled time is less than `max_scheduled_time` in the future
+            - the scheduler hasn't generated its runs since it or its deployment last
+              changed
+            - OR its runs will soon fall below `min_runs` or no longer reach
+              `min_scheduled_time` into the future
         """
         now = pendulum.now("UTC")
         query = (
             sa.select(db.Deployment.id)
-            .select_from(db.Deployment)
-            # TODO: on Postgres, this could be replaced with a lateral join that
-            # sorts by `next_scheduled_start_time desc` and limits by
-            # `self.min_runs` for a ~ 50% speedup. At the time of writing,
-            # performance of this universal query appears to be fast enough that
-            # this optimization is not worth maintaining db-specific queries
-            .join(
-                db.FlowRun,
-                # join on matching deployments, only picking up future scheduled runs
-                sa.and_(
-                    db.Deployment.id == db.FlowRun.deployment_id,
-                    db.FlowRun.state_type == StateType.SCHEDULED,
-                    db.FlowRun.next_scheduled_start_time >= now,
-                    db.FlowRun.auto_scheduled.is_(True),
-                ),
-                isouter=True,
-            )
             .where(
                 sa.and_(
                     db.Deployment.paused.is_not(True),
                     (
                         # Only include deployments that have at least one
-                        # active schedule.
+                        # active schedule that is due.
                         sa.select(db.DeploymentSchedule.deployment_id)
                         .where(
                             sa.and_(
                                 db.DeploymentSchedule.deployment_id == db.Deployment.id,
                                 db.DeploymentSchedule.active.is_(True),
+                                sa.or_(
+                                    db.DeploymentSchedule.next_due.is_(None),
+                                    db.DeploymentSchedule.next_due <= now,
+                                ),
                             )
                         )
                         .exists()
                     ),
                 )
             )
-            .group_by(db.Deployment.id)
-            # having EITHER fewer than three runs OR runs not scheduled far enough out
-            .having(
-                sa.or_(
-                    sa.func.count(db.FlowRun.next_scheduled_start_time) < self.min_runs,
-                    sa.func.max(db.FlowRun.next_scheduled_start_time)
-                    < now + self.min_scheduled_time,
-                )
-            )
             .order_by(db.Deployment.id)
             .limit(self.deployment_batch_size)
         )
@@ -182,6 +282,7 @@ class Scheduler(LoopService):
         self,
         session: sa.orm.Session,
         deployment_ids: List[UUID],
+        watermarks: Optional[Dict[UUID, models.deployments.ScheduleWatermark]] = None,
     ) -> List[Dict]:
         runs_to_insert = []
         for deployment_id in deployment_ids:
@@ -197,6 +298,7 @@ class Scheduler(LoopService):
                         min_time=self.min_scheduled_time,
                         min_runs=self.min_runs,
                         max_runs=self.max_runs,
+                        watermarks=watermarks,
                     )
                 )
             except Exception:
@@ -236,6 +338,7 @@ class Scheduler(LoopService):
         min_runs: int,
         max_runs: int,
         db: SyntaskDBInterface,
+        watermarks: Optional[Dict[UUID, models.deployments.ScheduleWatermark]] = None,
     ) -> List[Dict]:
         """
         Given a `deployment_id` and schedule params, generates a list of flow run
@@ -252,6 +355,8 @@ class Scheduler(LoopService):
             min_time: runs will be scheduled until at least this far in the future
             min_runs: a minimum amount of runs to schedule
             max_runs: a maximum amount of runs to schedule
+            watermarks: if provided, this is filled in with the watermark of each of
+                the deployment's active schedules, keyed by schedule id
 
         This function will generate the minimum number of runs that satisfy the min
         and max times, and the min and max counts. Specifically, the following order
@@ -272,6 +377,7 @@ class Scheduler(LoopService):
             min_time=min_time,
             min_runs=min_runs,
             max_runs=max_runs,
+            watermarks=watermarks,
         )
 
     @inject_db
@@ -1,20 +1,23 @@
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
 from uuid import UUID
 
 import pendulum
 import sqlalchemy as sa
+from pendulum.datetime import DateTime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from syntask.logging import get_logger
+from syntask.server import models
 from syntask.server.database.dependencies import db_injector, provide_database_interface
 from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.events.ordering import CausalOrdering, EventArrivedEarly
 from syntask.server.events.schemas.events import ReceivedEvent
 from syntask.server.schemas.core import TaskRun
-from syntask.server.schemas.states import State
+from syntask.server.schemas.states import State, StateType
 from syntask.server.utilities.messaging import Message, MessageHandler, create_consumer
+from syntask.settings import SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED
 
 logger = get_logger(__name__)
 
@@ -90,6 +93,19 @@ async def _update_task_run_with_state(
     )
 
 
+@db_injector
+async def _read_task_run_state_rollup_key(
+    db: SyntaskDBInterface, session: AsyncSession, task_run_id: UUID
+) -> Tuple[Optional[StateType], Optional[DateTime]]:
+    result = await session.execute(
+        sa.select(db.TaskRun.state_type, db.TaskRun.start_time).where(
+            db.TaskRun.id == task_run_id
+        )
+    )
+    row = result.one_or_none()
+    return (row.state_type, row.start_time) if row else (None, None)
+
+
 def task_run_from_event(event: ReceivedEvent) -> TaskRun:
     task_run_id = event.resource.syntask_object_id("syntask.task-run")
 
@@ -141,13 +157,24 @@ async def record_task_run_event(event: ReceivedEvent):
         "state_timestamp": task_run.state.timestamp,
     }
 
+    maintain_rollups = SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED.value()
+
     db = provide_database_interface()
     async with db.session_context(begin_transaction=True) as session:
+        if maintain_rollups:
+            before = await _read_task_run_state_rollup_key(session, task_run.id)
         await _insert_task_run(session, task_run, task_run_attributes)
         await _insert_task_run_state(session, task_run)
         await _update_task_run_with_state(
             session, task_run, denormalized_state_attributes
         )
+        if maintain_rollups:
+            await models.task_runs.update_task_run_state_rollup(
+                session,
+                task_run.id,
+                before=before,
+                after=await _read_task_run_state_rollup_key(session, task_run.id),
+            )
 
     logger.debug(
         "Recorded task run state change",
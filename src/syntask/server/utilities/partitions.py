@@ -0,0 +1,244 @@
+"""
+Management of the time-based partitions of tables on PostgreSQL.
+
+A table is partitioned by range on one of its timestamp columns, such as the
+`occurred` column of `events` or the `timestamp` column of `log`.  New partitions are
+created ahead of time, one per day or week, and expired partitions are dropped as a
+whole instead of deleting their rows.  Rows that do not fall into any partition are
+written to a default partition.
+"""
+
+import re
+from datetime import timedelta
+from typing import List, NamedTuple, Optional
+
+import pendulum
+import sqlalchemy as sa
+from pendulum.datetime import DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from syntask.logging.loggers import get_logger
+
+logger = get_logger(__name__)
+
+# The number of partitions to create ahead of the current one
+PARTITIONS_AHEAD = 3
+
+PARTITION_INTERVALS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
+_RANGE_BOUND = re.compile(r"FOR VALUES FROM \((.+)\) TO \((.+)\)")
+
+
+class Partition(NamedTuple):
+    """A partition of a partitioned table"""
+
+    name: str
+    # the inclusive lower and exclusive upper bounds; `None` if unbounded
+    start: Optional[DateTime]
+    end: Optional[DateTime]
+    default: bool = False
+
+
+def partition_start(moment: DateTime, interval: str) -> DateTime:
+    """Returns the start of the partition containing the given moment"""
+    moment = pendulum.instance(moment).in_timezone("UTC")
+    if interval == "daily":
+        return moment.start_of("day")
+    elif interval == "weekly":
+        return moment.start_of("week")
+    raise ValueError(
+        f"Unknown partition interval {interval!r}. Expected one of "
+        f"{', '.join(repr(i) for i in PARTITION_INTERVALS)}."
+    )
+
+
+def _parse_bound(bound: str) -> Optional[DateTime]:
+    if bound in ("MINVALUE", "MAXVALUE"):
+        return None
+    return pendulum.parse(bound.strip("'")).in_timezone("UTC")
+
+
+def _bound_literal(moment: DateTime) -> str:
+    return f"'{moment.in_timezone('UTC').isoformat()}'"
+
+
+async def is_partitioned(session: AsyncSession, table: str) -> bool:
+    """Returns whether the given table is a partitioned table"""
+    result = await session.execute(
+        sa.text(
+            "SELECT relkind = 'p' FROM pg_class WHERE oid = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    )
+    return bool(result.scalar())
+
+
+async def list_partitions(session: AsyncSession, table: str) -> List[Partition]:
+    """
+    Lists the partitions of a table, ordered by their lower bound with the default
+    partition last.
+    """
+    result = await session.execute(
+        sa.text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    )
+
+    partitions = []
+    for name, bound in result.all():
+        if bound == "DEFAULT":
+            partitions.append(Partition(name=name, start=None, end=None, default=True))
+            continue
+
+        match = _RANGE_BOUND.match(bound)
+        if not match:
+            continue
+        start, end = match.groups()
+        partitions.append(
+            Partition(name=name, start=_parse_bound(start), end=_parse_bound(end))
+        )
+
+    return sorted(
+        partitions, key=lambda p: (p.default, p.start is not None, p.start or 0)
+    )
+
+
+async def create_partitions(
+    session: AsyncSession,
+    table: str,
+    interval: str,
+    through: DateTime,
+    *,
+    column: str,
+) -> List[Partition]:
+    """
+    Creates the partitions of a table needed to cover the time from the current
+    partition through the given moment.
+
+    New partitions begin where the latest existing partition ends, so the existing
+    partitions are kept even if the interval changed.  Any rows of the default
+    partition that fall into a new partition are moved into it.
+
+    Args:
+        session: a database session
+        table: the partitioned table
+        interval: `daily` or `weekly`
+        through: the moment the partitions should cover
+        column: the column the table is partitioned by
+
+    Returns:
+        The partitions that were created
+    """
+    partitions = await list_partitions(session, table)
+    default = next((p for p in partitions if p.default), None)
+    covered_until = max((p.end for p in partitions if p.end), default=None)
+
+    created = []
+    start = partition_start(pendulum.now("UTC"), interval)
+    while start <= through:
+        end = partition_start(start + PARTITION_INTERVALS[interval], interval)
+        if covered_until is None or end > covered_until:
+            # Named after where the partition actually begins, since after a change
+            # of interval that may differ from the start of its interval
+            lower = max(start, covered_until) if covered_until else start
+            partition = Partition(
+                name=f"{table}_p{lower.format('YYYYMMDD')}",
+                start=lower,
+                end=end,
+            )
+            await _create_partition(session, table, partition, default, column)
+            created.append(partition)
+            covered_until = end
+        start = end
+
+    return created
+
+
+async def _create_partition(
+    session: AsyncSession,
+    table: str,
+    partition: Partition,
+    default: Optional[Partition],
+    column: str,
+) -> None:
+    assert partition.start and partition.end
+    logger.debug(
+        "Creating partition %s of %s from %s to %s",
+        partition.name,
+        table,
+        partition.start,
+        partition.end,
+    )
+
+    await session.execute(
+        sa.text(f"CREATE TABLE {partition.name} (LIKE {table} INCLUDING DEFAULTS)")
+    )
+
+    # A partition can't be attached while the default partition holds rows that
+    # belong in it
+    if default:
+        in_range = f'"{column}" >= :start AND "{column}" < :end'
+        bounds = {"start": partition.start, "end": partition.end}
+        await session.execute(
+            sa.text(
+                f"INSERT INTO {partition.name} "
+                f"SELECT * FROM {default.name} WHERE {in_range}"
+            ),
+            bounds,
+        )
+        await session.execute(
+            sa.text(f"DELETE FROM {default.name} WHERE {in_range}"), bounds
+        )
+
+    await session.execute(
+        sa.text(
+            f"ALTER TABLE {table} ATTACH PARTITION {partition.name} "
+            f"FOR VALUES FROM ({_bound_literal(partition.start)}) "
+            f"TO ({_bound_literal(partition.end)})"
+        )
+    )
+
+
+async def drop_partitions(
+    session: AsyncSession,
+    table: str,
+    older_than: DateTime,
+    *,
+    column: str,
+) -> List[Partition]:
+    """
+    Detaches and drops the partitions of a table that only hold rows from before
+    the given moment, and deletes those rows from the default partition.
+
+    Args:
+        session: a database session
+        table: the partitioned table
+        older_than: the moment before which rows are expired
+        column: the column the table is partitioned by
+
+    Returns:
+        The partitions that were dropped
+    """
+    dropped = []
+    for partition in await list_partitions(session, table):
+        if partition.default:
+            await session.execute(
+                sa.text(f'DELETE FROM {partition.name} WHERE "{column}" < :older_than'),
+                {"older_than": older_than},
+            )
+        elif partition.end is not None and partition.end <= older_than:
+            logger.debug("Dropping partition %s of %s", partition.name, table)
+            await session.execute(
+                sa.text(f"ALTER TABLE {table} DETACH PARTITION {partition.name}")
+            )
+            await session.execute(sa.text(f"DROP TABLE {partition.name}"))
+            dropped.append(partition)
+
+    return dropped
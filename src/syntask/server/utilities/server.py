@@ -2,6 +2,7 @@
 Utilities for the Syntask REST API server.
 """
 
+import hashlib
 from contextlib import AsyncExitStack
 from typing import Any, Callable, Coroutine, Sequence, Set, get_type_hints
 
@@ -25,6 +26,31 @@ def method_paths_from_routes(routes: Sequence[BaseRoute]) -> Set[str]:
     return method_paths
 
 
+def conditional_response(request: Request, response: Response) -> Response:
+    """
+    Adds an `ETag` header derived from the body of a successful response, and
+    replaces the response with an empty `304 Not Modified` if the request's
+    `If-None-Match` header names that ETag already, so that clients can cheaply
+    revalidate objects they have cached.
+    """
+    body = getattr(response, "body", None)
+    if response.status_code != status.HTTP_200_OK or not isinstance(body, bytes):
+        return response
+
+    etag = f'"{hashlib.sha256(body).hexdigest()}"'
+    response.headers["ETag"] = etag
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    return response
+
+
 class SyntaskAPIRoute(APIRoute):
     """
     A FastAPIRoute class which attaches an async stack to requests that exits before
@@ -35,6 +61,9 @@ class SyntaskAPIRoute(APIRoute):
     dependencies. If we want to close a dependency before the request is complete
     (i.e. before returning a response to the user), we need a stack with a different
     scope. This extension adds this stack at `request.state.response_scoped_stack`.
+
+    Successful responses to GET requests are also given an `ETag`, see
+    `conditional_response`.
     """
 
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
@@ -46,6 +75,9 @@ class SyntaskAPIRoute(APIRoute):
                 request.state.response_scoped_stack = stack
                 response = await default_handler(request)
 
+            if request.method == "GET":
+                response = conditional_response(request, response)
+
             return response
 
         return handle_response_scoped_depends
@@ -501,6 +501,23 @@ class Settings(BaseSettings):
         description="The default setting for persisting results when not otherwise specified.",
     )
 
+    results_local_cache_memory_max_bytes: int = Field(
+        default=0,
+        ge=0,
+        description="The maximum number of bytes of persisted result content to keep in an in-memory read-through cache in front of remote result storage. Set to `0` to disable the in-memory cache.",
+    )
+
+    results_local_cache_path: Optional[Path] = Field(
+        default=None,
+        description="The directory for an on-disk read-through cache of persisted result content read from remote result storage. If not set, the on-disk cache is disabled.",
+    )
+
+    results_local_cache_disk_max_bytes: int = Field(
+        default=1024**3,
+        ge=0,
+        description="The maximum number of bytes the on-disk result cache may use before the least recently used entries are evicted.",
+    )
+
     ###########################################################################
     # API settings
 
@@ -553,6 +570,18 @@ class Settings(BaseSettings):
         description="The maximum number of characters allowed for a task run cache key.",
     )
 
+    api_work_pools_max_wait_seconds: float = Field(
+        default=30,
+        ge=0,
+        description="The longest that a worker's request for scheduled flow runs may wait for runs to become due before returning empty. Keep this below the clients' `SYNTASK_API_REQUEST_TIMEOUT`.",
+    )
+
+    api_work_pools_wait_recheck_seconds: float = Field(
+        default=5,
+        gt=0,
+        description="How often a waiting request for scheduled flow runs checks the database for runs that are due, in addition to waking up when runs are scheduled in its work pool.",
+    )
+
     api_max_flow_run_graph_nodes: int = Field(
         default=10000,
         description="The maximum size of a flow run graph on the v2 API",
@@ -715,6 +744,41 @@ class Settings(BaseSettings):
         """,
     )
 
+    api_services_scheduler_coordination_enabled: bool = Field(
+        default=False,
+        description="""
+        Whether or not the schedulers of several server replicas sharing a database
+        should divide the deployments between them. When enabled, each replica holds a
+        lease in the database while it is running and schedules only the shards of
+        deployments assigned to it. Defaults to `False`, where every replica schedules
+        every deployment.
+        """,
+    )
+
+    api_services_scheduler_shards: int = Field(
+        default=16,
+        gt=0,
+        description="""
+        The number of shards the deployment IDs are divided into when scheduler
+        coordination is enabled. Shards are assigned to the live replicas by
+        rendezvous hashing, so a replica joining or leaving only moves the shards it
+        gains or loses. With `1`, a single replica schedules every deployment.
+        Defaults to `16`.
+        """,
+    )
+
+    api_services_scheduler_lease_seconds: float = Field(
+        default=180,
+        gt=0,
+        description="""
+        How long a scheduler replica's lease lasts without being renewed, in seconds,
+        when scheduler coordination is enabled. Leases are renewed on every loop, so
+        this should be longer than `scheduler_loop_seconds`. The shards of a replica
+        that stops without releasing its lease are reassigned once it expires.
+        Defaults to `180`.
+        """,
+    )
+
     api_services_late_runs_enabled: bool = Field(
         default=True,
         description="Whether or not to start the late runs service in the server application.",
@@ -797,6 +861,16 @@ class Settings(BaseSettings):
         """,
     )
 
+    api_services_foreman_poll_aggregation_enabled: bool = Field(
+        default=False,
+        description="""
+        Whether work queue and deployment polls and worker heartbeats are held in memory
+        and written in bulk at the start of each Foreman loop, instead of being written
+        as they arrive. Only takes effect when the Foreman runs in the server application.
+        Defaults to `False`.
+        """,
+    )
+
     api_services_task_run_recorder_enabled: bool = Field(
         default=True,
         description="Whether or not to start the task run recorder service in the server application.",
@@ -888,6 +962,36 @@ class Settings(BaseSettings):
         description="The maximum size in bytes for a single log.",
     )
 
+    logging_to_api_flow_run_rate_limit: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description="The maximum number of logs per second each flow run may send to the API, after a burst of `SYNTASK_LOGGING_TO_API_RATE_LIMIT_BURST` logs. Logs at the `WARNING` level and above are always sent. If not set, the logs of a flow run are not limited.",
+    )
+
+    logging_to_api_logger_rate_limit: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description="The maximum number of logs per second each logger may send to the API for a flow run, after a burst of `SYNTASK_LOGGING_TO_API_RATE_LIMIT_BURST` logs. Logs at the `WARNING` level and above are always sent. If not set, the logs of a logger are not limited.",
+    )
+
+    logging_to_api_rate_limit_burst: int = Field(
+        default=1000,
+        gt=0,
+        description="The number of logs a flow run or logger may send to the API at once before its rate limit applies.",
+    )
+
+    logging_to_api_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="The fraction of logs below the `WARNING` level that are sent to the API. Logs at the `WARNING` level and above are always sent.",
+    )
+
+    logging_to_api_collapse_repeated: bool = Field(
+        default=False,
+        description="If `True`, a log below the `WARNING` level with the same logger, level and message as the previous log of its flow run is not sent to the API. Instead, a single log reporting how many times the message was repeated is sent. Logs at the `WARNING` level and above are never collapsed.",
+    )
+
     logging_to_api_when_missing_flow: Literal["warn", "error", "ignore"] = Field(
         default="warn",
         description="""
@@ -1068,6 +1172,18 @@ class Settings(BaseSettings):
         description="Whether or not to start the triggers service in the server application.",
     )
 
+    api_services_triggers_batch_size: int = Field(
+        default=1,
+        gt=0,
+        description="The number of events the reactive triggers service will evaluate together, writing their automation bucket increments in one statement. Events are acknowledged only once their batch has been evaluated, and are delivered again if its evaluation fails. The default of 1 evaluates each event as it arrives.",
+    )
+
+    api_services_triggers_flush_interval: float = Field(
+        default=0.005,
+        gt=0.0,
+        description="The maximum number of seconds an event will wait in a batch of the reactive triggers service before it is evaluated.",
+    )
+
     api_services_event_persister_enabled: bool = Field(
         default=True,
         description="Whether or not to start the event persister service in the server application.",
@@ -1079,12 +1195,54 @@ class Settings(BaseSettings):
         description="The number of events the event persister will attempt to insert in one batch.",
     )
 
+    api_services_event_persister_copy_enabled: bool = Field(
+        default=False,
+        description="Whether or not the event persister should write events to PostgreSQL with a binary `COPY` into staging tables instead of `INSERT` statements. This is faster for large batches; consider raising the batch size along with it.",
+    )
+
     api_services_event_persister_flush_interval: float = Field(
         default=5,
         gt=0.0,
         description="The maximum number of seconds between flushes of the event persister.",
     )
 
+    api_services_event_retention_enabled: bool = Field(
+        default=True,
+        description="Whether or not to start the event retention service in the server application. On PostgreSQL, this service creates the partitions of the events tables and drops expired ones; while it is running, the event persister no longer deletes expired events itself.",
+    )
+
+    api_services_event_retention_loop_seconds: float = Field(
+        default=3600,
+        gt=0.0,
+        description="The event retention service will create and drop event partitions this often.",
+    )
+
+    api_services_log_retention_enabled: bool = Field(
+        default=True,
+        description="Whether or not to start the log retention service in the server application. On PostgreSQL, this service creates the partitions of the log table and drops expired ones.",
+    )
+
+    api_services_log_retention_loop_seconds: float = Field(
+        default=3600,
+        gt=0.0,
+        description="The log retention service will create and drop log partitions this often.",
+    )
+
+    api_logs_copy_enabled: bool = Field(
+        default=False,
+        description="Whether or not to write logs to PostgreSQL with a binary `COPY` instead of `INSERT` statements. This is faster for large batches of logs, which are then written in one statement rather than several.",
+    )
+
+    api_logs_retention_period: Optional[timedelta] = Field(
+        default=None,
+        description="The amount of time to retain logs in the database on PostgreSQL. Expired logs are dropped a partition at a time by the log retention service. If not set, logs are kept indefinitely.",
+    )
+
+    api_logs_partition_interval: Literal["daily", "weekly"] = Field(
+        default="daily",
+        description="The span of time covered by each partition of the log table on PostgreSQL.",
+    )
+
     api_events_stream_out_enabled: bool = Field(
         default=True,
         description="Whether or not to stream events out to the API via websockets.",
@@ -1095,6 +1253,11 @@ class Settings(BaseSettings):
         description="Whether or not to enable Prometheus metrics in the API.",
     )
 
+    api_task_run_dashboard_rollups_enabled: bool = Field(
+        default=False,
+        description="Whether or not the UI's task run dashboard should count task runs from their per-minute rollups when no filters other than a start time are given. The rollups are only maintained as task run states change while this is enabled, so task runs that finished while it was disabled are not counted by them. Task runs deleted along with their flow run are still counted by the rollups.",
+    )
+
     api_events_related_resource_cache_ttl: timedelta = Field(
         default=timedelta(minutes=5),
         description="The number of seconds to cache related resources for in the API.",
@@ -1124,6 +1287,15 @@ class Settings(BaseSettings):
         description="The maximum size of an Event when serialized to JSON",
     )
 
+    events_maximum_batch_size_bytes: int = Field(
+        default=16_000_000,
+        gt=0,
+        description=(
+            "The maximum size of a batch of Events sent in a single message to the"
+            " incoming events WebSocket, after decompression"
+        ),
+    )
+
     events_expired_bucket_buffer: timedelta = Field(
         default=timedelta(seconds=60),
         description="The amount of time to retain expired automation buckets",
@@ -1139,6 +1311,11 @@ class Settings(BaseSettings):
         description="The amount of time to retain events in the database.",
     )
 
+    events_partition_interval: Literal["daily", "weekly"] = Field(
+        default="daily",
+        description="The span of time covered by each partition of the events tables on PostgreSQL. Expired events are dropped a partition at a time.",
+    )
+
     events_maximum_websocket_backfill: timedelta = Field(
         default=timedelta(minutes=15),
         description="The maximum range to look back for backfilling events for a websocket subscriber.",
@@ -1150,6 +1327,34 @@ class Settings(BaseSettings):
         description="The page size for the queries to backfill events for websocket subscribers.",
     )
 
+    events_client_batching_enabled: bool = Field(
+        default=False,
+        description="Whether or not clients should send events to the API in batches, each in a single websocket message. Requires a server that accepts batches of events.",
+    )
+
+    events_client_batch_size: int = Field(
+        default=500,
+        gt=0,
+        description="The maximum number of events a client sends to the API in one websocket message when batching is enabled.",
+    )
+
+    events_client_batch_max_bytes: int = Field(
+        default=10_000_000,
+        gt=0,
+        description="The maximum size in bytes of the events a client sends to the API in one websocket message when batching is enabled, before compression. Larger batches are split across several messages. This should be below the server's `SYNTASK_EVENTS_MAXIMUM_BATCH_SIZE_BYTES`.",
+    )
+
+    events_client_batch_interval: float = Field(
+        default=0.1,
+        gt=0.0,
+        description="The number of seconds a client waits to fill a batch of events before sending it to the API when batching is enabled.",
+    )
+
+    events_client_batch_compression_enabled: bool = Field(
+        default=False,
+        description="Whether or not clients should compress batches of events sent to the API.",
+    )
+
     ###########################################################################
     # uncategorized
 
@@ -1214,6 +1419,62 @@ class Settings(BaseSettings):
         """,
     )
 
+    client_shared_connection_pool_enabled: bool = Field(
+        default=False,
+        description="""
+        If `True`, API clients in the same process share one connection pool per API
+        host instead of opening their own connections, so that short-lived clients
+        reuse open (and, with `SYNTASK_API_ENABLE_HTTP2`, multiplexed) connections.
+        Sync clients share their pool across threads; async clients share it within
+        an event loop.
+        """,
+    )
+
+    client_max_connections: int = Field(
+        default=16,
+        gt=0,
+        description="""
+        The maximum number of connections an API client's connection pool may open to
+        the API host.
+        """,
+    )
+
+    client_max_keepalive_connections: int = Field(
+        default=8,
+        ge=0,
+        description="""
+        The maximum number of idle connections an API client's connection pool keeps
+        open to the API host.
+        """,
+    )
+
+    client_keepalive_expiry: float = Field(
+        default=25,
+        ge=0,
+        description="""
+        The number of seconds an idle connection is kept open before it is closed. This
+        should be shorter than the time the API host or its load balancer keeps idle
+        connections open.
+        """,
+    )
+
+    client_cache_ttl: float = Field(
+        default=60,
+        ge=0,
+        description="""
+        The number of seconds an object read with `use_cache=True` is returned from the
+        client cache before it is revalidated with the API.
+        """,
+    )
+
+    client_cache_max_size: int = Field(
+        default=1000,
+        ge=0,
+        description="""
+        The maximum number of responses kept in the client cache.
+        """,
+    )
+
     experimental_warn: bool = Field(
         default=True,
         description="If `True`, warn on usage of experimental features.",
@@ -1359,6 +1620,12 @@ class Settings(BaseSettings):
         description="The number of seconds into the future a worker should query for scheduled work.",
     )
 
+    worker_long_poll_seconds: float = Field(
+        default=0,
+        ge=0,
+        description="If greater than zero, a worker asks for scheduled work with requests that wait up to this many seconds on the server for runs to become due, rather than querying every `SYNTASK_WORKER_QUERY_SECONDS`.",
+    )
+
     worker_webserver_host: str = Field(
         default="0.0.0.0",
         description="The host address the worker's webserver should bind to.",
@@ -2079,9 +2346,13 @@ class _SettingsDict(dict):
 
 SETTING_VARIABLES: dict[str, Setting] = _SettingsDict(Settings)
 
+# Settings are looked up through the module `__getattr__` on every import of a
+# setting, including in hot paths, so the valid names are only computed once
+_VALID_SETTING_NAMES = frozenset(Settings.valid_setting_names())
+
 
 def __getattr__(name: str) -> Setting:
-    if name in Settings.valid_setting_names():
+    if name in _VALID_SETTING_NAMES:
         return SETTING_VARIABLES[name]
     raise AttributeError(f"{name} is not a Syntask setting.")
 
@@ -54,6 +54,7 @@ from syntask.exceptions import (
     UpstreamTaskError,
 )
 from syntask.futures import SyntaskFuture
+from syntask.logging.handlers import APILogHandler
 from syntask.logging.loggers import get_logger, patch_print, task_run_logger
 from syntask.results import (
     BaseResult,
@@ -685,6 +686,10 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
                     raise
                 finally:
                     self.log_finished_message()
+                    if self.task_run:
+                        APILogHandler.report_limited_logs(
+                            self.task_run.flow_run_id, task_run_id=self.task_run.id
+                        )
                     self._is_started = False
                     self._client = None
 
@@ -1194,6 +1199,10 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
                     raise
                 finally:
                     self.log_finished_message()
+                    if self.task_run:
+                        APILogHandler.report_limited_logs(
+                            self.task_run.flow_run_id, task_run_id=self.task_run.id
+                        )
                     self._is_started = False
                     self._client = None
 
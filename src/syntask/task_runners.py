@@ -1,20 +1,28 @@
 import abc
 import asyncio
+import multiprocessing
+import os
 import sys
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextvars import copy_context
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
     Coroutine,
     Dict,
+    Generator,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
+    Union,
     overload,
 )
 
@@ -29,13 +37,22 @@ from syntask.futures import (
     SyntaskFutureList,
 )
 from syntask.logging.loggers import get_logger, get_run_logger
+from syntask.states import State
 from syntask.utilities.annotations import allow_failure, quote, unmapped
+from syntask.utilities.asyncutils import in_async_main_thread, run_coro_as_sync
 from syntask.utilities.callables import (
     collapse_variadic_parameters,
     explode_variadic_parameter,
     get_parameter_defaults,
 )
-from syntask.utilities.collections import isiterable
+from syntask.utilities.collections import StopVisiting, isiterable, visit_collection
+from syntask.utilities.shared_memory import (
+    SHARED_MEMORY_THRESHOLD,
+    dumps,
+    loads,
+    release_blocks,
+    unlink_blocks,
+)
 
 if TYPE_CHECKING:
     from syntask.tasks import Task
@@ -46,6 +63,40 @@ R = TypeVar("R")
 F = TypeVar("F", bound=SyntaskFuture, default=SyntaskConcurrentFuture)
 
 
+def _iterate_async_iterable(iterable: AsyncIterable[T]) -> Iterator[T]:
+    """
+    Iterate over an async iterable from synchronous code, one item at a time.
+    """
+    iterator = iterable.__aiter__()
+
+    async def get_next():
+        return await iterator.__anext__()
+
+    while True:
+        try:
+            yield run_coro_as_sync(get_next())
+        except StopAsyncIteration:
+            return
+
+
+_EXHAUSTED = object()
+
+
+def _all_exhausted(values: Dict[str, Any]) -> bool:
+    """
+    Check whether every iterable parameter of a streamed map ran out of values,
+    raising if only some of them did.
+    """
+    exhausted = [key for key, value in values.items() if value is _EXHAUSTED]
+    if exhausted and len(exhausted) < len(values):
+        raise MappingLengthMismatch(
+            "Received iterable parameters with different lengths. Parameters"
+            " for map must all be the same length. Ran out of values for:"
+            f" {exhausted}"
+        )
+    return bool(exhausted)
+
+
 class TaskRunner(abc.ABC, Generic[F]):
     """
     Abstract base class for task runners.
@@ -173,25 +224,12 @@ class TaskRunner(abc.ABC, Generic[F]):
 
         futures: List[SyntaskFuture] = []
         for i in range(map_length):
-            call_parameters = {
-                key: value[i] for key, value in iterable_parameters.items()
-            }
-            call_parameters.update(
-                {key: value for key, value in static_parameters.items()}
+            call_parameters = self._get_call_parameters(
+                task,
+                {key: value[i] for key, value in iterable_parameters.items()},
+                static_parameters,
+                annotated_parameters,
             )
-
-            # Add default values for parameters; these are skipped earlier since they should
-            # not be mapped over
-            for key, value in get_parameter_defaults(task.fn).items():
-                call_parameters.setdefault(key, value)
-
-            # Re-apply annotations to each key again
-            for key, annotation in annotated_parameters.items():
-                call_parameters[key] = annotation.rewrap(call_parameters[key])
-
-            # Collapse any previously exploded kwargs
-            call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
-
             futures.append(
                 self.submit(
                     task=task,
@@ -203,6 +241,217 @@ class TaskRunner(abc.ABC, Generic[F]):
 
         return SyntaskFutureList(futures)
 
+    def iter_map(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+    ) -> Generator[F, None, None]:
+        """
+        Lazily submit multiple tasks to the task run engine.
+
+        Unlike `map`, iterable parameters are not collected up front; they may be
+        iterators, generators, or async iterators of unknown length. A task is
+        submitted each time the returned generator is advanced, so the parameters
+        for only one task run are held in memory at a time.
+
+        Async iterators are driven on a background event loop, so they can't be
+        used from a running event loop; use `iter_map_async` there instead.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A generator that submits the next task and yields its future each time
+            it is advanced.
+        """
+        (
+            iterable_parameters,
+            static_parameters,
+            annotated_parameters,
+            task_inputs,
+        ) = self._prepare_iter_map(task, parameters)
+
+        for key, val in iterable_parameters.items():
+            if hasattr(val, "__anext__"):
+                if in_async_main_thread():
+                    raise TypeError(
+                        f"Parameter {key!r} is an async iterator, which can't be"
+                        " mapped over synchronously from a running event loop. Use"
+                        " `Task.map_stream_async` or `iter_map_async` instead."
+                    )
+                iterable_parameters[key] = _iterate_async_iterable(val)
+
+        return self._iter_submit(
+            task,
+            iterable_parameters,
+            static_parameters,
+            annotated_parameters,
+            wait_for,
+            task_inputs,
+        )
+
+    def iter_map_async(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+    ) -> AsyncGenerator[F, None]:
+        """
+        Lazily submit multiple tasks to the task run engine from an event loop.
+
+        This is the asynchronous counterpart of `iter_map`. Async iterators are
+        driven on the event loop that advances the returned generator.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            An async generator that submits the next task and yields its future each
+            time it is advanced.
+        """
+        (
+            iterable_parameters,
+            static_parameters,
+            annotated_parameters,
+            task_inputs,
+        ) = self._prepare_iter_map(task, parameters)
+
+        return self._iter_submit_async(
+            task,
+            iterable_parameters,
+            static_parameters,
+            annotated_parameters,
+            wait_for,
+            task_inputs,
+        )
+
+    def _prepare_iter_map(self, task: "Task", parameters: Dict[str, Any]):
+        if not self._started:
+            raise RuntimeError(
+                "The task runner must be started before submitting work."
+            )
+
+        from syntask.utilities.engine import (
+            collect_task_run_inputs_sync,
+            resolve_inputs_sync,
+        )
+
+        task_inputs = {
+            k: collect_task_run_inputs_sync(v, max_depth=0)
+            for k, v in parameters.items()
+        }
+        parameters = resolve_inputs_sync(parameters, max_depth=0)
+        parameters = explode_variadic_parameter(task.fn, parameters)
+
+        iterable_parameters = {}
+        static_parameters = {}
+        annotated_parameters = {}
+        for key, val in parameters.items():
+            if isinstance(val, (allow_failure, quote)):
+                annotated_parameters[key] = val
+                val = val.unwrap()
+
+            if isinstance(val, unmapped):
+                static_parameters[key] = val.value
+            elif hasattr(val, "__aiter__"):
+                iterable_parameters[key] = val.__aiter__()
+            elif isiterable(val):
+                iterable_parameters[key] = iter(val)
+            else:
+                static_parameters[key] = val
+
+        if not len(iterable_parameters):
+            raise MappingMissingIterable(
+                "No iterable parameters were received. Parameters for map must "
+                f"include at least one iterable. Parameters: {parameters}"
+            )
+
+        return iterable_parameters, static_parameters, annotated_parameters, task_inputs
+
+    def _iter_submit(
+        self,
+        task: "Task",
+        iterable_parameters: Dict[str, Iterator[Any]],
+        static_parameters: Dict[str, Any],
+        annotated_parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]],
+        dependencies: Dict[str, Set[TaskRunInput]],
+    ) -> Generator[F, None, None]:
+        while True:
+            values = {
+                key: next(iterator, _EXHAUSTED)
+                for key, iterator in iterable_parameters.items()
+            }
+            if _all_exhausted(values):
+                return
+
+            yield self.submit(
+                task=task,
+                parameters=self._get_call_parameters(
+                    task, values, static_parameters, annotated_parameters
+                ),
+                wait_for=wait_for,
+                dependencies=dependencies,
+            )
+
+    async def _iter_submit_async(
+        self,
+        task: "Task",
+        iterable_parameters: Dict[str, Union[Iterator[Any], AsyncIterator[Any]]],
+        static_parameters: Dict[str, Any],
+        annotated_parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]],
+        dependencies: Dict[str, Set[TaskRunInput]],
+    ) -> AsyncGenerator[F, None]:
+        while True:
+            values = {}
+            for key, iterator in iterable_parameters.items():
+                if isinstance(iterator, AsyncIterator):
+                    try:
+                        values[key] = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        values[key] = _EXHAUSTED
+                else:
+                    values[key] = next(iterator, _EXHAUSTED)
+            if _all_exhausted(values):
+                return
+
+            yield self.submit(
+                task=task,
+                parameters=self._get_call_parameters(
+                    task, values, static_parameters, annotated_parameters
+                ),
+                wait_for=wait_for,
+                dependencies=dependencies,
+            )
+
+    def _get_call_parameters(
+        self,
+        task: "Task",
+        mapped_values: Dict[str, Any],
+        static_parameters: Dict[str, Any],
+        annotated_parameters: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        call_parameters = dict(mapped_values)
+        call_parameters.update({key: value for key, value in static_parameters.items()})
+
+        # Add default values for parameters; these are skipped earlier since they should
+        # not be mapped over
+        for key, value in get_parameter_defaults(task.fn).items():
+            call_parameters.setdefault(key, value)
+
+        # Re-apply annotations to each key again
+        for key, annotation in annotated_parameters.items():
+            call_parameters[key] = annotation.rewrap(call_parameters[key])
+
+        # Collapse any previously exploded kwargs
+        return collapse_variadic_parameters(task.fn, call_parameters)
+
     def __enter__(self):
         if self._started:
             raise RuntimeError("This task runner is already started")
@@ -306,6 +555,9 @@ class ThreadPoolTaskRunner(TaskRunner[SyntaskConcurrentFuture]):
                 run_task_sync,
                 **submit_kwargs,
             )
+        # Forget the cancel event once the task run is done so that long-running
+        # flows don't accumulate one per task run
+        future.add_done_callback(lambda _: self._cancel_events.pop(task_run_id, None))
         syntask_future = SyntaskConcurrentFuture(
             task_run_id=task_run_id, wrapped_future=future
         )
@@ -366,6 +618,246 @@ class ThreadPoolTaskRunner(TaskRunner[SyntaskConcurrentFuture]):
 ConcurrentTaskRunner = ThreadPoolTaskRunner
 
 
+def _initialize_process_worker():
+    # Import the task engine up front so that the first task submitted to each worker
+    # process does not pay for it
+    import syntask.task_engine  # noqa: F401
+
+
+def _run_task_in_process_worker(payload: bytes, shared_memory_threshold: int):
+    """
+    Run a task in a process pool worker. Called with the task and its parameters
+    pickled by `syntask.utilities.shared_memory.dumps`; returns the final state
+    pickled in the same way.
+    """
+    from syntask.task_engine import run_task_async, run_task_sync
+
+    submit_kwargs, argument_blocks = loads(payload)
+    try:
+        if submit_kwargs["task"].isasync:
+            state = asyncio.run(run_task_async(**submit_kwargs))
+        else:
+            state = run_task_sync(**submit_kwargs)
+        del submit_kwargs
+
+        # The result blocks are unlinked by the parent process once it has loaded them
+        result, _ = dumps(state, threshold=shared_memory_threshold)
+        return result
+    finally:
+        release_blocks(argument_blocks)
+
+
+def _resolve_future_to_state(expr):
+    """
+    Replace futures with their final states so that parameters can be sent to another
+    process. Designed to be used with `visit_collection`.
+    """
+    if isinstance(expr, SyntaskFuture):
+        expr.wait()
+        return expr.state
+    elif isinstance(expr, State):
+        raise StopVisiting()
+    return expr
+
+
+class ProcessPoolTaskRunner(TaskRunner[SyntaskConcurrentFuture]):
+    """
+    A task runner that runs tasks in a pool of worker processes, which allows
+    CPU-bound Python tasks to run in parallel.
+
+    Worker processes are started when the first task is submitted and are reused
+    for later tasks. The run context and settings are sent to the worker process
+    with each task. Large `bytes`, `bytearray`, and NumPy array parameters and
+    results are passed through shared memory instead of being copied through a pipe.
+
+    Tasks, their parameters, and their results must be serializable with
+    cloudpickle. Worker processes are started with the `spawn` method, so scripts
+    that use this task runner must guard their entrypoint with
+    `if __name__ == "__main__":`.
+
+    Args:
+        max_workers: The maximum number of worker processes. Defaults to the number
+            of processors on the machine.
+        shared_memory_threshold: The size in bytes at which a buffer is passed
+            through shared memory.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        shared_memory_threshold: int = SHARED_MEMORY_THRESHOLD,
+    ):
+        super().__init__()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._dispatcher: Optional[ThreadPoolExecutor] = None
+        self._max_workers = max_workers
+        self._shared_memory_threshold = shared_memory_threshold
+
+    def duplicate(self) -> "ProcessPoolTaskRunner":
+        return type(self)(
+            max_workers=self._max_workers,
+            shared_memory_threshold=self._shared_memory_threshold,
+        )
+
+    @overload
+    def submit(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> SyntaskConcurrentFuture[R]: ...
+
+    @overload
+    def submit(
+        self,
+        task: "Task[Any, R]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> SyntaskConcurrentFuture[R]: ...
+
+    def submit(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ):
+        """
+        Submit a task to the task run engine running in a worker process.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A future object that can be used to wait for the task to complete and
+            retrieve the result.
+        """
+        if not self._started or self._executor is None or self._dispatcher is None:
+            raise RuntimeError("Task runner is not started")
+
+        from syntask.context import FlowRunContext, serialize_context
+
+        task_run_id = uuid.uuid4()
+
+        flow_run_ctx = FlowRunContext.get()
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+        else:
+            self.logger.debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+
+        submit_kwargs = dict(
+            task=task,
+            task_run_id=task_run_id,
+            parameters=parameters,
+            wait_for=wait_for,
+            return_type="state",
+            dependencies=dependencies,
+            context=serialize_context(),
+        )
+
+        # Upstream futures are waited on in a dispatcher thread so that submission
+        # does not block
+        future = self._dispatcher.submit(
+            copy_context().run, self._run_in_process, submit_kwargs
+        )
+        return SyntaskConcurrentFuture(task_run_id=task_run_id, wrapped_future=future)
+
+    def _run_in_process(self, submit_kwargs: Dict[str, Any]) -> State:
+        assert self._executor is not None
+
+        # Futures can't be sent to another process, so wait for them here and send
+        # their final states instead
+        for key in ("parameters", "wait_for"):
+            submit_kwargs[key] = visit_collection(
+                submit_kwargs[key],
+                visit_fn=_resolve_future_to_state,
+                return_data=True,
+                max_depth=-1,
+            )
+
+        payload, argument_blocks = dumps(
+            submit_kwargs, threshold=self._shared_memory_threshold
+        )
+        try:
+            result = self._executor.submit(
+                _run_task_in_process_worker, payload, self._shared_memory_threshold
+            ).result()
+        finally:
+            unlink_blocks(argument_blocks)
+
+        state, result_blocks = loads(result)
+        unlink_blocks(result_blocks)
+        release_blocks(result_blocks)
+        return state
+
+    @overload
+    def map(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+    ) -> SyntaskFutureList[SyntaskConcurrentFuture[R]]: ...
+
+    @overload
+    def map(
+        self,
+        task: "Task[Any, R]",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+    ) -> SyntaskFutureList[SyntaskConcurrentFuture[R]]: ...
+
+    def map(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+    ):
+        return super().map(task, parameters, wait_for)
+
+    def cancel_all(self):
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(cancel_futures=True)
+            self._dispatcher = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        super().__enter__()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_process_worker,
+        )
+        # Tasks are dispatched in submission order, so upstream tasks always hold a
+        # dispatcher thread before the tasks waiting on them and one thread per
+        # worker process is enough to keep the pool busy
+        self._dispatcher = ThreadPoolExecutor(
+            max_workers=self._max_workers or os.cpu_count() or 1
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cancel_all()
+        super().__exit__(exc_type, exc_value, traceback)
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ProcessPoolTaskRunner):
+            return False
+        return (
+            self._max_workers == value._max_workers
+            and self._shared_memory_threshold == value._shared_memory_threshold
+        )
+
+
 class SyntaskTaskRunner(TaskRunner[SyntaskDistributedFuture]):
     def __init__(self):
         super().__init__()
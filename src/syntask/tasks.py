@@ -11,10 +11,12 @@ from functools import partial, update_wrapper
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Awaitable,
     Callable,
     Coroutine,
     Dict,
+    Generator,
     Generic,
     Iterable,
     List,
@@ -48,7 +50,15 @@ from syntask.context import (
     TaskRunContext,
     serialize_context,
 )
-from syntask.futures import SyntaskDistributedFuture, SyntaskFuture, SyntaskFutureList
+from syntask.futures import (
+    SyntaskDistributedFuture,
+    SyntaskFuture,
+    SyntaskFutureList,
+    as_completed,
+    as_completed_async,
+    iter_in_order,
+    iter_in_order_async,
+)
 from syntask.logging.loggers import get_logger
 from syntask.results import (
     ResultSerializer,
@@ -78,6 +88,7 @@ from syntask.utilities.urls import url_for
 if TYPE_CHECKING:
     from syntask.client.orchestration import SyntaskClient
     from syntask.context import TaskRunContext
+    from syntask.task_runners import TaskRunner
     from syntask.transactions import Transaction
 
 T = TypeVar("T")  # Generic type var for capturing the inner return type of async funcs
@@ -1360,6 +1371,136 @@ class Task(Generic[P, R]):
         else:
             return futures
 
+    def map_stream(
+        self,
+        *args: Any,
+        max_in_flight: int = 100,
+        ordered: bool = False,
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+        **kwargs: Any,
+    ) -> Generator[SyntaskFuture, None, None]:
+        """
+        Submit a mapped run of the task, keeping a bounded number of task runs in
+        flight, and yield the futures of the task runs as they complete.
+
+        Must be called within a flow run context. Unlike `map`, iterable arguments
+        may be iterators, generators, or async iterators of any length; they are
+        consumed lazily, so memory use does not grow with the length of the input.
+        Task runs are submitted as the returned generator is advanced, and at most
+        `max_in_flight` submitted task runs are incomplete at any time.
+
+        Args:
+            *args: Iterable and static arguments to run the tasks with
+            max_in_flight: The maximum number of task runs to have in flight at once
+            ordered: If `True`, yield futures in the order of the inputs; otherwise,
+                yield futures as soon as they complete
+            wait_for: Upstream task futures to wait for before starting the
+                task
+            **kwargs: Keyword iterable arguments to run the task with
+
+        Returns:
+            A generator of completed futures
+
+        Examples:
+
+            Process a large input without creating every task run up front
+
+            >>> from syntask import flow, task
+            >>> @task
+            >>> def my_task(x):
+            >>>     return x + 1
+            >>>
+            >>> @flow
+            >>> def my_flow():
+            >>>     total = 0
+            >>>     for future in my_task.map_stream(range(10_000_000), max_in_flight=50):
+            >>>         total += future.result()
+            >>>     return total
+        """
+        task_runner = self._get_stream_task_runner("map_stream")
+        parameters = get_call_parameters(self.fn, args, kwargs, apply_defaults=False)
+
+        futures = task_runner.iter_map(self, parameters, wait_for)
+        if ordered:
+            return iter_in_order(futures, max_in_flight=max_in_flight)
+        return as_completed(futures, max_in_flight=max_in_flight)
+
+    def map_stream_async(
+        self,
+        *args: Any,
+        max_in_flight: int = 100,
+        ordered: bool = False,
+        wait_for: Optional[Iterable[SyntaskFuture]] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[SyntaskFuture, None]:
+        """
+        Submit a mapped run of the task, keeping a bounded number of task runs in
+        flight, and yield the futures of the task runs as they complete without
+        blocking the event loop.
+
+        This is the asynchronous counterpart of `map_stream` for use in async flows.
+        Async iterable arguments are consumed on the event loop that iterates over
+        the returned generator.
+
+        Args:
+            *args: Iterable and static arguments to run the tasks with
+            max_in_flight: The maximum number of task runs to have in flight at once
+            ordered: If `True`, yield futures in the order of the inputs; otherwise,
+                yield futures as soon as they complete
+            wait_for: Upstream task futures to wait for before starting the
+                task
+            **kwargs: Keyword iterable arguments to run the task with
+
+        Returns:
+            An async generator of completed futures
+
+        Examples:
+
+            Process records from an async source in an async flow
+
+            >>> from syntask import flow, task
+            >>> @task
+            >>> def my_task(x):
+            >>>     return x + 1
+            >>>
+            >>> @flow
+            >>> async def my_flow():
+            >>>     total = 0
+            >>>     async for future in my_task.map_stream_async(read_records()):
+            >>>         total += future.result()
+            >>>     return total
+        """
+        task_runner = self._get_stream_task_runner("map_stream_async")
+        parameters = get_call_parameters(self.fn, args, kwargs, apply_defaults=False)
+
+        futures = task_runner.iter_map_async(self, parameters, wait_for)
+        if ordered:
+            return iter_in_order_async(futures, max_in_flight=max_in_flight)
+        return as_completed_async(futures, max_in_flight=max_in_flight)
+
+    def _get_stream_task_runner(self, method_name: str) -> "TaskRunner":
+        from syntask.task_runners import TaskRunner
+        from syntask.utilities.visualization import (
+            VisualizationUnsupportedError,
+            get_task_viz_tracker,
+        )
+
+        if get_task_viz_tracker():
+            raise VisualizationUnsupportedError(
+                f"`task.{method_name}()` is not currently supported by"
+                " `flow.visualize()`"
+            )
+
+        flow_run_context = FlowRunContext.get()
+        task_runner = getattr(flow_run_context, "task_runner", None)
+        if not task_runner:
+            raise RuntimeError(
+                "Unable to determine task runner to use for mapped task runs."
+                f" `{method_name}` must be called within a flow."
+            )
+        assert isinstance(task_runner, TaskRunner)
+        return task_runner
+
     def apply_async(
         self,
         args: Optional[Tuple[Any, ...]] = None,
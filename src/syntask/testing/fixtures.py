@@ -3,6 +3,7 @@ import json
 import os
 import socket
 import sys
+import zlib
 from contextlib import contextmanager
 from typing import AsyncGenerator, Generator, List, Optional, Union
 from unittest import mock
@@ -12,6 +13,7 @@ import anyio
 import httpx
 import pendulum
 import pytest
+from pydantic import TypeAdapter
 from starlette.status import WS_1008_POLICY_VIOLATION
 from websockets.exceptions import ConnectionClosed
 from websockets.legacy.server import WebSocketServer, WebSocketServerProtocol, serve
@@ -249,6 +251,7 @@ def mock_anyio_sleep(monkeypatch):
 class Recorder:
     connections: int
     path: Optional[str]
+    messages: int
     events: List[Event]
     token: Optional[str]
     filter: Optional[EventFilter]
@@ -256,6 +259,7 @@ class Recorder:
     def __init__(self):
         self.connections = 0
         self.path = None
+        self.messages = 0
         self.events = []
 
 
@@ -311,11 +315,21 @@ async def events_server(
             except ConnectionClosed:
                 return
 
-            event = Event.model_validate_json(message)
-            recorder.events.append(event)
+            recorder.messages += 1
 
-            if puppeteer.hard_disconnect_after == event.id:
-                raise ValueError("zonk")
+            if isinstance(message, bytes):
+                message = zlib.decompress(message)
+
+            if message.lstrip()[:1] in ("[", b"["):
+                events = TypeAdapter(List[Event]).validate_json(message)
+            else:
+                events = [Event.model_validate_json(message)]
+
+            for event in events:
+                recorder.events.append(event)
+
+                if puppeteer.hard_disconnect_after == event.id:
+                    raise ValueError("zonk")
 
     async def outgoing_events(socket: WebSocketServerProtocol):
         # 1. authentication
@@ -1,18 +1,27 @@
 import hashlib
 import sys
+import weakref
+from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 
 import cloudpickle
 
-from syntask.serializers import JSONSerializer
+from syntask.serializers import JSONSerializer, syntask_json_object_encoder
+from syntask.utilities.importtools import to_qualified_name
 
 if sys.version_info[:2] >= (3, 9):
     _md5 = partial(hashlib.md5, usedforsecurity=False)
 else:
     _md5 = hashlib.md5
 
+# Buffers are fed to the hash algorithm in slices of this size
+HASH_CHUNK_SIZE = 2**20
+
+# A mapping of object ids and hash algorithm names to the object's digest
+HashMemo = Dict[Tuple[int, str], str]
+
 
 def stable_hash(*args: Union[str, bytes], hash_algo=_md5) -> str:
     """Given some arguments, produces a stable 64-bit hash of their contents.
@@ -48,20 +57,274 @@ def file_hash(path: str, hash_algo=_md5) -> str:
     return stable_hash(contents, hash_algo=hash_algo)
 
 
-def hash_objects(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
+def get_hash_algorithm(name: str) -> Callable:
     """
-    Attempt to hash objects by dumping to JSON or serializing with cloudpickle.
-    On failure of both, `None` will be returned
+    Get a hash algorithm by name.
+
+    Supported names are `md5`, `sha256`, `blake2b` and `xxhash`. The `xxhash`
+    algorithm is the fastest but requires the `xxhash` package to be installed.
+
+    Args:
+        name: the name of the hash algorithm
+
+    Returns:
+        A callable that creates a new hash object.
+    """
+    if name == "md5":
+        return _md5
+    elif name == "sha256":
+        return hashlib.sha256
+    elif name == "blake2b":
+        return partial(hashlib.blake2b, digest_size=16)
+    elif name == "xxhash":
+        try:
+            import xxhash
+        except ImportError as exc:
+            raise ImportError(
+                "The `xxhash` hash algorithm requires the `xxhash` package. Install it"
+                " with `pip install xxhash`."
+            ) from exc
+        return xxhash.xxh3_128
+    else:
+        raise ValueError(
+            f"Unknown hash algorithm {name!r}. Expected one of 'md5', 'sha256',"
+            " 'blake2b' or 'xxhash'."
+        )
+
+
+def _hashing_json_object_encoder(obj: Any) -> Any:
+    """
+    `JSONEncoder.default` for hashing; refuses objects that define a hash hook so
+    that they are hashed by `stream_hash` instead.
+    """
+    if hasattr(type(obj), "__syntask_hash__"):
+        raise TypeError(f"{type(obj).__name__} is hashed with its hash hook")
+    return syntask_json_object_encoder(obj)
+
+
+def json_hash(obj: Any, hash_algo=_md5) -> Optional[str]:
+    """
+    Attempt to hash an object by dumping it to JSON with sorted keys.
+    On failure, `None` will be returned.
     """
     try:
-        serializer = JSONSerializer(dumps_kwargs={"sort_keys": True})
-        return stable_hash(serializer.dumps((args, kwargs)), hash_algo=hash_algo)
+        serializer = JSONSerializer(
+            object_encoder=to_qualified_name(_hashing_json_object_encoder),
+            dumps_kwargs={"sort_keys": True},
+        )
+        return stable_hash(serializer.dumps(obj), hash_algo=hash_algo)
     except Exception:
-        pass
+        return None
 
+
+def stream_hash(
+    obj: Any, hash_algo=_md5, memo: Optional[HashMemo] = None
+) -> Optional[str]:
+    """
+    Hash an object by streaming its contents into the hash algorithm piece by piece,
+    without serializing the whole object first.
+
+    - Objects that support the buffer protocol, e.g. `bytes` or NumPy arrays, are
+      hashed without copying their contents.
+    - pandas objects are hashed with `pandas.util.hash_pandas_object`.
+    - Objects whose type defines `__syntask_hash__(self)` are hashed by hashing the
+      value returned by the hook instead.
+    - Dictionaries, lists, tuples and sets are hashed item by item. A container
+      that contains itself is hashed by its position in the enclosing containers.
+    - Any other object is hashed by serializing it with cloudpickle.
+
+    If a `memo` is given, the digests of read-only buffers are stored in it by object
+    identity and reused when the same object is hashed again. Only objects that
+    support weak references are memoized, and their digests are removed from the
+    memo when they are garbage collected.
+
+    Args:
+        obj: the object to hash
+        hash_algo: Hash algorithm to use.
+        memo: an optional mapping used to memoize the digests of read-only buffers
+
+    Returns:
+        A hex hash, or `None` if the object could not be hashed.
+    """
+    h = hash_algo()
     try:
-        return stable_hash(cloudpickle.dumps((args, kwargs)), hash_algo=hash_algo)
+        _update_hash(h, obj, hash_algo, memo, {})
     except Exception:
-        pass
+        return None
+    return h.hexdigest()
+
+
+@contextmanager
+def _entering(obj: Any, path: Dict[int, int]) -> Iterator[None]:
+    """
+    Record a container as being hashed for the duration of the block.
+    """
+    path[id(obj)] = len(path)
+    try:
+        yield
+    finally:
+        del path[id(obj)]
 
-    return None
+
+def _update_hash(
+    h, obj: Any, hash_algo, memo: Optional[HashMemo], path: Dict[int, int]
+) -> None:
+    # Each value is prefixed with a tag identifying its kind so that, e.g., the
+    # string "1" and the integer 1 produce different hashes
+    if obj is None:
+        h.update(b"N")
+    elif obj is True or obj is False:
+        h.update(b"T" if obj else b"F")
+    elif type(obj) is int:
+        h.update(b"i%d;" % obj)
+    elif type(obj) is float:
+        h.update(b"f" + repr(obj).encode() + b";")
+    elif type(obj) is str:
+        encoded = obj.encode()
+        h.update(b"s%d:" % len(encoded))
+        h.update(encoded)
+    elif (hook := getattr(type(obj), "__syntask_hash__", None)) is not None:
+        h.update(b"h" + to_qualified_name(type(obj)).encode() + b";")
+        _update_hash(h, hook(obj), hash_algo, memo, path)
+    elif id(obj) in path:
+        # a container that contains itself; refer to it by its depth instead
+        h.update(b"r%d;" % path[id(obj)])
+    elif type(obj) is dict:
+        h.update(b"d%d:" % len(obj))
+        with _entering(obj, path):
+            if all(type(key) is str for key in obj):
+                for key in sorted(obj):
+                    _update_hash(h, key, hash_algo, memo, path)
+                    _update_hash(h, obj[key], hash_algo, memo, path)
+            else:
+                # keys of mixed types may not be comparable, so order the items by
+                # hash
+                for digest in sorted(
+                    _digest((key, value), hash_algo, memo, path)
+                    for key, value in obj.items()
+                ):
+                    h.update(digest.encode())
+    elif type(obj) in (list, tuple):
+        h.update(b"%s%d:" % (b"l" if type(obj) is list else b"t", len(obj)))
+        with _entering(obj, path):
+            for item in obj:
+                _update_hash(h, item, hash_algo, memo, path)
+    elif type(obj) in (set, frozenset):
+        h.update(b"S%d:" % len(obj))
+        with _entering(obj, path):
+            for digest in sorted(_digest(item, hash_algo, memo, path) for item in obj):
+                h.update(digest.encode())
+    elif _is_pandas_object(obj):
+        _update_hash_with_pandas_object(h, obj, hash_algo, memo, path)
+    elif (view := _get_buffer(obj)) is not None:
+        h.update(b"m" + to_qualified_name(type(obj)).encode() + b";")
+        h.update(_buffer_digest(obj, view, hash_algo, memo).encode())
+    else:
+        pickled = cloudpickle.dumps(obj)
+        h.update(b"p%d:" % len(pickled))
+        h.update(pickled)
+
+
+def _digest(obj: Any, hash_algo, memo: Optional[HashMemo], path: Dict[int, int]) -> str:
+    h = hash_algo()
+    _update_hash(h, obj, hash_algo, memo, path)
+    return h.hexdigest()
+
+
+def _get_buffer(obj: Any) -> Optional[memoryview]:
+    try:
+        return memoryview(obj)
+    except (TypeError, ValueError, NotImplementedError):
+        # e.g. objects that do not support the buffer protocol or NumPy arrays of
+        # Python objects
+        return None
+
+
+def _buffer_digest(
+    obj: Any, view: memoryview, hash_algo, memo: Optional[HashMemo]
+) -> str:
+    memo_key = None
+    if (
+        memo is not None
+        and type(obj).__weakrefoffset__
+        and _buffer_is_immutable(obj, view)
+    ):
+        memo_key = (id(obj), getattr(hash_algo(), "name", repr(hash_algo)))
+        if memo_key in memo:
+            return memo[memo_key]
+
+    h = hash_algo()
+    h.update(f"{view.format};{view.shape};".encode())
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    data = view.cast("B")
+    for start in range(0, data.nbytes, HASH_CHUNK_SIZE):
+        h.update(data[start : start + HASH_CHUNK_SIZE])
+    digest = h.hexdigest()
+
+    if memo_key is not None:
+        # the object's identity may be reused once it is collected, so forget its
+        # digest then
+        memo[memo_key] = digest
+        weakref.finalize(obj, memo.pop, memo_key, None)
+    return digest
+
+
+def _buffer_is_immutable(obj: Any, view: memoryview) -> bool:
+    """
+    Whether the data of a buffer cannot change. A read-only view of a writable
+    buffer, such as a NumPy view of a writable array, changes along with it, so every
+    buffer the object's data belongs to must be read-only.
+    """
+    if not view.readonly:
+        return False
+
+    base = _buffer_base(obj)
+    while base is not None:
+        base_view = _get_buffer(base)
+        if base_view is None or not base_view.readonly:
+            return False
+        base = _buffer_base(base)
+    return True
+
+
+def _buffer_base(obj: Any) -> Any:
+    """Returns the object whose buffer holds the data of the given object, if any"""
+    if isinstance(obj, memoryview):
+        return obj.obj
+    # e.g. the array that a NumPy array is a view of
+    return getattr(obj, "base", None)
+
+
+def _is_pandas_object(obj: Any) -> bool:
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, (pd.DataFrame, pd.Series, pd.Index))
+
+
+def _update_hash_with_pandas_object(
+    h, obj: Any, hash_algo, memo: Optional[HashMemo], path: Dict[int, int]
+):
+    import pandas as pd
+
+    h.update(b"P" + to_qualified_name(type(obj)).encode() + b";")
+    if isinstance(obj, pd.DataFrame):
+        columns = [str(column) for column in obj.columns]
+        _update_hash(h, columns, hash_algo, memo, path)
+        _update_hash(h, [str(dtype) for dtype in obj.dtypes], hash_algo, memo, path)
+    else:
+        _update_hash(h, str(obj.name), hash_algo, memo, path)
+        _update_hash(h, str(obj.dtype), hash_algo, memo, path)
+
+    row_hashes = pd.util.hash_pandas_object(obj).to_numpy()
+    _update_hash(h, row_hashes, hash_algo, memo, path)
+
+
+def hash_objects(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
+    """
+    Attempt to hash objects by dumping to JSON or, if that fails, by streaming them
+    into the hash with `stream_hash`.
+    On failure of both, `None` will be returned
+    """
+    return json_hash((args, kwargs), hash_algo=hash_algo) or stream_hash(
+        (args, kwargs), hash_algo=hash_algo
+    )
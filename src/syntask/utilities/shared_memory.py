@@ -0,0 +1,185 @@
+"""
+Utilities for passing large buffers between processes through shared memory.
+"""
+
+import io
+import pickle
+import sys
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, List, Tuple
+
+import cloudpickle
+
+# Buffers smaller than this many bytes are copied into the pickle stream
+SHARED_MEMORY_THRESHOLD = 2**16
+
+# Attached blocks that could not be closed yet because their memory is still in use
+_open_blocks: List[SharedMemory] = []
+_open_blocks_lock = threading.Lock()
+
+
+class _AttachedSharedMemory(SharedMemory):
+    def __del__(self):
+        # A block still referenced by an array can't be closed; its memory is
+        # unmapped once the last reference is released
+        try:
+            self.close()
+        except (BufferError, OSError):
+            pass
+
+
+def _is_shareable_array(obj: Any) -> bool:
+    np = sys.modules.get("numpy")
+    return np is not None and type(obj) is np.ndarray and not obj.dtype.hasobject
+
+
+class SharedMemoryPickler(cloudpickle.Pickler):
+    """
+    A pickler that moves the contents of large `bytes`, `bytearray` and NumPy
+    array objects into shared memory blocks instead of copying them into the pickle
+    stream.
+
+    The blocks created while pickling are collected in `blocks`. They are closed in
+    this process once written, but remain allocated until they are unlinked.
+    """
+
+    def __init__(self, file, threshold: int = SHARED_MEMORY_THRESHOLD, **kwargs):
+        super().__init__(file, **kwargs)
+        self.threshold = threshold
+        self.blocks: List[SharedMemory] = []
+        # Objects are kept alive while pickling so that their ids are not reused
+        self._persistent_ids: Dict[int, Tuple[Any, Any]] = {}
+
+    def persistent_id(self, obj: Any) -> Any:
+        if id(obj) in self._persistent_ids:
+            return self._persistent_ids[id(obj)][1]
+
+        if type(obj) in (bytes, bytearray) and len(obj) >= self.threshold:
+            block = self._create_block(len(obj))
+            block.buf[: len(obj)] = obj
+            pid = (type(obj).__name__, block.name, len(obj))
+        elif _is_shareable_array(obj) and obj.nbytes >= self.threshold:
+            import numpy as np
+
+            block = self._create_block(obj.nbytes)
+            np.ndarray(obj.shape, dtype=obj.dtype, buffer=block.buf)[...] = obj
+            pid = ("ndarray", block.name, obj.shape, obj.dtype)
+        else:
+            return None
+
+        block.close()
+        self._persistent_ids[id(obj)] = (obj, pid)
+        return pid
+
+    def _create_block(self, size: int) -> SharedMemory:
+        block = SharedMemory(create=True, size=size)
+        self.blocks.append(block)
+        return block
+
+
+class SharedMemoryUnpickler(pickle.Unpickler):
+    """
+    An unpickler for data written by `SharedMemoryPickler`.
+
+    NumPy arrays are mapped onto their shared memory blocks without copying;
+    `bytes` and `bytearray` objects are copied out of their blocks. The blocks
+    attached while unpickling are collected in `blocks`.
+    """
+
+    def __init__(self, file):
+        super().__init__(file)
+        self.blocks: List[SharedMemory] = []
+        self._objects: Dict[str, Any] = {}
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, name, *metadata = pid
+        if name in self._objects:
+            return self._objects[name]
+
+        block = _AttachedSharedMemory(name=name)
+        self.blocks.append(block)
+
+        if kind == "ndarray":
+            import numpy as np
+
+            shape, dtype = metadata
+            # `frombuffer` holds the buffer open, which prevents the block from being
+            # closed while the array is alive
+            obj = np.frombuffer(
+                block.buf, dtype=dtype, count=int(np.prod(shape))
+            ).reshape(shape)
+        else:
+            (size,) = metadata
+            with block.buf[:size] as data:
+                obj = bytes(data) if kind == "bytes" else bytearray(data)
+
+        self._objects[name] = obj
+        return obj
+
+
+def dumps(
+    obj: Any, threshold: int = SHARED_MEMORY_THRESHOLD
+) -> Tuple[bytes, List[SharedMemory]]:
+    """
+    Pickle an object with cloudpickle, moving large buffers into shared memory.
+
+    Args:
+        obj: the object to pickle
+        threshold: the size in bytes at which buffers are moved into shared memory
+
+    Returns:
+        The pickled data and the shared memory blocks it references. The blocks
+        must be unlinked with `unlink_blocks` once the data has been loaded.
+    """
+    file = io.BytesIO()
+    pickler = SharedMemoryPickler(
+        file, threshold=threshold, protocol=pickle.HIGHEST_PROTOCOL
+    )
+    try:
+        pickler.dump(obj)
+    except BaseException:
+        unlink_blocks(pickler.blocks)
+        raise
+    return file.getvalue(), pickler.blocks
+
+
+def loads(data: bytes) -> Tuple[Any, List[SharedMemory]]:
+    """
+    Load an object pickled with `dumps`.
+
+    Returns:
+        The object and the shared memory blocks attached to load it. The blocks
+        should be passed to `release_blocks` once they are no longer needed.
+    """
+    unpickler = SharedMemoryUnpickler(io.BytesIO(data))
+    return unpickler.load(), unpickler.blocks
+
+
+def unlink_blocks(blocks: Iterable[SharedMemory]) -> None:
+    """
+    Unlink shared memory blocks so that their memory is freed once every process
+    has closed them.
+    """
+    for block in blocks:
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def release_blocks(blocks: Iterable[SharedMemory]) -> None:
+    """
+    Close attached shared memory blocks.
+
+    Blocks whose memory is still referenced, e.g. by a NumPy array, are retained
+    and closed by a later call once the references are gone.
+    """
+    with _open_blocks_lock:
+        still_open = []
+        for block in [*_open_blocks, *blocks]:
+            try:
+                block.close()
+            except BufferError:
+                still_open.append(block)
+        _open_blocks[:] = still_open
@@ -1,6 +1,8 @@
 import abc
+import datetime
 import inspect
 import threading
+import time
 from contextlib import AsyncExitStack
 from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Type, Union
@@ -11,6 +13,7 @@ import anyio.abc
 import pendulum
 from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from pydantic.json_schema import GenerateJsonSchema
+from starlette import status
 from typing_extensions import Literal
 
 import syntask
@@ -24,6 +27,7 @@ from syntask.events.related import object_as_related_resource, tags_as_related_r
 from syntask.exceptions import (
     Abort,
     ObjectNotFound,
+    SyntaskHTTPStatusError,
 )
 from syntask.logging.loggers import SyntaskLogAdapter, flow_run_logger, get_logger
 from syntask.plugins import load_syntask_collections
@@ -31,6 +35,7 @@ from syntask.settings import (
     SYNTASK_API_URL,
     SYNTASK_TEST_MODE,
     SYNTASK_WORKER_HEARTBEAT_SECONDS,
+    SYNTASK_WORKER_LONG_POLL_SECONDS,
     SYNTASK_WORKER_PREFETCH_SECONDS,
     SYNTASK_WORKER_QUERY_SECONDS,
     get_current_settings,
@@ -38,6 +43,7 @@ from syntask.settings import (
 from syntask.states import (
     Crashed,
     Pending,
+    Scheduled,
     exception_to_failed_state,
 )
 from syntask.utilities.dispatch import get_registry_for_type, register_base_type
@@ -411,6 +417,8 @@ class BaseWorker(abc.ABC):
         self._prefetch_seconds: float = (
             prefetch_seconds or SYNTASK_WORKER_PREFETCH_SECONDS.value()
         )
+        self._long_poll_seconds: float = SYNTASK_WORKER_LONG_POLL_SECONDS.value()
+        self._claim_scheduled_flow_runs = True
         self.heartbeat_interval_seconds = (
             heartbeat_interval_seconds or SYNTASK_WORKER_HEARTBEAT_SECONDS.value()
         )
@@ -528,7 +536,12 @@ class BaseWorker(abc.ABC):
                         partial(
                             critical_service_loop,
                             workload=self.get_and_submit_flow_runs,
-                            interval=SYNTASK_WORKER_QUERY_SECONDS.value(),
+                            # when long polling, the waiting happens on the server
+                            interval=(
+                                0
+                                if self._long_poll_seconds
+                                else SYNTASK_WORKER_QUERY_SECONDS.value()
+                            ),
                             run_once=run_once,
                             jitter_range=0.3,
                             backoff=4,  # Up to ~1 minute interval during backoff
@@ -653,11 +666,25 @@ class BaseWorker(abc.ABC):
         return is_still_polling
 
     async def get_and_submit_flow_runs(self):
+        poll_started = time.monotonic()
         runs_response = await self._get_scheduled_flow_runs()
 
         self._last_polled_time = pendulum.now("utc")
 
-        return await self._submit_scheduled_flow_runs(flow_run_response=runs_response)
+        submitted_flow_runs = await self._submit_scheduled_flow_runs(
+            flow_run_response=runs_response
+        )
+
+        if self._long_poll_seconds and not submitted_flow_runs:
+            # Keep polls that submit nothing at least the usual query interval apart.
+            # Either none of the runs that are due could be taken, because this
+            # worker is at its limit or is already submitting them, or the server
+            # answered without waiting, as servers that don't support long polling
+            # do; either way, asking again right away would get the same answer.
+            elapsed = time.monotonic() - poll_started
+            await anyio.sleep(max(0, SYNTASK_WORKER_QUERY_SECONDS.value() - elapsed))
+
+        return submitted_flow_runs
 
     async def _update_local_work_pool_info(self):
         try:
@@ -727,20 +754,53 @@ class BaseWorker(abc.ABC):
         self,
     ) -> List["WorkerFlowRunResponse"]:
         """
-        Retrieve scheduled flow runs from the work pool's queues.
+        Claim scheduled flow runs from the work pool's queues, taking no more runs
+        than this worker has capacity to submit.
         """
+        limit = None
+        if self._limiter:
+            limit = int(self._limiter.available_tokens)
+            if not limit:
+                self._logger.debug(
+                    "Flow run limit reached; not querying for scheduled flow runs"
+                )
+                return []
+
         scheduled_before = pendulum.now("utc").add(seconds=int(self._prefetch_seconds))
         self._logger.debug(
             f"Querying for flow runs scheduled before {scheduled_before}"
         )
         try:
-            scheduled_flow_runs = (
-                await self._client.get_scheduled_flow_runs_for_work_pool(
-                    work_pool_name=self._work_pool_name,
-                    scheduled_before=scheduled_before,
-                    work_queue_names=list(self._work_queues),
+            if self._claim_scheduled_flow_runs:
+                try:
+                    scheduled_flow_runs = (
+                        await self._client.claim_scheduled_flow_runs_for_work_pool(
+                            work_pool_name=self._work_pool_name,
+                            scheduled_before=scheduled_before,
+                            work_queue_names=list(self._work_queues),
+                            limit=limit,
+                            wait_seconds=self._long_poll_seconds or None,
+                        )
+                    )
+                except SyntaskHTTPStatusError as exc:
+                    if exc.response.status_code not in (
+                        status.HTTP_404_NOT_FOUND,
+                        status.HTTP_405_METHOD_NOT_ALLOWED,
+                    ):
+                        raise
+                    scheduled_flow_runs = await self._read_scheduled_flow_runs(
+                        scheduled_before
+                    )
+                    # the work pool was found, so the server is too old to claim runs
+                    self._logger.debug(
+                        "Server does not support claiming flow runs; proposing "
+                        "PENDING for each flow run instead"
+                    )
+                    self._claim_scheduled_flow_runs = False
+            else:
+                scheduled_flow_runs = await self._read_scheduled_flow_runs(
+                    scheduled_before
                 )
-            )
             self._logger.debug(
                 f"Discovered {len(scheduled_flow_runs)} scheduled_flow_runs"
             )
@@ -750,6 +810,20 @@ class BaseWorker(abc.ABC):
             # heartbeat (or an appropriate warning will be logged)
             return []
 
+    async def _read_scheduled_flow_runs(
+        self, scheduled_before: datetime.datetime
+    ) -> List["WorkerFlowRunResponse"]:
+        """
+        Retrieve scheduled flow runs from the work pool's queues without claiming them,
+        for servers that cannot claim flow runs.
+        """
+        return await self._client.get_scheduled_flow_runs_for_work_pool(
+            work_pool_name=self._work_pool_name,
+            scheduled_before=scheduled_before,
+            work_queue_names=list(self._work_queues),
+            wait_seconds=self._long_poll_seconds or None,
+        )
+
     async def _submit_scheduled_flow_runs(
         self, flow_run_response: List["WorkerFlowRunResponse"]
     ) -> List["FlowRun"]:
@@ -758,9 +832,11 @@ class BaseWorker(abc.ABC):
         for execution by the worker.
         """
         submittable_flow_runs = [entry.flow_run for entry in flow_run_response]
+        skipped_flow_runs: List["FlowRun"] = []
 
-        for flow_run in submittable_flow_runs:
+        for i, flow_run in enumerate(submittable_flow_runs):
             if flow_run.id in self._submitting_flow_run_ids:
+                skipped_flow_runs.append(flow_run)
                 continue
             try:
                 if self._limiter:
@@ -770,6 +846,7 @@ class BaseWorker(abc.ABC):
                     f"Flow run limit reached; {self._limiter.borrowed_tokens} flow runs"
                     " in progress."
                 )
+                skipped_flow_runs.extend(submittable_flow_runs[i:])
                 break
             else:
                 run_logger = self.get_flow_run_logger(flow_run)
@@ -782,6 +859,11 @@ class BaseWorker(abc.ABC):
                     flow_run,
                 )
 
+        # runs claimed for this worker that it won't submit must be released for
+        # another worker to claim
+        for flow_run in skipped_flow_runs:
+            await self._propose_scheduled_state(flow_run)
+
         return list(
             filter(
                 lambda run: run.id in self._submitting_flow_run_ids,
@@ -814,7 +896,7 @@ class BaseWorker(abc.ABC):
 
         try:
             await self._check_flow_run(flow_run)
-        except (ValueError, ObjectNotFound):
+        except (ValueError, ObjectNotFound) as exc:
             self._logger.exception(
                 (
                     "Flow run %s did not pass checks and will not be submitted for"
@@ -822,6 +904,12 @@ class BaseWorker(abc.ABC):
                 ),
                 flow_run.id,
             )
+            # A run that fails its checks would fail them again on every poll, so a
+            # claimed run is failed rather than returned to be claimed again
+            if flow_run.state and flow_run.state.is_pending():
+                await self._propose_failed_state(flow_run, exc)
+            if self._limiter:
+                self._limiter.release_on_behalf_of(flow_run.id)
             self._submitting_flow_run_ids.remove(flow_run.id)
             return
 
@@ -963,6 +1051,11 @@ class BaseWorker(abc.ABC):
     async def _propose_pending_state(self, flow_run: "FlowRun") -> bool:
         run_logger = self.get_flow_run_logger(flow_run)
         state = flow_run.state
+        if state and state.is_pending():
+            # the run was claimed for this worker, which already placed it in a
+            # PENDING state
+            return True
+
         try:
             state = await propose_state(
                 self._client, Pending(), flow_run_id=flow_run.id
@@ -992,6 +1085,29 @@ class BaseWorker(abc.ABC):
 
         return True
 
+    async def _propose_scheduled_state(self, flow_run: "FlowRun") -> None:
+        """
+        Returns a claimed flow run that will not be submitted to its scheduled state,
+        so that it is not left PENDING without any infrastructure.
+        """
+        if not (flow_run.state and flow_run.state.is_pending()):
+            return
+
+        run_logger = self.get_flow_run_logger(flow_run)
+        try:
+            await propose_state(
+                self._client,
+                Scheduled(scheduled_time=flow_run.expected_start_time),
+                flow_run_id=flow_run.id,
+            )
+        except Abort:
+            pass
+        except Exception:
+            run_logger.error(
+                f"Failed to update state of flow run '{flow_run.id}'",
+                exc_info=True,
+            )
+
     async def _propose_failed_state(self, flow_run: "FlowRun", exc: Exception) -> None:
         run_logger = self.get_flow_run_logger(flow_run)
         try:
@@ -750,6 +750,50 @@ class TestFlowRunLogs:
             expected_line_count=251,
         )
 
+    async def test_follow_shows_logs_until_flow_run_finishes(
+        self, syntask_client, monkeypatch
+    ):
+        monkeypatch.setattr("syntask.cli.flow_run.LOGS_FOLLOW_POLL_INTERVAL", 0)
+        monkeypatch.setattr("syntask.cli.flow_run.LOGS_FOLLOW_GRACE_PERIOD", 0.5)
+        flow_run = await syntask_client.create_flow_run(
+            name="finished_flow_run", flow=hello_flow, state=Completed()
+        )
+        await syntask_client.create_logs(
+            [
+                LogCreate(
+                    name="syntask.flow_runs",
+                    level=20,
+                    message=f"Log {i} from flow_run {flow_run.id}.",
+                    timestamp=DateTime.now(),
+                    flow_run_id=flow_run.id,
+                )
+                for i in range(3)
+            ]
+        )
+
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=["flow-run", "logs", str(flow_run.id), "--follow"],
+            expected_code=0,
+            expected_output_contains=[
+                f"Flow run '{flow_run.name}' - Log {i} from flow_run {flow_run.id}."
+                for i in range(3)
+            ],
+            expected_line_count=3,
+        )
+
+    async def test_follow_with_head_exits_with_error(self, flow_run_factory):
+        flow_run = await flow_run_factory(num_logs=1)
+
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=["flow-run", "logs", str(flow_run.id), "--head", "--follow"],
+            expected_code=1,
+            expected_output_contains=(
+                "The `follow` option can only be combined with the `tail` option."
+            ),
+        )
+
 
 class TestFlowRunExecute:
     @pytest.mark.usefixtures("use_hosted_api_server")
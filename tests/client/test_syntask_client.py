@@ -1,9 +1,14 @@
+import asyncio
+import contextvars
+import gc
 import json
 import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import Generator, List
-from unittest.mock import ANY, MagicMock, Mock
+from unittest.mock import ANY, MagicMock, Mock, patch
 from uuid import UUID, uuid4
 
 import anyio
@@ -23,6 +28,12 @@ import syntask.context
 import syntask.exceptions
 import syntask.server.api
 from syntask import flow, tags
+from syntask.client.base import (
+    SHARED_ASYNC_TRANSPORTS,
+    can_share_transport,
+    get_connection_pool_metrics,
+)
+from syntask.client.cache import RESPONSE_CACHE
 from syntask.client.constants import SERVER_API_VERSION
 from syntask.client.orchestration import (
     ServerType,
@@ -38,6 +49,7 @@ from syntask.client.schemas.actions import (
     GlobalConcurrencyLimitUpdate,
     LogCreate,
     VariableCreate,
+    VariableUpdate,
     WorkPoolCreate,
     WorkPoolUpdate,
 )
@@ -75,7 +87,9 @@ from syntask.settings import (
     SYNTASK_API_SSL_CERT_FILE,
     SYNTASK_API_TLS_INSECURE_SKIP_VERIFY,
     SYNTASK_API_URL,
+    SYNTASK_CLIENT_CACHE_TTL,
     SYNTASK_CLIENT_CSRF_SUPPORT_ENABLED,
+    SYNTASK_CLIENT_SHARED_CONNECTION_POOL_ENABLED,
     SYNTASK_CLOUD_API_URL,
     SYNTASK_UNIT_TEST_MODE,
     temporary_settings,
@@ -221,6 +235,202 @@ class TestClientProxyAwareness:
         assert pool._retries == 3  # set in syntask.client.orchestration.get_client()
 
 
+class TestSharedConnectionPool:
+    @pytest.fixture(autouse=True)
+    def shared_connection_pool(self):
+        with temporary_settings(
+            updates={SYNTASK_CLIENT_SHARED_CONNECTION_POOL_ENABLED: True}
+        ):
+            yield
+
+    async def test_clients_reuse_connections(self, hosted_api_server):
+        metrics = get_connection_pool_metrics(hosted_api_server)
+        requests, new_connections = metrics.requests, metrics.new_connections
+
+        async with SyntaskClient(hosted_api_server) as client:
+            await client.hello()
+        async with SyntaskClient(hosted_api_server) as client_2:
+            await client_2.hello()
+
+        assert client._client._transport is client_2._client._transport
+        assert metrics.requests - requests == 2
+        assert metrics.new_connections - new_connections <= 1
+        assert metrics.reuse_ratio > 0
+        assert metrics.connection_wait_seconds > 0
+
+    def test_sync_clients_share_connections_across_threads(self, hosted_api_server):
+        def hello():
+            with SyncSyntaskClient(hosted_api_server) as client:
+                client.hello()
+            return client._client._transport
+
+        # run in copies of this context so the threads see the temporary settings
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, hello) for _ in range(4)
+            ]
+            transports = [future.result() for future in futures]
+
+        assert all(transport is transports[0] for transport in transports)
+
+    def test_pools_of_closed_event_loops_are_released(self, hosted_api_server):
+        async def create_client():
+            client = SyntaskClient(hosted_api_server)
+            return asyncio.get_running_loop(), weakref.ref(client._client._transport)
+
+        first_loop, first_transport = asyncio.run(create_client())
+        second_loop, second_transport = asyncio.run(create_client())
+
+        assert id(first_loop) not in SHARED_ASYNC_TRANSPORTS
+        assert id(second_loop) in SHARED_ASYNC_TRANSPORTS
+        gc.collect()
+        assert first_transport() is None
+        assert second_transport() is not None
+
+    async def test_users_can_still_provide_transport(self, hosted_api_server):
+        transport = httpx.AsyncHTTPTransport()
+        client = SyntaskClient(
+            hosted_api_server, httpx_settings={"transport": transport}
+        )
+        assert client._client._transport is transport
+
+    async def test_clients_with_environment_proxies_do_not_share(
+        self, hosted_api_server, monkeypatch
+    ):
+        monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:6666")
+        client = SyntaskClient(hosted_api_server)
+
+        transport = client._client._transport_for_url(httpx.URL(hosted_api_server))
+        assert isinstance(transport._pool, httpcore.AsyncHTTPProxy)
+        assert transport._pool._retries == 3
+
+        sync_client = SyncSyntaskClient(hosted_api_server)
+        transport = sync_client._client._transport_for_url(httpx.URL(hosted_api_server))
+        assert isinstance(transport._pool, httpcore.HTTPProxy)
+
+    @pytest.mark.parametrize(
+        "httpx_settings",
+        [
+            {"proxy": "http://127.0.0.1:6666"},
+            {"proxies": {"all://": "http://127.0.0.1:6666"}},
+            {"cert": "client.pem"},
+        ],
+    )
+    def test_clients_with_proxies_or_certificates_do_not_share(self, httpx_settings):
+        # ignore any proxies set in the environment
+        httpx_settings = {"trust_env": False, **httpx_settings}
+        assert can_share_transport("http://127.0.0.1:4200/api", {"trust_env": False})
+        assert not can_share_transport("http://127.0.0.1:4200/api", httpx_settings)
+
+
+class TestClientCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        RESPONSE_CACHE.invalidate()
+        yield
+        RESPONSE_CACHE.invalidate()
+
+    async def test_cached_reads_are_not_sent_again(self, syntask_client, flow):
+        with patch.object(
+            syntask_client._client, "get", wraps=syntask_client._client.get
+        ) as get:
+            first = await syntask_client.read_flow(flow.id, use_cache=True)
+            second = await syntask_client.read_flow(flow.id, use_cache=True)
+
+        assert first == second
+        assert first is not second
+        get.assert_called_once()
+
+    async def test_reads_do_not_use_the_cache_by_default(self, syntask_client, flow):
+        with patch.object(
+            syntask_client._client, "get", wraps=syntask_client._client.get
+        ) as get:
+            await syntask_client.read_flow(flow.id, use_cache=True)
+            await syntask_client.read_flow(flow.id)
+
+        assert get.call_count == 2
+
+    async def test_expired_reads_are_revalidated(self, syntask_client, flow):
+        await syntask_client.read_flow(flow.id, use_cache=True)
+
+        with temporary_settings(updates={SYNTASK_CLIENT_CACHE_TTL: 0}):
+            with patch.object(
+                syntask_client._client, "get", wraps=syntask_client._client.get
+            ) as get:
+                cached = await syntask_client.read_flow(flow.id, use_cache=True)
+
+        assert cached.id == flow.id
+        assert get.call_args.kwargs["headers"]["If-None-Match"]
+
+    async def test_changes_invalidate_cached_reads(self, syntask_client):
+        await syntask_client.create_variable(
+            VariableCreate(name="my_variable", value="before")
+        )
+        await syntask_client.read_variable_by_name("my_variable", use_cache=True)
+
+        await syntask_client.update_variable(
+            VariableUpdate(name="my_variable", value="after")
+        )
+
+        variable = await syntask_client.read_variable_by_name(
+            "my_variable", use_cache=True
+        )
+        assert variable.value == "after"
+
+    async def test_explicit_invalidation(self, syntask_client, flow):
+        await syntask_client.read_flow(flow.id, use_cache=True)
+
+        syntask_client.invalidate_cache(f"/flows/{flow.id}")
+
+        with patch.object(
+            syntask_client._client, "get", wraps=syntask_client._client.get
+        ) as get:
+            await syntask_client.read_flow(flow.id, use_cache=True)
+
+        assert "If-None-Match" not in get.call_args.kwargs["headers"]
+
+    async def test_clients_with_different_credentials_do_not_share_reads(
+        self, syntask_client, flow
+    ):
+        await syntask_client.read_flow(flow.id, use_cache=True)
+
+        syntask_client._client.headers["Authorization"] = "Bearer another-key"
+        with patch.object(
+            syntask_client._client, "get", wraps=syntask_client._client.get
+        ) as get:
+            await syntask_client.read_flow(flow.id, use_cache=True)
+
+        get.assert_called_once()
+        assert "If-None-Match" not in get.call_args.kwargs["headers"]
+
+    async def test_posts_to_a_collection_invalidate_cached_reads(
+        self, syntask_client, flow
+    ):
+        await syntask_client.read_flow(flow.id, use_cache=True)
+
+        # creating a flow may upsert an existing one
+        await syntask_client.create_flow_from_name(flow.name)
+
+        with patch.object(
+            syntask_client._client, "get", wraps=syntask_client._client.get
+        ) as get:
+            await syntask_client.read_flow(flow.id, use_cache=True)
+
+        assert "If-None-Match" not in get.call_args.kwargs["headers"]
+
+    async def test_read_only_posts_keep_cached_reads(self, syntask_client, flow):
+        await syntask_client.read_flow(flow.id, use_cache=True)
+
+        await syntask_client.read_flows()
+
+        with patch.object(
+            syntask_client._client, "get", wraps=syntask_client._client.get
+        ) as get:
+            await syntask_client.read_flow(flow.id, use_cache=True)
+
+        get.assert_not_called()
+
+
 class TestInjectClient:
     @staticmethod
     @inject_client
@@ -1225,6 +1435,39 @@ async def test_set_then_read_task_run_state(syntask_client):
     assert run.state.message == "Test!"
 
 
+async def test_set_then_read_task_run_states_in_bulk(syntask_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar(syntask_client):
+        pass
+
+    flow_run = await syntask_client.create_flow_run(foo)
+    task_runs = [
+        await syntask_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key=str(i)
+        )
+        for i in range(3)
+    ]
+
+    responses = await syntask_client.set_task_run_states(
+        [(task_run.id, Completed(message="Test!")) for task_run in task_runs]
+    )
+
+    assert len(responses) == 3
+    for response in responses:
+        assert isinstance(response, OrchestrationResult)
+        assert response.status == SetStateStatus.ACCEPT
+
+    for task_run in task_runs:
+        run = await syntask_client.read_task_run(task_run.id)
+        assert run.state.type == StateType.COMPLETED
+        assert run.state.message == "Test!"
+        assert run.state.state_details.task_run_id == task_run.id
+
+
 async def test_create_then_read_autonomous_task_runs(syntask_client):
     @task
     def foo():
@@ -1383,6 +1626,105 @@ async def test_read_filtered_logs(session, syntask_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_stream_logs(syntask_client):
+    flow_run_id = uuid4()
+    now = DateTime.now("UTC")
+    await syntask_client.create_logs(
+        [
+            LogCreate(
+                name="syntask.flow_runs",
+                level=20,
+                message=f"Log {i}",
+                timestamp=now.add(seconds=i),
+                flow_run_id=flow_run_id,
+            )
+            for i in range(5)
+        ]
+    )
+    log_filter = LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+
+    logs = [log async for log in syntask_client.stream_logs(log_filter=log_filter)]
+    assert [log.message for log in logs] == [f"Log {i}" for i in range(5)]
+
+    logs = [
+        log
+        async for log in syntask_client.stream_logs(
+            log_filter=log_filter, after=logs[2]
+        )
+    ]
+    assert [log.message for log in logs] == ["Log 3", "Log 4"]
+
+
+async def test_stream_logs_follows_new_logs(syntask_client):
+    flow_run_id = uuid4()
+    log_filter = LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+
+    async def create_log(message: str):
+        await syntask_client.create_logs(
+            [
+                LogCreate(
+                    name="syntask.flow_runs",
+                    level=20,
+                    message=message,
+                    timestamp=DateTime.now("UTC"),
+                    flow_run_id=flow_run_id,
+                )
+            ]
+        )
+
+    await create_log("first")
+
+    messages = []
+    async for log in syntask_client.stream_logs(
+        log_filter=log_filter, follow=True, poll_interval=0.01
+    ):
+        messages.append(log.message)
+        if len(messages) == 1:
+            await create_log("second")
+        else:
+            break
+
+    assert messages == ["first", "second"]
+
+
+async def test_stream_logs_follows_logs_that_arrive_late(syntask_client):
+    flow_run_id = uuid4()
+    log_filter = LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+    now = DateTime.now("UTC")
+
+    async def create_log(message: str, timestamp: DateTime):
+        await syntask_client.create_logs(
+            [
+                LogCreate(
+                    name="syntask.flow_runs",
+                    level=20,
+                    message=message,
+                    timestamp=timestamp,
+                    flow_run_id=flow_run_id,
+                )
+            ]
+        )
+
+    await create_log("first", now)
+    await create_log("second", now.add(seconds=2))
+
+    messages = []
+    async for log in syntask_client.stream_logs(
+        log_filter=log_filter, follow=True, poll_interval=0.01
+    ):
+        messages.append(log.message)
+        if len(messages) == 2:
+            # Written before the newest log streamed, but only received now
+            await create_log("late", now.add(seconds=1))
+            # Too late to be included
+            await create_log("too late", now.subtract(seconds=10))
+            await create_log("third", now.add(seconds=3))
+        elif len(messages) == 4:
+            break
+
+    assert messages == ["first", "second", "late", "third"]
+
+
 async def test_syntask_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={SYNTASK_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
@@ -1946,6 +2288,26 @@ class TestWorkPools:
         with pytest.raises(syntask.exceptions.ObjectNotFound):
             await syntask_client.read_work_pool(work_pool.id)
 
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "get_scheduled_flow_runs_for_work_pool",
+            "claim_scheduled_flow_runs_for_work_pool",
+        ],
+    )
+    async def test_long_polls_extend_the_read_timeout(
+        self, syntask_client, work_pool, monkeypatch, method
+    ):
+        post = AsyncMock(return_value=httpx.Response(200, json=[]))
+        monkeypatch.setattr(syntask_client._client, "post", post)
+        read_timeout = syntask_client._client.timeout.read
+
+        await getattr(syntask_client, method)(work_pool.name, wait_seconds=30)
+        assert post.call_args.kwargs["timeout"].read == read_timeout + 30
+
+        await getattr(syntask_client, method)(work_pool.name)
+        assert post.call_args.kwargs["timeout"].read == read_timeout
+
 
 class TestArtifacts:
     @pytest.fixture
@@ -9,6 +9,7 @@ from syntask.events import Event, get_events_client
 from syntask.events.clients import (
     SyntaskCloudEventsClient,
     SyntaskEventsClient,
+    encode_events_batch,
     get_events_subscriber,
 )
 from syntask.settings import (
@@ -175,6 +176,78 @@ async def test_reconnects_and_resends_after_hard_disconnect(
     ]
 
 
+@pytest.mark.parametrize("compress_batches", [False, True])
+async def test_emits_a_batch_in_one_message(
+    Client: Type[SyntaskEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+    compress_batches: bool,
+):
+    async with Client(compress_batches=compress_batches) as client:
+        await client.emit_batch([example_event_1, example_event_2, example_event_3])
+
+    assert recorder.messages == 1
+    assert recorder.events == [example_event_1, example_event_2, example_event_3]
+
+
+@pytest.mark.parametrize("compress_batches", [False, True])
+async def test_splits_batches_larger_than_the_maximum_size(
+    Client: Type[SyntaskEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+    compress_batches: bool,
+):
+    events = [example_event_1, example_event_2, example_event_3]
+    # room for the first two events, but not the third
+    max_batch_bytes = len(encode_events_batch(events[:2]).encode()) + 1
+
+    async with Client(
+        compress_batches=compress_batches, max_batch_bytes=max_batch_bytes
+    ) as client:
+        await client.emit_batch(events)
+
+    assert recorder.messages == 2
+    assert recorder.events == events
+
+
+async def test_reconnects_and_resends_batches_after_hard_disconnect(
+    Client: Type[SyntaskEventsClient],
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    example_event_4: Event,
+    example_event_5: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+):
+    client = Client(checkpoint_every=1)
+    async with client:
+        assert recorder.connections == 1
+
+        await client.emit_batch([example_event_1])
+
+        puppeteer.hard_disconnect_after = example_event_2.id
+        await client.emit_batch([example_event_2])
+
+        await client.emit_batch([example_event_3, example_event_4])
+        await client.emit_batch([example_event_5])
+
+    assert recorder.connections == 2
+    assert recorder.events == [
+        example_event_1,
+        example_event_2,
+        example_event_3,
+        example_event_4,
+        example_event_3,  # resent due to the hard disconnect after event 2
+        example_event_4,
+        example_event_5,
+    ]
+
+
 @pytest.mark.parametrize("attempts", [4, 1, 0])
 async def test_gives_up_after_a_certain_amount_of_tries(
     Client: Type[SyntaskEventsClient],
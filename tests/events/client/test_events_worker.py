@@ -1,4 +1,5 @@
 import uuid
+from unittest import mock
 
 import pytest
 
@@ -12,6 +13,8 @@ from syntask.events.clients import (
 from syntask.events.worker import EventsWorker
 from syntask.settings import (
     SYNTASK_API_URL,
+    SYNTASK_EVENTS_CLIENT_BATCH_COMPRESSION_ENABLED,
+    SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED,
     temporary_settings,
 )
 
@@ -33,6 +36,52 @@ def test_emits_event_via_client(asserting_events_worker: EventsWorker, event: Ev
     assert asserting_events_worker._client.events == [event]
 
 
+def test_emits_events_in_batches_via_client(event: Event):
+    events = [Event(event=event.event, resource=event.resource.root) for _ in range(3)]
+    with temporary_settings(updates={SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED: True}):
+        with mock.patch.object(
+            AssertingEventsClient, "_emit_batch", autospec=True
+        ) as emit_batch:
+            emit_batch.side_effect = lambda client, batch: client.events.extend(batch)
+
+            worker = EventsWorker.instance(AssertingEventsClient)
+            for event in events:
+                worker.send(event)
+            worker.drain()
+
+    assert worker._client.events == events
+    assert emit_batch.call_count < len(events)
+
+
+def test_forgets_contexts_of_a_batch_that_fails(event: Event):
+    events = [Event(event=event.event, resource=event.resource.root) for _ in range(3)]
+    with temporary_settings(updates={SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED: True}):
+        with mock.patch.object(
+            EventsWorker,
+            "attach_related_resources_from_context",
+            side_effect=ValueError("woops"),
+        ):
+            worker = EventsWorker.instance(AssertingEventsClient)
+            for event in events:
+                worker.send(event)
+            worker.drain()
+
+    assert worker._context_cache == {}
+
+
+def test_worker_instance_compresses_batches_when_enabled():
+    with temporary_settings(
+        updates={
+            SYNTASK_API_URL: "http://localhost:8080/api",
+            SYNTASK_EVENTS_CLIENT_BATCHING_ENABLED: True,
+            SYNTASK_EVENTS_CLIENT_BATCH_COMPRESSION_ENABLED: True,
+        }
+    ):
+        worker = EventsWorker.instance()
+        assert worker.client_type == SyntaskEventsClient
+        assert dict(worker.client_options) == {"compress_batches": True}
+
+
 def test_worker_instance_server_client_non_cloud_api_url():
     with temporary_settings(updates={SYNTASK_API_URL: "http://localhost:8080/api"}):
         worker = EventsWorker.instance()
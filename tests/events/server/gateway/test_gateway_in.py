@@ -1,3 +1,4 @@
+import zlib
 from typing import Tuple
 from unittest import mock
 
@@ -5,11 +6,17 @@ import pendulum
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
+from starlette.status import WS_1009_MESSAGE_TOO_BIG
 from starlette.testclient import WebSocketTestSession
+from starlette.websockets import WebSocketDisconnect
 
 from syntask.server.events import messaging
 from syntask.server.events.schemas.events import Event
 from syntask.server.events.storage import database
+from syntask.settings import (
+    SYNTASK_EVENTS_MAXIMUM_BATCH_SIZE_BYTES,
+    temporary_settings,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -63,6 +70,51 @@ def test_stream_events_in(
     stream_publish.assert_has_awaits([mock.call(event) for event in server_events])
 
 
+def test_stream_batches_of_events_in(
+    test_client: TestClient,
+    frozen_time: pendulum.DateTime,
+    event1: Event,
+    event2: Event,
+    stream_publish: mock.AsyncMock,
+):
+    batch = f"[{event1.model_dump_json()},{event2.model_dump_json()}]"
+
+    websocket: WebSocketTestSession
+    with test_client.websocket_connect("/api/events/in") as websocket:
+        websocket.send_text(batch)
+        websocket.send_bytes(zlib.compress(batch.encode()))
+
+    server_events = [
+        event1.receive(received=frozen_time),
+        event2.receive(received=frozen_time),
+    ]
+    stream_publish.assert_has_awaits([mock.call(event) for event in server_events * 2])
+
+
+def test_stream_events_in_rejects_oversized_batches(
+    test_client: TestClient,
+    event1: Event,
+    event2: Event,
+    stream_publish: mock.AsyncMock,
+):
+    batch = f"[{event1.model_dump_json()},{event2.model_dump_json()}]"
+    # Highly compressible padding stands in for a compression bomb
+    bomb = zlib.compress(batch.encode() + b" " * 10_000_000)
+    assert len(bomb) < 20_000
+
+    with temporary_settings(
+        {SYNTASK_EVENTS_MAXIMUM_BATCH_SIZE_BYTES: len(batch) + 100}
+    ):
+        websocket: WebSocketTestSession
+        with test_client.websocket_connect("/api/events/in") as websocket:
+            websocket.send_bytes(bomb)
+            with pytest.raises(WebSocketDisconnect) as exc:
+                websocket.receive_text()
+
+    assert exc.value.code == WS_1009_MESSAGE_TOO_BIG
+    stream_publish.assert_not_awaited()
+
+
 def test_post_events(
     test_client: TestClient,
     frozen_time: pendulum.DateTime,
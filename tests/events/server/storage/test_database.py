@@ -21,6 +21,12 @@ from syntask.server.events.storage.database import (
     read_events,
     write_events,
 )
+from syntask.server.utilities.database import get_dialect
+from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
+    SYNTASK_API_SERVICES_EVENT_PERSISTER_COPY_ENABLED,
+    temporary_settings,
+)
 
 
 @pytest.fixture
@@ -166,6 +172,123 @@ class TestWriteEvents:
                 assert len(list(results)) == len(event.related) + 1
 
 
+class TestCopyEvents:
+    @pytest.fixture(autouse=True)
+    def copy_enabled(self):
+        dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
+        if dialect.name != "postgresql":
+            pytest.skip("COPY is only used with PostgreSQL")
+
+        with temporary_settings(
+            {SYNTASK_API_SERVICES_EVENT_PERSISTER_COPY_ENABLED: True}
+        ):
+            yield
+
+    async def test_copy_event(
+        self, session: AsyncSession, db: SyntaskDBInterface, event: ReceivedEvent
+    ):
+        async with session as session:
+            await write_events(session=session, events=[event])
+            await session.commit()
+
+        async with session as session:
+            events = await read_events(
+                session=session,
+                events_filter=EventFilter(
+                    id=EventIDFilter(id=[event.id]),
+                    occurred=EventOccurredFilter(
+                        since=pendulum.now("UTC").subtract(days=1)
+                    ),
+                ),
+            )
+            assert len(events) == 1
+            assert ReceivedEvent.model_validate(events[0]) == event
+
+            results = await session.execute(
+                sa.select(db.EventResource).where(db.EventResource.event_id == event.id)
+            )
+            resources = list(results.scalars())
+            assert {(r.resource_id, r.resource_role) for r in resources} == {
+                ("my.resource.id", ""),
+                ("related-1", "role-1"),
+                ("related-2", "role-1"),
+                ("related-3", "role-2"),
+            }
+
+    async def test_copy_events_ignores_duplicates(
+        self,
+        session: AsyncSession,
+        db: SyntaskDBInterface,
+        event: ReceivedEvent,
+        other_events: List[ReceivedEvent],
+    ):
+        chunks = (other_events[:500], other_events[500:])
+
+        for chunk in chunks:
+            # Include the event twice in each batch of other events
+            events = [event] + chunk[:250] + [event] + chunk[250:]
+
+            async with session as session:
+                await write_events(session=session, events=events)
+                await session.commit()
+
+        async with session as session:
+            results = await session.execute(
+                sa.select(db.Event).where(db.Event.id == event.id)
+            )
+            assert len(list(results)) == 1
+
+            results = await session.execute(
+                sa.select(db.EventResource).where(db.EventResource.event_id == event.id)
+            )
+            assert len(list(results)) == len(event.related) + 1
+
+    async def test_copy_events_in_one_batch(
+        self,
+        session: AsyncSession,
+        db: SyntaskDBInterface,
+        other_events: List[ReceivedEvent],
+    ):
+        async with session as session:
+            await write_events(session=session, events=other_events)
+            await session.commit()
+
+        async with session as session:
+            event_ids = [event.id for event in other_events]
+            result = await session.execute(
+                sa.select(sa.func.count())
+                .select_from(db.Event)
+                .where(db.Event.id.in_(event_ids))
+            )
+            assert result.scalar() == len(other_events)
+
+            result = await session.execute(
+                sa.select(sa.func.count())
+                .select_from(db.EventResource)
+                .where(db.EventResource.event_id.in_(event_ids))
+            )
+            assert result.scalar() == 4 * len(other_events)
+
+    async def test_copy_events_twice_in_one_transaction(
+        self,
+        session: AsyncSession,
+        db: SyntaskDBInterface,
+        other_events: List[ReceivedEvent],
+    ):
+        async with session as session:
+            await write_events(session=session, events=other_events[:10])
+            await write_events(session=session, events=other_events[10:20])
+            await session.commit()
+
+        async with session as session:
+            result = await session.execute(
+                sa.select(sa.func.count())
+                .select_from(db.EventResource)
+                .where(db.EventResource.event_id.in_([e.id for e in other_events[:20]]))
+            )
+            assert result.scalar() == 4 * 20
+
+
 class TestReadEvents:
     @pytest.fixture
     async def event_1(self, session: AsyncSession) -> ReceivedEvent:
@@ -16,7 +16,11 @@ from syntask.server.events.schemas.events import ReceivedEvent
 from syntask.server.events.services import event_persister
 from syntask.server.events.storage.database import query_events, write_events
 from syntask.server.utilities.messaging import CapturedMessage, Message, MessageHandler
-from syntask.settings import SYNTASK_EVENTS_RETENTION_PERIOD, temporary_settings
+from syntask.settings import (
+    SYNTASK_API_SERVICES_EVENT_RETENTION_ENABLED,
+    SYNTASK_EVENTS_RETENTION_PERIOD,
+    temporary_settings,
+)
 
 if TYPE_CHECKING:
     from syntask.server.database.orm_models import ORMEventResource
@@ -321,7 +325,12 @@ async def test_trims_messages_periodically(
     assert any(event.occurred < five_days_ago for event in initial_events)
     assert any(event.occurred >= five_days_ago for event in initial_events)
 
-    with temporary_settings({SYNTASK_EVENTS_RETENTION_PERIOD: timedelta(days=5)}):
+    with temporary_settings(
+        {
+            SYNTASK_EVENTS_RETENTION_PERIOD: timedelta(days=5),
+            SYNTASK_API_SERVICES_EVENT_RETENTION_ENABLED: False,
+        }
+    ):
         async with event_persister.create_handler(
             flush_every=timedelta(seconds=0.001),
             trim_every=timedelta(seconds=0.001),
@@ -0,0 +1,257 @@
+from typing import List
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from syntask.server.database.interface import SyntaskDBInterface
+from syntask.server.events.counting import Countable, TimeUnit
+from syntask.server.events.filters import (
+    EventAnyResourceFilter,
+    EventFilter,
+    EventOccurredFilter,
+    EventResourceFilter,
+)
+from syntask.server.events.schemas.events import ReceivedEvent
+from syntask.server.events.storage.database import count_events, write_events
+from syntask.server.events.storage.rollups import (
+    bucket_start,
+    rollup_where_clauses,
+    split_span,
+    trim_event_rollups,
+)
+
+
+@pytest.fixture
+def hour() -> pendulum.DateTime:
+    return pendulum.now("UTC").subtract(days=2).start_of("hour")
+
+
+def make_event(occurred, event="hello", resource_id="my.resource", **labels):
+    return ReceivedEvent(
+        occurred=occurred,
+        event=event,
+        resource={"syntask.resource.id": resource_id, **labels},
+        payload={},
+        id=uuid4(),
+    )
+
+
+@pytest.fixture
+def events(hour: pendulum.DateTime) -> List[ReceivedEvent]:
+    return [
+        make_event(hour.add(minutes=1), **{"syntask.resource.name": "old name"}),
+        make_event(hour.add(minutes=1, seconds=30), event="goodbye"),
+        make_event(hour.add(minutes=2), **{"syntask.resource.name": "new name"}),
+        make_event(hour.add(minutes=3), resource_id="other.resource"),
+    ]
+
+
+async def read_rollups(db: SyntaskDBInterface, session: AsyncSession, unit: str):
+    result = await session.execute(
+        sa.select(db.EventRollup)
+        .where(db.EventRollup.unit == unit)
+        .order_by(
+            db.EventRollup.bucket, db.EventRollup.event, db.EventRollup.resource_id
+        )
+    )
+    return result.scalars().all()
+
+
+def test_bucket_start():
+    moment = pendulum.datetime(2024, 10, 16, 13, 45, 12, 5, tz="UTC")
+    assert bucket_start(moment, "minute") == pendulum.datetime(
+        2024, 10, 16, 13, 45, tz="UTC"
+    )
+    assert bucket_start(moment, "hour") == pendulum.datetime(2024, 10, 16, 13, tz="UTC")
+
+
+def test_split_span_prefers_coarser_units():
+    start = pendulum.datetime(2024, 10, 16, 13, 45, 12, tz="UTC")
+    end = pendulum.datetime(2024, 10, 16, 16, 48, 12, tz="UTC")
+
+    def at(hour: int, minute: int) -> pendulum.DateTime:
+        return pendulum.datetime(2024, 10, 16, hour, minute, tz="UTC")
+
+    assert split_span(start, end, ["hour", "minute"]) == [
+        (None, start, at(13, 46)),
+        ("minute", at(13, 46), at(14, 0)),
+        ("hour", at(14, 0), at(16, 0)),
+        ("minute", at(16, 0), at(16, 48)),
+        (None, at(16, 48), end),
+    ]
+
+
+def test_split_span_without_whole_buckets():
+    start = pendulum.datetime(2024, 10, 16, 13, 45, 12, tz="UTC")
+    end = start.add(seconds=30)
+
+    assert split_span(start, end, ["hour", "minute"]) == [(None, start, end)]
+
+
+async def test_writing_events_writes_rollups(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    events: List[ReceivedEvent],
+    hour: pendulum.DateTime,
+):
+    await write_events(session, events)
+
+    hourly = await read_rollups(db, session, "hour")
+    assert [
+        (r.bucket, r.event, r.resource_id, r.resource_label, r.count) for r in hourly
+    ] == [
+        (hour, "goodbye", "my.resource", "my.resource", 1),
+        (hour, "hello", "my.resource", "new name", 2),
+        (hour, "hello", "other.resource", "other.resource", 1),
+    ]
+    assert hourly[1].oldest == hour.add(minutes=1)
+    assert hourly[1].latest == hour.add(minutes=2)
+
+    minutely = await read_rollups(db, session, "minute")
+    assert [(r.bucket, r.event, r.resource_id, r.count) for r in minutely] == [
+        (hour.add(minutes=1), "goodbye", "my.resource", 1),
+        (hour.add(minutes=1), "hello", "my.resource", 1),
+        (hour.add(minutes=2), "hello", "my.resource", 1),
+        (hour.add(minutes=3), "hello", "other.resource", 1),
+    ]
+
+
+async def test_rollups_accumulate_across_writes(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    events: List[ReceivedEvent],
+    hour: pendulum.DateTime,
+):
+    await write_events(session, events[2:])
+    await write_events(session, events[:2])
+
+    hourly = await read_rollups(db, session, "hour")
+    hello = next(
+        r for r in hourly if (r.event, r.resource_id) == ("hello", "my.resource")
+    )
+    assert hello.count == 2
+    assert hello.oldest == hour.add(minutes=1)
+    # the label is taken from the latest event, not the latest write
+    assert hello.resource_label == "new name"
+
+
+async def test_duplicate_events_are_not_counted_twice(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    events: List[ReceivedEvent],
+):
+    await write_events(session, events)
+    await write_events(session, events)
+
+    hourly = await read_rollups(db, session, "hour")
+    assert sum(r.count for r in hourly) == len(events)
+
+
+async def test_trimming_keeps_partly_expired_rollups(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    events: List[ReceivedEvent],
+    hour: pendulum.DateTime,
+):
+    await write_events(session, events)
+
+    await trim_event_rollups(session, older_than=hour.add(minutes=2, seconds=30))
+
+    assert len(await read_rollups(db, session, "hour")) == 3
+    assert [r.bucket for r in await read_rollups(db, session, "minute")] == [
+        hour.add(minutes=2),
+        hour.add(minutes=3),
+    ]
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [
+        EventFilter(any_resource=EventAnyResourceFilter(id=["my.resource"])),
+        EventFilter(resource=EventResourceFilter(labels={"hello": "world"})),
+        EventFilter(resource=EventResourceFilter(distinct=True)),
+    ],
+)
+def test_filters_the_rollups_cannot_answer(filter: EventFilter):
+    assert rollup_where_clauses(filter) is None
+
+
+async def test_counts_are_answered_from_rollups(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    events: List[ReceivedEvent],
+    hour: pendulum.DateTime,
+):
+    await write_events(session, events)
+
+    # with the events themselves gone, only the rollups can answer
+    await session.execute(sa.delete(db.Event))
+
+    counts = await count_events(
+        session=session,
+        filter=EventFilter(
+            occurred=EventOccurredFilter(since=hour, until=hour.add(hours=1)),
+            resource=EventResourceFilter(id=["my.resource"]),
+        ),
+        countable=Countable.event,
+        time_unit=TimeUnit.day,
+        time_interval=1.0,
+    )
+
+    assert [(c.value, c.label, c.count) for c in counts] == [
+        ("hello", "hello", 2),
+        ("goodbye", "goodbye", 1),
+    ]
+    assert counts[0].start_time == hour.add(minutes=1)
+    assert counts[0].end_time == hour.add(minutes=2)
+
+
+async def test_counts_fall_back_to_events_for_other_filters(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    events: List[ReceivedEvent],
+    hour: pendulum.DateTime,
+):
+    await write_events(session, events)
+    await session.execute(sa.delete(db.Event))
+
+    counts = await count_events(
+        session=session,
+        filter=EventFilter(
+            occurred=EventOccurredFilter(since=hour, until=hour.add(hours=1)),
+            any_resource=EventAnyResourceFilter(id=["my.resource"]),
+        ),
+        countable=Countable.event,
+        time_unit=TimeUnit.day,
+        time_interval=1.0,
+    )
+
+    assert counts == []
+
+
+async def test_counts_by_resource_use_the_latest_label(
+    session: AsyncSession,
+    events: List[ReceivedEvent],
+    hour: pendulum.DateTime,
+):
+    await write_events(session, events)
+
+    counts = await count_events(
+        session=session,
+        filter=EventFilter(
+            occurred=EventOccurredFilter(
+                since=hour.add(seconds=30), until=hour.add(hours=2)
+            ),
+        ),
+        countable=Countable.resource,
+        time_unit=TimeUnit.day,
+        time_interval=1.0,
+    )
+
+    assert [(c.value, c.label, c.count) for c in counts] == [
+        ("my.resource", "new name", 3),
+        ("other.resource", "other.resource", 1),
+    ]
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 from typing import Callable, List, Optional, Union
 from unittest import mock
@@ -17,6 +18,7 @@ from syntask.server.events.schemas.automations import (
     TriggerState,
 )
 from syntask.server.events.schemas.events import ReceivedEvent, matches
+from syntask.server.utilities.messaging.memory import MemoryMessage
 from syntask.settings import SYNTASK_EVENTS_EXPIRED_BUCKET_BUFFER
 
 
@@ -292,6 +294,214 @@ async def test_reactive_automation_does_not_trigger_if_threshold_not_met(
     act.assert_not_awaited()
 
 
+async def test_batched_reactive_evaluation_triggers_as_soon_as_it_can(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    act: mock.AsyncMock,
+    assert_acted_with: Callable[[Union[Firing, List[Firing]]], None],
+    frozen_time: DateTime,
+):
+    events = [
+        woodchonk_walked.model_copy(
+            update={
+                "id": uuid4(),
+                "occurred": woodchonk_walked.occurred + timedelta(seconds=i),
+            }
+        )
+        for i in range(3)
+    ]
+
+    await triggers.reactive_evaluation_batch(events)
+
+    # it fires on the third event, because the threshold of > 2 has been met
+    assert_acted_with(
+        Firing(
+            trigger=chonk_party.trigger,
+            trigger_states={TriggerState.Triggered},
+            triggered=frozen_time,  # type: ignore
+            triggering_labels={},
+            triggering_event=events[2],
+        ),
+    )
+
+
+async def test_batched_reactive_evaluation_writes_held_increments(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    automations_session: AsyncSession,
+    act: mock.AsyncMock,
+):
+    trigger = chonk_party.trigger
+    assert isinstance(trigger, EventTrigger), repr(trigger)
+
+    first = woodchonk_walked.model_copy(update={"id": uuid4()})
+    second = woodchonk_walked.model_copy(
+        update={"id": uuid4(), "occurred": first.occurred + timedelta(seconds=1)}
+    )
+
+    # the same event delivered twice in a batch is only counted once
+    await triggers.reactive_evaluation_batch([first, second, second])
+    act.assert_not_awaited()
+
+    bucketing_key = trigger.bucketing_key(first)
+    bucket = await triggers.read_bucket(automations_session, trigger, bucketing_key)
+    assert bucket
+    assert bucket.count == 2
+    assert bucket.last_event == second
+
+
+async def test_batched_increments_are_counted_when_a_failed_batch_is_redelivered(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    automations_session: AsyncSession,
+    act: mock.AsyncMock,
+):
+    trigger = chonk_party.trigger
+    assert isinstance(trigger, EventTrigger), repr(trigger)
+
+    first = woodchonk_walked.model_copy(update={"id": uuid4()})
+    second = woodchonk_walked.model_copy(
+        update={"id": uuid4(), "occurred": first.occurred + timedelta(seconds=1)}
+    )
+    messages = [
+        MemoryMessage(
+            data=event.model_dump_json().encode(),
+            attributes={"id": str(event.id)},
+        )
+        for event in [first, second]
+    ]
+
+    lock_bucket = triggers.lock_bucket
+    failures = [ValueError("woops")]
+
+    async def lock_bucket_failing_once(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return await lock_bucket(*args, **kwargs)
+
+    with mock.patch(
+        "syntask.server.events.triggers.lock_bucket", lock_bucket_failing_once
+    ):
+        async with triggers.consumer(
+            periodic_granularity=timedelta(hours=1),
+            batch_size=2,
+            flush_every=timedelta(hours=1),
+        ) as handler:
+            # the first event starts the bucket, while the increment for the second
+            # is held in the batch and fails to be written
+            results = await asyncio.gather(
+                *(handler(message) for message in messages),
+                return_exceptions=True,
+            )
+            assert [type(result) for result in results] == [ValueError, ValueError]
+
+        async with triggers.consumer(
+            periodic_granularity=timedelta(hours=1),
+            batch_size=2,
+            flush_every=timedelta(milliseconds=1),
+        ) as handler:
+            # when the batch is delivered again, the first event has already been
+            # counted, but the second must be counted now
+            await asyncio.wait_for(
+                asyncio.gather(*(handler(message) for message in messages)),
+                timeout=5,
+            )
+
+    act.assert_not_awaited()
+
+    bucketing_key = trigger.bucketing_key(first)
+    bucket = await triggers.read_bucket(automations_session, trigger, bucketing_key)
+    assert bucket
+    assert bucket.count == 2
+    assert bucket.last_event == second
+
+
+async def test_batched_increments_fire_when_other_writers_reach_the_threshold(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    automations_session: AsyncSession,
+    act: mock.AsyncMock,
+    assert_acted_with: Callable[[Union[Firing, List[Firing]]], None],
+    frozen_time: DateTime,
+):
+    trigger = chonk_party.trigger
+    assert isinstance(trigger, EventTrigger), repr(trigger)
+
+    first = woodchonk_walked.model_copy(update={"id": uuid4()})
+    second = woodchonk_walked.model_copy(
+        update={"id": uuid4(), "occurred": first.occurred + timedelta(seconds=1)}
+    )
+    bucketing_key = trigger.bucketing_key(first)
+
+    batch = triggers.BucketBatch()
+    await triggers.reactive_evaluation(first, batch=batch)
+    await triggers.reactive_evaluation(second, batch=batch)
+
+    # another consumer counts an event after the batch has read the bucket
+    async with automations_session.begin():
+        bucket = await triggers.read_bucket(automations_session, trigger, bucketing_key)
+        assert bucket
+        await triggers.increment_bucket(automations_session, bucket, 1, None)
+
+    act.assert_not_awaited()
+
+    await batch.flush()
+
+    assert_acted_with(
+        Firing(
+            trigger=chonk_party.trigger,
+            trigger_states={TriggerState.Triggered},
+            triggered=frozen_time,  # type: ignore
+            triggering_labels={},
+            triggering_event=second,
+        ),
+    )
+
+
+async def test_batched_increments_are_evaluated_again_when_the_bucket_moves(
+    effective_automations,
+    chonk_party: Automation,
+    woodchonk_walked: ReceivedEvent,
+    automations_session: AsyncSession,
+    act: mock.AsyncMock,
+):
+    trigger = chonk_party.trigger
+    assert isinstance(trigger, EventTrigger), repr(trigger)
+
+    first = woodchonk_walked.model_copy(update={"id": uuid4()})
+    second = woodchonk_walked.model_copy(
+        update={"id": uuid4(), "occurred": first.occurred + timedelta(seconds=1)}
+    )
+    bucketing_key = trigger.bucketing_key(first)
+
+    batch = triggers.BucketBatch()
+    await triggers.reactive_evaluation(first, batch=batch)
+    await triggers.reactive_evaluation(second, batch=batch)
+
+    # another consumer starts the next window after the batch has read the bucket,
+    # which the second event is too early to count towards
+    async with automations_session.begin():
+        await triggers.start_new_bucket(
+            automations_session,
+            trigger,
+            bucketing_key=bucketing_key,
+            start=second.occurred + timedelta(seconds=1),
+            end=second.occurred + timedelta(seconds=1) + trigger.within,
+            count=0,
+        )
+
+    await batch.flush()
+
+    act.assert_not_awaited()
+    bucket = await triggers.read_bucket(automations_session, trigger, bucketing_key)
+    assert bucket
+    assert bucket.count == 0
+
+
 async def test_reactive_automation_triggers_immediately_even_if_event_matches_after(
     effective_automations,
     woodchonk_table_for_one: ReceivedEvent,
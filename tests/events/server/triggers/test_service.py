@@ -373,6 +373,128 @@ async def test_only_processes_event_once(
     reactive_evaluation.assert_awaited_once_with(event)
 
 
+async def test_batches_events_by_size(
+    start_of_test: DateTime,
+    cleared_buckets: None,
+    effective_automations,
+    reactive_evaluation: mock.AsyncMock,
+):
+    events = [
+        ReceivedEvent(
+            occurred=start_of_test,
+            event="things.happened",
+            resource={"syntask.resource.id": "something"},
+            id=uuid4(),
+        )
+        for _ in range(3)
+    ]
+
+    async with triggers.consumer(
+        periodic_granularity=timedelta(seconds=0.0001),
+        batch_size=3,
+        flush_every=timedelta(hours=1),
+    ) as handler:
+        handled = [
+            asyncio.create_task(
+                handler(
+                    MemoryMessage(
+                        data=event.model_dump_json().encode(),
+                        attributes={"id": str(event.id)},
+                    )
+                )
+            )
+            for event in events[:2]
+        ]
+        await asyncio.sleep(0.1)
+
+        # the messages aren't acknowledged until their batch has been evaluated
+        reactive_evaluation.assert_not_awaited()
+        assert not any(task.done() for task in handled)
+
+        await handler(
+            MemoryMessage(
+                data=events[2].model_dump_json().encode(),
+                attributes={"id": str(events[2].id)},
+            )
+        )
+        await asyncio.gather(*handled)
+
+        assert reactive_evaluation.await_args_list == [
+            mock.call(event, batch=mock.ANY) for event in events
+        ]
+
+
+async def test_batches_events_by_interval(
+    start_of_test: DateTime,
+    cleared_buckets: None,
+    effective_automations,
+    reactive_evaluation: mock.AsyncMock,
+):
+    event = ReceivedEvent(
+        occurred=start_of_test,
+        event="things.happened",
+        resource={"syntask.resource.id": "something"},
+        id=uuid4(),
+    )
+
+    async with triggers.consumer(
+        periodic_granularity=timedelta(seconds=0.0001),
+        batch_size=100,
+        flush_every=timedelta(milliseconds=1),
+    ) as handler:
+        await asyncio.wait_for(
+            handler(
+                MemoryMessage(
+                    data=event.model_dump_json().encode(),
+                    attributes={"id": str(event.id)},
+                )
+            ),
+            timeout=5,
+        )
+
+        reactive_evaluation.assert_awaited_once_with(event, batch=mock.ANY)
+
+
+async def test_batched_handler_raises_when_its_batch_fails(
+    start_of_test: DateTime,
+    cleared_buckets: None,
+    effective_automations,
+    reactive_evaluation: mock.AsyncMock,
+):
+    reactive_evaluation.side_effect = ValueError("woops")
+
+    events = [
+        ReceivedEvent(
+            occurred=start_of_test,
+            event="things.happened",
+            resource={"syntask.resource.id": "something"},
+            id=uuid4(),
+        )
+        for _ in range(2)
+    ]
+
+    async with triggers.consumer(
+        periodic_granularity=timedelta(seconds=0.0001),
+        batch_size=2,
+        flush_every=timedelta(hours=1),
+    ) as handler:
+        results = await asyncio.gather(
+            *(
+                handler(
+                    MemoryMessage(
+                        data=event.model_dump_json().encode(),
+                        attributes={"id": str(event.id)},
+                    )
+                )
+                for event in events
+            ),
+            return_exceptions=True,
+        )
+
+    # both messages are left unacknowledged so that they are delivered again
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
 async def test_periodic_evaluation_continues_event_if_it_raises(
     periodic_evaluation: mock.AsyncMock,
 ):
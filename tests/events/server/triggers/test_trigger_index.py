@@ -0,0 +1,171 @@
+from datetime import timedelta
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from syntask.server.events import actions, triggers
+from syntask.server.events.schemas.automations import (
+    Automation,
+    EventTrigger,
+    Posture,
+)
+from syntask.server.events.schemas.events import ReceivedEvent
+from syntask.server.events.trigger_index import TriggerIndex
+
+
+def trigger(**kwargs: Any) -> EventTrigger:
+    return EventTrigger(posture=Posture.Reactive, threshold=1, **kwargs)
+
+
+def event(
+    name: str, resource: Dict[str, str], related: List[Dict[str, str]] = []
+) -> ReceivedEvent:
+    return ReceivedEvent(
+        occurred=pendulum.now("UTC"),
+        event=name,
+        resource=resource,
+        related=related,
+        id=uuid4(),
+    )
+
+
+TRIGGERS = [
+    trigger(),
+    trigger(expect={"stuff.happened"}),
+    trigger(expect={"stuff.*"}),
+    trigger(expect={"stuff.happened"}, after={"other.*"}),
+    trigger(expect={"*"}),
+    trigger(match={"syntask.resource.id": "foo"}),
+    trigger(match={"syntask.resource.id": ["foo", "bar"]}),
+    trigger(match={"syntask.resource.id": "fo*"}),
+    trigger(match={"syntask.resource.id": "!foo"}),
+    trigger(match={"syntask.resource.id": "*"}),
+    trigger(match={"hello": "world", "syntask.resource.id": "b*"}),
+    trigger(expect={"stuff.happened"}, match={"syntask.resource.id": "foo"}),
+    trigger(expect={"stuff.*"}, match={"hello": "world*"}),
+    trigger(match_related={"syntask.resource.role": "flow"}),
+    trigger(match_related={"syntask.resource.id": "related.*"}),
+    trigger(
+        match={"syntask.resource.id": "foo"},
+        match_related={"syntask.resource.role": "flow"},
+    ),
+]
+
+EVENTS = [
+    event("stuff.happened", {"syntask.resource.id": "foo"}),
+    event("stuff.happened.again", {"syntask.resource.id": "bar"}),
+    event("stuff.happenedish", {"syntask.resource.id": "food", "hello": "world"}),
+    event("other.thing", {"syntask.resource.id": "baz", "hello": "worldly"}),
+    event("stuff", {"syntask.resource.id": "foo"}),
+    event(
+        "nothing.related",
+        {"syntask.resource.id": "qux"},
+        [
+            {
+                "syntask.resource.id": "related.one",
+                "syntask.resource.role": "flow",
+            }
+        ],
+    ),
+]
+
+
+@pytest.fixture
+def index() -> TriggerIndex:
+    index = TriggerIndex()
+    for t in TRIGGERS:
+        index.add(t)
+    return index
+
+
+@pytest.mark.parametrize("e", EVENTS, ids=[e.event for e in EVENTS])
+def test_candidates_include_every_covering_trigger(index: TriggerIndex, e):
+    candidates = set(index.candidates(e))
+    assert {t.id for t in TRIGGERS if t.covers(e)} <= candidates
+
+
+def test_selective_triggers_are_not_candidates_for_other_events(index: TriggerIndex):
+    e = event("unrelated.event", {"syntask.resource.id": "zzz"})
+
+    candidates = set(index.candidates(e))
+
+    assert TRIGGERS[1].id not in candidates
+    assert TRIGGERS[5].id not in candidates
+    assert TRIGGERS[13].id not in candidates
+    # triggers without selective criteria are always candidates
+    assert TRIGGERS[0].id in candidates
+    assert TRIGGERS[8].id in candidates
+
+
+def test_candidates_are_in_the_order_they_were_added(index: TriggerIndex):
+    e = event("stuff.happened", {"syntask.resource.id": "foo"})
+    order = [t.id for t in TRIGGERS]
+
+    candidates = index.candidates(e)
+
+    assert candidates == sorted(candidates, key=order.index)
+
+
+def test_discarding_triggers(index: TriggerIndex):
+    for t in TRIGGERS:
+        index.discard(t.id)
+
+    assert len(index) == 0
+    for e in EVENTS:
+        assert index.candidates(e) == []
+
+
+def test_replacing_a_trigger_reindexes_it(index: TriggerIndex):
+    original = TRIGGERS[5]
+    e = event("stuff.happened", {"syntask.resource.id": "foo"})
+    assert original.id in index.candidates(e)
+
+    updated = original.model_copy(
+        update={"match": original.match.model_validate({"syntask.resource.id": "x"})}
+    )
+    index.add(updated)
+
+    assert original.id not in index.candidates(e)
+    assert len(index) == len(TRIGGERS)
+
+
+def test_find_interested_triggers_uses_the_index(cleared_automations: None):
+    interested = trigger(
+        expect={"stuff.happened"}, match={"syntask.resource.id": "foo"}
+    )
+    uninterested = trigger(
+        expect={"stuff.happened"}, match={"syntask.resource.id": "bar"}
+    )
+    automation = Automation(
+        name="indexed",
+        trigger=interested,
+        actions=[actions.DoNothing()],
+    )
+    other = Automation(
+        name="also indexed",
+        trigger=uninterested,
+        actions=[actions.DoNothing()],
+    )
+    triggers.load_automation(automation)
+    triggers.load_automation(other)
+
+    e = event("stuff.happened", {"syntask.resource.id": "foo"})
+    assert triggers.find_interested_triggers(e) == [automation.trigger]
+
+    triggers.forget_automation(automation.id)
+    assert triggers.find_interested_triggers(e) == []
+    assert automation.trigger.id not in triggers.trigger_index
+
+
+def test_adding_a_trigger_twice_indexes_it_once():
+    index = TriggerIndex()
+    t = trigger(expect={"stuff.happened"}, within=timedelta(seconds=10))
+    index.add(t)
+    index.add(t)
+
+    assert len(index) == 1
+    assert index.candidates(event("stuff.happened", {"syntask.resource.id": "a"})) == [
+        t.id
+    ]
@@ -30,6 +30,10 @@ def workspace_events_client(
         "syntask.server.models.deployments.SyntaskServerEventsClient",
         AssertingEventsClient,
     )
+    monkeypatch.setattr(
+        "syntask.server.models.flow_runs.SyntaskServerEventsClient",
+        AssertingEventsClient,
+    )
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -0,0 +1,291 @@
+import os
+
+import pendulum
+import pytest
+
+from syntask.filesystems import LocalFileSystem, RemoteFileSystem
+from syntask.result_cache.filesystem import FileSystemResultCache
+from syntask.result_cache.memory import MemoryResultCache
+from syntask.result_cache.protocol import ResultCache
+from syntask.result_cache.tiered import TieredResultCache
+from syntask.results import ResultStore, get_default_result_cache
+from syntask.settings import (
+    SYNTASK_RESULTS_LOCAL_CACHE_MEMORY_MAX_BYTES,
+    SYNTASK_RESULTS_LOCAL_CACHE_PATH,
+    temporary_settings,
+)
+
+
+class TestMemoryResultCache:
+    def test_get_returns_put_content(self):
+        cache = MemoryResultCache(max_bytes=100)
+        cache.put("key", b"content")
+
+        entry = cache.get("key")
+        assert entry.content == b"content"
+        assert entry.expiration is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 0
+
+    def test_get_missing_key_counts_miss(self):
+        cache = MemoryResultCache(max_bytes=100)
+        assert cache.get("key") is None
+        assert cache.stats.misses == 1
+
+    def test_expired_entries_are_removed(self):
+        cache = MemoryResultCache(max_bytes=100)
+        cache.put("key", b"content", expiration=pendulum.now("utc").subtract(seconds=1))
+
+        assert cache.get("key") is None
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 1
+        assert cache.size == 0
+
+    def test_evicts_least_recently_used_entries_over_budget(self):
+        cache = MemoryResultCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        # mark `a` as recently used
+        cache.get("a")
+        cache.put("c", b"cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a").content == b"aaaa"
+        assert cache.get("c").content == b"cccc"
+        assert cache.stats.evictions == 1
+        assert cache.size == 8
+
+    def test_content_larger_than_budget_is_not_cached(self):
+        cache = MemoryResultCache(max_bytes=3)
+        cache.put("key", b"content")
+        assert cache.get("key") is None
+        assert cache.size == 0
+
+    def test_invalidate(self):
+        cache = MemoryResultCache(max_bytes=100)
+        cache.put("key", b"content")
+        cache.invalidate("key")
+        assert cache.get("key") is None
+        assert cache.size == 0
+
+    def test_is_a_result_cache(self):
+        assert isinstance(MemoryResultCache(max_bytes=1), ResultCache)
+
+
+class TestFileSystemResultCache:
+    def test_get_returns_put_content(self, tmp_path):
+        cache = FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000)
+        expiration = pendulum.now("utc").add(hours=1)
+        cache.put("key", b"content", expiration=expiration)
+
+        entry = cache.get("key")
+        assert entry.content == b"content"
+        assert entry.expiration.timestamp() == pytest.approx(expiration.timestamp())
+        assert cache.stats.hits == 1
+
+    def test_content_is_shared_across_instances(self, tmp_path):
+        FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000).put(
+            "key", b"content"
+        )
+        cache = FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000)
+        assert cache.get("key").content == b"content"
+
+    def test_expired_entries_are_removed(self, tmp_path):
+        cache = FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000)
+        cache.put("key", b"content", expiration=pendulum.now("utc").subtract(seconds=1))
+
+        assert cache.get("key") is None
+        assert cache.stats.expirations == 1
+        assert list(tmp_path.iterdir()) == []
+
+    def test_evicts_least_recently_used_files_over_budget(self, tmp_path):
+        # each file holds an 8 byte header
+        cache = FileSystemResultCache(cache_directory=tmp_path, max_bytes=40)
+        cache.put("a", b"aaaaaaaa")
+        os.utime(cache._path_for_key("a"), (1, 1))
+        cache.put("b", b"bbbbbbbb")
+        os.utime(cache._path_for_key("b"), (2, 2))
+        cache.put("c", b"cccccccc")
+
+        assert cache.stats.evictions == 1
+        assert len(list(tmp_path.iterdir())) == 2
+        assert cache.get("a") is None
+        assert cache.get("b").content == b"bbbbbbbb"
+        assert cache.get("c").content == b"cccccccc"
+
+    def test_first_put_counts_existing_files_once(self, tmp_path):
+        # each file holds an 8 byte header
+        FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000).put(
+            "a", b"aaaaaaaa"
+        )
+
+        cache = FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000)
+        cache.put("b", b"bbbbbbbb")
+        assert cache._size == 32
+
+        cache.put("b", b"bbbb")
+        assert cache._size == 28
+
+    def test_invalidate(self, tmp_path):
+        cache = FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000)
+        cache.put("key", b"content")
+        cache.invalidate("key")
+        assert cache.get("key") is None
+
+
+class TestTieredResultCache:
+    def test_promotes_entries_from_slower_tiers(self, tmp_path):
+        memory = MemoryResultCache(max_bytes=100)
+        disk = FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000)
+        disk.put("key", b"content")
+        cache = TieredResultCache([memory, disk])
+
+        assert cache.get("key").content == b"content"
+        assert memory.get("key").content == b"content"
+        assert cache.stats.hits == 1
+
+    def test_put_and_invalidate_apply_to_all_tiers(self, tmp_path):
+        memory = MemoryResultCache(max_bytes=100)
+        disk = FileSystemResultCache(cache_directory=tmp_path, max_bytes=1000)
+        cache = TieredResultCache([memory, disk])
+
+        cache.put("key", b"content")
+        assert memory.get("key") is not None
+        assert disk.get("key") is not None
+
+        cache.invalidate("key")
+        assert cache.get("key") is None
+        assert cache.stats.misses == 1
+
+
+class TestDefaultResultCache:
+    def test_disabled_by_default(self):
+        assert get_default_result_cache() is None
+        assert ResultStore().result_cache is None
+
+    def test_memory_cache(self):
+        with temporary_settings({SYNTASK_RESULTS_LOCAL_CACHE_MEMORY_MAX_BYTES: 1000}):
+            cache = get_default_result_cache()
+            assert isinstance(cache, MemoryResultCache)
+            assert cache.max_bytes == 1000
+            # the cache is shared by result stores
+            assert get_default_result_cache() is cache
+            assert ResultStore().result_cache is cache
+
+    def test_memory_and_disk_cache(self, tmp_path):
+        with temporary_settings(
+            {
+                SYNTASK_RESULTS_LOCAL_CACHE_MEMORY_MAX_BYTES: 1000,
+                SYNTASK_RESULTS_LOCAL_CACHE_PATH: tmp_path,
+            }
+        ):
+            cache = get_default_result_cache()
+            assert isinstance(cache, TieredResultCache)
+            assert [type(tier) for tier in cache.tiers] == [
+                MemoryResultCache,
+                FileSystemResultCache,
+            ]
+
+
+class TestResultStoreWithResultCache:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return RemoteFileSystem(basepath=f"memory://{tmp_path.name}")
+
+    @pytest.fixture
+    def result_cache(self):
+        return MemoryResultCache(max_bytes=10_000)
+
+    @pytest.fixture
+    def spy_reads(self, storage, monkeypatch):
+        reads = []
+        read_path = RemoteFileSystem.read_path
+
+        async def spy(self, path):
+            reads.append(path)
+            return await read_path(self, path)
+
+        monkeypatch.setattr(RemoteFileSystem, "read_path", spy)
+        return reads
+
+    async def test_reads_are_served_from_cache(self, storage, result_cache, spy_reads):
+        writer = ResultStore(
+            result_storage=storage, cache_result_in_memory=False, result_cache=None
+        )
+        await writer.awrite(key="test", obj={"foo": "bar"})
+
+        store = ResultStore(
+            result_storage=storage,
+            cache_result_in_memory=False,
+            result_cache=result_cache,
+        )
+        assert await store.aexists("test")
+        assert (await store.aread("test")).result == {"foo": "bar"}
+        assert (await store.aread("test")).result == {"foo": "bar"}
+
+        assert spy_reads == ["test"]
+        assert result_cache.stats.misses == 1
+        assert result_cache.stats.hits == 2
+
+    async def test_writes_populate_cache(self, storage, result_cache, spy_reads):
+        store = ResultStore(
+            result_storage=storage,
+            cache_result_in_memory=False,
+            result_cache=result_cache,
+        )
+        await store.awrite(key="test", obj={"foo": "bar"})
+
+        assert (await store.aread("test")).result == {"foo": "bar"}
+        assert spy_reads == []
+
+    async def test_metadata_storage_reads_are_served_from_cache(
+        self, storage, result_cache, spy_reads, tmp_path
+    ):
+        metadata_storage = RemoteFileSystem(basepath=f"memory://{tmp_path.name}-meta")
+        writer = ResultStore(
+            result_storage=storage,
+            metadata_storage=metadata_storage,
+            cache_result_in_memory=False,
+            result_cache=None,
+        )
+        await writer.awrite(key="test", obj={"foo": "bar"})
+
+        store = ResultStore(
+            result_storage=storage,
+            metadata_storage=metadata_storage,
+            cache_result_in_memory=False,
+            result_cache=result_cache,
+        )
+        assert (await store.aread("test")).result == {"foo": "bar"}
+        assert (await store.aread("test")).result == {"foo": "bar"}
+        assert await store.aexists("test")
+
+        assert len(spy_reads) == 2
+        assert result_cache.stats.hits == 3
+
+    async def test_expired_results_do_not_exist(self, storage, result_cache):
+        store = ResultStore(
+            result_storage=storage,
+            cache_result_in_memory=False,
+            result_cache=result_cache,
+        )
+        await store.awrite(
+            key="test",
+            obj={"foo": "bar"},
+            expiration=pendulum.now("utc").subtract(seconds=1),
+        )
+
+        assert not await store.aexists("test")
+        assert result_cache.stats.expirations == 1
+
+    async def test_local_storage_is_not_cached(self, tmp_path, result_cache):
+        store = ResultStore(
+            result_storage=LocalFileSystem(basepath=str(tmp_path)),
+            cache_result_in_memory=False,
+            result_cache=result_cache,
+        )
+        await store.awrite(key="test", obj={"foo": "bar"})
+        assert (await store.aread("test")).result == {"foo": "bar"}
+
+        assert result_cache.size == 0
+        assert result_cache.stats.hits == 0
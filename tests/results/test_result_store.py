@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import syntask.exceptions
@@ -11,7 +12,7 @@ from syntask.results import (
     ResultStore,
     should_persist_result,
 )
-from syntask.serializers import JSONSerializer, PickleSerializer
+from syntask.serializers import ColumnarSerializer, JSONSerializer, PickleSerializer
 from syntask.settings import (
     SYNTASK_LOCAL_STORAGE_PATH,
     SYNTASK_RESULTS_DEFAULT_SERIALIZER,
@@ -778,6 +779,35 @@ async def test_result_store_read_and_write_with_metadata_storage(tmp_path):
     ).read_text() == read_value.metadata.model_dump_json(serialize_as_any=True)
 
 
+async def test_result_store_streams_columnar_results_with_metadata_storage(
+    tmp_path,
+):
+    metadata_storage = LocalFileSystem(basepath=tmp_path / "metadata")
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    result_store = ResultStore(
+        metadata_storage=metadata_storage,
+        result_storage=result_storage,
+        serializer=ColumnarSerializer(),
+        cache_result_in_memory=False,
+    )
+
+    key = "test"
+    value = np.arange(10.0)
+    await result_store.awrite(key=key, obj=value)
+
+    # The result is written as a raw `.npy` file rather than base64 encoded bytes
+    np.testing.assert_array_equal(np.load(tmp_path / "results" / key), value)
+
+    read_value = await result_store.aread(key=key)
+    assert isinstance(read_value.result, np.memmap)
+    np.testing.assert_array_equal(read_value.result, value)
+
+    # Overwriting the result does not disturb results loaded from the previous file
+    await result_store.awrite(key=key, obj=np.zeros(3))
+    np.testing.assert_array_equal(read_value.result, value)
+    np.testing.assert_array_equal(result_store.read(key=key).result, np.zeros(3))
+
+
 async def test_result_store_exists_with_metadata_storage(tmp_path):
     metadata_storage = LocalFileSystem(basepath=tmp_path / "metadata")
     result_storage = LocalFileSystem(basepath=tmp_path / "results")
@@ -6,6 +6,7 @@ import signal
 import sys
 import tempfile
 import time
+import uuid
 import warnings
 from itertools import combinations
 from pathlib import Path
@@ -16,6 +17,7 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 import anyio
+import httpx
 import pendulum
 import pytest
 from starlette import status
@@ -35,6 +37,7 @@ from syntask.deployments.runner import (
 from syntask.docker.docker_image import DockerImage
 from syntask.events.clients import AssertingEventsClient
 from syntask.events.worker import EventsWorker
+from syntask.exceptions import SyntaskHTTPStatusError
 from syntask.flows import load_flow_from_entrypoint
 from syntask.logging.loggers import flow_run_logger
 from syntask.runner.runner import Runner
@@ -789,6 +792,63 @@ class TestRunner:
             runner._cancelling_flow_run_ids.add(flow_run.id)
             await runner._cancel_run(flow_run)
 
+    async def test_runner_releases_claimed_runs_it_cannot_submit(
+        self, syntask_client: SyntaskClient
+    ):
+        async with Runner(limit=1, pause_on_shutdown=False) as runner:
+            deployment_id = await runner.add_deployment(
+                RunnerDeployment.from_flow(flow=dummy_flow_1, name=__file__)
+            )
+            flow_runs = [
+                await syntask_client.create_flow_run_from_deployment(
+                    deployment_id=deployment_id
+                )
+                for _ in range(2)
+            ]
+
+            # another run holds the runner's only slot after both runs were claimed
+            claimed = await runner._get_scheduled_flow_runs()
+            assert len(claimed) == 1
+            claimed += await syntask_client.claim_scheduled_flow_runs_for_deployments(
+                deployment_ids=[deployment_id]
+            )
+            runner._acquire_limit_slot(uuid.uuid4())
+
+            assert await runner._submit_scheduled_flow_runs(claimed) == []
+
+        for flow_run in flow_runs:
+            flow_run = await syntask_client.read_flow_run(flow_run.id)
+            assert flow_run.state.is_scheduled()
+
+    async def test_runner_reads_scheduled_runs_when_server_cannot_claim(
+        self, syntask_client: SyntaskClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        async with Runner(pause_on_shutdown=False) as runner:
+            deployment_id = await runner.add_deployment(
+                RunnerDeployment.from_flow(flow=dummy_flow_1, name=__file__)
+            )
+            flow_run = await syntask_client.create_flow_run_from_deployment(
+                deployment_id=deployment_id
+            )
+
+            claim = AsyncMock(
+                side_effect=SyntaskHTTPStatusError(
+                    "Not Found",
+                    request=httpx.Request("POST", "http://test/claim"),
+                    response=httpx.Response(status_code=status.HTTP_404_NOT_FOUND),
+                )
+            )
+            monkeypatch.setattr(
+                runner._client, "claim_scheduled_flow_runs_for_deployments", claim
+            )
+
+            scheduled_flow_runs = await runner._get_scheduled_flow_runs()
+            assert [run.id for run in scheduled_flow_runs] == [flow_run.id]
+
+            # the server is not asked to claim runs again
+            await runner._get_scheduled_flow_runs()
+            claim.assert_awaited_once()
+
 
 @pytest.mark.usefixtures("use_hosted_api_server")
 async def test_runner_emits_cancelled_event(
@@ -15,6 +15,7 @@ import pytest
 from sqlalchemy.orm.exc import FlushError
 
 from syntask.server import models
+from syntask.server.api import logs as logs_api
 from syntask.server.schemas.actions import LogCreate
 from syntask.server.schemas.core import Log
 from syntask.server.schemas.filters import LogFilter
@@ -22,6 +23,7 @@ from syntask.server.schemas.filters import LogFilter
 NOW = pendulum.now("UTC")
 CREATE_LOGS_URL = "/logs/"
 READ_LOGS_URL = "/logs/filter"
+STREAM_LOGS_URL = "/logs/stream"
 
 
 @pytest.fixture
@@ -175,3 +177,71 @@ class TestReadLogs:
         api_logs = [Log(**log_data) for log_data in response.json()]
         assert api_logs[0].timestamp > api_logs[1].timestamp
         assert api_logs[0].message == "Black flag ahead, captain!"
+
+
+class TestStreamLogs:
+    @pytest.fixture()
+    async def logs(self, client, flow_run_id):
+        # several logs share each timestamp, so that they are ordered by their IDs
+        log_data = [
+            LogCreate(
+                name="syntask.flow_run",
+                level=20,
+                message=f"Log {i}",
+                timestamp=NOW + timedelta(seconds=i // 3),
+                flow_run_id=flow_run_id,
+            ).model_dump(mode="json")
+            for i in range(10)
+        ]
+        await client.post(CREATE_LOGS_URL, json=log_data)
+
+        response = await client.post(READ_LOGS_URL)
+        logs = [Log(**log) for log in response.json()]
+        yield sorted(logs, key=lambda log: (log.timestamp, log.id))
+
+    def parse(self, response):
+        return [Log.model_validate_json(line) for line in response.text.splitlines()]
+
+    async def test_stream_logs(self, client, logs):
+        response = await client.post(STREAM_LOGS_URL)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert self.parse(response) == logs
+
+    async def test_stream_logs_in_pages(self, client, logs, monkeypatch):
+        monkeypatch.setattr(logs_api, "LOGS_STREAM_PAGE_SIZE", 3)
+
+        response = await client.post(STREAM_LOGS_URL)
+        assert self.parse(response) == logs
+
+    async def test_stream_logs_after_a_log(self, client, logs, monkeypatch):
+        monkeypatch.setattr(logs_api, "LOGS_STREAM_PAGE_SIZE", 3)
+
+        response = await client.post(
+            STREAM_LOGS_URL,
+            json={
+                "after_timestamp": logs[4].timestamp.isoformat(),
+                "after_id": str(logs[4].id),
+            },
+        )
+        assert self.parse(response) == logs[5:]
+
+    async def test_stream_logs_applies_log_filter(self, client, logs):
+        response = await client.post(
+            STREAM_LOGS_URL,
+            json={"logs": {"timestamp": {"after_": logs[-1].timestamp.isoformat()}}},
+        )
+        assert self.parse(response) == [
+            log for log in logs if log.timestamp == logs[-1].timestamp
+        ]
+
+    async def test_stream_logs_returns_nothing(self, client):
+        response = await client.post(STREAM_LOGS_URL)
+        assert response.status_code == 200
+        assert response.text == ""
+
+    async def test_stream_logs_requires_timestamp_and_id(self, client, logs):
+        response = await client.post(
+            STREAM_LOGS_URL, json={"after_id": str(logs[0].id)}
+        )
+        assert response.status_code == 422
@@ -10,6 +10,12 @@ from syntask.server.schemas.actions import LogCreate
 from syntask.server.schemas.core import Log
 from syntask.server.schemas.filters import LogFilter, LogFilterTaskRunId
 from syntask.server.schemas.sorting import LogSort
+from syntask.server.utilities.database import get_dialect
+from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
+    SYNTASK_API_LOGS_COPY_ENABLED,
+    temporary_settings,
+)
 
 NOW = pendulum.now("UTC")
 
@@ -77,6 +83,51 @@ class TestCreateLogs:
             )
 
 
+class TestCopyLogs:
+    @pytest.fixture(autouse=True)
+    def copy_enabled(self):
+        dialect = get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value())
+        if dialect.name != "postgresql":
+            pytest.skip("COPY is only used with PostgreSQL")
+
+        with temporary_settings({SYNTASK_API_LOGS_COPY_ENABLED: True}):
+            yield
+
+    async def test_copy_logs(self, session, log_data, logs, db):
+        query = select(db.Log).order_by(db.Log.timestamp.asc())
+        result = await session.execute(query)
+        read_logs = result.scalars().unique().all()
+
+        assert [
+            Log.model_validate(log, from_attributes=True).model_dump(
+                exclude={"created", "id", "updated"},
+            )
+            for log in read_logs
+        ] == log_data
+        assert len({log.id for log in read_logs}) == len(log_data)
+
+    async def test_copy_more_logs_than_fit_in_one_insert(self, session, db):
+        flow_run_id = uuid4()
+        log_data = [
+            LogCreate(
+                name="syntask.flow_run",
+                level=20,
+                message=f"Log {i}",
+                timestamp=NOW,
+                flow_run_id=flow_run_id,
+            )
+            for i in range(models.logs.LOG_BATCH_SIZE + 1)
+        ]
+
+        async with session.begin():
+            await models.logs.create_logs(session=session, logs=log_data)
+
+        logs = await models.logs.read_logs(
+            session=session, log_filter=LogFilter(flow_run_id={"any_": [flow_run_id]})
+        )
+        assert len(logs) == len(log_data)
+
+
 class TestReadLogs:
     async def test_read_logs_timestamp_after_inclusive(self, session, logs, log_data):
         after = log_data[1].timestamp
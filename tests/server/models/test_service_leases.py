@@ -0,0 +1,87 @@
+import datetime
+
+from syntask.server import models
+
+
+async def test_renewing_a_lease_makes_its_holder_live(session):
+    await models.service_leases.renew_service_lease(
+        session=session,
+        service="my-service",
+        holder="replica-b",
+        duration=datetime.timedelta(minutes=1),
+    )
+    await models.service_leases.renew_service_lease(
+        session=session,
+        service="my-service",
+        holder="replica-a",
+        duration=datetime.timedelta(minutes=1),
+    )
+
+    holders = await models.service_leases.read_service_lease_holders(
+        session=session, service="my-service"
+    )
+    assert holders == ["replica-a", "replica-b"]
+
+
+async def test_renewing_a_lease_extends_it(session):
+    for duration in [datetime.timedelta(seconds=-1), datetime.timedelta(minutes=1)]:
+        await models.service_leases.renew_service_lease(
+            session=session,
+            service="my-service",
+            holder="replica-a",
+            duration=duration,
+        )
+
+    holders = await models.service_leases.read_service_lease_holders(
+        session=session, service="my-service"
+    )
+    assert holders == ["replica-a"]
+
+
+async def test_expired_leases_are_not_live(session):
+    await models.service_leases.renew_service_lease(
+        session=session,
+        service="my-service",
+        holder="replica-a",
+        duration=datetime.timedelta(seconds=-1),
+    )
+
+    holders = await models.service_leases.read_service_lease_holders(
+        session=session, service="my-service"
+    )
+    assert holders == []
+
+
+async def test_leases_are_scoped_to_their_service(session):
+    await models.service_leases.renew_service_lease(
+        session=session,
+        service="my-service",
+        holder="replica-a",
+        duration=datetime.timedelta(minutes=1),
+    )
+
+    holders = await models.service_leases.read_service_lease_holders(
+        session=session, service="another-service"
+    )
+    assert holders == []
+
+
+async def test_deleting_a_lease(session):
+    await models.service_leases.renew_service_lease(
+        session=session,
+        service="my-service",
+        holder="replica-a",
+        duration=datetime.timedelta(minutes=1),
+    )
+
+    assert await models.service_leases.delete_service_lease(
+        session=session, service="my-service", holder="replica-a"
+    )
+    assert not await models.service_leases.delete_service_lease(
+        session=session, service="my-service", holder="replica-a"
+    )
+
+    holders = await models.service_leases.read_service_lease_holders(
+        session=session, service="my-service"
+    )
+    assert holders == []
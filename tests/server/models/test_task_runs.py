@@ -9,6 +9,10 @@ from syntask.server.models import concurrency_limits, task_runs
 from syntask.server.orchestration.core_policy import CoreTaskPolicy
 from syntask.server.schemas.core import TaskRunResult
 from syntask.server.schemas.states import Failed, Pending, Running, Scheduled
+from syntask.settings import (
+    SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED,
+    temporary_settings,
+)
 
 
 class TestCreateTaskRun:
@@ -747,6 +751,173 @@ class TestDeleteTaskRun:
         ) is None
 
 
+class TestSetTaskRunStates:
+    @pytest.fixture(autouse=True)
+    async def running_flow_run(self, session, flow_run):
+        await models.flow_runs.set_flow_run_state(
+            session=session, flow_run_id=flow_run.id, state=Running()
+        )
+        await session.commit()
+
+    async def test_set_task_run_states(self, flow_run, session):
+        runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                ),
+            )
+            for i in range(3)
+        ]
+
+        results = await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_states=[(run.id, Running()) for run in runs],
+            task_policy=CoreTaskPolicy,
+        )
+
+        assert [result.status.value for result in results] == ["ACCEPT"] * 3
+        for run in runs:
+            task_run = await models.task_runs.read_task_run(
+                session=session, task_run_id=run.id
+            )
+            assert task_run.state.type.value == "RUNNING"
+
+    async def test_set_task_run_states_applies_transitions_in_order(
+        self, task_run, session
+    ):
+        results = await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_states=[(task_run.id, Pending()), (task_run.id, Running())],
+            task_policy=CoreTaskPolicy,
+        )
+
+        assert [result.state.type.value for result in results] == [
+            "PENDING",
+            "RUNNING",
+        ]
+        assert task_run.state.type.value == "RUNNING"
+
+    async def test_set_task_run_states_aborts_missing_task_runs(
+        self, task_run, session
+    ):
+        missing_id = uuid4()
+        results = await models.task_runs.set_task_run_states(
+            session=session,
+            task_run_states=[(missing_id, Running()), (task_run.id, Running())],
+            task_policy=CoreTaskPolicy,
+        )
+
+        assert results[0].status.value == "ABORT"
+        assert str(missing_id) in results[0].details.reason
+        assert results[1].status.value == "ACCEPT"
+
+    async def test_set_task_run_states_with_no_states(self, session):
+        assert (
+            await models.task_runs.set_task_run_states(
+                session=session, task_run_states=[]
+            )
+            == []
+        )
+
+
+class TestTaskRunStateRollup:
+    @pytest.fixture(autouse=True)
+    def enable_rollups(self):
+        with temporary_settings({SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED: True}):
+            yield
+
+    async def read_rollups(self, db, session):
+        result = await session.execute(
+            sa.select(
+                db.TaskRunStateRollup.bucket,
+                db.TaskRunStateRollup.state_type,
+                db.TaskRunStateRollup.count,
+            ).order_by(db.TaskRunStateRollup.state_type)
+        )
+        return [tuple(row) for row in result]
+
+    async def test_counts_task_runs_entering_terminal_states(
+        self, db, task_run, session
+    ):
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=Running()
+        )
+        assert await self.read_rollups(db, session) == []
+
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=Failed()
+        )
+        minute = task_run.start_time.start_of("minute")
+        assert await self.read_rollups(db, session) == [
+            (minute, schemas.states.StateType.FAILED, 1)
+        ]
+
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Completed(),
+            force=True,
+        )
+        assert await self.read_rollups(db, session) == [
+            (minute, schemas.states.StateType.COMPLETED, 1),
+            (minute, schemas.states.StateType.FAILED, 0),
+        ]
+
+    async def test_deleting_a_task_run_removes_it_from_the_rollups(
+        self, db, task_run, session
+    ):
+        for state in (Running(), Failed()):
+            await models.task_runs.set_task_run_state(
+                session=session, task_run_id=task_run.id, state=state
+            )
+
+        await models.task_runs.delete_task_run(session=session, task_run_id=task_run.id)
+
+        assert [count for _, _, count in await self.read_rollups(db, session)] == [0]
+
+    async def test_counts_are_not_kept_when_rollups_are_disabled(
+        self, db, task_run, session
+    ):
+        with temporary_settings(
+            {SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED: False}
+        ):
+            for state in (Running(), Failed()):
+                await models.task_runs.set_task_run_state(
+                    session=session, task_run_id=task_run.id, state=state
+                )
+            await models.task_runs.delete_task_run(
+                session=session, task_run_id=task_run.id
+            )
+
+        assert await self.read_rollups(db, session) == []
+
+    async def test_task_runs_are_counted_in_shards(self, db, session):
+        task_run_ids = [uuid4() for _ in range(50)]
+        start_time = pendulum.now("UTC")
+        for task_run_id in task_run_ids:
+            await models.task_runs.update_task_run_state_rollup(
+                session,
+                task_run_id,
+                before=(None, None),
+                after=(schemas.states.StateType.COMPLETED, start_time),
+            )
+
+        result = await session.execute(
+            sa.select(db.TaskRunStateRollup.shard, db.TaskRunStateRollup.count)
+        )
+        counts = dict(result.all())
+        assert len(counts) > 1
+        assert sum(counts.values()) == len(task_run_ids)
+
+    async def test_ignores_task_runs_that_never_started(self, db, task_run, session):
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=Failed()
+        )
+
+        assert await self.read_rollups(db, session) == []
+
+
 class TestPreventOrphanedConcurrencySlots:
     @pytest.fixture
     async def task_run_1(self, session, flow_run):
@@ -860,6 +860,34 @@ class TestGetScheduledRuns:
         )
         assert len(runs) == 0
 
+    async def test_read_next_scheduled_start_time(self, session, work_pools):
+        now = pendulum.now("UTC")
+        next_start = await models.workers.read_next_scheduled_start_time(
+            session=session, work_pool_ids=[work_pools["wp_a"].id]
+        )
+        assert now.subtract(hours=1, minutes=1) < next_start < now.subtract(hours=1)
+
+    async def test_read_next_scheduled_start_time_scheduled_after(
+        self, session, work_pools
+    ):
+        now = pendulum.now("UTC")
+        next_start = await models.workers.read_next_scheduled_start_time(
+            session=session,
+            work_pool_ids=[work_pools["wp_a"].id],
+            scheduled_after=now,
+        )
+        assert now.add(minutes=59) < next_start < now.add(hours=1)
+
+    async def test_read_next_scheduled_start_time_pools_and_queues_incompatible(
+        self, session, work_pools, work_queues
+    ):
+        next_start = await models.workers.read_next_scheduled_start_time(
+            session=session,
+            work_pool_ids=[work_pools["wp_b"].id],
+            work_queue_ids=[work_queues["wq_aa"].id],
+        )
+        assert next_start is None
+
 
 class TestDeleteWorker:
     async def test_delete_worker(self, session, work_pool):
@@ -2111,6 +2111,38 @@ class TestGetScheduledFlowRuns:
         assert response.status_code == 200
         assert {res["id"] for res in response.json()} == {str(flow_runs[0].id)}
 
+    async def test_claim_scheduled_runs(
+        self,
+        client,
+        flow_runs,
+        deployments,
+    ):
+        deployment_1, _deployment_2 = deployments
+        response = await client.post(
+            "/deployments/claim_scheduled_flow_runs",
+            json=dict(deployment_ids=[str(deployment_1.id)], limit=1),
+        )
+        assert response.status_code == 200
+        assert [res["id"] for res in response.json()] == [str(flow_runs[0].id)]
+        assert response.json()[0]["state"]["type"] == "PENDING"
+
+        assert_status_events(deployment_1.name, ["syntask.deployment.ready"])
+
+        # the claimed run is no longer scheduled, so it is not claimed again
+        response = await client.post(
+            "/deployments/claim_scheduled_flow_runs",
+            json=dict(deployment_ids=[str(deployment_1.id)]),
+        )
+        assert response.status_code == 200
+        assert [res["id"] for res in response.json()] == [str(flow_runs[1].id)]
+
+        response = await client.post(
+            "/deployments/claim_scheduled_flow_runs",
+            json=dict(deployment_ids=[str(deployment_1.id)]),
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
     async def test_get_scheduled_runs_sort_order(
         self,
         client,
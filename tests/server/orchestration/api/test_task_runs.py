@@ -577,6 +577,120 @@ class TestSetTaskRunState:
         assert response_2.status == responses.SetStateStatus.ABORT
 
 
+class TestSetTaskRunStates:
+    @pytest.fixture(autouse=True)
+    async def running_flow_run(self, session, flow_run):
+        await models.flow_runs.set_flow_run_state(
+            session=session, flow_run_id=flow_run.id, state=states.Running()
+        )
+        await session.commit()
+
+    async def test_set_task_run_states(self, flow_run, client, session):
+        task_runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                ),
+            )
+            for i in range(3)
+        ]
+        await session.commit()
+        task_run_ids = [task_run.id for task_run in task_runs]
+
+        response = await client.post(
+            "/task_runs/set_states",
+            json=dict(
+                task_run_states=[
+                    dict(
+                        task_run_id=str(task_run_id),
+                        state=dict(type="RUNNING", name="Test State"),
+                    )
+                    for task_run_id in task_run_ids
+                ]
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        results = [OrchestrationResult.model_validate(r) for r in response.json()]
+        assert [result.status for result in results] == [
+            responses.SetStateStatus.ACCEPT
+        ] * 3
+
+        session.expire_all()
+        for task_run_id in task_run_ids:
+            run = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_id
+            )
+            assert run.state.type == states.StateType.RUNNING
+            assert run.state.name == "Test State"
+            assert run.run_count == 1
+
+    async def test_set_task_run_states_returns_results_per_item(
+        self, task_run: TaskRun, client, session
+    ):
+        # set max retries to 1
+        # copy to trigger ORM updates
+        task_run.empirical_policy = task_run.empirical_policy.model_copy()
+        task_run.empirical_policy.retries = 1
+        await session.flush()
+
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=states.Running(),
+        )
+        await session.commit()
+
+        missing_id = uuid4()
+        response = await client.post(
+            "/task_runs/set_states",
+            json=dict(
+                task_run_states=[
+                    dict(task_run_id=str(missing_id), state=dict(type="RUNNING")),
+                    dict(task_run_id=str(task_run.id), state=dict(type="FAILED")),
+                ]
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        missing, failed = [
+            OrchestrationResult.model_validate(r) for r in response.json()
+        ]
+        assert missing.status == responses.SetStateStatus.ABORT
+        assert failed.status == responses.SetStateStatus.REJECT
+        assert failed.state.name == "AwaitingRetry"
+
+    async def test_set_task_run_states_force_skips_orchestration(
+        self, task_run: TaskRun, client, session
+    ):
+        task_run.empirical_policy = task_run.empirical_policy.model_copy()
+        task_run.empirical_policy.retries = 1
+        await session.flush()
+
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=states.Running(),
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/set_states",
+            json=dict(
+                task_run_states=[
+                    dict(task_run_id=str(task_run.id), state=dict(type="FAILED"))
+                ],
+                force=True,
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        (result,) = [OrchestrationResult.model_validate(r) for r in response.json()]
+        assert result.status == responses.SetStateStatus.ACCEPT
+        assert result.state.type == states.StateType.FAILED
+
+
 class TestTaskRunHistory:
     async def test_history_interval_must_be_one_second_or_larger(self, client):
         response = await client.post(
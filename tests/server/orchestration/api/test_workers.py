@@ -1,3 +1,4 @@
+import time
 from datetime import timedelta
 from typing import List
 
@@ -1785,6 +1786,135 @@ class TestGetScheduledRuns:
         )
         assert len(data) == 0
 
+    async def test_waiting_returns_runs_that_are_already_due(self, client, work_pools):
+        start = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC")), wait_seconds=5),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert time.monotonic() - start < 5
+
+        data = parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert len(data) == 6
+
+    async def test_waiting_returns_nothing_when_no_runs_become_due(
+        self, client, work_pools
+    ):
+        start = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+            json=dict(
+                scheduled_before=str(pendulum.now("UTC").subtract(hours=3)),
+                wait_seconds=0.5,
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert time.monotonic() - start >= 0.5
+        assert response.json() == []
+
+    async def test_waiting_returns_runs_as_they_become_due(self, client, session, flow):
+        work_pool = await models.workers.create_work_pool(
+            session=session,
+            work_pool=schemas.actions.WorkPoolCreate(name="D"),
+        )
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=syntask.server.schemas.states.Scheduled(
+                    scheduled_time=pendulum.now("UTC").add(seconds=1)
+                ),
+                work_queue_id=work_pool.default_queue_id,
+            ),
+        )
+        await session.commit()
+
+        start = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC")), wait_seconds=10),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert time.monotonic() - start < 10
+
+        data = parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert [d.flow_run.id for d in data] == [flow_run.id]
+
+    async def test_claim_runs(self, client, work_pools):
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/claim_scheduled_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC")), limit=4),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        data = parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert len(data) == 4
+        assert all(d.flow_run.state.is_pending() for d in data)
+
+        for d in data:
+            flow_run_response = await client.get(f"/flow_runs/{d.flow_run.id}")
+            assert flow_run_response.json()["state"]["type"] == "PENDING"
+
+        # only the due runs that were not claimed are left to claim
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/claim_scheduled_flow_runs",
+            json=dict(scheduled_before=str(pendulum.now("UTC"))),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        remaining = parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert len(remaining) == 2
+        assert not {d.flow_run.id for d in remaining} & {d.flow_run.id for d in data}
+
+    async def test_claim_runs_respects_work_queue_concurrency_limit(
+        self, client, session, flow
+    ):
+        work_pool = await models.workers.create_work_pool(
+            session=session,
+            work_pool=schemas.actions.WorkPoolCreate(name="D"),
+        )
+        work_queue = await models.workers.create_work_queue(
+            session=session,
+            work_pool_id=work_pool.id,
+            work_queue=schemas.actions.WorkQueueCreate(name="DA", concurrency_limit=2),
+        )
+        for _ in range(3):
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=syntask.server.schemas.states.Scheduled(
+                        scheduled_time=pendulum.now("UTC").subtract(minutes=1)
+                    ),
+                    work_queue_id=work_queue.id,
+                ),
+            )
+        await session.commit()
+
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/claim_scheduled_flow_runs",
+            json=dict(work_queue_names=[work_queue.name]),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(response.json()) == 2
+
+        # the claimed runs are PENDING, so they count toward the limit
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/claim_scheduled_flow_runs",
+            json=dict(work_queue_names=[work_queue.name]),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+
     async def test_updates_last_polled_on_a_single_work_queue(
         self, client, work_queues, work_pools
     ):
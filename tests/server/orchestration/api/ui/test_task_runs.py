@@ -1,4 +1,5 @@
 from typing import Tuple, cast
+from uuid import uuid4
 
 import pendulum
 import pytest
@@ -9,6 +10,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from syntask.server import models
 from syntask.server.api.ui.task_runs import TaskRunCount
 from syntask.server.schemas import core, filters, states
+from syntask.settings import (
+    SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED,
+    temporary_settings,
+)
 
 
 class TestReadDashboardTaskRunCounts:
@@ -129,6 +134,89 @@ class TestReadDashboardTaskRunCounts:
             TaskRunCount(completed=2, failed=2),
         ]
 
+    @pytest.fixture
+    async def task_run_rollups(self, session: AsyncSession, create_task_runs):
+        # the task runs above were created with their state types directly, so they
+        # are added to the rollups here
+        task_runs = await models.task_runs.read_task_runs(session=session)
+        for task_run in task_runs:
+            await models.task_runs.update_task_run_state_rollup(
+                session,
+                task_run.id,
+                before=(None, None),
+                after=(task_run.state_type, task_run.start_time),
+            )
+        await session.commit()
+
+    async def test_counts_from_rollups_match_task_runs(
+        self,
+        url: str,
+        task_run_filter: filters.TaskRunFilter,
+        client: AsyncClient,
+        task_run_rollups,
+    ):
+        body = {"task_runs": task_run_filter.model_dump(mode="json")}
+        response = await client.post(url, json=body)
+        assert response.status_code == 200
+
+        with temporary_settings({SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED: True}):
+            rollup_response = await client.post(url, json=body)
+        assert rollup_response.status_code == 200
+
+        assert rollup_response.json() == response.json()
+
+    async def test_counts_from_rollups(
+        self,
+        url: str,
+        session: AsyncSession,
+        task_run_filter: filters.TaskRunFilter,
+        client: AsyncClient,
+        time_window,
+    ):
+        now, eight_hours_ago = time_window
+        await models.task_runs.update_task_run_state_rollup(
+            session,
+            uuid4(),
+            before=(None, None),
+            after=(states.StateType.COMPLETED, eight_hours_ago.add(minutes=10)),
+        )
+        await session.commit()
+
+        body = {"task_runs": task_run_filter.model_dump(mode="json")}
+        with temporary_settings({SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED: True}):
+            response = await client.post(url, json=body)
+        assert response.status_code == 200
+
+        counts = [TaskRunCount(**count) for count in response.json()]
+        assert counts[0] == TaskRunCount(completed=1, failed=0)
+        assert sum(count.completed for count in counts) == 1
+
+    async def test_counts_with_other_filters_ignore_rollups(
+        self,
+        url: str,
+        session: AsyncSession,
+        task_run_filter: filters.TaskRunFilter,
+        client: AsyncClient,
+        time_window,
+    ):
+        now, eight_hours_ago = time_window
+        await models.task_runs.update_task_run_state_rollup(
+            session,
+            uuid4(),
+            before=(None, None),
+            after=(states.StateType.COMPLETED, eight_hours_ago.add(minutes=10)),
+        )
+        await session.commit()
+
+        task_run_filter.name = filters.TaskRunFilterName(like_="task")
+        body = {"task_runs": task_run_filter.model_dump(mode="json")}
+        with temporary_settings({SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED: True}):
+            response = await client.post(url, json=body)
+        assert response.status_code == 200
+
+        counts = [TaskRunCount(**count) for count in response.json()]
+        assert sum(count.completed for count in counts) == 0
+
 
 class TestReadTaskRunCountsByState:
     @pytest.fixture
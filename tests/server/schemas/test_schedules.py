@@ -589,6 +589,80 @@ class TestRRuleScheduleDaylightSavingsTime:
         assert [d.in_tz("UTC").hour for d in dates] == [9, 9, 9, 9, 9]
 
 
+class TestGetDatesBatch:
+    """
+    Tests that `get_dates_batch` returns exactly what `get_dates` does
+    """
+
+    @pytest.mark.parametrize(
+        "schedule",
+        [
+            IntervalSchedule(interval=timedelta(minutes=7), anchor_date=dt),
+            IntervalSchedule(
+                interval=timedelta(hours=1),
+                anchor_date=datetime(2018, 3, 10, tz="America/New_York"),
+            ),
+            IntervalSchedule(
+                interval=timedelta(days=1),
+                anchor_date=datetime(2018, 3, 1, 9, tz="America/New_York"),
+            ),
+            IntervalSchedule(
+                interval=timedelta(days=1, hours=5),
+                anchor_date=datetime(2018, 10, 20, 9, tz="America/New_York"),
+            ),
+            CronSchedule(cron="0 * * * *", timezone="America/New_York"),
+            CronSchedule(cron="0 9 * * *", timezone="America/New_York"),
+            CronSchedule(cron="*/15 1-3 * * *", timezone="America/New_York"),
+            CronSchedule(cron="10 0 * * *", timezone="America/Montreal"),
+            CronSchedule(cron="30 9 * * 1-5", timezone="Europe/Berlin"),
+            CronSchedule(cron="0 0 13 * 5", timezone="UTC"),
+            CronSchedule(cron="0 0 13 * 5", timezone="UTC", day_or=False),
+            CronSchedule(cron="0 0 29 2 *", timezone="UTC"),
+            CronSchedule(cron="@daily", timezone="UTC"),
+            CronSchedule(cron="0 12 * * 5#3", timezone="UTC"),
+            CronSchedule(cron="0 12 L * *", timezone="UTC"),
+            RRuleSchedule(rrule="FREQ=HOURLY", timezone="America/New_York"),
+            RRuleSchedule(
+                rrule="DTSTART:20180301T090000\nRRULE:FREQ=DAILY",
+                timezone="America/New_York",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "start",
+        [
+            datetime(2018, 3, 10, 23, 0, tz="America/New_York"),
+            datetime(2018, 11, 3, 23, 0, 1, tz="America/New_York"),
+            datetime(2023, 3, 12, 5, 10, 2, tz="UTC"),
+            pydatetime(2024, 2, 28, 23, 59, 59, 500),
+        ],
+    )
+    async def test_matches_get_dates(self, schedule, start):
+        for n in [1, 5, 100]:
+            expected = await schedule.get_dates(n=n, start=start)
+            assert schedule.get_dates_batch(n=n, start=start) == expected
+
+        end = pendulum.instance(start).add(days=3)
+        expected = await schedule.get_dates(start=start, end=end)
+        assert schedule.get_dates_batch(start=start, end=end) == expected
+
+        expected = await schedule.get_dates(n=10, start=start, end=end)
+        assert schedule.get_dates_batch(n=10, start=start, end=end) == expected
+
+    async def test_interval_past_end(self):
+        s = IntervalSchedule(interval=timedelta(days=1), anchor_date=dt)
+        assert s.get_dates_batch(start=dt.add(hours=1), end=dt.add(hours=2)) == []
+
+    async def test_interval_is_limited_by_max_iterations(self):
+        s = IntervalSchedule(interval=timedelta(minutes=1), anchor_date=dt)
+        dates = s.get_dates_batch(n=MAX_ITERATIONS * 2, start=dt)
+        assert dates == await s.get_dates(n=MAX_ITERATIONS * 2, start=dt)
+
+    async def test_default_n_is_one_without_end_date(self):
+        s = CronSchedule(cron="0 9 * * *")
+        assert len(s.get_dates_batch()) == 1
+
+
 class TestCreateRRuleSchedule:
     async def test_rrule_is_required(self):
         with pytest.raises(ValidationError):
@@ -233,3 +233,76 @@ async def test_service_leaves_terminal_runs_alone(
     assert orphaned_task_run.state.type == state_constructor[0]
     assert orphaned_subflow_run.state.type == state_constructor[0]
     assert orphaned_subflow_run_from_deployment.state.type == state_constructor[0]
+
+
+async def test_service_cleans_up_runs_across_batches(
+    session,
+    cancelled_flow_run,
+    orphaned_task_run_maker,
+    orphaned_subflow_run_maker,
+):
+    orphaned_task_runs = [
+        await orphaned_task_run_maker(cancelled_flow_run, states.Running)
+        for _ in range(5)
+    ]
+    orphaned_subflow_runs = [
+        await orphaned_subflow_run_maker(cancelled_flow_run, states.Running)
+        for _ in range(3)
+    ]
+
+    service = CancellationCleanup()
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    for run in orphaned_task_runs + orphaned_subflow_runs:
+        await session.refresh(run)
+        assert run.state.type == "CANCELLED"
+
+
+async def test_service_finishes_when_task_runs_cannot_be_cancelled(
+    session,
+    cancelled_flow_run,
+    monkeypatch,
+):
+    async with session.begin():
+        for i in range(5):
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=cancelled_flow_run.id,
+                    task_key="a task",
+                    dynamic_key=str(i),
+                    state=states.Running(),
+                ),
+            )
+
+    set_task_run_states_calls = []
+
+    async def set_task_run_states(session, task_run_states, force):
+        # leave the task runs active, as a rejected or lost update would
+        set_task_run_states_calls.append(task_run_states)
+
+    monkeypatch.setattr(
+        "syntask.server.models.task_runs.set_task_run_states", set_task_run_states
+    )
+
+    service = CancellationCleanup()
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    assert [len(call) for call in set_task_run_states_calls] == [2, 2, 1]
+
+
+async def test_service_leaves_subflows_of_active_runs_alone(
+    session, flow_run, orphaned_subflow_run_maker
+):
+    async with session.begin():
+        await models.flow_runs.set_flow_run_state(
+            session=session, flow_run_id=flow_run.id, state=states.Running()
+        )
+    subflow_run = await orphaned_subflow_run_maker(flow_run, states.Running)
+
+    await CancellationCleanup().start(loops=1)
+
+    await session.refresh(subflow_run)
+    assert subflow_run.state.type == "RUNNING"
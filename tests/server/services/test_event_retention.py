@@ -0,0 +1,201 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from syntask.server.services.event_retention import EventRetention
+from syntask.server.utilities.database import get_dialect
+from syntask.server.utilities.partitions import (
+    PARTITIONS_AHEAD,
+    create_partitions,
+    drop_partitions,
+    list_partitions,
+    partition_start,
+)
+from syntask.settings import SYNTASK_API_DATABASE_CONNECTION_URL
+
+
+def is_postgres() -> bool:
+    return get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value()).name == "postgresql"
+
+
+needs_postgres = pytest.mark.skipif(
+    not is_postgres(), reason="Partitioning is only used with PostgreSQL"
+)
+
+
+def test_partition_start_daily():
+    moment = pendulum.datetime(2024, 10, 16, 13, 45, tz="America/New_York")
+    assert partition_start(moment, "daily") == pendulum.datetime(2024, 10, 16, tz="UTC")
+
+
+def test_partition_start_weekly():
+    moment = pendulum.datetime(2024, 10, 16, 13, 45, tz="UTC")
+    assert partition_start(moment, "weekly") == pendulum.datetime(
+        2024, 10, 14, tz="UTC"
+    )
+
+
+def test_partition_start_unknown_interval():
+    with pytest.raises(ValueError, match="Unknown partition interval 'hourly'"):
+        partition_start(pendulum.now("UTC"), "hourly")
+
+
+async def test_does_nothing_without_partitioned_tables():
+    if is_postgres():
+        pytest.skip("The events tables are partitioned on PostgreSQL")
+
+    await EventRetention().start(loops=1)
+
+
+@needs_postgres
+class TestPartitions:
+    @pytest.fixture
+    async def table(self, session):
+        async with session.begin():
+            await session.execute(
+                sa.text(
+                    "CREATE TABLE retention_test (id uuid, occurred timestamptz NOT NULL) "
+                    "PARTITION BY RANGE (occurred)"
+                )
+            )
+            await session.execute(
+                sa.text(
+                    "CREATE TABLE retention_test_default PARTITION OF retention_test DEFAULT"
+                )
+            )
+        yield "retention_test"
+        async with session.begin():
+            await session.execute(sa.text("DROP TABLE retention_test"))
+
+    async def insert(self, session, table, *occurred):
+        await session.execute(
+            sa.text(f"INSERT INTO {table} (id, occurred) VALUES (:id, :occurred)"),
+            [{"id": uuid4(), "occurred": o} for o in occurred],
+        )
+
+    async def count(self, session, table) -> int:
+        result = await session.execute(sa.text(f"SELECT count(*) FROM {table}"))
+        return result.scalar()
+
+    async def test_creates_partitions_ahead(self, session, table):
+        today = partition_start(pendulum.now("UTC"), "daily")
+        through = today.add(days=PARTITIONS_AHEAD)
+
+        async with session.begin():
+            created = await create_partitions(
+                session, table, "daily", through, column="occurred"
+            )
+
+        assert [(p.start, p.end) for p in created] == [
+            (today.add(days=i), today.add(days=i + 1))
+            for i in range(PARTITIONS_AHEAD + 1)
+        ]
+
+        async with session.begin():
+            partitions = await list_partitions(session, table)
+            assert [p.name for p in partitions] == [
+                *(p.name for p in created),
+                "retention_test_default",
+            ]
+            assert partitions[-1].default
+
+            # partitions that already exist are not created again
+            created_again = await create_partitions(
+                session, table, "daily", through, column="occurred"
+            )
+            assert created_again == []
+
+    async def test_moves_rows_from_the_default_partition(self, session, table):
+        now = pendulum.now("UTC")
+        async with session.begin():
+            await self.insert(session, table, now, now.subtract(days=30))
+            await create_partitions(session, table, "daily", now, column="occurred")
+
+        async with session.begin():
+            assert await self.count(session, f"{table}_p{now.format('YYYYMMDD')}") == 1
+            assert await self.count(session, "retention_test_default") == 1
+            assert await self.count(session, table) == 2
+
+    async def test_continues_after_the_latest_partition(self, session, table):
+        today = partition_start(pendulum.now("UTC"), "daily")
+        async with session.begin():
+            await create_partitions(session, table, "daily", today, column="occurred")
+            created = await create_partitions(
+                session, table, "weekly", today.add(weeks=1), column="occurred"
+            )
+
+        assert created[0].start == today.add(days=1)
+        assert all(p.start.day_of_week == pendulum.MONDAY for p in created[1:])
+
+    async def test_switches_from_daily_to_weekly_partitions(self, session, table):
+        today = partition_start(pendulum.now("UTC"), "daily")
+        async with session.begin():
+            # a week of daily partitions always includes the start of a week
+            await create_partitions(
+                session, table, "daily", today.add(days=7), column="occurred"
+            )
+            created = await create_partitions(
+                session, table, "weekly", today.add(weeks=3), column="occurred"
+            )
+
+        assert created[0].start == today.add(days=8)
+        assert created[0].name == f"{table}_p{today.add(days=8).format('YYYYMMDD')}"
+        assert all(p.start.day_of_week == pendulum.MONDAY for p in created[1:])
+
+        async with session.begin():
+            partitions = await list_partitions(session, table)
+            assert len({p.name for p in partitions}) == len(partitions)
+            assert partitions[-2].end == created[-1].end
+
+    async def test_drops_expired_partitions(self, session, table):
+        now = pendulum.now("UTC")
+        async with session.begin():
+            await session.execute(
+                sa.text(
+                    "CREATE TABLE retention_test_old PARTITION OF retention_test "
+                    f"FOR VALUES FROM (MINVALUE) TO ('{now.subtract(days=2)}')"
+                )
+            )
+            await self.insert(
+                session, table, now, now.subtract(days=3), now.subtract(days=30)
+            )
+            await create_partitions(session, table, "daily", now, column="occurred")
+
+        async with session.begin():
+            dropped = await drop_partitions(
+                session, table, older_than=now - timedelta(days=1), column="occurred"
+            )
+
+        assert [p.name for p in dropped] == ["retention_test_old"]
+
+        async with session.begin():
+            assert "retention_test_old" not in {
+                p.name for p in await list_partitions(session, table)
+            }
+            assert await self.count(session, table) == 1
+
+    async def test_drops_expired_rows_from_the_default_partition(self, session, table):
+        now = pendulum.now("UTC")
+        async with session.begin():
+            await self.insert(session, table, now, now.subtract(days=30))
+
+        async with session.begin():
+            dropped = await drop_partitions(
+                session, table, now.subtract(days=1), column="occurred"
+            )
+            assert dropped == []
+
+        async with session.begin():
+            assert await self.count(session, "retention_test_default") == 1
+
+    async def test_service_creates_partitions_for_events(self, session):
+        await EventRetention().start(loops=1)
+
+        ahead = pendulum.now("UTC").add(days=PARTITIONS_AHEAD)
+        async with session.begin():
+            for events_table in ("events", "event_resources"):
+                partitions = await list_partitions(session, events_table)
+                assert max(p.end for p in partitions if p.end) > ahead
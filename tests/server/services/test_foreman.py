@@ -13,10 +13,12 @@ from syntask.server.database.dependencies import db_injector
 from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.events.clients import AssertingEventsClient
 from syntask.server.schemas.statuses import DeploymentStatus
-from syntask.server.services.foreman import Foreman
+from syntask.server.services.foreman import Foreman, get_poll_aggregator
 from syntask.settings import (
     SYNTASK_API_SERVICES_FOREMAN_FALLBACK_HEARTBEAT_INTERVAL_SECONDS,
     SYNTASK_API_SERVICES_FOREMAN_INACTIVITY_HEARTBEAT_MULTIPLE,
+    SYNTASK_API_SERVICES_FOREMAN_POLL_AGGREGATION_ENABLED,
+    temporary_settings,
 )
 
 if TYPE_CHECKING:
@@ -897,3 +899,157 @@ class TestForemanWorkQueueService:
         await Foreman().run_once()
 
         assert len(AssertingEventsClient.all) == 0
+
+
+class TestForemanPollAggregation:
+    @pytest.fixture
+    async def foreman(self):
+        with temporary_settings(
+            {SYNTASK_API_SERVICES_FOREMAN_POLL_AGGREGATION_ENABLED: True}
+        ):
+            foreman = Foreman()
+            await foreman._on_start()
+        try:
+            yield foreman
+        finally:
+            await foreman._on_stop()
+
+    async def test_aggregation_is_off_by_default(self):
+        foreman = Foreman()
+        await foreman._on_start()
+        try:
+            assert get_poll_aggregator() is None
+        finally:
+            await foreman._on_stop()
+
+    async def test_polls_and_heartbeats_are_written_on_the_next_loop(
+        self,
+        foreman: Foreman,
+        ready_work_pool: "ORMWorkPool",
+        client: AsyncClient,
+    ):
+        assert get_poll_aggregator() is foreman._poll_aggregator
+
+        for _ in range(3):
+            response = await client.post(
+                f"/work_pools/{ready_work_pool.name}/workers/heartbeat",
+                json=dict(name="test-worker", heartbeat_interval_seconds=10),
+            )
+            assert response.status_code == 204, response.text
+
+            response = await client.post(
+                f"/work_pools/{ready_work_pool.name}/get_scheduled_flow_runs"
+            )
+            assert response.status_code == 200, response.text
+
+        workers_response = await client.post(
+            f"/work_pools/{ready_work_pool.name}/workers/filter"
+        )
+        assert workers_response.json() == []
+
+        work_queue_response = await client.get(
+            f"/work_queues/{ready_work_pool.default_queue_id}"
+        )
+        assert work_queue_response.json()["last_polled"] is None
+
+        await foreman.run_once()
+
+        workers_response = await client.post(
+            f"/work_pools/{ready_work_pool.name}/workers/filter"
+        )
+        assert len(workers_response.json()) == 1
+        assert workers_response.json()[0]["status"] == "ONLINE"
+        assert workers_response.json()[0]["heartbeat_interval_seconds"] == 10
+
+        work_queue_response = await client.get(
+            f"/work_queues/{ready_work_pool.default_queue_id}"
+        )
+        assert work_queue_response.json()["last_polled"] is not None
+        assert work_queue_response.json()["status"] == "READY"
+
+    async def test_heartbeats_for_not_ready_work_pools_are_written_immediately(
+        self,
+        foreman: Foreman,
+        not_ready_work_pool: "ORMWorkPool",
+        client: AsyncClient,
+    ):
+        response = await client.post(
+            f"/work_pools/{not_ready_work_pool.name}/workers/heartbeat",
+            json=dict(name="test-worker"),
+        )
+        assert response.status_code == 204, response.text
+
+        work_pool_response = await client.get(f"/work_pools/{not_ready_work_pool.name}")
+        assert work_pool_response.json()["status"] == "READY"
+
+        workers_response = await client.post(
+            f"/work_pools/{not_ready_work_pool.name}/workers/filter"
+        )
+        assert len(workers_response.json()) == 1
+
+    async def test_polls_are_written_when_the_foreman_stops(
+        self,
+        ready_work_pool: "ORMWorkPool",
+        client: AsyncClient,
+    ):
+        with temporary_settings(
+            {SYNTASK_API_SERVICES_FOREMAN_POLL_AGGREGATION_ENABLED: True}
+        ):
+            foreman = Foreman()
+            await foreman._on_start()
+
+        response = await client.post(
+            f"/work_pools/{ready_work_pool.name}/get_scheduled_flow_runs"
+        )
+        assert response.status_code == 200, response.text
+
+        await foreman._on_stop()
+        assert get_poll_aggregator() is None
+
+        work_queue_response = await client.get(
+            f"/work_queues/{ready_work_pool.default_queue_id}"
+        )
+        assert work_queue_response.json()["last_polled"] is not None
+
+    async def test_polls_are_kept_when_a_flush_fails(
+        self,
+        foreman: Foreman,
+        ready_work_pool: "ORMWorkPool",
+        client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        async def fail(**kwargs):
+            raise RuntimeError("database unavailable")
+
+        response = await client.post(
+            f"/work_pools/{ready_work_pool.name}/workers/heartbeat",
+            json=dict(name="test-worker"),
+        )
+        assert response.status_code == 204, response.text
+        response = await client.post(
+            f"/work_pools/{ready_work_pool.name}/get_scheduled_flow_runs"
+        )
+        assert response.status_code == 200, response.text
+
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                "syntask.server.services.foreman.mark_work_queues_ready", fail
+            )
+            with pytest.raises(RuntimeError, match="database unavailable"):
+                await foreman._poll_aggregator.flush()
+
+        workers_response = await client.post(
+            f"/work_pools/{ready_work_pool.name}/workers/filter"
+        )
+        assert len(workers_response.json()) == 1
+        work_queue_response = await client.get(
+            f"/work_queues/{ready_work_pool.default_queue_id}"
+        )
+        assert work_queue_response.json()["last_polled"] is None
+
+        await foreman._poll_aggregator.flush()
+
+        work_queue_response = await client.get(
+            f"/work_queues/{ready_work_pool.default_queue_id}"
+        )
+        assert work_queue_response.json()["last_polled"] is not None
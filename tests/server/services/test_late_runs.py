@@ -265,3 +265,68 @@ async def test_mark_late_runs_ignores_missing_runs(late_run: "ORMFlowRun"):
             await service.run_once()
         finally:
             await service._on_stop()
+
+
+async def test_mark_late_runs_marks_runs_across_batches(session, flow):
+    async with session.begin():
+        late_runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=schemas.states.Scheduled(
+                        scheduled_time=pendulum.now("UTC").subtract(minutes=1)
+                    ),
+                ),
+            )
+            for _ in range(5)
+        ]
+
+    service = MarkLateRuns()
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    for late_run in late_runs:
+        await session.refresh(late_run)
+        assert late_run.state_name == "Late"
+        assert late_run.state.name == "Late"
+        assert late_run.state.state_details.scheduled_time == (
+            late_run.next_scheduled_start_time
+        )
+
+
+async def test_mark_late_runs_updates_parent_task_of_late_subflow(
+    session, flow, flow_run
+):
+    async with session.begin():
+        parent_task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="a virtual task",
+                dynamic_key="a virtual dynamic key",
+                state=schemas.states.Scheduled(
+                    scheduled_time=pendulum.now("UTC").subtract(minutes=1)
+                ),
+            ),
+        )
+        late_subflow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                parent_task_run_id=parent_task_run.id,
+                state=schemas.states.Scheduled(
+                    scheduled_time=pendulum.now("UTC").subtract(minutes=1)
+                ),
+            ),
+        )
+
+    await MarkLateRuns().start(loops=1)
+
+    await session.refresh(late_subflow_run)
+    await session.refresh(parent_task_run)
+    assert late_subflow_run.state_name == "Late"
+    assert parent_task_run.state_name == "Late"
+    assert parent_task_run.state.state_details.child_flow_run_id == (
+        late_subflow_run.id
+    )
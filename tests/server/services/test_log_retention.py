@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from syntask.server import models
+from syntask.server.schemas.actions import LogCreate
+from syntask.server.services.log_retention import LogRetention
+from syntask.server.utilities.database import get_dialect
+from syntask.server.utilities.partitions import PARTITIONS_AHEAD, list_partitions
+from syntask.settings import (
+    SYNTASK_API_DATABASE_CONNECTION_URL,
+    SYNTASK_API_LOGS_RETENTION_PERIOD,
+    temporary_settings,
+)
+
+
+def is_postgres() -> bool:
+    return get_dialect(SYNTASK_API_DATABASE_CONNECTION_URL.value()).name == "postgresql"
+
+
+needs_postgres = pytest.mark.skipif(
+    not is_postgres(), reason="Partitioning is only used with PostgreSQL"
+)
+
+
+async def test_does_nothing_without_a_partitioned_log_table():
+    if is_postgres():
+        pytest.skip("The log table is partitioned on PostgreSQL")
+
+    await LogRetention().start(loops=1)
+
+
+@needs_postgres
+class TestLogRetention:
+    async def count_logs(self, session) -> int:
+        result = await session.execute(sa.text("SELECT count(*) FROM log"))
+        return result.scalar()
+
+    async def test_creates_partitions_for_logs(self, session):
+        await LogRetention().start(loops=1)
+
+        ahead = pendulum.now("UTC").add(days=PARTITIONS_AHEAD)
+        async with session.begin():
+            partitions = await list_partitions(session, "log")
+            assert max(p.end for p in partitions if p.end) > ahead
+
+    async def test_keeps_logs_without_a_retention_period(self, session):
+        await LogRetention().start(loops=1)
+
+        old = pendulum.now("UTC").subtract(years=1)
+        async with session.begin():
+            await models.logs.create_logs(
+                session=session,
+                logs=[LogCreate(name="test", level=20, message="old", timestamp=old)],
+            )
+            before = await self.count_logs(session)
+
+        await LogRetention().start(loops=1)
+
+        async with session.begin():
+            assert await self.count_logs(session) == before
+
+    async def test_drops_expired_logs(self, session):
+        now = pendulum.now("UTC")
+        async with session.begin():
+            await models.logs.create_logs(
+                session=session,
+                logs=[
+                    LogCreate(name="test", level=20, message="new", timestamp=now),
+                    LogCreate(
+                        name="test",
+                        level=20,
+                        message="old",
+                        timestamp=now.subtract(days=30),
+                    ),
+                ],
+            )
+
+        with temporary_settings({SYNTASK_API_LOGS_RETENTION_PERIOD: timedelta(days=7)}):
+            await LogRetention().start(loops=1)
+
+        async with session.begin():
+            result = await session.execute(
+                sa.text("SELECT message FROM log WHERE name = 'test'")
+            )
+            assert result.scalars().all() == ["new"]
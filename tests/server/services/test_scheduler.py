@@ -5,10 +5,19 @@ import pytest
 import sqlalchemy as sa
 
 from syntask.server import models, schemas
-from syntask.server.services.scheduler import RecentDeploymentsScheduler, Scheduler
+from syntask.server.database import orm_models
+from syntask.server.services.scheduler import (
+    RecentDeploymentsScheduler,
+    Scheduler,
+    assign_shards,
+    shard_range,
+)
 from syntask.settings import (
+    SYNTASK_API_SERVICES_SCHEDULER_COORDINATION_ENABLED,
     SYNTASK_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE,
     SYNTASK_API_SERVICES_SCHEDULER_MIN_RUNS,
+    SYNTASK_API_SERVICES_SCHEDULER_SHARDS,
+    temporary_settings,
 )
 
 
@@ -369,6 +378,175 @@ async def test_only_looks_at_deployments_with_active_schedules(
     assert deployment_ids[0] == deployment_with_active_schedules.id
 
 
+class TestScheduleWatermarks:
+    async def read_schedules(self, session, deployment_id):
+        # inactive schedules are never scheduled, so they never have watermarks
+        result = await session.execute(
+            sa.select(orm_models.DeploymentSchedule)
+            .where(
+                orm_models.DeploymentSchedule.deployment_id == deployment_id,
+                orm_models.DeploymentSchedule.active.is_(True),
+            )
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().all()
+
+    async def test_scheduling_records_watermarks(
+        self, session, deployment_with_active_schedules
+    ):
+        await Scheduler().start(loops=1)
+
+        runs = await models.flow_runs.read_flow_runs(session)
+        latest = max(r.state.state_details.scheduled_time for r in runs)
+
+        schedules = await self.read_schedules(
+            session, deployment_with_active_schedules.id
+        )
+        assert all(s.next_due for s in schedules)
+        assert all(s.next_due > pendulum.now("UTC") for s in schedules)
+        assert max(s.scheduled_through for s in schedules) == latest
+
+    async def test_schedules_that_are_not_due_are_skipped(
+        self, session, deployment_with_active_schedules
+    ):
+        service = Scheduler()
+        await service.start(loops=1)
+
+        query = service._get_select_deployments_to_schedule_query()
+        deployment_ids = (await session.execute(query)).scalars().all()
+        assert deployment_ids == []
+
+    async def test_deleting_scheduled_runs_clears_watermarks(
+        self, session, deployment_with_active_schedules
+    ):
+        await Scheduler().start(loops=1)
+
+        await models.deployments._delete_scheduled_runs(
+            session=session, deployment_id=deployment_with_active_schedules.id
+        )
+        await session.commit()
+
+        schedules = await self.read_schedules(
+            session, deployment_with_active_schedules.id
+        )
+        assert all(s.next_due is None for s in schedules)
+        assert all(s.scheduled_through is None for s in schedules)
+
+        # the next loop generates the runs again
+        await Scheduler().start(loops=1)
+        assert await models.flow_runs.count_flow_runs(session) > 0
+
+    async def test_deleting_a_scheduled_run_clears_watermarks(
+        self, session, deployment_with_active_schedules
+    ):
+        await Scheduler().start(loops=1)
+        n_runs = await models.flow_runs.count_flow_runs(session)
+
+        runs = await models.flow_runs.read_flow_runs(session, limit=1)
+        assert await models.flow_runs.delete_flow_run(
+            session=session, flow_run_id=runs[0].id
+        )
+        await session.commit()
+
+        schedules = await self.read_schedules(
+            session, deployment_with_active_schedules.id
+        )
+        assert all(s.next_due is None for s in schedules)
+
+        # the next loop replaces the deleted run
+        await Scheduler().start(loops=1)
+        assert await models.flow_runs.count_flow_runs(session) == n_runs
+
+    async def test_watermarks_are_not_recorded_over_a_concurrent_clear(
+        self, session, deployment_with_active_schedules
+    ):
+        watermarks = {}
+        runs = await models.deployments._generate_scheduled_flow_runs(
+            session=session,
+            deployment_id=deployment_with_active_schedules.id,
+            start_time=pendulum.now("UTC"),
+            end_time=pendulum.now("UTC").add(days=100),
+            min_time=datetime.timedelta(hours=1),
+            min_runs=3,
+            max_runs=10,
+            watermarks=watermarks,
+        )
+        await models.deployments._insert_scheduled_flow_runs(session=session, runs=runs)
+        await session.commit()
+
+        # the deployment's runs are deleted after the scheduler generated them
+        await models.deployments._delete_scheduled_runs(
+            session=session, deployment_id=deployment_with_active_schedules.id
+        )
+        await session.commit()
+
+        await models.deployments._set_deployment_schedule_watermarks(
+            session=session, watermarks=watermarks
+        )
+        await session.commit()
+
+        schedules = await self.read_schedules(
+            session, deployment_with_active_schedules.id
+        )
+        assert schedules
+        assert all(s.next_due is None for s in schedules)
+
+    async def test_updating_a_schedule_clears_its_watermark(
+        self, session, deployment_with_active_schedules
+    ):
+        await Scheduler().start(loops=1)
+
+        schedule = (
+            await self.read_schedules(session, deployment_with_active_schedules.id)
+        )[0]
+        await models.deployments.update_deployment_schedule(
+            session=session,
+            deployment_id=deployment_with_active_schedules.id,
+            deployment_schedule_id=schedule.id,
+            schedule=schemas.actions.DeploymentScheduleUpdate(active=True),
+        )
+        await session.commit()
+
+        schedules = await self.read_schedules(
+            session, deployment_with_active_schedules.id
+        )
+        assert {s.id for s in schedules if s.next_due is None} == {schedule.id}
+
+    @pytest.mark.parametrize(
+        "offsets,expected",
+        [
+            # due when fewer than three runs would remain
+            ([1, 2, 3, 90], 2),
+            # due when the last run is less than an hour away
+            ([100, 110, 120], 60),
+            # never earlier than when the runs were generated
+            ([0, 1], 0),
+        ],
+    )
+    def test_next_due(self, offsets, expected):
+        start = pendulum.datetime(2024, 1, 1, tz="UTC")
+        dates = [start.add(minutes=offset) for offset in offsets]
+
+        next_due = models.deployments._next_due(
+            dates,
+            start_time=start,
+            min_time=datetime.timedelta(hours=1),
+            min_runs=3,
+        )
+        assert next_due == start.add(minutes=expected)
+
+    def test_next_due_without_dates(self):
+        start = pendulum.datetime(2024, 1, 1, tz="UTC")
+
+        next_due = models.deployments._next_due(
+            [],
+            start_time=start,
+            min_time=datetime.timedelta(hours=1),
+            min_runs=3,
+        )
+        assert next_due == start.add(hours=1)
+
+
 class TestRecentDeploymentsScheduler:
     async def test_tight_loop_by_default(self):
         assert RecentDeploymentsScheduler().loop_seconds == 5
@@ -463,6 +641,115 @@ class TestRecentDeploymentsScheduler:
         assert deployment_ids[0] == deployment_with_active_schedules.id
 
 
+class TestCoordinatedScheduler:
+    @pytest.fixture(autouse=True)
+    def enable_coordination(self):
+        with temporary_settings(
+            {
+                SYNTASK_API_SERVICES_SCHEDULER_COORDINATION_ENABLED: True,
+                SYNTASK_API_SERVICES_SCHEDULER_SHARDS: 4,
+            }
+        ):
+            yield
+
+    @pytest.fixture
+    async def deployments(self, flow, session):
+        deployments = [
+            await models.deployments.create_deployment(
+                session=session,
+                deployment=schemas.core.Deployment(
+                    name=f"test-{i}",
+                    flow_id=flow.id,
+                    schedules=[
+                        schemas.core.DeploymentSchedule(
+                            schedule=schemas.schedules.IntervalSchedule(
+                                interval=datetime.timedelta(hours=1)
+                            ),
+                            active=True,
+                        )
+                    ],
+                ),
+            )
+            for i in range(20)
+        ]
+        await session.commit()
+        return deployments
+
+    def test_shard_ranges_cover_the_id_space(self):
+        ranges = [shard_range(shard, 4) for shard in range(4)]
+
+        assert ranges[0][0] is None
+        assert ranges[-1][1] is None
+        for (_, upper), (lower, _) in zip(ranges, ranges[1:]):
+            assert upper == lower
+
+    def test_shard_range_for_a_single_shard_is_unbounded(self):
+        assert shard_range(0, 1) == (None, None)
+
+    def test_shards_are_assigned_to_exactly_one_holder(self):
+        holders = ["a", "b", "c"]
+        assigned = [assign_shards(holder, holders, 16) for holder in holders]
+
+        assert sorted(sum(assigned, [])) == list(range(16))
+
+    def test_only_the_shards_of_a_departing_holder_move(self):
+        before = {
+            holder: set(assign_shards(holder, ["a", "b", "c"], 16))
+            for holder in ["a", "b", "c"]
+        }
+        after = {
+            holder: set(assign_shards(holder, ["a", "b"], 16)) for holder in ["a", "b"]
+        }
+
+        assert before["a"] <= after["a"]
+        assert before["b"] <= after["b"]
+        assert after["a"] | after["b"] == set(range(16))
+
+    async def test_single_replica_schedules_every_deployment(
+        self, session, deployments
+    ):
+        await Scheduler().start(loops=1)
+
+        runs = await models.flow_runs.read_flow_runs(session)
+        assert {run.deployment_id for run in runs} == {d.id for d in deployments}
+
+    async def test_replicas_schedule_only_their_shards(self, session, deployments):
+        first, second = Scheduler(), Scheduler()
+
+        # both replicas take their leases before either schedules
+        await first._claim_shard_ranges()
+        second_ranges = await second._claim_shard_ranges()
+        first_ranges = await first._claim_shard_ranges()
+        assert first_ranges and second_ranges
+
+        await first.run_once()
+
+        def in_ranges(deployment_id, ranges):
+            return any(
+                (lower is None or deployment_id >= lower)
+                and (upper is None or deployment_id < upper)
+                for lower, upper in ranges
+            )
+
+        runs = await models.flow_runs.read_flow_runs(session)
+        scheduled = {run.deployment_id for run in runs}
+        assert scheduled == {d.id for d in deployments if in_ranges(d.id, first_ranges)}
+
+        await second.run_once()
+
+        runs = await models.flow_runs.read_flow_runs(session)
+        assert {run.deployment_id for run in runs} == {d.id for d in deployments}
+
+    async def test_releases_lease_on_stop(self, session):
+        service = Scheduler()
+        await service.start(loops=1)
+
+        holders = await models.service_leases.read_service_lease_holders(
+            session=session, service=service.name
+        )
+        assert service.lease_holder not in holders
+
+
 class TestScheduleRulesWaterfall:
     @pytest.mark.parametrize(
         "interval,n",
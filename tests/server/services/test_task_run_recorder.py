@@ -6,8 +6,10 @@ from uuid import UUID
 
 import pendulum
 import pytest
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from syntask.server.database.interface import SyntaskDBInterface
 from syntask.server.events.schemas.events import ReceivedEvent
 from syntask.server.models.flow_runs import create_flow_run
 from syntask.server.models.task_run_states import (
@@ -20,6 +22,10 @@ from syntask.server.schemas.states import StateDetails, StateType
 from syntask.server.services import task_run_recorder
 from syntask.server.utilities.messaging import MessageHandler
 from syntask.server.utilities.messaging.memory import MemoryMessage
+from syntask.settings import (
+    SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED,
+    temporary_settings,
+)
 
 
 async def test_start_and_stop_service():
@@ -541,6 +547,41 @@ async def test_updates_task_run_on_subsequent_state_changes(
     )
 
 
+async def test_recording_terminal_state_updates_rollup(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    pending_event: ReceivedEvent,
+    running_event: ReceivedEvent,
+    completed_event: ReceivedEvent,
+    task_run_recorder_handler: MessageHandler,
+):
+    with temporary_settings({SYNTASK_API_TASK_RUN_DASHBOARD_ROLLUPS_ENABLED: True}):
+        await task_run_recorder_handler(message(pending_event))
+        await task_run_recorder_handler(message(running_event))
+        await task_run_recorder_handler(message(completed_event))
+
+    result = await session.execute(sa.select(db.TaskRunStateRollup))
+    assert [(r.bucket, r.state_type, r.count) for r in result.scalars().all()] == [
+        (pendulum.datetime(2024, 1, 1, 0, 1, 0, 0, "UTC"), StateType.COMPLETED, 1)
+    ]
+
+
+async def test_recording_does_not_update_rollup_when_disabled(
+    db: SyntaskDBInterface,
+    session: AsyncSession,
+    pending_event: ReceivedEvent,
+    running_event: ReceivedEvent,
+    completed_event: ReceivedEvent,
+    task_run_recorder_handler: MessageHandler,
+):
+    await task_run_recorder_handler(message(pending_event))
+    await task_run_recorder_handler(message(running_event))
+    await task_run_recorder_handler(message(completed_event))
+
+    result = await session.execute(sa.select(db.TaskRunStateRollup))
+    assert result.scalars().all() == []
+
+
 async def test_updates_only_fields_that_are_set(
     session: AsyncSession,
     pending_event: ReceivedEvent,
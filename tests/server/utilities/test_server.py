@@ -30,3 +30,46 @@ class TestParsing:
         quoted_response = client.get(urllib.parse.quote(f"/{x}"))
 
         assert x == response.json() == quoted_response.json()
+
+
+class TestConditionalResponses:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        router = SyntaskRouter()
+
+        @router.get("/{x}")
+        def echo(x: str):
+            return x
+
+        @router.post("/{x}")
+        def post_echo(x: str):
+            return x
+
+        app.include_router(router)
+        client = TestClient(app)
+        return client
+
+    def test_get_responses_have_etags(self, client):
+        response = client.get("/hello")
+        assert response.headers["ETag"]
+        assert client.get("/hello").headers["ETag"] == response.headers["ETag"]
+        assert client.get("/goodbye").headers["ETag"] != response.headers["ETag"]
+
+    def test_matching_etag_is_not_modified(self, client):
+        etag = client.get("/hello").headers["ETag"]
+
+        response = client.get("/hello", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_stale_etag_is_sent_the_response(self, client):
+        etag = client.get("/hello").headers["ETag"]
+
+        response = client.get("/goodbye", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == "goodbye"
+
+    def test_post_responses_have_no_etags(self, client):
+        assert "ETag" not in client.post("/hello").headers
@@ -15,6 +15,7 @@ from syntask.cache_policies import (
     _None,
 )
 from syntask.context import TaskRunContext
+from syntask.utilities.hashing import hash_objects
 
 
 class TestBaseClass:
@@ -111,6 +112,46 @@ class TestInputsPolicy:
             )
             assert new_key == key
 
+    def test_key_is_unchanged_for_json_inputs(self):
+        policy = Inputs()
+        key = policy.compute_key(task_ctx=None, inputs={"x": 42}, flow_parameters=None)
+        assert key == hash_objects({"x": 42})
+
+    def test_key_varies_on_buffer_contents(self):
+        policy = Inputs()
+        key = policy.compute_key(
+            task_ctx=None, inputs={"x": b"a" * 10}, flow_parameters=None
+        )
+        assert key is not None
+        assert key == policy.compute_key(
+            task_ctx=None, inputs={"x": b"a" * 10}, flow_parameters=None
+        )
+        assert key != policy.compute_key(
+            task_ctx=None, inputs={"x": b"b" * 10}, flow_parameters=None
+        )
+
+    @pytest.mark.parametrize("hash_algorithm", ["md5", "sha256", "blake2b"])
+    def test_key_uses_hash_algorithm(self, hash_algorithm):
+        inputs = {"x": 42, "y": b"data"}
+        key = Inputs(hash_algorithm=hash_algorithm).compute_key(
+            task_ctx=None, inputs=inputs, flow_parameters=None
+        )
+        assert key is not None
+        if hash_algorithm != "md5":
+            assert key != Inputs().compute_key(
+                task_ctx=None, inputs=inputs, flow_parameters=None
+            )
+
+    def test_unknown_hash_algorithm_raises(self):
+        policy = Inputs(hash_algorithm="foo")
+        with pytest.raises(ValueError, match="Unknown hash algorithm"):
+            policy.compute_key(task_ctx=None, inputs={"x": 42}, flow_parameters=None)
+
+    def test_subtraction_preserves_hash_algorithm(self):
+        policy = Inputs(hash_algorithm="blake2b") - "y"
+        assert policy.exclude == ["y"]
+        assert policy.hash_algorithm == "blake2b"
+
 
 class TestCompoundPolicy:
     def test_initializes(self):
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import uuid
 from collections import OrderedDict
 from concurrent.futures import Future
@@ -16,6 +17,9 @@ from syntask.futures import (
     SyntaskFutureList,
     SyntaskWrappedFuture,
     as_completed,
+    as_completed_async,
+    iter_in_order,
+    iter_in_order_async,
     resolve_futures_to_states,
     wait,
 )
@@ -76,6 +80,124 @@ class TestUtilityFunctions:
             exc_info.value.args[0] == f"1 (of {len(mock_futures)}) futures unfinished"
         )
 
+    def test_as_completed_limits_futures_in_flight(self):
+        taken = []
+        max_in_flight = 0
+
+        def lazily_submit():
+            nonlocal max_in_flight
+            for i in range(10):
+                future = SyntaskConcurrentFuture(uuid.uuid4(), Future())
+                taken.append(future)
+                max_in_flight = max(
+                    max_in_flight,
+                    sum(not f.wrapped_future.done() for f in taken),
+                )
+                threading.Timer(
+                    0.01, future.wrapped_future.set_result, [Completed(data=i)]
+                ).start()
+                yield future
+
+        completed = as_completed(lazily_submit(), max_in_flight=3)
+        assert taken == []
+        assert sorted(future.result() for future in completed) == list(range(10))
+        assert max_in_flight <= 3
+
+    def test_as_completed_with_max_in_flight_yields_completed_futures(self):
+        mock_futures = [MockFuture(data=i) for i in range(5)]
+        completed = list(as_completed(iter(mock_futures), max_in_flight=2))
+        assert completed == mock_futures
+
+    def test_as_completed_rejects_invalid_max_in_flight(self):
+        with pytest.raises(ValueError, match="must be at least 1"):
+            list(as_completed([], max_in_flight=0))
+
+    def test_iter_in_order(self):
+        futures = [SyntaskConcurrentFuture(uuid.uuid4(), Future()) for _ in range(5)]
+        for i, future in enumerate(futures):
+            # complete later futures first
+            threading.Timer(
+                0.01 * (5 - i), future.wrapped_future.set_result, [Completed(data=i)]
+            ).start()
+
+        assert [future.result() for future in iter_in_order(futures, 2)] == [
+            0,
+            1,
+            2,
+            3,
+            4,
+        ]
+
+    def test_iter_in_order_limits_futures_in_flight(self):
+        taken = []
+
+        def lazily_submit():
+            for i in range(10):
+                taken.append(i)
+                yield MockFuture(data=i)
+
+        for yielded, future in enumerate(iter_in_order(lazily_submit(), 3), start=1):
+            assert len(taken) - yielded <= 2
+            assert future.result() == yielded - 1
+
+    async def test_as_completed_async_limits_futures_in_flight(self):
+        taken = []
+        max_in_flight = 0
+
+        async def lazily_submit():
+            nonlocal max_in_flight
+            for i in range(10):
+                future = SyntaskConcurrentFuture(uuid.uuid4(), Future())
+                taken.append(future)
+                max_in_flight = max(
+                    max_in_flight,
+                    sum(not f.wrapped_future.done() for f in taken),
+                )
+                threading.Timer(
+                    0.01, future.wrapped_future.set_result, [Completed(data=i)]
+                ).start()
+                yield future
+
+        results = [
+            future.result()
+            async for future in as_completed_async(lazily_submit(), max_in_flight=3)
+        ]
+        assert sorted(results) == list(range(10))
+        assert max_in_flight <= 3
+
+    async def test_as_completed_async_does_not_block_the_event_loop(self):
+        future = SyntaskConcurrentFuture(uuid.uuid4(), Future())
+
+        async def submit():
+            yield future
+
+        async def complete_later():
+            await asyncio.sleep(0.01)
+            future.wrapped_future.set_result(Completed(data=1))
+
+        completer = asyncio.create_task(complete_later())
+        results = [
+            future.result()
+            async for future in as_completed_async(submit(), max_in_flight=1)
+        ]
+        await completer
+        assert results == [1]
+
+    async def test_iter_in_order_async(self):
+        futures = [SyntaskConcurrentFuture(uuid.uuid4(), Future()) for _ in range(5)]
+        for i, future in enumerate(futures):
+            # complete later futures first
+            threading.Timer(
+                0.01 * (5 - i), future.wrapped_future.set_result, [Completed(data=i)]
+            ).start()
+
+        async def submit():
+            for future in futures:
+                yield future
+
+        results = [future.result() async for future in iter_in_order_async(submit(), 2)]
+        assert results == [0, 1, 2, 3, 4]
+
     @pytest.mark.usefixtures("use_hosted_api_server")
     def test_as_completed_yields_correct_order(self):
         @task
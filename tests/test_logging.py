@@ -30,7 +30,13 @@ from syntask.logging.configuration import (
 )
 from syntask.logging.filters import ObfuscateApiKeyFilter
 from syntask.logging.formatters import JsonFormatter
-from syntask.logging.handlers import APILogHandler, APILogWorker, SyntaskConsoleHandler
+from syntask.logging.handlers import (
+    APILogHandler,
+    APILogLimiter,
+    APILogWorker,
+    SyntaskConsoleHandler,
+    TokenBucket,
+)
 from syntask.logging.highlighters import SyntaskConsoleHighlighter
 from syntask.logging.loggers import (
     SyntaskLogAdapter,
@@ -51,8 +57,13 @@ from syntask.settings import (
     SYNTASK_LOGGING_SETTINGS_PATH,
     SYNTASK_LOGGING_TO_API_BATCH_INTERVAL,
     SYNTASK_LOGGING_TO_API_BATCH_SIZE,
+    SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED,
     SYNTASK_LOGGING_TO_API_ENABLED,
+    SYNTASK_LOGGING_TO_API_FLOW_RUN_RATE_LIMIT,
+    SYNTASK_LOGGING_TO_API_LOGGER_RATE_LIMIT,
     SYNTASK_LOGGING_TO_API_MAX_LOG_SIZE,
+    SYNTASK_LOGGING_TO_API_RATE_LIMIT_BURST,
+    SYNTASK_LOGGING_TO_API_SAMPLE_RATE,
     SYNTASK_LOGGING_TO_API_WHEN_MISSING_FLOW,
     SYNTASK_TEST_MODE,
     temporary_settings,
@@ -627,6 +638,244 @@ class TestAPILogHandler:
         assert handler._get_payload_size(dict_log) == log_size
 
 
+def test_token_bucket_refills():
+    bucket = TokenBucket(rate=1000, capacity=2)
+    assert bucket.take()
+    assert bucket.take()
+    assert not bucket.take()
+
+    time.sleep(0.01)
+    assert bucket.take()
+
+
+@pytest.mark.enable_api_log_handler
+class TestAPILogLimits:
+    @pytest.fixture(autouse=True)
+    def limiter(self, monkeypatch):
+        limiter = APILogLimiter()
+        monkeypatch.setattr(APILogHandler, "_limiter", limiter)
+        yield limiter
+
+    @pytest.fixture
+    def logger(self):
+        handler = APILogHandler()
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        yield logger
+        logger.removeHandler(handler)
+
+    def sent_messages(self, mock_log_worker):
+        return [
+            call.args[0]["message"]
+            for call in mock_log_worker.instance().send.call_args_list
+        ]
+
+    def test_collapses_repeated_logs(self, logger, mock_log_worker, flow_run):
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            for message in ["a", "a", "a", "b", "b", "a"]:
+                logger.info(message, extra={"flow_run_id": flow_run.id})
+
+        assert self.sent_messages(mock_log_worker) == [
+            "a",
+            "Last message repeated 2 time(s)",
+            "b",
+            "Last message repeated 1 time(s)",
+            "a",
+        ]
+
+    def test_does_not_collapse_logs_at_other_levels(
+        self, logger, mock_log_worker, flow_run
+    ):
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            logger.info("a", extra={"flow_run_id": flow_run.id})
+            logger.error("a", extra={"flow_run_id": flow_run.id})
+
+        assert self.sent_messages(mock_log_worker) == ["a", "a"]
+
+    def test_reports_repeats_when_flow_run_finishes(
+        self, logger, mock_log_worker, flow_run
+    ):
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            for _ in range(3):
+                logger.info("a", extra={"flow_run_id": flow_run.id})
+            APILogHandler.report_limited_logs(flow_run.id)
+
+        assert self.sent_messages(mock_log_worker) == [
+            "a",
+            "Last message repeated 2 time(s)",
+        ]
+
+    def test_limits_logs_per_flow_run(self, logger, mock_log_worker, flow_run):
+        with temporary_settings(
+            {
+                SYNTASK_LOGGING_TO_API_FLOW_RUN_RATE_LIMIT: 0.001,
+                SYNTASK_LOGGING_TO_API_RATE_LIMIT_BURST: 2,
+            }
+        ):
+            for i in range(5):
+                logger.info(f"info {i}", extra={"flow_run_id": flow_run.id})
+            logger.warning("warning", extra={"flow_run_id": flow_run.id})
+            logger.info("other run", extra={"flow_run_id": uuid.uuid4()})
+            APILogHandler.report_limited_logs(flow_run.id)
+
+        assert self.sent_messages(mock_log_worker) == [
+            "info 0",
+            "info 1",
+            "warning",
+            "other run",
+            "3 log(s) of this flow run were not sent to the API because of the log "
+            "sampling or rate limit settings.",
+        ]
+        report = mock_log_worker.instance().send.call_args_list[-1].args[0]
+        assert report["level"] == logging.WARNING
+        assert report["flow_run_id"] == str(flow_run.id)
+
+    def test_limits_logs_per_logger(self, logger, mock_log_worker, flow_run):
+        other_logger = logging.getLogger(f"{__name__}.other")
+
+        with temporary_settings(
+            {
+                SYNTASK_LOGGING_TO_API_LOGGER_RATE_LIMIT: 0.001,
+                SYNTASK_LOGGING_TO_API_RATE_LIMIT_BURST: 1,
+            }
+        ):
+            for i in range(3):
+                logger.info(f"info {i}", extra={"flow_run_id": flow_run.id})
+                other_logger.info(f"other {i}", extra={"flow_run_id": flow_run.id})
+
+        assert self.sent_messages(mock_log_worker) == ["info 0", "other 0"]
+
+    def test_samples_logs_below_warning(self, logger, mock_log_worker, flow_run):
+        with temporary_settings({SYNTASK_LOGGING_TO_API_SAMPLE_RATE: 0}):
+            logger.info("info", extra={"flow_run_id": flow_run.id})
+            logger.warning("warning", extra={"flow_run_id": flow_run.id})
+            logger.error("error", extra={"flow_run_id": flow_run.id})
+
+        assert self.sent_messages(mock_log_worker) == ["warning", "error"]
+
+    def test_reports_nothing_without_dropped_logs(
+        self, logger, mock_log_worker, flow_run
+    ):
+        logger.info("info", extra={"flow_run_id": flow_run.id})
+        APILogHandler.report_limited_logs(flow_run.id)
+
+        assert self.sent_messages(mock_log_worker) == ["info"]
+
+    def test_does_not_collapse_warnings(self, logger, mock_log_worker, flow_run):
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            for _ in range(2):
+                logger.info("a", extra={"flow_run_id": flow_run.id})
+            for _ in range(2):
+                logger.warning("a", extra={"flow_run_id": flow_run.id})
+            for _ in range(2):
+                logger.error("b", extra={"flow_run_id": flow_run.id})
+
+        assert self.sent_messages(mock_log_worker) == [
+            "a",
+            "Last message repeated 1 time(s)",
+            "a",
+            "a",
+            "b",
+            "b",
+        ]
+
+    def test_reports_repeats_when_task_run_finishes(
+        self, logger, mock_log_worker, flow_run
+    ):
+        task_run_id = uuid.uuid4()
+        extra = {"flow_run_id": flow_run.id, "task_run_id": task_run_id}
+
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            for _ in range(3):
+                logger.info("a", extra=extra)
+            APILogHandler.report_limited_logs(flow_run.id, task_run_id=uuid.uuid4())
+            APILogHandler.report_limited_logs(flow_run.id, task_run_id=task_run_id)
+
+        assert self.sent_messages(mock_log_worker) == [
+            "a",
+            "Last message repeated 2 time(s)",
+        ]
+
+    def log(self, message: str, flow_run_id=None, task_run_id=None):
+        return {
+            "flow_run_id": str(flow_run_id) if flow_run_id else None,
+            "task_run_id": str(task_run_id) if task_run_id else None,
+            "name": __name__,
+            "level": logging.INFO,
+            "timestamp": pendulum.now("UTC").isoformat(),
+            "message": message,
+        }
+
+    def test_limits_task_runs_outside_of_flow_runs(self, limiter):
+        task_run_id = uuid.uuid4()
+
+        with temporary_settings(
+            {
+                SYNTASK_LOGGING_TO_API_FLOW_RUN_RATE_LIMIT: 0.001,
+                SYNTASK_LOGGING_TO_API_RATE_LIMIT_BURST: 1,
+            }
+        ):
+            settings = syntask.context.get_settings_context().settings
+            sent = [
+                log["message"]
+                for i in range(3)
+                for log in limiter.limit(
+                    self.log(f"info {i}", task_run_id=task_run_id), settings
+                )
+            ]
+
+        assert sent == ["info 0"]
+        (report,) = limiter.report(None, str(task_run_id))
+        assert report["task_run_id"] == str(task_run_id)
+        assert report["flow_run_id"] is None
+        assert report["message"].startswith("2 log(s) of this task run")
+        assert limiter.report(None, str(task_run_id)) == []
+
+    def test_does_not_keep_state_for_logs_without_a_run(self, limiter):
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            settings = syntask.context.get_settings_context().settings
+            for _ in range(2):
+                assert len(limiter.limit(self.log("a"), settings)) == 1
+
+        assert not limiter._runs
+
+    def test_reports_and_forgets_least_recently_used_runs(self):
+        limiter = APILogLimiter(max_runs=2)
+        flow_run_ids = [uuid.uuid4() for _ in range(3)]
+
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            settings = syntask.context.get_settings_context().settings
+            for flow_run_id in flow_run_ids[:2]:
+                for _ in range(2):
+                    limiter.limit(self.log("a", flow_run_id), settings)
+
+            logs = limiter.limit(self.log("a", flow_run_ids[2]), settings)
+
+        assert [(log["flow_run_id"], log["message"]) for log in logs] == [
+            (str(flow_run_ids[0]), "Last message repeated 1 time(s)"),
+            (str(flow_run_ids[2]), "a"),
+        ]
+        assert list(limiter._runs) == [str(id) for id in flow_run_ids[1:]]
+
+    def test_reports_and_forgets_idle_runs(self):
+        limiter = APILogLimiter(idle_timeout=0.01)
+        flow_run_ids = [uuid.uuid4() for _ in range(2)]
+
+        with temporary_settings({SYNTASK_LOGGING_TO_API_COLLAPSE_REPEATED: True}):
+            settings = syntask.context.get_settings_context().settings
+            for _ in range(2):
+                limiter.limit(self.log("a", flow_run_ids[0]), settings)
+            time.sleep(0.02)
+            logs = limiter.limit(self.log("b", flow_run_ids[1]), settings)
+
+        assert [log["message"] for log in logs] == [
+            "Last message repeated 1 time(s)",
+            "b",
+        ]
+        assert list(limiter._runs) == [str(flow_run_ids[1])]
+
+
 class TestAPILogWorker:
     @pytest.fixture
     async def worker(self):
@@ -1,13 +1,16 @@
 import base64
+import io
 import json
 import uuid
 from dataclasses import dataclass
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pydantic import BaseModel, ValidationError, field_validator
 
 from syntask.serializers import (
+    ColumnarSerializer,
     CompressedSerializer,
     JSONSerializer,
     PickleSerializer,
@@ -18,6 +21,23 @@ from syntask.serializers import (
 from syntask.testing.utilities import exceptions_equal
 from syntask.utilities.dispatch import get_registry_for_type
 
+# The optional columnar libraries are imported once here, since modules imported
+# during a test are unloaded after it and pyarrow keeps references to pandas types
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+requires_pyarrow = pytest.mark.skipif(pa is None, reason="Requires pyarrow")
+requires_pandas = pytest.mark.skipif(
+    pa is None or pd is None, reason="Requires pandas and pyarrow"
+)
+
 # Freeze a UUID for deterministic tests
 TEST_UUID = uuid.UUID("a53e3495-d681-4a53-84b8-9d9542f7237c")
 
@@ -368,3 +388,141 @@ class TestCompressedSerializer:
         serializer = Serializer(type="compressed/json")
         assert isinstance(serializer, CompressedSerializer)
         assert isinstance(serializer.serializer, JSONSerializer)
+
+
+class TestColumnarSerializer:
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_simple_roundtrip(self, data):
+        serializer = ColumnarSerializer()
+        serialized = serializer.dumps(data)
+        assert serializer.loads(serialized) == data
+
+    def test_numpy_array_roundtrip(self):
+        serializer = ColumnarSerializer()
+        array = np.arange(12, dtype="int32").reshape(3, 4)
+        result = serializer.loads(serializer.dumps(array))
+        np.testing.assert_array_equal(result, array)
+        assert result.dtype == array.dtype
+
+    def test_dump_writes_npy_format(self):
+        serializer = ColumnarSerializer()
+        array = np.arange(5.0)
+        file = io.BytesIO()
+        serializer.dump(array, file)
+        file.seek(0)
+        np.testing.assert_array_equal(np.load(file), array)
+
+    def test_load_memory_maps_numpy_arrays(self, tmp_path):
+        serializer = ColumnarSerializer()
+        array = np.arange(5.0)
+        path = tmp_path / "result"
+        with open(path, "wb") as file:
+            serializer.dump(array, file)
+
+        result = serializer.load(path)
+        assert isinstance(result, np.memmap)
+        np.testing.assert_array_equal(result, array)
+
+    def test_loads_accepts_raw_file_content(self):
+        serializer = ColumnarSerializer()
+        array = np.arange(5.0)
+        file = io.BytesIO()
+        serializer.dump(array, file)
+        np.testing.assert_array_equal(serializer.loads(file.getvalue()), array)
+
+    def test_object_arrays_use_fallback_serializer(self):
+        serializer = ColumnarSerializer()
+        array = np.array([{"foo": "bar"}, None], dtype=object)
+        serialized = serializer.dumps(array)
+        assert not base64.decodebytes(serialized).startswith(b"\x93NUMPY")
+
+        result = serializer.loads(serialized)
+        assert result.dtype == object
+        assert result.tolist() == array.tolist()
+
+    def test_masked_array_roundtrip(self, tmp_path):
+        serializer = ColumnarSerializer()
+        array = np.ma.masked_array([1.0, 2.0, 3.0], mask=[False, True, False])
+
+        result = serializer.loads(serializer.dumps(array))
+        assert isinstance(result, np.ma.MaskedArray)
+        np.testing.assert_array_equal(result.mask, array.mask)
+        np.testing.assert_array_equal(result.data, array.data)
+
+        path = tmp_path / "result"
+        with open(path, "wb") as file:
+            serializer.dump(array, file)
+        result = serializer.load(path)
+        assert isinstance(result, np.ma.MaskedArray)
+        np.testing.assert_array_equal(result.mask, array.mask)
+
+    def test_load_uses_fallback_serializer(self, tmp_path):
+        serializer = ColumnarSerializer(fallback_serializer="json")
+        path = tmp_path / "result"
+        with open(path, "wb") as file:
+            serializer.dump({"foo": "bar"}, file)
+
+        assert path.read_bytes() == JSONSerializer().dumps({"foo": "bar"})
+        assert serializer.load(path) == {"foo": "bar"}
+
+    @requires_pyarrow
+    def test_arrow_table_roundtrip(self, tmp_path):
+        serializer = ColumnarSerializer(record_batch_size=2)
+        table = pa.table({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+        assert serializer.loads(serializer.dumps(table)).equals(table)
+
+        path = tmp_path / "result"
+        with open(path, "wb") as file:
+            serializer.dump(table, file)
+        assert serializer.load(path).equals(table)
+
+    @requires_pandas
+    def test_pandas_dataframe_roundtrip(self, tmp_path):
+        serializer = ColumnarSerializer()
+        df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+        pd.testing.assert_frame_equal(serializer.loads(serializer.dumps(df)), df)
+
+        path = tmp_path / "result"
+        with open(path, "wb") as file:
+            serializer.dump(df, file)
+        pd.testing.assert_frame_equal(serializer.load(path), df)
+
+    @requires_pandas
+    def test_pandas_dataframe_without_arrow_schema_uses_fallback_serializer(
+        self, tmp_path
+    ):
+        serializer = ColumnarSerializer()
+        df = pd.DataFrame({"x": [1, "a", {"b": 2}]})
+
+        serialized = serializer.dumps(df)
+        assert not base64.decodebytes(serialized).startswith(b"\xff\xff\xff\xff")
+        pd.testing.assert_frame_equal(serializer.loads(serialized), df)
+
+        path = tmp_path / "result"
+        with open(path, "wb") as file:
+            serializer.dump(df, file)
+        pd.testing.assert_frame_equal(serializer.load(path), df)
+
+    @requires_pandas
+    def test_pandas_dataframe_without_arrow_schema_roundtrips_through_file_content(
+        self, tmp_path
+    ):
+        serializer = ColumnarSerializer()
+        df = pd.DataFrame({"x": [1, "a", {"b": 2}]})
+
+        path = tmp_path / "result"
+        with open(path, "wb") as file:
+            serializer.dump(df, file)
+
+        pd.testing.assert_frame_equal(serializer.loads(path.read_bytes()), df)
+
+    def test_loads_accepts_raw_fallback_file_content(self):
+        serializer = ColumnarSerializer(fallback_serializer="json")
+        file = io.BytesIO()
+        serializer.dump({"foo": "bar"}, file)
+        assert serializer.loads(file.getvalue()) == {"foo": "bar"}
+
+    def test_columnar_shorthand(self):
+        serializer = Serializer(type="columnar")
+        assert isinstance(serializer, ColumnarSerializer)
+        assert isinstance(serializer.fallback_serializer, PickleSerializer)
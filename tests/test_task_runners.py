@@ -19,7 +19,11 @@ from syntask.settings import (
     temporary_settings,
 )
 from syntask.states import Completed, Running
-from syntask.task_runners import SyntaskTaskRunner, ThreadPoolTaskRunner
+from syntask.task_runners import (
+    ProcessPoolTaskRunner,
+    SyntaskTaskRunner,
+    ThreadPoolTaskRunner,
+)
 from syntask.task_worker import serve
 from syntask.tasks import task
 
@@ -34,6 +38,21 @@ async def my_test_async_task(param1, param2):
     return param1, param2
 
 
+@task
+def sum_array(array):
+    return float(array.sum())
+
+
+@task
+def double_array(array):
+    return array * 2
+
+
+@task
+def fails():
+    raise ValueError("oops")
+
+
 @task
 def context_matters(param1=None, param2=None):
     return TagsContext.get().current_tags
@@ -189,6 +208,36 @@ class TestThreadPoolTaskRunner:
                 results = [future.result() for future in futures]
                 assert results == [{"tag1", "tag2"}] * 3
 
+    def test_iter_map_submits_lazily(self):
+        taken = []
+
+        def generate_numbers():
+            for i in range(3):
+                taken.append(i)
+                yield i
+
+        with ThreadPoolTaskRunner() as runner:
+            futures = runner.iter_map(
+                my_test_task, {"param1": generate_numbers(), "param2": 0}
+            )
+            assert taken == []
+
+            first = next(futures)
+            assert taken == [0]
+            assert first.result() == (0, 0)
+            assert [future.result() for future in futures] == [(1, 0), (2, 0)]
+
+    def test_cancel_events_are_removed_once_task_runs_finish(self):
+        with ThreadPoolTaskRunner() as runner:
+            futures = runner.map(my_test_task, {"param1": [1, 2, 3], "param2": 0})
+            futures.wait()
+            # done callbacks run just after waiters are notified
+            for _ in range(100):
+                if not runner._cancel_events:
+                    break
+                time.sleep(0.01)
+            assert runner._cancel_events == {}
+
     def test_map_with_future_resolved_to_list(self):
         with ThreadPoolTaskRunner() as runner:
             future = MockFuture(data=[1, 2, 3])
@@ -227,6 +276,90 @@ class TestThreadPoolTaskRunner:
         assert test_flow().result() == 0
 
 
+@pytest.mark.usefixtures("use_hosted_api_server")
+class TestProcessPoolTaskRunner:
+    def test_duplicate(self):
+        runner = ProcessPoolTaskRunner(max_workers=2, shared_memory_threshold=1024)
+        duplicate_runner = runner.duplicate()
+        assert isinstance(duplicate_runner, ProcessPoolTaskRunner)
+        assert duplicate_runner is not runner
+        assert duplicate_runner == runner
+
+    def test_runner_must_be_started(self):
+        runner = ProcessPoolTaskRunner()
+        with pytest.raises(RuntimeError, match="Task runner is not started"):
+            runner.submit(my_test_task, {})
+
+    def test_set_max_workers(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            assert runner._executor._max_workers == 2
+            assert runner._dispatcher._max_workers == 2
+
+    def test_submit_sync_and_async_tasks(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            parameters = {"param1": 1, "param2": 2}
+            futures = [
+                runner.submit(my_test_task, parameters),
+                runner.submit(my_test_async_task, parameters),
+            ]
+            for future in futures:
+                assert isinstance(future, SyntaskFuture)
+                assert isinstance(future.task_run_id, UUID)
+                assert isinstance(future.wrapped_future, Future)
+                assert future.result() == (1, 2)
+
+    def test_submit_task_receives_context(self):
+        with tags("tag1", "tag2"):
+            with ProcessPoolTaskRunner(max_workers=1) as runner:
+                future = runner.submit(context_matters, {})
+                assert future.result() == {"tag1", "tag2"}
+
+    def test_map_sync_task(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            parameters = {"param1": [1, 2, 3], "param2": [4, 5, 6]}
+            futures = runner.map(my_test_task, parameters)
+            assert [future.result() for future in futures] == [(1, 4), (2, 5), (3, 6)]
+
+    def test_passes_upstream_futures_as_states(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            upstream = runner.submit(my_test_task, {"param1": 1, "param2": 2})
+            downstream = runner.submit(
+                my_test_task,
+                {"param1": upstream, "param2": 3},
+                wait_for=[upstream],
+            )
+            assert downstream.result() == ((1, 2), 3)
+
+    def test_failed_upstream_prevents_downstream_run(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            upstream = runner.submit(fails, {})
+            downstream = runner.submit(my_test_task, {"param1": upstream, "param2": 3})
+            downstream.wait()
+            assert upstream.state.is_failed()
+            assert downstream.state.is_pending()
+            assert downstream.state.name == "NotReady"
+
+    def test_large_arrays_are_passed_through_shared_memory(self):
+        np = pytest.importorskip("numpy")
+        array = np.arange(100_000, dtype=np.float64)
+
+        with ProcessPoolTaskRunner(
+            max_workers=1, shared_memory_threshold=1024
+        ) as runner:
+            doubled = runner.submit(double_array, {"array": array})
+            total = runner.submit(sum_array, {"array": doubled})
+            np.testing.assert_array_equal(doubled.result(), array * 2)
+            assert total.result() == float((array * 2).sum())
+
+    def test_used_as_flow_task_runner(self):
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=2))
+        def test_flow():
+            futures = my_test_task.map([1, 2], [3, 4])
+            return [future.result() for future in futures]
+
+        assert test_flow() == [(1, 3), (2, 4)]
+
+
 class TestSyntaskTaskRunner:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
@@ -2,6 +2,7 @@ import asyncio
 import datetime
 import inspect
 import json
+import threading
 import time
 from asyncio import Event, sleep
 from functools import partial
@@ -4096,6 +4097,202 @@ class TestTaskMap:
         my_flow()
 
 
+class TestTaskMapStream:
+    @staticmethod
+    @task
+    def add_one(x):
+        return x + 1
+
+    @staticmethod
+    @task
+    def add_together(x, y):
+        return x + y
+
+    def test_map_stream_over_generator(self):
+        def generate_numbers():
+            yield from range(10)
+
+        @flow
+        def my_flow():
+            return [
+                future.result()
+                for future in TestTaskMapStream.add_one.map_stream(
+                    generate_numbers(), max_in_flight=3
+                )
+            ]
+
+        assert sorted(my_flow()) == list(range(1, 11))
+
+    def test_map_stream_ordered(self):
+        @task
+        def sleep_and_return(x):
+            time.sleep(0.05 * (5 - x))
+            return x
+
+        @flow
+        def my_flow():
+            return [
+                future.result()
+                for future in sleep_and_return.map_stream(
+                    iter(range(5)), max_in_flight=5, ordered=True
+                )
+            ]
+
+        assert my_flow() == [0, 1, 2, 3, 4]
+
+    def test_map_stream_limits_task_runs_in_flight(self):
+        taken = []
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        @task
+        def track_concurrency(x):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return x
+
+        def generate_numbers():
+            for i in range(20):
+                taken.append(i)
+                yield i
+
+        @flow
+        def my_flow():
+            futures = track_concurrency.map_stream(generate_numbers(), max_in_flight=4)
+            # nothing is submitted until the generator is advanced
+            assert taken == []
+            return [future.result() for future in futures]
+
+        assert sorted(my_flow()) == list(range(20))
+        assert 1 <= max_running <= 4
+
+    def test_map_stream_over_async_iterator(self):
+        async def generate_numbers():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+
+        @flow
+        def my_flow():
+            return [
+                future.result()
+                for future in TestTaskMapStream.add_one.map_stream(
+                    generate_numbers(), ordered=True
+                )
+            ]
+
+        assert my_flow() == [1, 2, 3]
+
+    def test_map_stream_with_static_and_unmapped_arguments(self):
+        @flow
+        def my_flow():
+            return [
+                future.result()
+                for future in TestTaskMapStream.add_together.map_stream(
+                    iter([1, 2, 3]), unmapped(10), ordered=True
+                )
+            ]
+
+        assert my_flow() == [11, 12, 13]
+
+    def test_map_stream_raises_on_length_mismatch(self):
+        @flow
+        def my_flow():
+            for future in TestTaskMapStream.add_together.map_stream(
+                iter([1, 2, 3]), iter([1, 2])
+            ):
+                future.result()
+
+        with pytest.raises(MappingLengthMismatch):
+            my_flow()
+
+    def test_map_stream_requires_iterable(self):
+        @flow
+        def my_flow():
+            TestTaskMapStream.add_together.map_stream(1, 2)
+
+        with pytest.raises(MappingMissingIterable):
+            my_flow()
+
+    def test_map_stream_outside_of_flow_raises(self):
+        with pytest.raises(RuntimeError, match="must be called within a flow"):
+            TestTaskMapStream.add_one.map_stream(iter([1, 2, 3]))
+
+    async def test_map_stream_async_iterates_on_the_flow_event_loop(self):
+        loops = []
+
+        async def generate_numbers():
+            for i in range(3):
+                loops.append(asyncio.get_running_loop())
+                await asyncio.sleep(0)
+                yield i
+
+        @flow
+        async def my_flow():
+            results = [
+                future.result()
+                async for future in TestTaskMapStream.add_one.map_stream_async(
+                    generate_numbers(), max_in_flight=2, ordered=True
+                )
+            ]
+            return results, asyncio.get_running_loop()
+
+        results, flow_loop = await my_flow()
+        assert results == [1, 2, 3]
+        assert loops == [flow_loop] * 3
+
+    async def test_map_stream_async_does_not_block_the_event_loop(self):
+        @task
+        def sleep_and_return(x):
+            time.sleep(0.1)
+            return x
+
+        @flow
+        async def my_flow():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.create_task(tick())
+            results = [
+                future.result()
+                async for future in sleep_and_return.map_stream_async(
+                    iter(range(2)), max_in_flight=2
+                )
+            ]
+            ticker.cancel()
+            return sorted(results), ticks
+
+        results, ticks = await my_flow()
+        assert results == [0, 1]
+        assert ticks > 1
+
+    async def test_map_stream_rejects_async_iterators_in_async_flows(self):
+        async def generate_numbers():
+            yield 1
+
+        @flow
+        async def my_flow():
+            TestTaskMapStream.add_one.map_stream(generate_numbers())
+
+        with pytest.raises(TypeError, match="map_stream_async"):
+            await my_flow()
+
+    async def test_map_stream_async_outside_of_flow_raises(self):
+        with pytest.raises(RuntimeError, match="must be called within a flow"):
+            TestTaskMapStream.add_one.map_stream_async(iter([1, 2, 3]))
+
+
 class TestTaskConstructorValidation:
     async def test_task_cannot_configure_too_many_custom_retry_delays(self):
         with pytest.raises(ValueError, match="Can not configure more"):
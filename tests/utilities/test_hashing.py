@@ -1,8 +1,19 @@
+import gc
 import hashlib
+from dataclasses import dataclass
 
+import numpy as np
 import pytest
 
-from syntask.utilities.hashing import file_hash, stable_hash
+from syntask.serializers import JSONSerializer
+from syntask.utilities.hashing import (
+    file_hash,
+    get_hash_algorithm,
+    hash_objects,
+    json_hash,
+    stable_hash,
+    stream_hash,
+)
 
 
 @pytest.mark.parametrize(
@@ -55,3 +66,176 @@ class TestFileHash:
         assert val == hashlib.md5(b"0").hexdigest()
         # Check if the hash is stable
         assert val == "cfcd208495d565ef66e7dff9f98764da"
+
+
+@dataclass
+class HashableThing:
+    value: int
+    ignored: str = ""
+
+    def __syntask_hash__(self):
+        return self.value
+
+
+class TestGetHashAlgorithm:
+    @pytest.mark.parametrize("name", ["md5", "sha256", "blake2b"])
+    def test_returns_hash_constructor(self, name):
+        h = get_hash_algorithm(name)()
+        h.update(b"hello")
+        assert isinstance(h.hexdigest(), str)
+
+    def test_md5_matches_hashlib(self):
+        assert (
+            get_hash_algorithm("md5")(b"hello").hexdigest()
+            == hashlib.md5(b"hello").hexdigest()
+        )
+
+    def test_unknown_algorithm_raises(self):
+        with pytest.raises(ValueError, match="Unknown hash algorithm"):
+            get_hash_algorithm("foo")
+
+
+class TestHashObjects:
+    def test_json_serializable_objects_are_hashed_as_json(self):
+        assert hash_objects({"x": 1}, y=[1, 2]) == json_hash(
+            (({"x": 1},), {"y": [1, 2]})
+        )
+
+    def test_bytes_are_hashed_as_json_when_possible(self):
+        # keeps the cache keys of text-like bytes inputs from older versions
+        serializer = JSONSerializer(dumps_kwargs={"sort_keys": True})
+        assert hash_objects(b"data") == stable_hash(serializer.dumps(((b"data",), {})))
+
+    def test_hash_is_stable(self):
+        assert hash_objects(np.arange(10)) == hash_objects(np.arange(10))
+
+    def test_unhashable_returns_none(self):
+        class Unpicklable:
+            def __reduce__(self):
+                raise TypeError("nope")
+
+        assert hash_objects(Unpicklable()) is None
+
+
+class TestStreamHash:
+    def test_distinguishes_types(self):
+        assert stream_hash(1) != stream_hash("1")
+        assert stream_hash(1) != stream_hash(1.0)
+        assert stream_hash([1, 2]) != stream_hash((1, 2))
+        assert stream_hash(b"ab") != stream_hash(bytearray(b"ab"))
+
+    def test_dict_order_does_not_matter(self):
+        assert stream_hash({"a": 1, "b": 2}) == stream_hash({"b": 2, "a": 1})
+        assert stream_hash({1: "a", "b": 2}) == stream_hash({"b": 2, 1: "a"})
+
+    def test_set_order_does_not_matter(self):
+        assert stream_hash({1, "a", 2.5}) == stream_hash({2.5, "a", 1})
+
+    def test_numpy_arrays_are_hashed_by_contents(self):
+        array = np.arange(100, dtype=np.int64)
+        assert stream_hash(array) == stream_hash(array.copy())
+        assert stream_hash(array) != stream_hash(array + 1)
+        assert stream_hash(array) != stream_hash(array.astype(np.int32))
+        assert stream_hash(array) != stream_hash(array.reshape(10, 10))
+
+    def test_non_contiguous_buffers(self):
+        array = np.arange(100).reshape(10, 10)
+        assert stream_hash(array[:, ::2]) == stream_hash(array[:, ::2].copy())
+
+    def test_large_buffers_are_hashed_in_chunks(self, monkeypatch):
+        monkeypatch.setattr("syntask.utilities.hashing.HASH_CHUNK_SIZE", 7)
+        data = bytes(range(256))
+        chunked = stream_hash(data)
+        monkeypatch.setattr("syntask.utilities.hashing.HASH_CHUNK_SIZE", 2**20)
+        assert chunked == stream_hash(data)
+
+    def test_hash_hook_is_used(self):
+        assert stream_hash(HashableThing(1, "a")) == stream_hash(HashableThing(1, "b"))
+        assert stream_hash(HashableThing(1)) != stream_hash(HashableThing(2))
+        assert stream_hash(HashableThing(1)) != stream_hash(1)
+
+    def test_hash_hook_takes_precedence_over_json(self):
+        assert hash_objects(HashableThing(1, "a")) == hash_objects(
+            HashableThing(1, "b")
+        )
+
+    def test_falls_back_to_cloudpickle(self):
+        assert stream_hash(HashableThing) == stream_hash(HashableThing)
+
+    def test_self_referential_containers(self):
+        first = [1]
+        first.append(first)
+        second = [1]
+        second.append(second)
+        assert stream_hash(first) is not None
+        assert stream_hash(first) == stream_hash(second)
+        assert stream_hash(first) != stream_hash([1, [1]])
+
+        mapping = {"a": 1}
+        mapping["self"] = mapping
+        assert stream_hash(mapping) is not None
+
+    def test_shared_containers_are_not_cycles(self):
+        shared = [1, 2]
+        assert stream_hash([shared, shared]) == stream_hash([[1, 2], [1, 2]])
+
+    def test_hash_algorithm(self):
+        assert stream_hash(b"data") != stream_hash(b"data", hash_algo=hashlib.sha256)
+
+    def test_memo_reuses_digests_of_read_only_buffers(self):
+        array = np.arange(100)
+        array.flags.writeable = False
+        memo = {}
+        key = stream_hash([array, array], memo=memo)
+        assert key == stream_hash([array, array])
+        assert len(memo) == 1
+
+        # the memoized digest is used instead of the contents
+        ((memo_key, _),) = memo.items()
+        memo[memo_key] = "memoized"
+        assert stream_hash(array, memo=memo) != stream_hash(array)
+
+    def test_memo_ignores_read_only_views_of_writable_buffers(self):
+        base = np.arange(10)
+        view = base.view()
+        view.flags.writeable = False
+        memo = {}
+        key = stream_hash(view, memo=memo)
+        assert memo == {}
+
+        base[0] = 100
+        assert stream_hash(view, memo=memo) != key
+
+        # once the base can't change either, the view's digest is memoized
+        base.flags.writeable = False
+        stream_hash(view, memo=memo)
+        assert len(memo) == 1
+
+    def test_memo_forgets_collected_objects(self):
+        array = np.arange(100)
+        array.flags.writeable = False
+        memo = {}
+        stream_hash(array, memo=memo)
+        assert len(memo) == 1
+
+        del array
+        gc.collect()
+        assert memo == {}
+
+    def test_memo_ignores_objects_without_weak_references(self):
+        memo = {}
+        stream_hash(b"x" * 100, memo=memo)
+        assert memo == {}
+
+    def test_memo_ignores_writable_buffers(self):
+        array = np.arange(10)
+        memo = {}
+        key = stream_hash(array, memo=memo)
+        assert memo == {}
+
+        array[0] = 100
+        assert stream_hash(array, memo=memo) != key
+
+        array.flags.writeable = False
+        stream_hash(array, memo=memo)
+        assert len(memo) == 1
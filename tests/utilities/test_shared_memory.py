@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from syntask.utilities import shared_memory
+from syntask.utilities.shared_memory import (
+    dumps,
+    loads,
+    release_blocks,
+    unlink_blocks,
+)
+
+
+@pytest.fixture
+def roundtrip():
+    loaded_blocks = []
+
+    def roundtrip(obj, threshold=1024):
+        data, blocks = dumps(obj, threshold=threshold)
+        try:
+            loaded, attached = loads(data)
+        finally:
+            unlink_blocks(blocks)
+        loaded_blocks.extend(attached)
+        return loaded, data, blocks
+
+    yield roundtrip
+    release_blocks(loaded_blocks)
+
+
+class TestSharedMemoryPickling:
+    def test_small_objects_are_pickled_in_band(self, roundtrip):
+        obj = {"x": b"small", "y": np.arange(3)}
+        loaded, _, blocks = roundtrip(obj)
+        assert blocks == []
+        assert loaded["x"] == b"small"
+        np.testing.assert_array_equal(loaded["y"], obj["y"])
+
+    @pytest.mark.parametrize("typ", [bytes, bytearray])
+    def test_large_buffers_use_shared_memory(self, roundtrip, typ):
+        obj = typ(b"x" * 4096)
+        loaded, data, blocks = roundtrip(obj)
+        assert len(blocks) == 1
+        assert len(data) < 4096
+        assert type(loaded) is typ
+        assert loaded == obj
+
+    def test_large_arrays_use_shared_memory(self, roundtrip):
+        array = np.arange(10_000, dtype=np.float64).reshape(100, 100)
+        loaded, data, blocks = roundtrip(array)
+        assert len(blocks) == 1
+        assert len(data) < array.nbytes
+        assert loaded.dtype == array.dtype
+        np.testing.assert_array_equal(loaded, array)
+
+    def test_non_contiguous_arrays(self, roundtrip):
+        array = np.arange(10_000).reshape(100, 100)[:, ::2]
+        loaded, _, _ = roundtrip(array)
+        np.testing.assert_array_equal(loaded, array)
+
+    def test_object_arrays_are_pickled_in_band(self, roundtrip):
+        array = np.array([{"a": i} for i in range(1000)], dtype=object)
+        loaded, _, blocks = roundtrip(array)
+        assert blocks == []
+        assert list(loaded) == list(array)
+
+    def test_shared_objects_keep_their_identity(self, roundtrip):
+        array = np.zeros(1000)
+        loaded, _, blocks = roundtrip([array, array])
+        assert len(blocks) == 1
+        assert loaded[0] is loaded[1]
+
+
+class TestReleaseBlocks:
+    def test_blocks_referenced_by_arrays_are_retained(self):
+        data, blocks = dumps(np.ones(1000), threshold=1024)
+        array, attached = loads(data)
+        unlink_blocks(blocks)
+
+        release_blocks(attached)
+        assert attached[0] in shared_memory._open_blocks
+        assert array.sum() == 1000
+
+        del array
+        release_blocks([])
+        assert attached[0] not in shared_memory._open_blocks
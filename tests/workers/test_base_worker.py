@@ -2,6 +2,7 @@ import uuid
 from typing import Any, Dict, Optional, Type
 from unittest.mock import MagicMock
 
+import httpx
 import pendulum
 import pytest
 from packaging import version
@@ -15,6 +16,7 @@ from syntask.client.schemas import FlowRun
 from syntask.exceptions import (
     CrashedRun,
     ObjectNotFound,
+    SyntaskHTTPStatusError,
 )
 from syntask.flows import flow
 from syntask.server import models
@@ -24,7 +26,9 @@ from syntask.server.schemas.responses import DeploymentResponse
 from syntask.settings import (
     SYNTASK_API_URL,
     SYNTASK_TEST_MODE,
+    SYNTASK_WORKER_LONG_POLL_SECONDS,
     SYNTASK_WORKER_PREFETCH_SECONDS,
+    SYNTASK_WORKER_QUERY_SECONDS,
     get_current_settings,
     temporary_settings,
 )
@@ -201,6 +205,41 @@ async def test_worker_with_work_pool(
     assert {flow_run.id for flow_run in submitted_flow_runs} == set(flow_run_ids[1:4])
 
 
+async def test_worker_long_polls_for_runs_becoming_due(
+    syntask_client: SyntaskClient, worker_deployment_wq1, work_pool
+):
+    flow_run = await syntask_client.create_flow_run_from_deployment(
+        worker_deployment_wq1.id,
+        state=Scheduled(
+            scheduled_time=pendulum.now("utc").add(
+                seconds=SYNTASK_WORKER_PREFETCH_SECONDS.value() + 1
+            )
+        ),
+    )
+
+    with temporary_settings({SYNTASK_WORKER_LONG_POLL_SECONDS: 10}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+            submitted_flow_runs = await worker.get_and_submit_flow_runs()
+
+    assert [run.id for run in submitted_flow_runs] == [flow_run.id]
+
+
+async def test_worker_waits_between_empty_polls_when_the_server_does_not_wait(
+    work_pool, monkeypatch: pytest.MonkeyPatch
+):
+    sleep = AsyncMock()
+    monkeypatch.setattr("syntask.workers.base.anyio.sleep", sleep)
+
+    with temporary_settings({SYNTASK_WORKER_LONG_POLL_SECONDS: 10}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+            # a server without long polling answers right away
+            worker._get_scheduled_flow_runs = AsyncMock(return_value=[])
+            await worker.get_and_submit_flow_runs()
+
+    sleep.assert_awaited_once()
+    assert 0 < sleep.call_args.args[0] <= SYNTASK_WORKER_QUERY_SECONDS.value()
+
+
 async def test_worker_with_work_pool_and_work_queue(
     syntask_client: SyntaskClient,
     worker_deployment_wq1,
@@ -328,17 +367,84 @@ async def test_worker_with_work_pool_and_limit(
             flow_run_ids[1:3]
         )
 
+        # the worker is at its limit, so no more runs are claimed
         submitted_flow_runs = await worker.get_and_submit_flow_runs()
-        assert {flow_run.id for flow_run in submitted_flow_runs} == set(
-            flow_run_ids[1:3]
-        )
+        assert submitted_flow_runs == []
 
         worker._limiter.release_on_behalf_of(flow_run_ids[1])
 
         submitted_flow_runs = await worker.get_and_submit_flow_runs()
         assert {flow_run.id for flow_run in submitted_flow_runs} == set(
-            flow_run_ids[1:4]
+            flow_run_ids[3:4]
+        )
+
+    for flow_run_id in flow_run_ids[1:4]:
+        flow_run = await syntask_client.read_flow_run(flow_run_id)
+        assert flow_run.state.is_pending()
+
+    flow_run = await syntask_client.read_flow_run(flow_run_ids[4])
+    assert flow_run.state.is_scheduled()
+
+
+async def test_worker_releases_claimed_runs_it_cannot_submit(
+    syntask_client: SyntaskClient, worker_deployment_wq1, work_pool
+):
+    flow_runs = [
+        await syntask_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id,
+            state=Scheduled(scheduled_time=pendulum.now("utc").subtract(minutes=i)),
+        )
+        for i in range(2)
+    ]
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name, limit=1) as worker:
+        worker._submit_run = AsyncMock()  # don't run anything
+
+        # another run takes the worker's only slot after both runs were claimed
+        claimed = await syntask_client.claim_scheduled_flow_runs_for_work_pool(
+            work_pool_name=work_pool.name
+        )
+        assert len(claimed) == 2
+        worker._limiter.acquire_on_behalf_of_nowait(uuid.uuid4())
+
+        submitted_flow_runs = await worker._submit_scheduled_flow_runs(claimed)
+        assert submitted_flow_runs == []
+
+    for flow_run in flow_runs:
+        flow_run = await syntask_client.read_flow_run(flow_run.id)
+        assert flow_run.state.is_scheduled()
+
+
+async def test_worker_reads_and_proposes_pending_when_server_cannot_claim(
+    syntask_client: SyntaskClient,
+    worker_deployment_wq1,
+    work_pool,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    flow_run = await syntask_client.create_flow_run_from_deployment(
+        worker_deployment_wq1.id,
+        state=Scheduled(scheduled_time=pendulum.now("utc").subtract(minutes=1)),
+    )
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        claim = AsyncMock(
+            side_effect=SyntaskHTTPStatusError(
+                "Not Found",
+                request=httpx.Request("POST", "http://test/claim_scheduled_flow_runs"),
+                response=httpx.Response(status_code=404),
+            )
+        )
+        monkeypatch.setattr(
+            worker._client, "claim_scheduled_flow_runs_for_work_pool", claim
         )
+        worker._submit_run = AsyncMock()  # don't run anything
+
+        submitted_flow_runs = await worker.get_and_submit_flow_runs()
+        assert [run.id for run in submitted_flow_runs] == [flow_run.id]
+
+        # the server is not asked to claim runs again
+        await worker.get_and_submit_flow_runs()
+        claim.assert_awaited_once()
 
 
 async def test_worker_calls_run_with_expected_arguments(
@@ -412,8 +518,10 @@ async def test_worker_warns_when_running_a_flow_run_with_a_storage_block(
         in caplog.text
     )
 
+    # the claimed run would fail its checks on every poll, so it is failed
     flow_run = await syntask_client.read_flow_run(flow_run.id)
-    assert flow_run.state_name == "Scheduled"
+    assert flow_run.state.is_failed()
+    assert "configured with a storage block" in flow_run.state.message
 
 
 async def test_worker_creates_only_one_client_context(